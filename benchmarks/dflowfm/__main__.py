@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy
+
+from benchmarks.dflowfm.synthetic import write_case
+
+BASELINE_FORMAT = 1
+
+# stages reported by the D-Flow FM analysis in the order of execution
+STAGES = [
+    "load mesh",
+    "read dzq",
+    "kernel",
+    "region of interest",
+    "projection",
+    "face order",
+    "sedimentation areas",
+    "write netCDF",
+    "plotting",
+    "analysis",
+]
+
+# key of the peak resident set size [MB] in the results of run_case
+PEAK_MEMORY = "peak memory [MB]"
+
+
+def run_case(
+    directory: Path,
+    nfaces: int,
+    nconditions: int,
+    tide: bool,
+    nfields: int,
+    chainage: bool,
+    plotting: bool,
+    block_size: int = 0,
+    partitions: int = 0,
+    face_order: Optional[str] = None,
+    precision: Optional[str] = None,
+) -> Dict[str, float]:
+    """
+    Generate a synthetic case, run the analysis and return the stage timings.
+
+    Arguments
+    ---------
+    directory : Path
+        Directory in which the case is generated and run.
+    nfaces : int
+        Requested number of faces.
+    nconditions : int
+        Number of flow conditions.
+    tide : bool
+        Flag indicating whether the flow conditions are tidal.
+    nfields : int
+        Number of time steps covering a tidal period.
+    chainage : bool
+        Flag indicating whether a chainage line should be used.
+    plotting : bool
+        Flag indicating whether figures should be created and saved.
+    block_size : int
+        Number of faces processed per block (0 to process all faces at once).
+    partitions : int
+        Number of partitions whose faces are interleaved in the map files.
+    face_order : Optional[str]
+        Order of the faces in the region of interest; default if None.
+    precision : Optional[str]
+        Precision of the field arrays; default if None.
+
+    Returns
+    -------
+    timings : Dict[str, float]
+        Total wall clock time [s] per stage; the key "faces" holds the actual
+        number of faces of the mesh and the key PEAK_MEMORY the peak memory
+        use of the process.
+    """
+    from dfastmi.batch.core import batch_mode_core
+    from dfastmi.config.ConfigFileOperations import ConfigFileOperations
+    from dfastmi.io.RiversObject import RiversObject
+
+    # generate the case in a separate process, such that the peak memory use
+    # of this process only reflects the analysis
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        case = executor.submit(
+            write_case,
+            directory,
+            nfaces,
+            nconditions=nconditions,
+            tide=tide,
+            nfields=nfields,
+            chainage=chainage,
+            plotting=plotting,
+            block_size=block_size,
+            partitions=partitions,
+            face_order=face_order,
+            precision=precision,
+        ).result()
+    rivers = RiversObject(str(case.rivers_file))
+    config = ConfigFileOperations.load_configuration_file(str(case.config_file))
+    with contextlib.redirect_stdout(io.StringIO()):
+        success = batch_mode_core(rivers, False, config, rootdir=str(directory))
+    if not success:
+        raise RuntimeError(f"Analysis of synthetic case in {directory} failed.")
+
+    with open(directory / "output" / "timing.json") as timing_file:
+        spans = json.load(timing_file)["spans"]
+    timings: Dict[str, float] = {"faces": float(case.nfaces)}
+    for span in spans:
+        timings[span["name"]] = timings.get(span["name"], 0.0) + span["wall_time"]
+    peak_rss = max((span.get("peak_rss", 0) for span in spans), default=0)
+    timings[PEAK_MEMORY] = peak_rss / 1024**2
+    return timings
+
+
+def scaling_exponent(faces: List[float], times: List[float]) -> Optional[float]:
+    """
+    Return the exponent p of the least squares fit time ~ faces**p.
+
+    Arguments
+    ---------
+    faces : List[float]
+        Number of faces per run.
+    times : List[float]
+        Wall clock time [s] per run.
+
+    Returns
+    -------
+    exponent : Optional[float]
+        The fitted exponent; None if there are too few positive measurements.
+    """
+    points = [(f, t) for f, t in zip(faces, times) if f > 0 and t > 0]
+    if len(points) < 2 or len({f for f, _ in points}) < 2:
+        return None
+    x, y = numpy.log(numpy.array(points)).T
+    return float(numpy.polyfit(x, y, 1)[0])
+
+
+def print_report(results: List[Dict[str, float]]) -> None:
+    """
+    Print the timing per stage and mesh size with the fitted scaling exponent.
+
+    Arguments
+    ---------
+    results : List[Dict[str, float]]
+        Stage timings per run as returned by run_case.
+    """
+    faces = [result["faces"] for result in results]
+    header = f"{'stage':<22}" + "".join(f"{int(f):>12d}" for f in faces)
+    print(header + f"{'exponent':>10}")
+    print("-" * (len(header) + 10))
+    for stage in STAGES:
+        if not any(stage in result for result in results):
+            continue
+        times = [result.get(stage, 0.0) for result in results]
+        exponent = scaling_exponent(faces, times)
+        line = f"{stage:<22}" + "".join(f"{t:12.3f}" for t in times)
+        line += f"{exponent:10.2f}" if exponent is not None else f"{'-':>10}"
+        print(line)
+    peaks = [result.get(PEAK_MEMORY, 0.0) for result in results]
+    print(f"{PEAK_MEMORY:<22}" + "".join(f"{p:12.0f}" for p in peaks))
+
+
+def save_baseline(filename: str, results: List[Dict[str, float]]) -> None:
+    """
+    Save the stage timings as baseline for later comparison.
+
+    Arguments
+    ---------
+    filename : str
+        Name of the JSON file to be written.
+    results : List[Dict[str, float]]
+        Stage timings per run as returned by run_case.
+    """
+    stages: Dict[str, Dict[str, float]] = {}
+    for result in results:
+        size = str(int(result["faces"]))
+        for stage, wall_time in result.items():
+            if stage not in ("faces", PEAK_MEMORY):
+                stages.setdefault(stage, {})[size] = wall_time
+    content = {"format": BASELINE_FORMAT, "stages": stages}
+    with open(filename, "w") as baseline_file:
+        json.dump(content, baseline_file, indent=1)
+
+
+def compare_baseline(
+    filename: str, results: List[Dict[str, float]], tolerance: float
+) -> bool:
+    """
+    Compare the stage timings with a baseline saved before.
+
+    Arguments
+    ---------
+    filename : str
+        Name of the JSON file containing the baseline.
+    results : List[Dict[str, float]]
+        Stage timings per run as returned by run_case.
+    tolerance : float
+        Largest acceptable ratio of the current and the baseline time.
+
+    Returns
+    -------
+    success : bool
+        Flag indicating whether none of the stages exceeds the tolerance.
+    """
+    with open(filename) as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"Unsupported baseline format in {filename}.")
+
+    success = True
+    print(f"\nComparison with baseline {filename} (tolerance {tolerance:.2f}x)")
+    for result in results:
+        size = str(int(result["faces"]))
+        for stage in STAGES:
+            reference = baseline["stages"].get(stage, {}).get(size)
+            if stage not in result or not reference:
+                continue
+            ratio = result[stage] / reference
+            flag = ""
+            if ratio > tolerance:
+                flag = "  SLOWER"
+                success = False
+            print(f"{stage:<22}{int(size):>12d}{ratio:10.2f}x{flag}")
+    return success
+
+
+def main() -> None:
+    """
+    Parse the command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the scaling of the D-Flow FM analysis on synthetic meshes."
+    )
+    parser.add_argument(
+        "--faces",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="approximate number of mesh faces per run (%(default)s is default)",
+    )
+    parser.add_argument(
+        "--conditions",
+        type=int,
+        default=3,
+        help="number of flow conditions (%(default)s is default)",
+    )
+    parser.add_argument(
+        "--tide",
+        action="store_true",
+        help="use tidal flow conditions with multiple time steps",
+    )
+    parser.add_argument(
+        "--fields",
+        type=int,
+        default=4,
+        help="number of time steps per tidal period (%(default)s is default)",
+    )
+    parser.add_argument(
+        "--no-chainage",
+        action="store_true",
+        help="run without chainage line, skipping the projection stages",
+    )
+    parser.add_argument(
+        "--plot",
+        action="store_true",
+        help="include the creation of figures",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=0,
+        help="number of faces processed per block (%(default)s: all faces at once)",
+    )
+    parser.add_argument(
+        "--partitions",
+        type=int,
+        default=0,
+        help="number of partitions whose faces are interleaved in the map files "
+        "(%(default)s: faces stored row by row)",
+    )
+    parser.add_argument(
+        "--face-order",
+        choices=["source", "chainage", "hilbert"],
+        help="order of the faces in the region of interest (default: source)",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["double", "single"],
+        help="precision of the field arrays (default: double)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        metavar="FILE",
+        help="save the timings as baseline in FILE",
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        help="compare the timings with the baseline in FILE",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.25,
+        help="largest acceptable slow-down relative to baseline (%(default)s is default)",
+    )
+    args = parser.parse_args()
+    if args.tide and args.no_chainage:
+        parser.error("tidal analyses require a chainage line")
+
+    from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+
+    ApplicationSettingsHelper.load_program_texts(
+        str(Path(__file__).parents[2] / "dfastmi" / "messages.UK.ini")
+    )
+
+    results = []
+    for nfaces in args.faces:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            start = time.perf_counter()
+            results.append(
+                run_case(
+                    Path(tmpdir),
+                    nfaces,
+                    args.conditions,
+                    args.tide,
+                    args.fields,
+                    not args.no_chainage,
+                    args.plot,
+                    args.block_size,
+                    args.partitions,
+                    args.face_order,
+                    args.precision,
+                )
+            )
+            elapsed = time.perf_counter() - start
+        print(
+            f"Ran synthetic case with {int(results[-1]['faces'])} faces in {elapsed:.1f} s"
+        )
+    print()
+    print_report(results)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+    if args.baseline and not compare_baseline(args.baseline, results, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,535 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import configparser
+import zlib
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import List, Optional
+
+import netCDF4
+import numpy
+
+# origin of the synthetic channel in Dutch RD coordinates [m]
+X0 = 190_000.0
+Y0 = 430_000.0
+
+# size of the cells along and across the channel [m]
+CELL_LENGTH = 20.0
+CELL_WIDTH = 10.0
+
+# number of cells along the channel per cell across the channel
+ASPECT_RATIO = 10
+
+# amplitude [m] and wave length [m] of the meandering centreline
+MEANDER_AMPLITUDE = 500.0
+MEANDER_LENGTH = 5000.0
+
+# chainage [km] at the start of the channel
+KM0 = 800.0
+
+FILL_VALUE = -999
+
+
+@dataclass
+class ChannelMesh:
+    """
+    Curvilinear mesh of a meandering channel with mixed triangles and quads.
+
+    Attributes
+    ----------
+    node_x : numpy.ndarray
+        X-coordinates of the nodes [m].
+    node_y : numpy.ndarray
+        Y-coordinates of the nodes [m].
+    face_nodes : numpy.ndarray
+        Zero-based face node connectivity; FILL_VALUE for unused corners.
+    face_s : numpy.ndarray
+        Distance along the centreline of the face centres [m].
+    face_n : numpy.ndarray
+        Distance from the centreline of the face centres [m].
+    face_tx : numpy.ndarray
+        X-component of the channel direction at the face centres.
+    face_ty : numpy.ndarray
+        Y-component of the channel direction at the face centres.
+    length : float
+        Length of the channel along the centreline [m].
+    width : float
+        Width of the channel [m].
+    """
+
+    node_x: numpy.ndarray
+    node_y: numpy.ndarray
+    face_nodes: numpy.ndarray
+    face_s: numpy.ndarray
+    face_n: numpy.ndarray
+    face_tx: numpy.ndarray
+    face_ty: numpy.ndarray
+    length: float
+    width: float
+
+    @property
+    def nfaces(self) -> int:
+        """Number of faces of the mesh."""
+        return self.face_nodes.shape[0]
+
+
+def centreline(s: numpy.ndarray):
+    """
+    Return the coordinates and unit direction of the centreline.
+
+    Arguments
+    ---------
+    s : numpy.ndarray
+        Distance parameter along the channel [m].
+
+    Returns
+    -------
+    x, y, tx, ty : numpy.ndarray
+        Coordinates [m] and unit direction vector of the centreline.
+    """
+    k = 2.0 * numpy.pi / MEANDER_LENGTH
+    x = X0 + s
+    y = Y0 + MEANDER_AMPLITUDE * numpy.sin(k * s)
+    dy = MEANDER_AMPLITUDE * k * numpy.cos(k * s)
+    norm = numpy.sqrt(1.0 + dy**2)
+    return x, y, 1.0 / norm, dy / norm
+
+
+def channel_mesh(nfaces: int) -> ChannelMesh:
+    """
+    Create the mesh of a meandering channel with approximately nfaces faces.
+
+    The channel consists of rows of quadrilaterals across the channel; every
+    other row is split into triangles such that the mesh mixes both types.
+
+    Arguments
+    ---------
+    nfaces : int
+        Requested number of faces.
+
+    Returns
+    -------
+    mesh : ChannelMesh
+        The mesh.
+    """
+    # ns rows along the channel of nn cells; half of the rows are split in two
+    nn = max(2, int(round(numpy.sqrt(nfaces / (1.5 * ASPECT_RATIO)))))
+    ns = max(2, int(round(nfaces / (1.5 * nn))))
+    length = ns * CELL_LENGTH
+    width = nn * CELL_WIDTH
+
+    s = numpy.arange(ns + 1) * CELL_LENGTH
+    n = (numpy.arange(nn + 1) - nn / 2) * CELL_WIDTH
+    x, y, tx, ty = centreline(s)
+    node_x = (x[:, None] - n[None, :] * ty[:, None]).ravel()
+    node_y = (y[:, None] + n[None, :] * tx[:, None]).ravel()
+
+    i, j = numpy.meshgrid(numpy.arange(ns), numpy.arange(nn), indexing="ij")
+    a = (i * (nn + 1) + j).ravel()
+    b = a + nn + 1
+    c = b + 1
+    d = a + 1
+    split = (i.ravel() % 2) == 1
+    quads = numpy.column_stack([a, b, c, d])[~split]
+    tri1 = numpy.column_stack([a, b, c, numpy.full(a.shape, FILL_VALUE)])[split]
+    tri2 = numpy.column_stack([a, c, d, numpy.full(a.shape, FILL_VALUE)])[split]
+    face_nodes = numpy.concatenate([quads, tri1, tri2]).astype(numpy.int32)
+
+    corner_s = numpy.where(face_nodes >= 0, face_nodes // (nn + 1), 0) * CELL_LENGTH
+    corner_n = (numpy.where(face_nodes >= 0, face_nodes % (nn + 1), 0) - nn / 2) * (
+        CELL_WIDTH
+    )
+    ncorners = (face_nodes >= 0).sum(axis=1)
+    used = face_nodes >= 0
+    face_s = (corner_s * used).sum(axis=1) / ncorners
+    face_n = (corner_n * used).sum(axis=1) / ncorners
+    _, _, face_tx, face_ty = centreline(face_s)
+
+    return ChannelMesh(
+        node_x, node_y, face_nodes, face_s, face_n, face_tx, face_ty, length, width
+    )
+
+
+def interleave_partitions(mesh: ChannelMesh, npartitions: int) -> ChannelMesh:
+    """
+    Reorder the faces as if they were merged from interleaved partitions.
+
+    The channel is split into npartitions strips along the centreline and the
+    faces of the strips are stored alternately, such that faces that are
+    neighbours in space are far apart in memory.
+
+    Arguments
+    ---------
+    mesh : ChannelMesh
+        The mesh with the faces stored row by row.
+    npartitions : int
+        Number of partitions; the mesh is returned unchanged if less than 2.
+
+    Returns
+    -------
+    mesh : ChannelMesh
+        The mesh with the faces in interleaved order.
+    """
+    if npartitions < 2:
+        return mesh
+    row_order = numpy.argsort(mesh.face_s, kind="stable")
+    partition = numpy.arange(mesh.nfaces) * npartitions // mesh.nfaces
+    local_index = numpy.arange(mesh.nfaces) - numpy.searchsorted(partition, partition)
+    order = row_order[numpy.lexsort((partition, local_index))]
+    return replace(
+        mesh,
+        face_nodes=mesh.face_nodes[order],
+        face_s=mesh.face_s[order],
+        face_n=mesh.face_n[order],
+        face_tx=mesh.face_tx[order],
+        face_ty=mesh.face_ty[order],
+    )
+
+
+def flow_fields(mesh: ChannelMesh, discharge: float, intervention: bool, ntimes: int):
+    """
+    Return synthetic velocity and water depth fields.
+
+    The intervention reduces the flow velocity in a part of the channel and
+    increases it on the opposite side, such that both sedimentation and
+    erosion areas occur.
+
+    Arguments
+    ---------
+    mesh : ChannelMesh
+        The mesh.
+    discharge : float
+        Discharge [m3/s] scaling the velocity and water depth.
+    intervention : bool
+        Flag indicating whether the fields include the effect of an intervention.
+    ntimes : int
+        Number of time steps; if more than one, the flow reverses like a tide.
+
+    Returns
+    -------
+    ucx, ucy, depth : numpy.ndarray
+        Arrays of shape (ntimes, nfaces).
+    """
+    scale = discharge / 2000.0
+    profile = 1.0 - 2.0 * (mesh.face_n / mesh.width) ** 2
+    rng = numpy.random.default_rng(int(discharge))
+    umag = (0.3 + 0.7 * scale) * profile * (1.0 + 0.02 * rng.random(mesh.nfaces))
+    depth = (1.0 + 4.0 * scale) * profile
+
+    if intervention:
+        s_rel = mesh.face_s / mesh.length
+        n_rel = mesh.face_n / mesh.width
+        region = (s_rel > 0.4) & (s_rel < 0.5)
+        umag = numpy.where(region & (n_rel > 0.1), 0.7 * umag, umag)
+        umag = numpy.where(region & (n_rel < -0.1), 1.15 * umag, umag)
+
+    if ntimes > 1:
+        phase = numpy.cos(2.0 * numpy.pi * (numpy.arange(ntimes) + 0.5) / ntimes)
+    else:
+        phase = numpy.ones(1)
+    ucx = phase[:, None] * (umag * mesh.face_tx)[None, :]
+    ucy = phase[:, None] * (umag * mesh.face_ty)[None, :]
+    depth = numpy.broadcast_to(depth, (ntimes, mesh.nfaces))
+    return ucx, ucy, depth
+
+
+def write_map_file(
+    filename: Path,
+    mesh: ChannelMesh,
+    discharge: float,
+    intervention: bool = False,
+    ntimes: int = 1,
+) -> None:
+    """
+    Write a D-Flow FM like UGRID map file of the synthetic channel.
+
+    Arguments
+    ---------
+    filename : Path
+        Name of the file to be written.
+    mesh : ChannelMesh
+        The mesh.
+    discharge : float
+        Discharge [m3/s] scaling the velocity and water depth.
+    intervention : bool
+        Flag indicating whether the fields include the effect of an intervention.
+    ntimes : int
+        Number of time steps.
+    """
+    ucx, ucy, depth = flow_fields(mesh, discharge, intervention, ntimes)
+    with netCDF4.Dataset(filename, "w", format="NETCDF4") as dataset:
+        dataset.Conventions = "CF-1.8 UGRID-1.0/Deltares-0.9"
+        dataset.createDimension("mesh2d_nNodes", mesh.node_x.size)
+        dataset.createDimension("mesh2d_nFaces", mesh.nfaces)
+        dataset.createDimension("mesh2d_nMax_face_nodes", 4)
+        dataset.createDimension("time", None)
+
+        mesh2d = dataset.createVariable("mesh2d", "i4")
+        mesh2d.cf_role = "mesh_topology"
+        mesh2d.long_name = "Topology data of 2D mesh"
+        mesh2d.topology_dimension = 2
+        mesh2d.node_coordinates = "mesh2d_node_x mesh2d_node_y"
+        mesh2d.node_dimension = "mesh2d_nNodes"
+        mesh2d.max_face_nodes_dimension = "mesh2d_nMax_face_nodes"
+        mesh2d.face_node_connectivity = "mesh2d_face_nodes"
+        mesh2d.face_dimension = "mesh2d_nFaces"
+
+        for axis, data in (("x", mesh.node_x), ("y", mesh.node_y)):
+            var = dataset.createVariable(
+                f"mesh2d_node_{axis}", "f8", ("mesh2d_nNodes",)
+            )
+            var.units = "m"
+            var.standard_name = f"projection_{axis}_coordinate"
+            var.long_name = f"{axis}-coordinate of mesh nodes"
+            var[:] = data
+
+        var = dataset.createVariable(
+            "mesh2d_face_nodes",
+            "i4",
+            ("mesh2d_nFaces", "mesh2d_nMax_face_nodes"),
+            fill_value=FILL_VALUE,
+        )
+        var.cf_role = "face_node_connectivity"
+        var.long_name = "Vertex nodes of mesh faces (counterclockwise)"
+        var.start_index = 1
+        var[:] = numpy.where(mesh.face_nodes >= 0, mesh.face_nodes + 1, FILL_VALUE)
+
+        var = dataset.createVariable("time", "f8", ("time",))
+        var.standard_name = "time"
+        var.units = "seconds since 2001-01-01 00:00:00"
+        var[:] = numpy.arange(ntimes) * 3600.0
+
+        for name, standard_name, units, data in (
+            ("mesh2d_ucx", "sea_water_x_velocity", "m s-1", ucx),
+            ("mesh2d_ucy", "sea_water_y_velocity", "m s-1", ucy),
+            ("mesh2d_waterdepth", "sea_floor_depth_below_sea_surface", "m", depth),
+        ):
+            var = dataset.createVariable(
+                name, "f8", ("time", "mesh2d_nFaces"), fill_value=float(FILL_VALUE)
+            )
+            var.mesh = "mesh2d"
+            var.location = "face"
+            var.standard_name = standard_name
+            var.units = units
+            var[:] = data
+
+
+def write_chainage_file(filename: Path, mesh: ChannelMesh, step: float = 100.0):
+    """
+    Write the chainage line of the synthetic channel as xyc file.
+
+    Arguments
+    ---------
+    filename : Path
+        Name of the file to be written.
+    mesh : ChannelMesh
+        The mesh.
+    step : float
+        Distance [m] between the points of the line.
+    """
+    # parametric distance; close enough to the distance along the meander
+    s = numpy.arange(0.0, mesh.length + step / 2, step)
+    x, y, _, _ = centreline(s)
+    km = KM0 + s / 1000.0
+    numpy.savetxt(filename, numpy.column_stack([km, x, y]), fmt="%16.7e")
+
+
+def write_rivers_file(
+    filename: Path, discharges: List[float], tide: bool, width: float
+) -> None:
+    """
+    Write a rivers configuration file describing the synthetic channel.
+
+    Arguments
+    ---------
+    filename : Path
+        Name of the file to be written.
+    discharges : List[float]
+        Characteristic discharges [m3/s].
+    tide : bool
+        Flag indicating whether the flow conditions are tidal.
+    width : float
+        Normal width [m] of the channel.
+    """
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    config["General"] = {"Version": "3.0", "UCrit": "0.3", "CelerForm": "1"}
+    branch = {
+        "QLocation": "Synthetic",
+        "HydroQ": " ".join(f"{q:.1f}" for q in discharges),
+        "HydroT": " ".join([f"{1.0 / len(discharges):.6f}"] * len(discharges)),
+        "QStagnant": f"{discharges[0] / 2:.1f}",
+        "QFit": f"{discharges[0] / 2:.1f} {discharges[0]:.1f}",
+        "Reach1": "Channel",
+        "NWidth1": f"{width:.1f}",
+        "PropQ1": f"{discharges[0]:.1f} {discharges[-1]:.1f}",
+        "PropC1": "0.8 3.6",
+    }
+    if tide:
+        branch["Tide"] = "true"
+        branch["TideBC"] = " ".join(["0"] * len(discharges))
+    config["Synthetic"] = branch
+
+    checksum = 1
+    for section in config.sections():
+        for value in config[section].values():
+            checksum = zlib.adler32(value.encode("utf-8"), checksum) & 0xFFFFFFFF
+    config["General"]["checksum"] = str(checksum)
+    with open(filename, "w") as file:
+        config.write(file)
+
+
+@dataclass
+class SyntheticCase:
+    """
+    Files of a synthetic D-Flow FM analysis.
+
+    Attributes
+    ----------
+    config_file : Path
+        Name of the analysis configuration file.
+    rivers_file : Path
+        Name of the rivers configuration file.
+    nfaces : int
+        Number of faces of the mesh.
+    """
+
+    config_file: Path
+    rivers_file: Path
+    nfaces: int
+
+
+def write_case(
+    directory: Path,
+    nfaces: int,
+    nconditions: int = 3,
+    tide: bool = False,
+    nfields: int = 4,
+    chainage: bool = True,
+    plotting: bool = False,
+    timing_file: Optional[str] = "timing.json",
+    block_size: int = 0,
+    partitions: int = 0,
+    face_order: Optional[str] = None,
+    precision: Optional[str] = None,
+) -> SyntheticCase:
+    """
+    Write all files of a synthetic D-Flow FM analysis of the channel.
+
+    Arguments
+    ---------
+    directory : Path
+        Directory in which the files are written.
+    nfaces : int
+        Requested number of faces.
+    nconditions : int
+        Number of flow conditions.
+    tide : bool
+        Flag indicating whether the flow conditions are tidal.
+    nfields : int
+        Number of time steps covering a tidal period (only used if tide is True).
+    chainage : bool
+        Flag indicating whether a chainage line should be used; the region of
+        interest, projection and sedimentation area stages require it.
+    plotting : bool
+        Flag indicating whether figures should be created and saved.
+    timing_file : Optional[str]
+        Name of the JSON timing file written by the analysis.
+    block_size : int
+        Number of faces processed per block (0 to process all faces at once).
+    partitions : int
+        Number of partitions whose faces are interleaved in the map files
+        (0 to store the faces row by row).
+    face_order : Optional[str]
+        Order of the faces in the region of interest ("source", "chainage" or
+        "hilbert"); the default of the analysis is used if None.
+    precision : Optional[str]
+        Precision of the field arrays ("double" or "single"); the default of
+        the analysis is used if None.
+
+    Returns
+    -------
+    case : SyntheticCase
+        The names of the configuration files and the size of the mesh.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    mesh = interleave_partitions(channel_mesh(nfaces), partitions)
+    ntimes = nfields if tide else 1
+    discharges = [1000.0 * (i + 1) for i in range(nconditions)]
+
+    rivers_file = directory / "rivers.ini"
+    write_rivers_file(rivers_file, discharges, tide, mesh.width)
+
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    general = {
+        "Version": "3.0",
+        "Branch": "Synthetic",
+        "Reach": "Channel",
+        "Qthreshold": f"{discharges[0] / 2:.1f}",
+        "Ucrit": "0.3",
+        "OutputDir": "output",
+        "Plotting": str(plotting),
+        "SavePlots": str(plotting),
+        "FigureDir": "figure",
+        "ClosePlots": "True",
+        "Timing": "True",
+    }
+    if timing_file:
+        general["TimingFile"] = timing_file
+    if chainage:
+        write_chainage_file(directory / "chainage.xyc", mesh)
+        general["RiverKM"] = "chainage.xyc"
+    if tide:
+        general["NFields"] = str(nfields)
+    if block_size > 0:
+        general["BlockSize"] = str(block_size)
+    if face_order:
+        general["FaceOrder"] = face_order
+    if precision:
+        general["Precision"] = precision
+    config["General"] = general
+
+    for i, discharge in enumerate(discharges):
+        reference = f"reference-Q{i + 1}_map.nc"
+        intervention = f"intervention-Q{i + 1}_map.nc"
+        write_map_file(directory / reference, mesh, discharge, False, ntimes)
+        write_map_file(directory / intervention, mesh, discharge, True, ntimes)
+        condition = {"Discharge": f"{discharge:.1f}"}
+        if tide:
+            condition["TideBC"] = "0"
+        condition["Reference"] = reference
+        condition["WithIntervention"] = intervention
+        config[f"C{i + 1}"] = condition
+
+    config_file = directory / "synthetic.cfg"
+    with open(config_file, "w") as file:
+        config.write(file)
+    return SyntheticCase(config_file, rivers_file, mesh.nfaces)
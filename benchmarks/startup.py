@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+# packages whose import time is reported separately
+HEAVY_PACKAGES = [
+    "matplotlib",
+    "PyQt5",
+    "fiona",
+    "geopandas",
+    "pandas",
+    "netCDF4",
+    "shapely",
+    "pyproj",
+    "pydantic",
+    "numpy",
+]
+
+# generous budget for the total start-up import time of a batch run [ms]; it's
+# meant to catch heavy libraries sneaking into the start-up, not fluctuations
+BATCH_BUDGET = 2000
+
+
+def parse_import_times(stderr: str) -> Dict[str, int]:
+    """
+    Parse the output of ``python -X importtime``.
+
+    Arguments
+    ---------
+    stderr : str
+        Text written by the interpreter to stderr.
+
+    Returns
+    -------
+    cumulative : Dict[str, int]
+        Cumulative import time in microseconds per module name. Only the first
+        (i.e. actual) import of every module is listed.
+    """
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # header line
+            continue
+        name = fields[2].strip()
+        cumulative.setdefault(name, int(fields[1]))
+    return cumulative
+
+
+def total_import_time(cumulative: Dict[str, int], stderr: str) -> int:
+    """
+    Determine the total import time of all top-level imports.
+
+    Arguments
+    ---------
+    cumulative : Dict[str, int]
+        Cumulative import time in microseconds per module name.
+    stderr : str
+        Text written by the interpreter to stderr.
+
+    Returns
+    -------
+    total : int
+        Total import time in microseconds.
+    """
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        # top-level imports are not indented beyond the single separator space
+        if not fields[2].startswith("  "):
+            total += int(fields[1])
+    return total
+
+
+def measure(arguments: Sequence[str], cwd: Path) -> str:
+    """
+    Run the Python interpreter with import time logging.
+
+    Arguments
+    ---------
+    arguments : Sequence[str]
+        Command line arguments to pass to the interpreter.
+    cwd : Path
+        Working directory of the process.
+
+    Returns
+    -------
+    stderr : str
+        Text written by the interpreter to stderr.
+    """
+    command = [sys.executable, "-X", "importtime", *arguments]
+    result = subprocess.run(
+        command, cwd=cwd, capture_output=True, text=True, check=False
+    )
+    return result.stderr
+
+
+def package_times(cumulative: Dict[str, int]) -> Dict[str, int]:
+    """
+    Select the import times of the heavy third party packages.
+
+    Arguments
+    ---------
+    cumulative : Dict[str, int]
+        Cumulative import time in microseconds per module name.
+
+    Returns
+    -------
+    times : Dict[str, int]
+        Cumulative import time in microseconds per loaded heavy package.
+    """
+    return {name: cumulative[name] for name in HEAVY_PACKAGES if name in cumulative}
+
+
+def run(repeat: int, arguments: List[str]) -> bool:
+    """
+    Measure and report the start-up import times of a batch run.
+
+    The start-up of ``python -m dfastmi --mode BATCH`` is measured for a
+    configuration file that doesn't exist, such that only the start-up costs
+    are included. The import time of ``matplotlib.pyplot`` is measured
+    separately to show the time saved by loading it only when needed.
+
+    Arguments
+    ---------
+    repeat : int
+        Number of measurements; the fastest is reported.
+    arguments : List[str]
+        Additional command line arguments passed to dfastmi.
+
+    Returns
+    -------
+    within_budget : bool
+        True if the fastest total import time doesn't exceed BATCH_BUDGET.
+    """
+    root = Path(__file__).resolve().parent.parent
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = str(Path(tmpdir) / "missing.cfg")
+        dfastmi_args = ["-m", "dfastmi", "--mode", "BATCH", "--config", config]
+        dfastmi_args += arguments
+
+        best_total = None
+        best_cumulative: Dict[str, int] = {}
+        for _ in range(repeat):
+            stderr = measure(dfastmi_args, root)
+            if "Traceback" in stderr:
+                print(stderr.splitlines()[-1], file=sys.stderr)
+                raise SystemExit("The batch run failed to start.")
+            cumulative = parse_import_times(stderr)
+            total = total_import_time(cumulative, stderr)
+            if best_total is None or total < best_total:
+                best_total = total
+                best_cumulative = cumulative
+
+    pyplot_time = min(
+        parse_import_times(
+            measure(["-c", "import numpy; import matplotlib.pyplot"], root)
+        ).get("matplotlib.pyplot", 0)
+        for _ in range(repeat)
+    )
+
+    print("Start-up import time of 'python -m dfastmi --mode BATCH'")
+    print(f"  total                      : {best_total / 1000:10.1f} ms")
+    for name, time in package_times(best_cumulative).items():
+        print(f"  {name:27s}: {time / 1000:10.1f} ms")
+    loaded = "matplotlib.pyplot" in best_cumulative
+    print(f"  matplotlib.pyplot loaded   : {loaded}")
+    if not loaded:
+        print(f"  saved by lazy plotting     : {pyplot_time / 1000:10.1f} ms")
+    within_budget = best_total / 1000 <= BATCH_BUDGET
+    status = "" if within_budget else " (exceeded)"
+    print(f"  budget                     : {BATCH_BUDGET:10.1f} ms{status}")
+    return within_budget
+
+
+def main() -> None:
+    """
+    Parse the command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the start-up import time of D-FAST MI batch runs."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of measurements (%(default)s is default)",
+    )
+    args, remaining = parser.parse_known_args()
+    if not run(args.repeat, remaining):
+        raise SystemExit("The start-up import time exceeds the budget.")
+
+
+if __name__ == "__main__":
+    main()
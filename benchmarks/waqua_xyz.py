@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy
+
+from dfastmi.io.DataTextFileOperations import DataTextFileOperations
+
+# columns read per stage: velocity (with m and n), water depth and velocity
+STAGE_COLUMNS = [(2, 3, 4), (2,), (2,)]
+
+
+def write_export(filename: Path, nlines: int) -> None:
+    """
+    Write a synthetic WAQUA xyz export.
+
+    Arguments
+    ---------
+    filename : Path
+        Name of the file to be written.
+    nlines : int
+        Number of data lines.
+    """
+    rng = numpy.random.default_rng(0)
+    index = numpy.arange(nlines)
+    data = numpy.column_stack(
+        [
+            1.9e5 + rng.random(nlines) * 1e4,
+            4.3e5 + rng.random(nlines) * 1e4,
+            rng.random(nlines) * 3.0,
+            index % 1000 + 1,
+            index // 1000 + 1,
+            index + 1,
+        ]
+    )
+    with open(filename, "w") as file:
+        file.write("x,y,z,m,n,id\n")
+        numpy.savetxt(
+            file,
+            data,
+            fmt=["%15.3f", "%15.3f", "%15.4f", "%6d", "%6d", "%10d"],
+            delimiter=",",
+        )
+
+
+def read_genfromtxt(filenames: List[str]) -> List[numpy.ndarray]:
+    """
+    Read the files of a stage one after another using numpy.genfromtxt.
+
+    Arguments
+    ---------
+    filenames : List[str]
+        Names of the files to be read.
+
+    Returns
+    -------
+    data : List[numpy.ndarray]
+        Data read from each file.
+    """
+    return [
+        numpy.genfromtxt(filename, delimiter=",", skip_header=1, usecols=cols)
+        for filename, cols in zip(filenames, STAGE_COLUMNS)
+    ]
+
+
+def read_sequential(filenames: List[str]) -> List[numpy.ndarray]:
+    """
+    Read the files of a stage one after another using the fast reader.
+
+    Arguments
+    ---------
+    filenames : List[str]
+        Names of the files to be read.
+
+    Returns
+    -------
+    data : List[numpy.ndarray]
+        Data read from each file.
+    """
+    return [
+        DataTextFileOperations.read_waqua_xyz(filename, cols)
+        for filename, cols in zip(filenames, STAGE_COLUMNS)
+    ]
+
+
+def read_concurrent(filenames: List[str]) -> List[numpy.ndarray]:
+    """
+    Read the files of a stage concurrently using the fast reader.
+
+    Arguments
+    ---------
+    filenames : List[str]
+        Names of the files to be read.
+
+    Returns
+    -------
+    data : List[numpy.ndarray]
+        Data read from each file.
+    """
+    return DataTextFileOperations.read_waqua_xyz_files(filenames, STAGE_COLUMNS)
+
+
+def best_time(reader: Callable, filenames: List[str], repeat: int) -> float:
+    """
+    Return the fastest of a number of runs of a reader in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        reader(filenames)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(nlines: int, repeat: int, skip_genfromtxt: bool) -> None:
+    """
+    Measure and report the time to read the three xyz files of one stage.
+
+    Arguments
+    ---------
+    nlines : int
+        Number of data lines per synthetic export.
+    repeat : int
+        Number of measurements; the fastest is reported.
+    skip_genfromtxt : bool
+        Flag indicating whether the slow reference reader should be skipped.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filenames = []
+        for i in range(len(STAGE_COLUMNS)):
+            filename = Path(tmpdir) / f"xyz_export.{i:03d}.Q1.xyz"
+            write_export(filename, nlines)
+            filenames.append(str(filename))
+
+        # load pandas before timing
+        read_sequential(filenames[:1])
+
+        print(f"Reading 3 WAQUA xyz exports of {nlines} lines each")
+        if not skip_genfromtxt:
+            reference = best_time(read_genfromtxt, filenames, repeat)
+            print(f"  numpy.genfromtxt           : {reference:8.2f} s")
+        sequential = best_time(read_sequential, filenames, repeat)
+        print(f"  read_waqua_xyz (sequential): {sequential:8.2f} s")
+        concurrent = best_time(read_concurrent, filenames, repeat)
+        print(f"  read_waqua_xyz_files       : {concurrent:8.2f} s")
+        if not skip_genfromtxt:
+            print(f"  speed-up                   : {reference / concurrent:8.1f} x")
+
+
+def main() -> None:
+    """
+    Parse the command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the time to read synthetic WAQUA xyz exports."
+    )
+    parser.add_argument(
+        "--lines",
+        type=int,
+        default=2_000_000,
+        help="number of data lines per file (%(default)s is default)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="number of measurements (%(default)s is default)",
+    )
+    parser.add_argument(
+        "--skip-genfromtxt",
+        action="store_true",
+        help="don't measure the numpy.genfromtxt reference",
+    )
+    args = parser.parse_args()
+    run(args.lines, args.repeat, args.skip_genfromtxt)
+
+
+if __name__ == "__main__":
+    main()
@@ -32,7 +32,7 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 # ------------------------------------------------------------------------------
 import os
 import pathlib
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 is_nuitka = "__compiled__" in globals()
 if is_nuitka:
@@ -47,24 +47,29 @@ if is_nuitka:
     pyproj.datadir.set_data_dir(root + os.sep + "proj")
     import pyproj
 
-import argparse
+    # modules that are loaded dynamically and would otherwise be missed by
+    # Nuitka; they are only imported by the compiled program such that a
+    # regular Python run doesn't load them before parsing the arguments
+    import _ctypes
+    import cftime
+    import fiona.enums
+    import fiona.ogrext
+    import fiona.schema
+    import netCDF4.utils
+    import pandas._libs.tslibs.base
+    import shapely._geos
+    import six
 
-import _ctypes
-import cftime
-import fiona.enums
-import fiona.ogrext
-import fiona.schema
-import netCDF4.utils
-import pandas._libs.tslibs.base
-import shapely._geos
-import six
+import argparse
 
 import dfastmi.cmd
 
 # ------------------------------------------------------------------------------
 
 
-def parse_arguments() -> Tuple[str, str, Optional[str], str, bool]:
+def parse_arguments() -> (
+    Tuple[str, str, Optional[str], str, bool, bool, List[str], int, bool, Optional[int]]
+):
     """
     Parse the command line arguments.
 
@@ -82,7 +87,7 @@ def parse_arguments() -> Tuple[str, str, Optional[str], str, bool]:
     language : str
         Language identifier ("NL" or "UK").
     runmode : str
-        Specification of the run mode ("BATCH", "CLI" or "GUI")
+        Specification of the run mode ("BATCH", "MULTIBATCH", "SERVER", "CLI" or "GUI")
     config_name : Optional[str]
         Name of the analysis configuration file (optional).
     rivers_file : str
@@ -90,6 +95,18 @@ def parse_arguments() -> Tuple[str, str, Optional[str], str, bool]:
     reduced_output : bool
         Flag to indicate whether WAQUA output should be reduced to the area of
         interest only.
+    cache_xyz : bool
+        Flag to indicate whether parsed WAQUA xyz files may be cached in binary
+        sidecar files.
+    configs : List[str]
+        Names of (or glob patterns for) the analysis configuration files of a
+        multi-case batch run.
+    workers : int
+        Number of worker processes for a multi-case batch run (0 for one per CPU).
+    profile : bool
+        Flag to indicate whether the analysis stages should be profiled.
+    port : Optional[int]
+        Port number on which the analysis server listens in SERVER mode.
     """
     parser = argparse.ArgumentParser(description="D-FAST Morphological Impact.")
 
@@ -103,7 +120,7 @@ def parse_arguments() -> Tuple[str, str, Optional[str], str, bool]:
     parser.add_argument(
         "--mode",
         default="GUI",
-        help="run mode 'BATCH' or 'GUI' (%(default)s is default)",
+        help="run mode 'BATCH', 'MULTIBATCH', 'SERVER' or 'GUI' (%(default)s is default)",
     )
 
     parser.add_argument(
@@ -124,6 +141,41 @@ def parse_arguments() -> Tuple[str, str, Optional[str], str, bool]:
         action="store_true",
     )
     parser.set_defaults(reduced_output=False)
+
+    parser.add_argument(
+        "--cache_xyz",
+        help="cache parsed WAQUA xyz files in binary files next to them",
+        action="store_true",
+    )
+    parser.set_defaults(cache_xyz=False)
+
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        default=[],
+        help="names of (or glob patterns for) analysis configuration files in MULTIBATCH mode",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="number of worker processes in MULTIBATCH mode (0 for one per CPU is default)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        help="profile the analysis stages and write the profiles to the output directory",
+        action="store_true",
+    )
+    parser.set_defaults(profile=False)
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="port number of the analysis server on localhost in SERVER mode (8095 is default)",
+    )
     args = parser.parse_args()
 
     language = args.__dict__["language"].upper()
@@ -131,6 +183,11 @@ def parse_arguments() -> Tuple[str, str, Optional[str], str, bool]:
     config = args.__dict__["config"]
     rivers_file = args.__dict__["rivers"]
     reduced_output = args.__dict__["reduced_output"]
+    cache_xyz = args.__dict__["cache_xyz"]
+    configs = args.__dict__["configs"]
+    workers = args.__dict__["workers"]
+    profile = args.__dict__["profile"]
+    port = args.__dict__["port"]
     if rivers_file == "unspecified":
         if runmode == "CLI":
             rivers_file = "Dutch_rivers_v1.ini"
@@ -141,9 +198,42 @@ def parse_arguments() -> Tuple[str, str, Optional[str], str, bool]:
         raise LookupError(
             f'Incorrect language "{language}" specified. Should read "NL" or "UK".'
         )
-    return language, runmode, config, rivers_file, reduced_output
+    return (
+        language,
+        runmode,
+        config,
+        rivers_file,
+        reduced_output,
+        cache_xyz,
+        configs,
+        workers,
+        profile,
+        port,
+    )
 
 
 if __name__ == "__main__":
-    language, runmode, config, rivers_file, reduced_output = parse_arguments()
-    dfastmi.cmd.run(language, runmode, config, rivers_file, reduced_output)
+    (
+        language,
+        runmode,
+        config,
+        rivers_file,
+        reduced_output,
+        cache_xyz,
+        configs,
+        workers,
+        profile,
+        port,
+    ) = parse_arguments()
+    dfastmi.cmd.run(
+        language,
+        runmode,
+        config,
+        rivers_file,
+        reduced_output,
+        cache_xyz,
+        configs,
+        workers,
+        profile,
+        port,
+    )
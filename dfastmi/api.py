@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import contextlib
+from configparser import ConfigParser
+from dataclasses import dataclass, field
+from io import StringIO
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy
+from packaging.version import Version
+
+from dfastmi.batch.AnalyserDflowfm import AnalyserDflowfm
+from dfastmi.batch.core import get_filenames
+from dfastmi.batch.PlotOptions import PlotOptions
+from dfastmi.batch.ReporterDflowfm import ReporterDflowfm
+from dfastmi.batch.SedimentationData import SedimentationData
+from dfastmi.config.ConfigFileOperations import ConfigFileOperations
+from dfastmi.config.ConfigurationInitializerFactory import (
+    ConfigurationInitializerFactory,
+)
+from dfastmi.io.DFastAnalysisConfigFileParser import DFastAnalysisConfigFileParser
+from dfastmi.io.RiversObject import RiversObject
+
+
+@dataclass
+class Condition:
+    """Class describing one D-Flow FM simulation pair of an analysis."""
+
+    discharge: float
+    """
+    discharge [m3/s] of the condition
+    """
+
+    reference: str
+    """
+    name of the D-Flow FM map or fou file of the reference simulation
+    """
+
+    intervention: str
+    """
+    name of the D-Flow FM map or fou file of the simulation with intervention
+    """
+
+    tide_bc: str = ""
+    """
+    tidal boundary condition; only used if the reach depends on the tide
+    """
+
+
+@dataclass
+class AnalysisResult:
+    """Class for keeping the results of an analysis in memory."""
+
+    success: bool
+    """
+    flag indicating whether the analysis could be carried out
+    """
+
+    log: str = ""
+    """
+    progress and error messages of the analysis
+    """
+
+    nfaces: int = 0
+    """
+    number of faces of the mesh
+    """
+
+    iface: Optional[numpy.ndarray] = None
+    """
+    indices of the faces in the region of interest to which the results apply
+    """
+
+    dzgem: Optional[numpy.ndarray] = None
+    """
+    year-averaged bed level change [m] without dredging
+    """
+
+    dzmax: Optional[numpy.ndarray] = None
+    """
+    maximum bed level change [m]
+    """
+
+    dzmin: Optional[numpy.ndarray] = None
+    """
+    minimum bed level change [m]
+    """
+
+    dzq: List[numpy.ndarray] = field(default_factory=list)
+    """
+    equilibrium bed level change [m] per condition
+    """
+
+    dzb: List[numpy.ndarray] = field(default_factory=list)
+    """
+    bed level change [m] at the beginning of each period
+    """
+
+    sedimentation_data: Optional[SedimentationData] = None
+    """
+    sedimentation and erosion areas and volumes (only if a chainage file is given)
+    """
+
+    def on_mesh(
+        self, values: numpy.ndarray, fill_value: float = numpy.nan
+    ) -> numpy.ndarray:
+        """
+        Expand values in the region of interest to an array for all faces.
+
+        Arguments
+        ---------
+        values : numpy.ndarray
+            Values at the faces in the region of interest, e.g. dzgem.
+        fill_value : float
+            Value assigned to the faces outside the region of interest.
+
+        Returns
+        -------
+        mesh_values : numpy.ndarray
+            Array with one value per face of the mesh.
+        """
+        mesh_values = numpy.full(self.nfaces, fill_value)
+        mesh_values[self.iface] = values
+        return mesh_values
+
+
+def analyse(
+    rivers: RiversObject,
+    branch: str,
+    reach: str,
+    conditions: Sequence[Condition],
+    ucrit: Optional[float] = None,
+    q_threshold: Optional[float] = None,
+    river_km: Optional[str] = None,
+    settings: Optional[Dict[str, str]] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+) -> AnalysisResult:
+    """
+    Analyse D-Flow FM results and return the results in memory.
+
+    Unlike a batch run no report file is written, and the netCDF results and
+    binned sedimentation volumes are only written if an output directory is
+    specified. Figures are never created. The messages that would go to the
+    report and standard out are collected in the log of the result.
+
+    Arguments
+    ---------
+    rivers : RiversObject
+        An object containing the river data.
+    branch : str
+        Name of the branch.
+    reach : str
+        Name of the reach.
+    conditions : Sequence[Condition]
+        The simulation pair per condition.
+    ucrit : Optional[float]
+        Critical flow velocity [m/s] (default from the rivers configuration).
+    q_threshold : Optional[float]
+        Discharge [m3/s] below which the flow doesn't result in morphological
+        changes (default from the rivers configuration).
+    river_km : Optional[str]
+        Name of the chainage file; required for the sedimentation volumes.
+    settings : Optional[Dict[str, str]]
+        Other settings of the [General] block of a configuration file, e.g.
+        "NFields", "Workers" or "Qbankfull".
+    output_dir : Optional[Union[str, Path]]
+        Directory to write the netCDF results and sedimentation volumes to.
+
+    Raises
+    ------
+    LookupError
+        If the branch or reach doesn't exist.
+
+    Returns
+    -------
+    result : AnalysisResult
+        The results of the analysis.
+    """
+    branch_object = rivers.get_branch(branch)
+    if not branch_object:
+        raise LookupError(f'Branch "{branch}" not found.')
+    reach_object = branch_object.get_reach(reach)
+    if not reach_object:
+        raise LookupError(f'Reach "{reach}" not found on branch "{branch}".')
+
+    config = get_configuration(
+        rivers.version, branch, reach, conditions, ucrit, q_threshold, river_km
+    )
+    for key, value in (settings or {}).items():
+        config.set("General", key, str(value))
+    config.set("General", "Plotting", "False")
+
+    outputdir = None
+    if output_dir is not None:
+        outputdir = Path(output_dir)
+        outputdir.mkdir(parents=True, exist_ok=True)
+
+    log = StringIO()
+    with contextlib.redirect_stdout(log):
+        initialized_config = ConfigurationInitializerFactory.generate(
+            rivers.version, reach_object, config
+        )
+        plotting_options = PlotOptions()
+        plotting_options.set_plotting_flags(
+            Path.cwd(), False, DFastAnalysisConfigFileParser(config)
+        )
+        filenames = get_filenames(1, initialized_config.needs_tide, config)
+
+        analyser = AnalyserDflowfm(False, log, False, outputdir, initialized_config)
+        reporter = ReporterDflowfm(False) if outputdir is not None else None
+        report_data = analyser.analyse(
+            reach_object.normal_width,
+            filenames,
+            plotting_options.xykm,
+            plotting_options,
+            block_writer=reporter,
+        )
+        if report_data is None or analyser.missing_data:
+            return AnalysisResult(False, log.getvalue())
+
+        if reporter is not None:
+            reporter.report(outputdir, plotting_options, report_data)
+
+    return AnalysisResult(
+        True,
+        log.getvalue(),
+        nfaces=report_data.face_node_connectivity.shape[0],
+        iface=report_data.xykm_data.iface,
+        dzgem=report_data.dzgemi,
+        dzmax=report_data.dzmaxi,
+        dzmin=report_data.dzmini,
+        dzq=report_data.dzq,
+        dzb=report_data.dzbi,
+        sedimentation_data=report_data.sedimentation_data,
+    )
+
+
+def get_configuration(
+    version: Version,
+    branch: str,
+    reach: str,
+    conditions: Sequence[Condition],
+    ucrit: Optional[float] = None,
+    q_threshold: Optional[float] = None,
+    river_km: Optional[str] = None,
+) -> ConfigParser:
+    """
+    Create the configuration of a D-Flow FM analysis.
+
+    Arguments
+    ---------
+    version : Version
+        Version of the rivers configuration; version 1 configurations support
+        three conditions only.
+    branch : str
+        Name of the branch.
+    reach : str
+        Name of the reach.
+    conditions : Sequence[Condition]
+        The simulation pair per condition.
+    ucrit : Optional[float]
+        Critical flow velocity [m/s].
+    q_threshold : Optional[float]
+        Discharge [m3/s] below which the flow doesn't result in morphological
+        changes.
+    river_km : Optional[str]
+        Name of the chainage file.
+
+    Returns
+    -------
+    config : ConfigParser
+        Configuration equivalent to a configuration file of the same version.
+    """
+    general = {
+        "Version": str(version),
+        "Branch": branch,
+        "Reach": reach,
+        "Mode": "D-Flow FM map",
+    }
+    if ucrit is not None:
+        general["Ucrit"] = str(ucrit)
+    if q_threshold is not None:
+        general["Qthreshold"] = str(q_threshold)
+    if river_km is not None:
+        general["RiverKM"] = str(river_km)
+    sections = {"General": general}
+
+    legacy = version == Version("1")
+    for i, condition in enumerate(conditions):
+        section = {"Discharge": str(condition.discharge)}
+        if condition.tide_bc:
+            section["TideBC"] = condition.tide_bc
+        section["Reference"] = condition.reference
+        if legacy:
+            sections[f"Q{i + 1}"] = section
+            section["WithMeasure"] = condition.intervention
+        else:
+            sections[f"C{i + 1}"] = section
+            section["WithIntervention"] = condition.intervention
+
+    return ConfigFileOperations.load_configuration_dict(sections, str(Path.cwd()))
@@ -56,6 +56,28 @@ class AFileNameRetriever(ABC):
             each reference/with intervention pair.
         """
 
+    def get_variant_file_names(
+        self, config: Optional[configparser.ConfigParser] = None
+    ) -> Dict[str, Dict[Any, Tuple[str, str]]]:
+        """
+        Get the filenames per variant of the intervention.
+
+        Only some configuration file versions support the comparison of
+        multiple variants; by default no variants are returned.
+
+        Arguments
+        ---------
+        config : Optional[configparser.ConfigParser]
+            The variable containing the configuration (may be None for imode = 0).
+
+        Returns
+        -------
+        variant_filenames : Dict[str, Dict[Any, Tuple[str,str]]]
+            Per variant name the file names as returned by get_file_names;
+            empty if the configuration doesn't specify multiple variants.
+        """
+        return {}
+
     def _cfg_get(self, config: configparser.ConfigParser, chap: str, key: str) -> str:
         """
         Get a single entry from the analysis configuration structure.
@@ -87,12 +87,14 @@ def analyse_and_report_dflowfm(
     analyser = AnalyserDflowfm(
         display, report, old_zmin_zmax, outputdir, initialized_config
     )
-    report_data = analyser.analyse(normal_width, filenames, xykm, plotting_options)
+    reporter = ReporterDflowfm(display)
+    report_data = analyser.analyse(
+        normal_width, filenames, xykm, plotting_options, block_writer=reporter
+    )
 
     if analyser.missing_data:
         return True
 
-    reporter = ReporterDflowfm(display)
     reporter.report(outputdir, plotting_options, report_data)
 
     return not analyser.missing_data
@@ -30,6 +30,7 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 from pathlib import Path
 from typing import TextIO
 
+from dfastmi.batch import instrumentation
 from dfastmi.batch.AnalyserWaqua import AnalyserWaqua
 from dfastmi.batch.ReporterWaqua import ReporterWaqua
 from dfastmi.kernel.typehints import BoolVector, Vector
@@ -47,6 +48,7 @@ def analyse_and_report_waqua(
     ucrit: float,
     old_zmin_zmax: bool,
     outputdir: Path,
+    cache_xyz: bool = False,
 ) -> bool:
     """
     Perform analysis based on WAQUA data.
@@ -79,6 +81,9 @@ def analyse_and_report_waqua(
         Specifies the minimum and maximum should follow old or new definition.
     outputdir : Path
         The output directory.
+    cache_xyz : bool
+        Flag indicating whether parsed xyz files may be cached in binary
+        sidecar files (default False).
 
     Returns
     -------
@@ -94,10 +99,12 @@ def analyse_and_report_waqua(
         apply_q,
         ucrit,
         old_zmin_zmax,
+        cache_xyz,
     )
     output_data = waqua.analyse(fraction_of_year, rsigma)
 
     waqua_reporter = ReporterWaqua(outputdir)
-    waqua_reporter.write_report(output_data)
+    with instrumentation.span("write output"):
+        waqua_reporter.write_report(output_data)
 
     return True
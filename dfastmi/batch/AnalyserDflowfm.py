@@ -27,25 +27,91 @@ INFORMATION
 This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
 """
 
+import itertools
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
 import numpy
 from shapely.geometry.linestring import LineString
 
+from dfastmi.batch import instrumentation, progress, sessioncache
 from dfastmi.batch.DflowfmReporters import AnalyserDflowfmReporter
 from dfastmi.batch.Face import face_mean
 from dfastmi.batch.OutputDataDflowfm import OutputDataDflowfm
 from dfastmi.batch.PlotOptions import PlotOptions
+from dfastmi.batch.ReporterDflowfm import ReporterDflowfm
 from dfastmi.batch.SedimentationVolume import comp_sedimentation_volume
 from dfastmi.batch.XykmData import XykmData
-from dfastmi.config.AConfigurationInitializerBase import AConfigurationInitializerBase
+from dfastmi.config.AConfigurationInitializerBase import (
+    PROCESS_POOL,
+    SOURCE_ORDER,
+    AConfigurationInitializerBase,
+)
+from dfastmi.io.DzqCache import DzqCache
 from dfastmi.io.OutputFile import OutputFile
+from dfastmi.io.OutputFileBlock import OutputFileBlock
 from dfastmi.io.OutputFileFactory import OutputFileFactory
+from dfastmi.io.PartitionedMapFile import PartitionedMapFile
+from dfastmi.kernel import precision
 from dfastmi.kernel.core import dzq_from_du_and_h, main_computation
 from dfastmi.kernel.typehints import Vector
 
+# maximum number of time steps of a tidal condition processed at once
+FIELDS_PER_CHUNK = 16
+
+
+@dataclass
+class FlowField:
+    """
+    Flow data of one time step of a condition needed to compute dzq.
+
+    Attributes
+    ----------
+    umag1 : numpy.ndarray
+        Velocity magnitude of the reference simulation.
+    h1 : numpy.ndarray
+        Water depth of the reference simulation.
+    umag2 : numpy.ndarray
+        Velocity magnitude of the simulation with intervention, mapped to the
+        faces of the reference simulation.
+    u1 : Optional[numpy.ndarray]
+        x-velocity of the reference simulation; only kept for tidal conditions.
+    v1 : Optional[numpy.ndarray]
+        y-velocity of the reference simulation; only kept for tidal conditions.
+    """
+
+    umag1: numpy.ndarray
+    h1: numpy.ndarray
+    umag2: numpy.ndarray
+    u1: Optional[numpy.ndarray] = None
+    v1: Optional[numpy.ndarray] = None
+
+
+@dataclass
+class ReferenceField:
+    """
+    Flow data of one time step of the reference simulation of a condition.
+
+    Attributes
+    ----------
+    umag1 : numpy.ndarray
+        Velocity magnitude of the reference simulation.
+    h1 : numpy.ndarray
+        Water depth of the reference simulation.
+    u1 : Optional[numpy.ndarray]
+        x-velocity of the reference simulation; only kept for tidal conditions.
+    v1 : Optional[numpy.ndarray]
+        y-velocity of the reference simulation; only kept for tidal conditions.
+    """
+
+    umag1: numpy.ndarray
+    h1: numpy.ndarray
+    u1: Optional[numpy.ndarray] = None
+    v1: Optional[numpy.ndarray] = None
+
 
 class AnalyserDflowfm:
     """
@@ -66,7 +132,7 @@ class AnalyserDflowfm:
         display: bool,
         report: TextIO,
         old_zmin_zmax: bool,
-        outputdir: Path,
+        outputdir: Optional[Path],
         config: AConfigurationInitializerBase,
     ):
         """
@@ -80,8 +146,8 @@ class AnalyserDflowfm:
             Specifies whether the tidal boundary is needed.
         old_zmin_zmax : bool
             Specifies the minimum and maximum should follow old or new definition.
-        outputdir : Path
-            Path of output directory.
+        outputdir : Optional[Path]
+            Path of output directory; no files are written if None.
         config : AConfigurationInitializerBase
             DTO with discharges, times, etc. for analysis
         """
@@ -97,6 +163,15 @@ class AnalyserDflowfm:
         self._ucrit = config.ucrit
         self._n_fields = config.n_fields
         self._tide_bc = config.tide_bc
+        self._workers = config.workers
+        self._worker_pool = config.worker_pool
+        self._dzq_cache = config.dzq_cache
+        self._dzq_cache_size = config.dzq_cache_size
+        self._region_cache = config.region_cache
+        self._block_size = config.block_size
+        # the blocks are read as contiguous ranges of the faces in source order
+        self._face_order = SOURCE_ORDER if self._block_size > 0 else config.face_order
+        self._precision = config.precision
 
         self._old_zmin_zmax = old_zmin_zmax
         self._outputdir = outputdir
@@ -109,11 +184,17 @@ class AnalyserDflowfm:
         filenames: Dict[Any, Tuple[str, str]],
         xykm: LineString,
         plotting_options: PlotOptions,
+        block_writer: Optional[ReporterDflowfm] = None,
     ) -> OutputDataDflowfm:
         """
         Perform analysis based on D-Flow FM data.
         Read data from D-Flow FM output files and perform analysis.
 
+        If a block size is configured and a block writer is given, the faces
+        are processed in blocks: the results per block are written by the
+        block writer and only the yearly mean bed level change in the region
+        of interest is retained.
+
         Arguments
         ---------
         nwidth : float
@@ -127,6 +208,8 @@ class AnalyserDflowfm:
             Original river chainage line.
         plotting_options : PlotOptions
             Class containing the plot options.
+        block_writer : Optional[ReporterDflowfm]
+            Reporter writing the results block by block.
 
         Returns
         -------
@@ -134,6 +217,24 @@ class AnalyserDflowfm:
             DTO with the data which is needed to create a report.
             None will be returned if data is missing.
         """
+        with precision.policy(self._precision):
+            return self._analyse(
+                nwidth, filenames, xykm, plotting_options, block_writer
+            )
+
+    def _analyse(
+        self,
+        nwidth: float,
+        filenames: Dict[Any, Tuple[str, str]],
+        xykm: LineString,
+        plotting_options: PlotOptions,
+        block_writer: Optional[ReporterDflowfm],
+    ) -> OutputDataDflowfm:
+        """
+        Perform analysis based on D-Flow FM data using the configured precision.
+
+        See analyse for a description of the arguments and return value.
+        """
         rsigma = self._rsigma
         one_fm_filename = self._get_first_fm_data_filename(filenames)
 
@@ -141,47 +242,80 @@ class AnalyserDflowfm:
             return None
 
         self._reporter.report_load_mesh()
-        output_file = OutputFileFactory.generate(one_fm_filename)
-        xn = output_file.node_x_coordinates
-        yn = output_file.node_y_coordinates
-        face_node_connectivity = self._get_face_node_connectivity(output_file)
+        self._reporter.report_progress(progress.LOAD_MESH)
+        with instrumentation.span("load mesh"):
+            xn, yn, face_node_connectivity = sessioncache.get(
+                "mesh",
+                lambda: DzqCache.get_file_identity(one_fm_filename),
+                lambda: self._load_mesh(one_fm_filename),
+            )
 
-        xykm_data = self._get_xykm_data(xykm, xn, yn, face_node_connectivity)
+        self._reporter.report_progress(progress.REGION_OF_INTEREST)
+        xykm_data = sessioncache.get(
+            "region of interest",
+            lambda: (
+                DzqCache.get_file_identity(one_fm_filename),
+                None if xykm is None else xykm.wkb,
+                self._face_order,
+            ),
+            lambda: self._get_xykm_data(xykm, xn, yn, face_node_connectivity),
+        )
 
         if xykm is None and self._needs_tide:
             self._reporter.print_riverkm_needed_for_tidal()
             self._missing_data = True
             return None
 
-        dzq = self._get_dzq(filenames, xykm_data.iface, xykm_data.dxi, xykm_data.dyi)
+        if self._block_size > 0 and block_writer is not None:
+            return self._analyse_blocks(
+                nwidth,
+                filenames,
+                xykm,
+                plotting_options,
+                one_fm_filename,
+                xn,
+                face_node_connectivity,
+                xykm_data,
+                block_writer,
+            )
 
-        if not self._missing_data:
-            self._reporter.report_char_bed_changes()
+        with instrumentation.span("read dzq"):
+            dzq = self._get_dzq(
+                filenames, xykm_data.iface, xykm_data.dxi, xykm_data.dyi
+            )
 
-            dzq = self._determine_dzq(dzq)
-            time_fraction_of_year = self._get_time_fractions_of_the_year()
-            rsigma = self._get_rsigma()
+        if self._missing_data:
+            return None
 
-            # main_computation now returns new pointwise zmin and zmax
+        self._reporter.report_char_bed_changes()
+        self._reporter.report_progress(progress.CHAR_BED_CHANGES)
+
+        dzq = self._determine_dzq(dzq)
+        time_fraction_of_year = self._get_time_fractions_of_the_year()
+        rsigma = self._get_rsigma()
+
+        # main_computation now returns new pointwise zmin and zmax
+        with instrumentation.span("kernel"):
             dzgemi, dzmaxi, dzmini, dzbi = main_computation(
                 dzq, time_fraction_of_year, rsigma
             )
 
-            minimum_bedlevel_value = self._get_minimum_bedlevel_value(dzmini, dzbi)
-            maximum_bedlevel_value = self._get_maximum_bedlevel_value(dzmaxi, dzbi)
-            maximum_bedlevel_messsage = self._get_maximum_bedlevel_message()
-            minimum_bedlevel_message = self._get_minimum_bedlevel_message()
+        minimum_bedlevel_value = self._get_minimum_bedlevel_value(dzmini, dzbi)
+        maximum_bedlevel_value = self._get_maximum_bedlevel_value(dzmaxi, dzbi)
+        maximum_bedlevel_messsage = self._get_maximum_bedlevel_message()
+        minimum_bedlevel_message = self._get_minimum_bedlevel_message()
 
         sedimentation_data = None
         if xykm is not None:
-            sedimentation_data = comp_sedimentation_volume(
-                xykm_data,
-                dzgemi,
-                self._slength,
-                nwidth,
-                self._outputdir,
-                plotting_options,
-            )
+            with instrumentation.span("sedimentation areas"):
+                sedimentation_data = comp_sedimentation_volume(
+                    xykm_data,
+                    dzgemi,
+                    self._slength,
+                    nwidth,
+                    self._outputdir,
+                    plotting_options,
+                )
 
         return OutputDataDflowfm(
             rsigma,
@@ -199,6 +333,324 @@ class AnalyserDflowfm:
             sedimentation_data,
         )
 
+    def _analyse_blocks(
+        self,
+        nwidth: float,
+        filenames: Dict[Any, Tuple[str, str]],
+        xykm: LineString,
+        plotting_options: PlotOptions,
+        one_fm_filename: str,
+        xn: numpy.ndarray,
+        face_node_connectivity: numpy.ndarray,
+        xykm_data: XykmData,
+        block_writer: ReporterDflowfm,
+    ) -> Optional[OutputDataDflowfm]:
+        """
+        Perform the analysis block by block to limit the memory use.
+
+        The flow fields, dzq and the bed level changes are only kept in memory
+        for one block of faces at a time, such that the memory use is bounded
+        by the block size times the number of periods. The results are written
+        per block; only the yearly mean bed level change in the region of
+        interest is retained for the sedimentation volumes and the plots.
+
+        Arguments
+        ---------
+        nwidth : float
+            normal width of the reach.
+        filenames : Dict[Any, Tuple[str,str]]
+            Names of the reference and intervention files per condition.
+        xykm : shapely.geometry.linestring.LineString
+            Original river chainage line.
+        plotting_options : PlotOptions
+            Class containing the plot options.
+        one_fm_filename : str
+            First fm data filename.
+        xn : numpy.ndarray
+            X-coordinates of the mesh nodes.
+        face_node_connectivity : numpy.ndarray
+            Masked M x N array containing the indices of corner nodes per cell.
+        xykm_data : XykmData
+            DTO of the XykmData.
+        block_writer : ReporterDflowfm
+            Reporter writing the results block by block.
+
+        Returns
+        -------
+        Output data : OutputDataDflowfm
+            DTO with the data which is needed to complete the report.
+            None will be returned if data is missing.
+        """
+        iface = xykm_data.iface
+        self._reporter.report_progress(progress.READ_DZQ)
+        with instrumentation.span("read dzq"):
+            dzq_inactive, jobs = self._get_dzq_jobs(filenames, 0)
+            if self._missing_data:
+                return None
+            sources = {
+                i: AnalyserDflowfm._open_dzq_source(job_filenames, iface, self._workers)
+                for i, (job_filenames, _) in jobs.items()
+            }
+
+        self._reporter.report_char_bed_changes()
+        time_fraction_of_year = self._get_time_fractions_of_the_year()
+        rsigma = self._get_rsigma()
+        maximum_bedlevel_messsage = self._get_maximum_bedlevel_message()
+        minimum_bedlevel_message = self._get_minimum_bedlevel_message()
+        keep_dzgemi = xykm is not None or plotting_options.plotting
+
+        block_writer.open_blocks(self._outputdir, one_fm_filename)
+        dzgemi_blocks = []
+        executor = None
+        if self._workers > 1 and len(jobs) > 1:
+            # the blocks are small and the files are shared, so use threads
+            executor = ThreadPoolExecutor(max_workers=min(self._workers, len(jobs)))
+        try:
+            for start in range(0, len(iface), self._block_size):
+                stop = min(start + self._block_size, len(iface))
+                with instrumentation.span("read dzq"):
+                    dzq = self._compute_dzq_block(
+                        dzq_inactive, jobs, sources, xykm_data, start, stop, executor
+                    )
+                dzq = self._determine_dzq(dzq)
+
+                with instrumentation.span("kernel"):
+                    dzgemi, dzmaxi, dzmini, dzbi = main_computation(
+                        dzq, time_fraction_of_year, rsigma
+                    )
+
+                block_data = OutputDataDflowfm(
+                    rsigma,
+                    one_fm_filename,
+                    xn,
+                    face_node_connectivity,
+                    dzq,
+                    dzgemi,
+                    self._get_maximum_bedlevel_value(dzmaxi, dzbi),
+                    self._get_minimum_bedlevel_value(dzmini, dzbi),
+                    dzbi,
+                    maximum_bedlevel_messsage,
+                    minimum_bedlevel_message,
+                    xykm_data,
+                    None,
+                )
+                block_writer.write_block(self._outputdir, iface[start:stop], block_data)
+                if keep_dzgemi:
+                    dzgemi_blocks.append(dzgemi)
+                self._reporter.report_progress(progress.READ_DZQ, stop, len(iface))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self._reporter.report_progress(progress.CHAR_BED_CHANGES)
+
+        dzgemi = None
+        if keep_dzgemi:
+            dzgemi = numpy.concatenate(
+                [numpy.zeros(0, dtype=precision.float_dtype())] + dzgemi_blocks
+            )
+
+        sedimentation_data = None
+        if xykm is not None:
+            with instrumentation.span("sedimentation areas"):
+                sedimentation_data = comp_sedimentation_volume(
+                    xykm_data,
+                    dzgemi,
+                    self._slength,
+                    nwidth,
+                    self._outputdir,
+                    plotting_options,
+                )
+
+        return OutputDataDflowfm(
+            rsigma,
+            one_fm_filename,
+            xn,
+            face_node_connectivity,
+            None,
+            dzgemi,
+            None,
+            None,
+            None,
+            maximum_bedlevel_messsage,
+            minimum_bedlevel_message,
+            xykm_data,
+            sedimentation_data,
+        )
+
+    def _compute_dzq_block(
+        self,
+        dzq_inactive: List[Any],
+        jobs: Dict[int, Tuple[Tuple[str, str], int]],
+        sources: Dict[int, Tuple[OutputFile, OutputFile, Optional[Tuple]]],
+        xykm_data: XykmData,
+        start: int,
+        stop: int,
+        executor: Optional[ThreadPoolExecutor],
+    ) -> List[Any]:
+        """
+        Compute dzq for all conditions for a block of faces.
+
+        Arguments
+        ---------
+        dzq_inactive : List[Any]
+            Values of dzq for the conditions without job: 0 for ignored periods
+            and an empty array for periods in which the intervention is inactive.
+        jobs : Dict[int, Tuple[Tuple[str, str], int]]
+            Names of the files and the number of fields to process per condition.
+        sources : Dict[int, Tuple[OutputFile, OutputFile, Optional[Tuple]]]
+            Opened files and mapping of the faces per condition.
+        xykm_data : XykmData
+            DTO of the XykmData.
+        start : int
+            Index of the first face of the block in the region of interest.
+        stop : int
+            Index beyond the last face of the block in the region of interest.
+        executor : Optional[ThreadPoolExecutor]
+            Pool for processing the conditions concurrently.
+
+        Returns
+        -------
+        dzq : List[Any]
+            Equilibrium bed level change per condition for the faces of the block.
+        """
+        dx = None if xykm_data.dxi is None else xykm_data.dxi[start:stop]
+        dy = None if xykm_data.dyi is None else xykm_data.dyi[start:stop]
+        dzq = [
+            (
+                numpy.zeros(stop - start, dtype=precision.float_dtype())
+                if isinstance(value, numpy.ndarray)
+                else value
+            )
+            for value in dzq_inactive
+        ]
+        arguments = {
+            i: AnalyserDflowfm._get_block_arguments(
+                sources[i], xykm_data.iface, start, stop
+            )
+            + (n_fields, self._ucrit, dx, dy, numpy.arange(stop - start))
+            for i, (_, n_fields) in jobs.items()
+        }
+        if executor is None:
+            for i, args in arguments.items():
+                dzq[i] = AnalyserDflowfm._compute_dzq_fm_mapped(*args)
+        else:
+            futures = {
+                i: executor.submit(AnalyserDflowfm._compute_dzq_fm_mapped, *args)
+                for i, args in arguments.items()
+            }
+            for i, future in futures.items():
+                dzq[i] = future.result()
+        return dzq
+
+    @staticmethod
+    def _generate_output_file(filename: str, workers: int) -> OutputFile:
+        """
+        Open a D-Flow FM output file for reading the flow fields.
+
+        Arguments
+        ---------
+        filename : str
+            Name of the D-Flow FM map or fourier file.
+        workers : int
+            Maximum number of processes reading the partitions of a partitioned run.
+
+        Returns
+        -------
+        output_file : OutputFile
+            The opened file.
+        """
+        output_file = OutputFileFactory.generate(filename)
+        if isinstance(output_file, PartitionedMapFile):
+            output_file.max_workers = workers
+        return output_file
+
+    @staticmethod
+    def _open_dzq_source(
+        filenames: Tuple[str, str], iface: numpy.ndarray, workers: int
+    ) -> Tuple[OutputFile, OutputFile, Optional[Tuple]]:
+        """
+        Open the files of a condition and determine the mapping of the faces.
+
+        Arguments
+        ---------
+        filenames : Tuple[str, str]
+            Names of the reference simulation file and file with the implemented intervention.
+        iface : numpy.ndarray
+            Array containing the subselection of cells.
+        workers : int
+            Maximum number of processes reading the partitions of a partitioned run.
+
+        Returns
+        -------
+        output_file1 : OutputFile
+            Reference simulation file.
+        output_file2 : OutputFile
+            Simulation file with intervention.
+        mapping : Optional[Tuple[bool, numpy.ndarray, numpy.ndarray]]
+            None if both files share the same mesh, otherwise the result of
+            _map_grids with the pairs of matching faces sorted by i1.
+        """
+        output_file1 = AnalyserDflowfm._generate_output_file(filenames[0], workers)
+        output_file2 = AnalyserDflowfm._generate_output_file(filenames[1], workers)
+        if AnalyserDflowfm._meshes_equal(output_file1, output_file2):
+            return output_file1, output_file2, None
+
+        grids_match, i1, i2 = AnalyserDflowfm._map_grids(
+            output_file1, output_file2, iface
+        )
+        order = numpy.argsort(i1)
+        return output_file1, output_file2, (grids_match, i1[order], i2[order])
+
+    @staticmethod
+    def _get_block_arguments(
+        source: Tuple[OutputFile, OutputFile, Optional[Tuple]],
+        iface: numpy.ndarray,
+        start: int,
+        stop: int,
+    ) -> Tuple[OutputFileBlock, OutputFileBlock, bool, numpy.ndarray, numpy.ndarray]:
+        """
+        Return the files and mapping restricted to a block of faces.
+
+        Arguments
+        ---------
+        source : Tuple[OutputFile, OutputFile, Optional[Tuple]]
+            Opened files and mapping of the faces as returned by _open_dzq_source.
+        iface : numpy.ndarray
+            Array containing the subselection of cells.
+        start : int
+            Index of the first face of the block in the region of interest.
+        stop : int
+            Index beyond the last face of the block in the region of interest.
+
+        Returns
+        -------
+        block1 : OutputFileBlock
+            Reference results at the faces of the block.
+        block2 : OutputFileBlock
+            Results with intervention at the faces needed for the block.
+        grids_match : bool
+            Flag indicating whether the faces of block1 and block2 match.
+        i1 : numpy.ndarray
+            Matching indices in block1 (empty if grids_match = True).
+        i2 : numpy.ndarray
+            Matching indices in block2 (empty if grids_match = True).
+        """
+        output_file1, output_file2, mapping = source
+        faces = iface[start:stop]
+        block1 = OutputFileBlock(output_file1, faces)
+        empty = numpy.zeros(0, dtype=numpy.int64)
+        if mapping is None:
+            return block1, OutputFileBlock(output_file2, faces), True, empty, empty
+
+        grids_match, i1, i2 = mapping
+        if grids_match:
+            faces2 = numpy.arange(start, stop)
+            return block1, OutputFileBlock(output_file2, faces2), True, empty, empty
+
+        first, last = numpy.searchsorted(i1, [start, stop])
+        block2 = OutputFileBlock(output_file2, i2[first:last])
+        return block1, block2, False, i1[first:last] - start, numpy.arange(last - first)
+
     def _determine_dzq(self, dzq: numpy.ndarray) -> numpy.ndarray:
         if self._tstag > 0:
             return (dzq[0], 0, dzq[1], dzq[2])
@@ -294,6 +746,35 @@ class AnalyserDflowfm:
                     self._missing_data = True
         return None
 
+    @staticmethod
+    def _load_mesh(
+        filename: str,
+    ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Read the node coordinates and face node connectivity of a mesh.
+
+        Arguments
+        ---------
+        filename : str
+            Name of the D-Flow FM output file.
+
+        Returns
+        -------
+        xn : numpy.ndarray
+            X-coordinates of the mesh nodes.
+        yn : numpy.ndarray
+            Y-coordinates of the mesh nodes.
+        face_node_connectivity : numpy.ndarray
+            Masked array containing the indices of the corner nodes of each face.
+        """
+        output_file = OutputFileFactory.generate(filename)
+        xn = output_file.node_x_coordinates
+        yn = output_file.node_y_coordinates
+        face_node_connectivity = AnalyserDflowfm._get_face_node_connectivity(
+            output_file
+        )
+        return xn, yn, face_node_connectivity
+
     def _get_xykm_data(
         self,
         xykm: LineString,
@@ -302,7 +783,14 @@ class AnalyserDflowfm:
         face_node_connectivity: numpy.ndarray,
     ) -> XykmData:
         xykm_data = XykmData(self._reporter.xykm_data_logger)
-        xykm_data.initialize_data(xykm, xn, yn, face_node_connectivity)
+        xykm_data.initialize_data(
+            xykm,
+            xn,
+            yn,
+            face_node_connectivity,
+            self._face_order,
+            self._region_cache,
+        )
         return xykm_data
 
     def _get_dzq(
@@ -312,19 +800,44 @@ class AnalyserDflowfm:
         dxi: numpy.ndarray,
         dyi: numpy.ndarray,
     ) -> numpy.ndarray:
+        dzq, jobs = self._get_dzq_jobs(filenames, len(iface))
+        self._compute_dzq_for_jobs(jobs, dzq, dxi, dyi, iface)
+        return dzq
+
+    def _get_dzq_jobs(
+        self, filenames: Dict[Any, Tuple[str, str]], nfaces: int
+    ) -> Tuple[List[Any], Dict[int, Tuple[Tuple[str, str], int]]]:
+        """
+        Determine per condition whether and how dzq should be computed.
+
+        Missing files are reported in the order of the conditions.
+
+        Arguments
+        ---------
+        filenames : Dict[Any, Tuple[str,str]]
+            Names of the reference and intervention files per condition.
+        nfaces : int
+            Number of faces for which dzq is determined.
+
+        Returns
+        -------
+        dzq : List[Any]
+            Per condition 0 if the period is ignored, an array of nfaces zeros if
+            the intervention is inactive, and None otherwise.
+        jobs : Dict[int, Tuple[Tuple[str, str], int]]
+            Names of the reference and intervention files and the number of
+            fields to process per condition index for which dzq must be computed.
+        """
         if 2 in filenames.keys():  # the keys are 0,1,2
-            return self._get_dzq_based_on_numbered_keys(filenames, dxi, dyi, iface)
+            return self._get_dzq_jobs_based_on_numbered_keys(filenames, nfaces)
         else:  # the keys are the conditions
-            return self._get_dzq_based_on_conditions_keys(filenames, dxi, dyi, iface)
+            return self._get_dzq_jobs_based_on_conditions_keys(filenames, nfaces)
 
-    def _get_dzq_based_on_numbered_keys(
-        self,
-        filenames: Dict[Any, Tuple[str, str]],
-        dxi: numpy.ndarray,
-        dyi: numpy.ndarray,
-        iface: numpy.ndarray,
-    ) -> numpy.ndarray:
+    def _get_dzq_jobs_based_on_numbered_keys(
+        self, filenames: Dict[Any, Tuple[str, str]], nfaces: int
+    ) -> Tuple[List[Any], Dict[int, Tuple[Tuple[str, str], int]]]:
         dzq = [None] * len(self._discharges)
+        jobs: Dict[int, Tuple[Tuple[str, str], int]] = {}
         for i in range(3):
             if self._discharges[i] is None:
                 # ignore period
@@ -334,23 +847,18 @@ class AnalyserDflowfm:
                 and self._discharges[i] <= self._q_threshold
             ):
                 # intervention inactive, so zero-effect for this period
-                dzq[i] = numpy.zeros_like(iface, dtype=float)
+                dzq[i] = numpy.zeros(nfaces, dtype=precision.float_dtype())
+            elif self._check_files_fm(self._discharges[i], filenames[i]):
+                jobs[i] = (filenames[i], self._n_fields)
             else:
-                dzq[i] = self._get_values_fm(
-                    self._discharges[i], filenames[i], self._n_fields, dxi, dyi, iface
-                )
-                if dzq[i] is None:
-                    self._missing_data = True
-        return dzq
+                self._missing_data = True
+        return dzq, jobs
 
-    def _get_dzq_based_on_conditions_keys(
-        self,
-        filenames: Dict[Any, Tuple[str, str]],
-        dxi: numpy.ndarray,
-        dyi: numpy.ndarray,
-        iface: numpy.ndarray,
-    ) -> numpy.ndarray:
+    def _get_dzq_jobs_based_on_conditions_keys(
+        self, filenames: Dict[Any, Tuple[str, str]], nfaces: int
+    ) -> Tuple[List[Any], Dict[int, Tuple[Tuple[str, str], int]]]:
         dzq = [None] * len(self._discharges)
+        jobs: Dict[int, Tuple[Tuple[str, str], int]] = {}
         for i in range(len(self._discharges)):
             if self._discharges[i] is None:
                 # ignore period
@@ -359,19 +867,106 @@ class AnalyserDflowfm:
                 key, q, t = self._get_condition_key(self._discharges, self._tide_bc, i)
                 if q <= self._q_threshold:
                     # intervention inactive, so zero-effect for this period
-                    dzq[i] = numpy.zeros_like(iface, dtype=float)
+                    dzq[i] = numpy.zeros(nfaces, dtype=precision.float_dtype())
                 elif key in filenames.keys():
                     if t:
                         n_fields_request = self._n_fields
                     else:
                         n_fields_request = 1
-                    dzq[i] = self._get_values_fm(
-                        q, filenames[key], n_fields_request, dxi, dyi, iface
-                    )
+                    if self._check_files_fm(q, filenames[key]):
+                        jobs[i] = (filenames[key], n_fields_request)
                 else:
                     self._reporter.report_missing_calculation_dzq_values(q, t)
                     self._missing_data = True
-        return dzq
+        return dzq, jobs
+
+    def _compute_dzq_for_jobs(
+        self,
+        jobs: Dict[int, Tuple[Tuple[str, str], int]],
+        dzq: List[Any],
+        dxi: numpy.ndarray,
+        dyi: numpy.ndarray,
+        iface: numpy.ndarray,
+    ) -> None:
+        """
+        Compute dzq for the conditions of which the files are available.
+
+        The conditions are processed concurrently if multiple workers are
+        configured. All messages have been reported before, such that the
+        report doesn't depend on the order in which the conditions complete.
+        If enabled, previously computed values are taken from the cache and
+        newly computed values are added to it.
+
+        Arguments
+        ---------
+        jobs : Dict[int, Tuple[Tuple[str, str], int]]
+            Names of the reference and intervention files and the number of
+            fields to process per condition index.
+        dzq : List[Any]
+            List of equilibrium bed level changes per condition; updated in place.
+        dxi : numpy.ndarray
+            Array containing the x-component of the direction vector at each cell.
+        dyi : numpy.ndarray
+            Array containing the y-component of the direction vector at each cell.
+        iface : numpy.ndarray
+            Array containing the subselection of cells.
+        """
+        cache_keys: Dict[int, str] = {}
+        if self._dzq_cache:
+            for i, (filenames, n_fields) in list(jobs.items()):
+                cache_keys[i] = DzqCache.get_cache_key(
+                    filenames, self._ucrit, n_fields, dxi, dyi, iface
+                )
+                cached_dzq = DzqCache.load(cache_keys[i])
+                if cached_dzq is not None:
+                    dzq[i] = cached_dzq
+                    del jobs[i]
+
+        self._reporter.report_progress(progress.READ_DZQ, 0, len(jobs))
+        if self._workers <= 1 or len(jobs) <= 1:
+            for done, (i, (filenames, n_fields)) in enumerate(jobs.items(), start=1):
+                dzq[i] = AnalyserDflowfm._compute_dzq_fm(
+                    filenames, n_fields, self._ucrit, dxi, dyi, iface, self._workers
+                )
+                self._reporter.report_progress(progress.READ_DZQ, done, len(jobs))
+        else:
+            if self._worker_pool == PROCESS_POOL:
+                executor_class = ProcessPoolExecutor
+            else:
+                executor_class = ThreadPoolExecutor
+            pool_arguments = {"max_workers": min(self._workers, len(jobs))}
+            if executor_class is ProcessPoolExecutor:
+                # worker processes don't share the precision of this process
+                pool_arguments["initializer"] = precision.set_precision
+                pool_arguments["initargs"] = (precision.get_precision(),)
+            with executor_class(**pool_arguments) as executor:
+                futures = {
+                    i: executor.submit(
+                        AnalyserDflowfm._compute_dzq_fm,
+                        filenames,
+                        n_fields,
+                        self._ucrit,
+                        dxi,
+                        dyi,
+                        iface,
+                        self._workers,
+                    )
+                    for i, (filenames, n_fields) in jobs.items()
+                }
+                try:
+                    for done, (i, future) in enumerate(futures.items(), start=1):
+                        dzq[i] = future.result()
+                        self._reporter.report_progress(
+                            progress.READ_DZQ, done, len(jobs)
+                        )
+                except progress.AnalysisCancelled:
+                    for future in futures.values():
+                        future.cancel()
+                    raise
+
+        for i in jobs:
+            if i in cache_keys:
+                DzqCache.save(cache_keys[i], dzq[i], self._dzq_cache_size)
 
     def _get_condition_key(self, discharges: Vector, tide_bc: Tuple[str, ...], i: int):
         q = discharges[i]
@@ -383,77 +978,249 @@ class AnalyserDflowfm:
             key = q
         return key, q, t
 
-    def _get_values_fm(
-        self,
-        q: float,
+    def _check_files_fm(self, q: float, filenames: Tuple[str, str]) -> bool:
+        """
+        Check whether the D-Flow FM data files for the specified stage exist.
+
+        Arguments
+        ---------
+        q : float
+            Discharge value.
+        filenames : Tuple[str, str]
+            Names of the reference simulation file and file with the implemented intervention.
+
+        Returns
+        -------
+        available : bool
+            Flag indicating whether both files exist; if not, it's reported.
+        """
+        # reference file
+        if filenames[0] == "":
+            self._reporter.report_file_not_specified(q)
+            return False
+        elif not os.path.isfile(filenames[0]):
+            self._reporter.report_file_not_found(filenames[0])
+            return False
+
+        # file with intervention implemented
+        if not os.path.isfile(filenames[1]):
+            self._reporter.report_file_not_found(filenames[1])
+            return False
+
+        return True
+
+    @staticmethod
+    def _compute_dzq_fm(
         filenames: Tuple[str, str],
         n_fields: int,
+        ucrit: float,
         dx: numpy.ndarray,
         dy: numpy.ndarray,
         iface: numpy.ndarray,
+        workers: int = 1,
     ) -> numpy.ndarray:
         """
         Read D-Flow FM data files for the specified stage, and return dzq.
 
+        This routine doesn't report anything, such that it can run in a worker
+        thread or process.
+
         Arguments
         ---------
-        q : float
-            Discharge value.
-        ucrit : float
-            Critical flow velocity.
         filenames : Tuple[str, str]
             Names of the reference simulation file and file with the implemented intervention.
         n_fields : int
             Number of fields to process (e.g. to cover a tidal period).
+        ucrit : float
+            Critical flow velocity.
         dx : numpy.ndarray
             Array containing the x-component of the direction vector at each cell.
         dy : numpy.ndarray
             Array containing the y-component of the direction vector at each cell.
         iface : numpy.ndarray
             Array containing the subselection of cells.
+        workers : int
+            Maximum number of processes reading the partitions of a partitioned run.
 
         Returns
         -------
         dzq : numpy.ndarray
             Array containing equilibrium bed level change.
         """
-        # reference file
-        if filenames[0] == "":
-            self._reporter.report_file_not_specified(q)
-            return None
-        elif not os.path.isfile(filenames[0]):
-            self._reporter.report_file_not_found(filenames[0])
-            return None
+        output_file1 = AnalyserDflowfm._generate_output_file(filenames[0], workers)
+        output_file2 = AnalyserDflowfm._generate_output_file(filenames[1], workers)
+
+        grids_match, i1, i2 = sessioncache.get(
+            "grid mapping",
+            lambda: (
+                DzqCache.get_file_identity(filenames[0]),
+                DzqCache.get_file_identity(filenames[1]),
+                sessioncache.array_key(iface),
+            ),
+            lambda: AnalyserDflowfm._map_grids(output_file1, output_file2, iface),
+        )
 
-        # file with intervention implemented
-        if not os.path.isfile(filenames[1]):
-            self._reporter.report_file_not_found(filenames[1])
-            return None
+        def read_flow_fields(
+            reference_fields: Optional[Iterable[ReferenceField]],
+        ) -> Iterator[FlowField]:
+            return AnalyserDflowfm._read_flow_fields(
+                output_file1,
+                output_file2,
+                grids_match,
+                i1,
+                i2,
+                n_fields,
+                iface,
+                reference_fields,
+            )
 
-        output_file1 = OutputFileFactory.generate(filenames[0])
-        output_file2 = OutputFileFactory.generate(filenames[1])
+        def get_reference_fields() -> List[ReferenceField]:
+            # keep the reference fields, such that they're read only once for
+            # all interventions compared with the same reference simulation
+            return sessioncache.get(
+                "reference fields",
+                lambda: (
+                    DzqCache.get_file_identity(filenames[0]),
+                    sessioncache.array_key(iface),
+                    n_fields,
+                    precision.get_precision(),
+                ),
+                lambda: list(
+                    AnalyserDflowfm._read_reference_fields(
+                        output_file1, n_fields, iface
+                    )
+                ),
+            )
 
-        grids_match, i1, i2 = self._map_grids(output_file1, output_file2, iface)
+        def read_cached_flow_fields() -> List[FlowField]:
+            return list(read_flow_fields(get_reference_fields()))
 
-        ifld: Optional[int]
-        if n_fields > 1:
-            ustream_pos = numpy.zeros(dx.shape)
-            ustream_neg = numpy.zeros(dx.shape)
-            dzq_pos = numpy.zeros(dx.shape)
-            dzq_neg = numpy.zeros(dx.shape)
-            t_pos = numpy.zeros(dx.shape)
-            t_neg = numpy.zeros(dx.shape)
+        if not sessioncache.is_enabled():
+            flow_fields = read_flow_fields(None)
+        elif not sessioncache.is_cached("flow fields"):
+            # stream the flow fields of e.g. the variants of an intervention,
+            # only the reference fields are kept
+            flow_fields = read_flow_fields(get_reference_fields())
+        else:
+            # keep the flow fields, such that a change of ucrit or Qthreshold
+            # only requires the recomputation of dzq from these fields
+            flow_fields = sessioncache.get(
+                "flow fields",
+                lambda: (
+                    DzqCache.get_file_identity(filenames[0]),
+                    DzqCache.get_file_identity(filenames[1]),
+                    sessioncache.array_key(iface),
+                    n_fields,
+                    precision.get_precision(),
+                ),
+                read_cached_flow_fields,
+            )
 
-        for ifld in range(n_fields):
+        return AnalyserDflowfm._dzq_from_flow_fields(
+            flow_fields, n_fields, ucrit, dx, dy
+        )
+
+    @staticmethod
+    def _compute_dzq_fm_mapped(
+        output_file1: Union[OutputFile, OutputFileBlock],
+        output_file2: Union[OutputFile, OutputFileBlock],
+        grids_match: bool,
+        i1: numpy.ndarray,
+        i2: numpy.ndarray,
+        n_fields: int,
+        ucrit: float,
+        dx: numpy.ndarray,
+        dy: numpy.ndarray,
+        iface: numpy.ndarray,
+    ) -> numpy.ndarray:
+        """
+        Compute dzq from the data of two files of which the faces are mapped.
+
+        Arguments
+        ---------
+        output_file1 : Union[OutputFile, OutputFileBlock]
+            Reference simulation results.
+        output_file2 : Union[OutputFile, OutputFileBlock]
+            Simulation results with intervention.
+        grids_match : bool
+            Flag indicating whether the two grids match.
+        i1 : numpy.ndarray
+            Matching indices in mesh1 (empty if grids_match = True).
+        i2 : numpy.ndarray
+            Matching indices in mesh2 (empty if grids_match = True).
+        n_fields : int
+            Number of fields to process (e.g. to cover a tidal period).
+        ucrit : float
+            Critical flow velocity.
+        dx : numpy.ndarray
+            Array containing the x-component of the direction vector at each cell.
+        dy : numpy.ndarray
+            Array containing the y-component of the direction vector at each cell.
+        iface : numpy.ndarray
+            Array containing the subselection of cells.
+
+        Returns
+        -------
+        dzq : numpy.ndarray
+            Array containing equilibrium bed level change.
+        """
+        flow_fields = AnalyserDflowfm._read_flow_fields(
+            output_file1, output_file2, grids_match, i1, i2, n_fields, iface
+        )
+        return AnalyserDflowfm._dzq_from_flow_fields(
+            flow_fields, n_fields, ucrit, dx, dy
+        )
+
+    @staticmethod
+    def _read_flow_fields(
+        output_file1: Union[OutputFile, OutputFileBlock],
+        output_file2: Union[OutputFile, OutputFileBlock],
+        grids_match: bool,
+        i1: numpy.ndarray,
+        i2: numpy.ndarray,
+        n_fields: int,
+        iface: numpy.ndarray,
+        reference_fields: Optional[Iterable[ReferenceField]] = None,
+    ) -> Iterator[FlowField]:
+        """
+        Read the flow data needed to compute dzq time step by time step.
+
+        Arguments
+        ---------
+        output_file1 : Union[OutputFile, OutputFileBlock]
+            Reference simulation results.
+        output_file2 : Union[OutputFile, OutputFileBlock]
+            Simulation results with intervention.
+        grids_match : bool
+            Flag indicating whether the two grids match.
+        i1 : numpy.ndarray
+            Matching indices in mesh1 (empty if grids_match = True).
+        i2 : numpy.ndarray
+            Matching indices in mesh2 (empty if grids_match = True).
+        n_fields : int
+            Number of fields to process (e.g. to cover a tidal period).
+        iface : numpy.ndarray
+            Array containing the subselection of cells.
+        reference_fields : Optional[Iterable[ReferenceField]]
+            The reference data per time step if read before; read from
+            output_file1 if None.
+
+        Returns
+        -------
+        flow_fields : Iterator[FlowField]
+            The flow data per time step.
+        """
+        if reference_fields is None:
+            reference_fields = AnalyserDflowfm._read_reference_fields(
+                output_file1, n_fields, iface
+            )
+
+        ifld: Optional[int]
+        for ifld, reference_field in zip(range(n_fields), reference_fields):
             # if last time step is needed, pass None to allow for files without time specification
             if n_fields == 1:
                 ifld = None
-
-            # reference data
-            u1 = output_file1.x_velocity(time_index_from_last=ifld)[iface]
-            v1 = output_file1.y_velocity(time_index_from_last=ifld)[iface]
-            umag1 = numpy.sqrt(u1**2 + v1**2)
-            h1 = output_file1.water_depth(time_index_from_last=ifld)[iface]
+            umag1 = reference_field.umag1
 
             # data with intervention
             u2 = output_file2.x_velocity(time_index_from_last=ifld)
@@ -466,39 +1233,175 @@ class AnalyserDflowfm:
                 umag2 = umag1.copy()
                 umag2[i1] = umag_temp
 
-            # compute the equilibrium bed level change
-            dzq2 = dzq_from_du_and_h(umag1, h1, umag2, self._ucrit, default=0.0)
+            yield FlowField(
+                umag1, reference_field.h1, umag2, reference_field.u1, reference_field.v1
+            )
 
-            # in case of tides: determine values for maximum ebb and flood conditions
-            if n_fields > 1:
-                ustream = u1 * dx + v1 * dy
+    @staticmethod
+    def _read_reference_fields(
+        output_file1: Union[OutputFile, OutputFileBlock],
+        n_fields: int,
+        iface: numpy.ndarray,
+    ) -> Iterator[ReferenceField]:
+        """
+        Read the flow data of the reference simulation time step by time step.
 
-                # positive flow -> flow in downstream direction -> biggest flow in positive direction during peak ebb flow
-                ipos = ustream > 0.0
-                t_pos[ipos] = t_pos[ipos] + 1
+        Arguments
+        ---------
+        output_file1 : Union[OutputFile, OutputFileBlock]
+            Reference simulation results.
+        n_fields : int
+            Number of fields to process (e.g. to cover a tidal period).
+        iface : numpy.ndarray
+            Array containing the subselection of cells.
 
-                ipos = ustream > ustream_pos
-                ustream_pos[ipos] = ustream[ipos]
-                dzq_pos[ipos] = dzq2[ipos]
+        Returns
+        -------
+        reference_fields : Iterator[ReferenceField]
+            The reference data per time step.
+        """
+        ifld: Optional[int]
+        for ifld in range(n_fields):
+            # if last time step is needed, pass None to allow for files without time specification
+            if n_fields == 1:
+                ifld = None
 
-                # negative flow -> flow in upstream direction -> biggest flow in negative direction during peak flood flow
-                ineg = ustream < 0.0
-                t_neg[ineg] = t_neg[ineg] + 1
+            u1 = output_file1.x_velocity(time_index_from_last=ifld)[iface]
+            v1 = output_file1.y_velocity(time_index_from_last=ifld)[iface]
+            umag1 = numpy.sqrt(u1**2 + v1**2)
+            h1 = output_file1.water_depth(time_index_from_last=ifld)[iface]
+
+            if n_fields > 1:
+                yield ReferenceField(umag1, h1, u1, v1)
+            else:
+                yield ReferenceField(umag1, h1)
+
+    @staticmethod
+    def _dzq_from_flow_fields(
+        flow_fields: Iterable[FlowField],
+        n_fields: int,
+        ucrit: float,
+        dx: numpy.ndarray,
+        dy: numpy.ndarray,
+    ) -> numpy.ndarray:
+        """
+        Compute dzq from the flow data of a condition.
 
-                ineg = ustream < ustream_neg
-                ustream_neg[ineg] = ustream[ineg]
-                dzq_neg[ineg] = dzq2[ineg]
+        Arguments
+        ---------
+        flow_fields : Iterable[FlowField]
+            The flow data per time step.
+        n_fields : int
+            Number of fields to process (e.g. to cover a tidal period).
+        ucrit : float
+            Critical flow velocity.
+        dx : numpy.ndarray
+            Array containing the x-component of the direction vector at each cell.
+        dy : numpy.ndarray
+            Array containing the y-component of the direction vector at each cell.
 
-        # in case of tides: average over ebb and flood conditions
+        Returns
+        -------
+        dzq : numpy.ndarray
+            Array containing equilibrium bed level change.
+        """
         if n_fields > 1:
-            dzq = (t_pos * dzq_pos + t_neg * dzq_neg) / numpy.maximum(t_pos + t_neg, 1)
-        else:
-            dzq = dzq2
+            return precision.as_float(
+                AnalyserDflowfm._dzq_from_tidal_flow_fields(flow_fields, ucrit, dx, dy)
+            )
 
+        for flow_field in flow_fields:
+            # compute the equilibrium bed level change
+            dzq = dzq_from_du_and_h(
+                flow_field.umag1, flow_field.h1, flow_field.umag2, ucrit, default=0.0
+            )
         return dzq
 
+    @staticmethod
+    def _dzq_from_tidal_flow_fields(
+        flow_fields: Iterable[FlowField],
+        ucrit: float,
+        dx: numpy.ndarray,
+        dy: numpy.ndarray,
+        fields_per_chunk: int = FIELDS_PER_CHUNK,
+    ) -> numpy.ndarray:
+        """
+        Compute dzq for a tidal condition as weighted mean of ebb and flood.
+
+        Per face the dzq values at the peak ebb and peak flood flow are
+        weighted by the number of time steps with flow in downstream and
+        upstream direction. The time steps are processed in chunks: the flow
+        data of a chunk is stacked into (fields x faces) arrays, such that the
+        counts and the peaks follow from reductions over the first axis
+        instead of masked updates per time step.
+
+        Arguments
+        ---------
+        flow_fields : Iterable[FlowField]
+            The flow data per time step.
+        ucrit : float
+            Critical flow velocity.
+        dx : numpy.ndarray
+            Array containing the x-component of the direction vector at each cell.
+        dy : numpy.ndarray
+            Array containing the y-component of the direction vector at each cell.
+        fields_per_chunk : int
+            Maximum number of time steps stacked at once; limits the memory use.
+
+        Returns
+        -------
+        dzq : numpy.ndarray
+            Array containing equilibrium bed level change.
+        """
+        ustream_pos = numpy.zeros(dx.shape)
+        ustream_neg = numpy.zeros(dx.shape)
+        dzq_pos = numpy.zeros(dx.shape)
+        dzq_neg = numpy.zeros(dx.shape)
+        t_pos = numpy.zeros(dx.shape)
+        t_neg = numpy.zeros(dx.shape)
+
+        flow_fields = iter(flow_fields)
+        while True:
+            chunk = list(itertools.islice(flow_fields, fields_per_chunk))
+            if not chunk:
+                break
+
+            dzq2 = dzq_from_du_and_h(
+                numpy.stack([flow_field.umag1 for flow_field in chunk]),
+                numpy.stack([flow_field.h1 for flow_field in chunk]),
+                numpy.stack([flow_field.umag2 for flow_field in chunk]),
+                ucrit,
+                default=0.0,
+            )
+            ustream = (
+                numpy.stack([flow_field.u1 for flow_field in chunk]) * dx
+                + numpy.stack([flow_field.v1 for flow_field in chunk]) * dy
+            )
+            # undefined velocities never count nor become the peak
+            ustream[numpy.isnan(ustream)] = 0.0
+
+            # positive flow -> flow in downstream direction -> biggest flow in positive direction during peak ebb flow
+            t_pos += numpy.count_nonzero(ustream > 0.0, axis=0)
+            ipeak = numpy.argmax(ustream, axis=0)[numpy.newaxis, :]
+            upeak = numpy.take_along_axis(ustream, ipeak, axis=0)[0]
+            # the earliest peak is kept, as with a time step by time step update
+            ipos = upeak > ustream_pos
+            ustream_pos[ipos] = upeak[ipos]
+            dzq_pos[ipos] = numpy.take_along_axis(dzq2, ipeak, axis=0)[0][ipos]
+
+            # negative flow -> flow in upstream direction -> biggest flow in negative direction during peak flood flow
+            t_neg += numpy.count_nonzero(ustream < 0.0, axis=0)
+            ipeak = numpy.argmin(ustream, axis=0)[numpy.newaxis, :]
+            upeak = numpy.take_along_axis(ustream, ipeak, axis=0)[0]
+            ineg = upeak < ustream_neg
+            ustream_neg[ineg] = upeak[ineg]
+            dzq_neg[ineg] = numpy.take_along_axis(dzq2, ipeak, axis=0)[0][ineg]
+
+        # average over ebb and flood conditions
+        return (t_pos * dzq_pos + t_neg * dzq_neg) / numpy.maximum(t_pos + t_neg, 1)
+
+    @staticmethod
     def _map_grids(
-        self,
         output_file1: OutputFile,
         output_file2: OutputFile,
         iface: numpy.ndarray,
@@ -526,18 +1429,29 @@ class AnalyserDflowfm:
         """
         xn1 = output_file1.node_x_coordinates
         yn1 = output_file1.node_y_coordinates
-        FNC1 = self._get_face_node_connectivity(output_file1)[iface]
+        FNC1_all = AnalyserDflowfm._get_face_node_connectivity(output_file1)
 
         xn2 = output_file2.node_x_coordinates
         yn2 = output_file2.node_y_coordinates
-        FNC2 = self._get_face_node_connectivity(output_file2)
+        FNC2 = AnalyserDflowfm._get_face_node_connectivity(output_file2)
 
-        grids_match = (
-            numpy.array_equal(FNC1, FNC2)
-            and numpy.array_equal(xn1, xn2)
-            and numpy.array_equal(yn1, yn2)
-        )
+        nodes_equal = numpy.array_equal(xn1, xn2) and numpy.array_equal(yn1, yn2)
+        if nodes_equal and numpy.array_equal(FNC1_all, FNC2):
+            # same mesh; compared without copying the selected faces
+            grids_match = numpy.array_equal(
+                iface, numpy.arange(FNC1_all.shape[0], dtype=iface.dtype)
+            )
+            if grids_match:
+                i1 = numpy.zeros(0)
+                i2 = numpy.zeros(0)
+            else:
+                # only a subselection or reordering of the faces
+                i1 = numpy.arange(len(iface), dtype=precision.index_dtype(len(iface)))
+                i2 = numpy.asarray(iface)
+            return grids_match, i1, i2
 
+        FNC1 = FNC1_all[iface]
+        grids_match = nodes_equal and numpy.array_equal(FNC1, FNC2)
         if grids_match:
             i1 = numpy.zeros(0)
             i2 = numpy.zeros(0)
@@ -548,7 +1462,38 @@ class AnalyserDflowfm:
 
         return grids_match, i1, i2
 
-    def _get_face_node_connectivity(self, output_file: OutputFile) -> numpy.ndarray:
+    @staticmethod
+    def _meshes_equal(output_file1: OutputFile, output_file2: OutputFile) -> bool:
+        """
+        Check whether two output files share the same mesh.
+
+        Arguments
+        ---------
+        output_file1 : OutputFile
+            Reference simulation file.
+        output_file2 : OutputFile
+            Simulation file with intervention.
+
+        Returns
+        -------
+        equal : bool
+            Flag indicating whether the nodes and faces of both meshes are equal.
+        """
+        return (
+            numpy.array_equal(
+                output_file1.node_x_coordinates, output_file2.node_x_coordinates
+            )
+            and numpy.array_equal(
+                output_file1.node_y_coordinates, output_file2.node_y_coordinates
+            )
+            and numpy.array_equal(
+                AnalyserDflowfm._get_face_node_connectivity(output_file1),
+                AnalyserDflowfm._get_face_node_connectivity(output_file2),
+            )
+        )
+
+    @staticmethod
+    def _get_face_node_connectivity(output_file: OutputFile) -> numpy.ndarray:
         face_node_connectivity = output_file.face_node_connectivity
 
         if face_node_connectivity.mask.shape == ():
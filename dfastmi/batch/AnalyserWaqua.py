@@ -33,6 +33,7 @@ from typing import List, Optional, TextIO, Tuple, Union
 import numpy
 
 import dfastmi.kernel.core
+from dfastmi.batch import instrumentation
 from dfastmi.batch.OutputDataWaqua import OutputDataWaqua
 from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
 from dfastmi.io.DataTextFileOperations import DataTextFileOperations
@@ -107,6 +108,7 @@ class AnalyserWaqua:
         apply_q,
         ucrit,
         old_zmin_zmax,
+        cache_xyz=False,
     ):
         """
         Init of the analyser.
@@ -130,6 +132,9 @@ class AnalyserWaqua:
             Critical flow velocity [m/s].
         old_zmin_zmax : bool
             Specifies the minimum and maximum should follow old or new definition.
+        cache_xyz : bool
+            Flag indicating whether parsed xyz files may be cached in binary
+            sidecar files (default False).
         """
         self._logger = _WaquaLogger(display, report)
         self.reduced_output = reduced_output
@@ -138,6 +143,7 @@ class AnalyserWaqua:
         self.apply_q = apply_q
         self.ucrit = ucrit
         self.old_zmin_zmax = old_zmin_zmax
+        self.cache_xyz = cache_xyz
 
     def analyse(self, fraction_of_year: Vector, rsigma: Vector) -> OutputDataWaqua:
         """
@@ -155,7 +161,8 @@ class AnalyserWaqua:
         output_data : OutputDataWaqua
             data used to generate a report.
         """
-        dzq, first_min_velocity_m, first_min_velocity_n = self._process_files()
+        with instrumentation.span("read dzq"):
+            dzq, first_min_velocity_m, first_min_velocity_n = self._process_files()
         output_data = self._calculate_output_data(
             fraction_of_year, rsigma, dzq, first_min_velocity_m, first_min_velocity_n
         )
@@ -249,9 +256,9 @@ class AnalyserWaqua:
     ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
         self._logger.log_input_stage(stage)
 
-        u0temp = DataTextFileOperations.read_waqua_xyz(files[0], cols=(2, 3, 4))
-        h0temp = DataTextFileOperations.read_waqua_xyz(files[1])
-        u1temp = DataTextFileOperations.read_waqua_xyz(files[2])
+        u0temp, h0temp, u1temp = DataTextFileOperations.read_waqua_xyz_files(
+            files, [(2, 3, 4), (2,), (2,)], use_cache=self.cache_xyz
+        )
 
         return u0temp, h0temp, u1temp
 
@@ -328,9 +335,10 @@ class AnalyserWaqua:
             rsigma = (rsigma[0], 1.0, rsigma[1], rsigma[2])
 
         # main_computation now returns new pointwise zmin and zmax
-        data_zgem, data_zmax, data_zmin, dzb = dfastmi.kernel.core.main_computation(
-            dzq, fraction_of_year, rsigma
-        )
+        with instrumentation.span("kernel"):
+            data_zgem, data_zmax, data_zmin, dzb = dfastmi.kernel.core.main_computation(
+                dzq, fraction_of_year, rsigma
+            )
 
         if self.old_zmin_zmax:
             # get old zmax and zmin
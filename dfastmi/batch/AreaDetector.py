@@ -32,6 +32,8 @@ from typing import Tuple
 
 import numpy
 
+from dfastmi.kernel import precision
+
 
 @dataclass
 class AreaData:
@@ -372,7 +374,9 @@ class AreaDetector:
         nregions : int
             Number of regions detected.
         """
-        partition = -numpy.ones(fcondition.shape[0], dtype=numpy.int64)
+        partition = -numpy.ones(
+            fcondition.shape[0], dtype=precision.index_dtype(fcondition.shape[0])
+        )
 
         ncells = fcondition.sum()
         partition[fcondition] = numpy.arange(ncells)
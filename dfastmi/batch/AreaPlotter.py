@@ -27,18 +27,22 @@ INFORMATION
 This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
 """
 
+from __future__ import annotations
+
 from abc import ABC
-from typing import List
+from typing import TYPE_CHECKING, List
 
 import numpy
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 
 import dfastmi.batch.plotting
 import dfastmi.kernel.core
 from dfastmi.batch.AreaDetector import AreaData
 from dfastmi.batch.PlotOptions import PlotOptions
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class AreaPlotter(ABC):
     """
@@ -29,6 +29,7 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 
 from typing import TextIO
 
+from dfastmi.batch import progress
 from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
 
 
@@ -95,6 +96,12 @@ class AnalyserDflowfmReporter:
         self.report = report
         self.xykm_data_logger = XykmDataReporter(display)
 
+    def report_progress(self, stage: str, done: int = 0, total: int = 1):
+        """
+        Notify the progress listener and stop if cancellation was requested.
+        """
+        progress.report_stage(stage, done, total)
+
     def report_char_bed_changes(self):
         if self.display:
             ApplicationSettingsHelper.log_text("char_bed_changes")
@@ -160,6 +167,12 @@ class ReporterDflowfmReporter:
         """
         self.display = display
 
+    def report_progress(self, stage: str, done: int = 0, total: int = 1):
+        """
+        Notify the progress listener and stop if cancellation was requested.
+        """
+        progress.report_stage(stage, done, total)
+
     def report_compute_initial_year_dredging(self):
         if self.display:
             ApplicationSettingsHelper.log_text("compute_initial_year_dredging")
@@ -29,6 +29,8 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 
 import numpy
 
+from dfastmi.kernel import precision
+
 
 def face_all(bn: numpy.ndarray, face_node_connectivity: numpy.ndarray) -> numpy.ndarray:
     if face_node_connectivity.mask.shape == ():
@@ -99,16 +101,16 @@ def filter_faces_by_face_condition(
     inode : numpy.ndarray
         Array of length K2 containing the indices of the nodes to keep [-].
     """
-    iface = numpy.nonzero(condition)[0]
+    iface = precision.as_index(numpy.nonzero(condition)[0], len(condition))
     face_node_connectivity_index = face_node_connectivity[iface]
-    inode = numpy.unique(face_node_connectivity_index.flatten())
+    inode = _used_nodes(face_node_connectivity_index, len(xn))
     if len(inode) == 0:
         inode_max = 0
     else:
         inode_max = inode.max()
 
     face_node_connectivity_index.data[face_node_connectivity_index.mask] = 0
-    renum = numpy.zeros(inode_max + 1, dtype=numpy.int64)
+    renum = numpy.zeros(inode_max + 1, dtype=precision.index_dtype(len(inode)))
     renum[inode] = range(len(inode))
     renumbered_face_node_connectivity = numpy.ma.masked_array(
         renum[face_node_connectivity_index], mask=face_node_connectivity_index.mask
@@ -117,6 +119,40 @@ def filter_faces_by_face_condition(
     return xn[inode], yn[inode], renumbered_face_node_connectivity, iface, inode
 
 
+def _used_nodes(
+    face_node_connectivity: numpy.ma.masked_array, nnodes: int
+) -> numpy.ndarray:
+    """
+    Determine the sorted indices of the nodes used by the faces.
+
+    This gives the same result as numpy.unique applied to the masked array,
+    including a trailing masked entry if any entry is masked, but it marks
+    the used nodes instead of sorting all entries to limit the memory use.
+
+    Arguments
+    ---------
+    face_node_connectivity : numpy.ma.masked_array
+        Masked M x N array containing the indices of (max N) corner nodes for each of the M cells [-].
+    nnodes : int
+        Number of nodes K of the mesh.
+
+    Returns
+    -------
+    inode : numpy.ndarray
+        Array of length K2 <= K + 1 containing the indices of the nodes used [-].
+    """
+    mask = numpy.ma.getmaskarray(face_node_connectivity)
+    data = numpy.ma.getdata(face_node_connectivity)
+    used = numpy.zeros(nnodes, dtype=bool)
+    used[data[~mask]] = True
+    inode = numpy.flatnonzero(used).astype(face_node_connectivity.dtype, copy=False)
+    if not mask.any():
+        return numpy.ma.masked_array(inode)
+    inode_mask = numpy.zeros(len(inode) + 1, dtype=bool)
+    inode_mask[-1] = True
+    return numpy.ma.masked_array(numpy.append(inode, data[mask][0]), mask=inode_mask)
+
+
 def filter_faces_by_node_condition(
     xn: numpy.ndarray,
     yn: numpy.ndarray,
@@ -159,6 +195,108 @@ def filter_faces_by_node_condition(
     return rxn, ryn, renumbered_face_node_connectivity, iface, inode
 
 
+def hilbert_index(x: numpy.ndarray, y: numpy.ndarray, order: int = 16) -> numpy.ndarray:
+    """
+    Determine the position of points along a Hilbert curve covering their bounding box.
+
+    Arguments
+    ---------
+    x : numpy.ndarray
+        Array of length M containing the x-coordinates of the points [m or deg east].
+    y : numpy.ndarray
+        Array of length M containing the y-coordinates of the points [m or deg north].
+    order : int
+        Order of the curve; the bounding box is divided into 2**order by 2**order cells.
+
+    Returns
+    -------
+    d : numpy.ndarray
+        Array of length M containing the index of the points along the curve [-].
+    """
+    n = 2**order
+    d = numpy.zeros(len(x), dtype=numpy.int64)
+    if len(x) == 0:
+        return d
+
+    def scale(v: numpy.ndarray) -> numpy.ndarray:
+        vmin = v.min()
+        vrange = v.max() - vmin
+        if vrange == 0:
+            return numpy.zeros(len(v), dtype=numpy.int64)
+        return numpy.minimum((v - vmin) / vrange * n, n - 1).astype(numpy.int64)
+
+    xi = scale(numpy.asarray(x, dtype=numpy.float64))
+    yi = scale(numpy.asarray(y, dtype=numpy.float64))
+    s = n // 2
+    while s > 0:
+        rx = (xi & s) > 0
+        ry = (yi & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # rotate the quadrant such that the curve continues in the next level
+        flip = ~ry & rx
+        xi = numpy.where(flip, n - 1 - xi, xi)
+        yi = numpy.where(flip, n - 1 - yi, yi)
+        xi, yi = numpy.where(ry, xi, yi), numpy.where(ry, yi, xi)
+        s //= 2
+
+    return d
+
+
+def reorder_faces(
+    face_node_connectivity: numpy.ma.masked_array, key: numpy.ndarray, nnodes: int
+) -> [numpy.ma.masked_array, numpy.ndarray, numpy.ndarray]:
+    """
+    Renumber the faces in increasing order of the key and the nodes in order of first use.
+
+    Nodes that aren't used by any cell are placed after the used nodes.
+
+    Arguments
+    ---------
+    face_node_connectivity : numpy.ma.masked_array
+        Masked M x N array containing the indices of (max N) corner nodes for each of the M cells [-].
+        Node indices are 0-based, hence the maximum node index is K-1.
+    key : numpy.ndarray
+        Array of length M containing the sort key of the cells.
+    nnodes : int
+        Number of nodes K.
+
+    Results
+    -------
+    renumbered_face_node_connectivity : numpy.ma.masked_array
+        Masked M x N array containing the renumbered corner nodes of the reordered cells [-].
+    face_order : numpy.ndarray
+        Array of length M containing the original index of each reordered cell [-].
+    node_order : numpy.ndarray
+        Array of length K containing the original index of each renumbered node [-].
+    """
+    face_order = precision.as_index(
+        numpy.argsort(numpy.ma.getdata(key), kind="stable"), len(key)
+    )
+    face_node_connectivity_data = face_node_connectivity.data[face_order]
+    mask = face_node_connectivity.mask
+    if mask.shape == ():
+        used = face_node_connectivity_data.flatten()
+    else:
+        mask = mask[face_order]
+        used = face_node_connectivity_data[~mask]
+        face_node_connectivity_data[mask] = 0
+
+    nodes, first_use = numpy.unique(used, return_index=True)
+    unused = numpy.ones(nnodes, dtype=bool)
+    unused[nodes] = False
+    node_order = precision.as_index(
+        numpy.concatenate((nodes[numpy.argsort(first_use)], numpy.nonzero(unused)[0])),
+        nnodes,
+    )
+    renum = numpy.zeros(nnodes, dtype=node_order.dtype)
+    renum[node_order] = range(nnodes)
+    renumbered_face_node_connectivity = numpy.ma.masked_array(
+        renum[face_node_connectivity_data], mask=mask
+    )
+
+    return renumbered_face_node_connectivity, face_order, node_order
+
+
 def count_nodes(face_node_connectivity: numpy.ndarray) -> numpy.ndarray:
     if face_node_connectivity.mask.shape == ():
         # all faces have the same number of nodes
@@ -194,7 +332,7 @@ def facenode_to_edgeface(face_node_connectivity: numpy.ndarray) -> numpy.ndarray
     nnodes = count_nodes(face_node_connectivity)  # nedges equals to nnodes
     tot_nedges = nnodes.sum()
 
-    edges = numpy.zeros((tot_nedges, 2), dtype=numpy.int64)
+    edges = numpy.zeros((tot_nedges, 2), dtype=face_node_connectivity.dtype)
     ie = 0
     for i in range(nfaces):
         nni = nnodes[i]
@@ -212,7 +350,7 @@ def facenode_to_edgeface(face_node_connectivity: numpy.ndarray) -> numpy.ndarray
     edges, iedge = numpy.unique(edges, axis=0, return_inverse=True)
     nedges = edges.shape[0]
 
-    EFC = -numpy.ones((nedges, 2), dtype=numpy.int64)
+    EFC = -numpy.ones((nedges, 2), dtype=precision.index_dtype(nfaces))
     ie = 0
     for i in range(nfaces):
         nni = nnodes[i]
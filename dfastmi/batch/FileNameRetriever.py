@@ -28,9 +28,13 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 """
 
 import configparser
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from dfastmi.batch.AFileNameRetriever import AFileNameRetriever
+from dfastmi.config.ConfigFileOperations import VARIANT_PREFIX
+
+# name of the variant specified by the WithIntervention key
+DEFAULT_VARIANT = "default"
 
 
 class FileNameRetriever(AFileNameRetriever):
@@ -69,14 +73,76 @@ class FileNameRetriever(AFileNameRetriever):
             can be the discharge index, discharge value or a tuple of forcing
             conditions, such as a Discharge and Tide forcing tuple.
         """
+        return self._get_file_names_for_key(config, "WithIntervention")
+
+    def get_variant_file_names(
+        self, config: Optional[configparser.ConfigParser] = None
+    ) -> Dict[str, Dict[Any, Tuple[str, str]]]:
+        """
+        Extract the file names per variant of the intervention.
+
+        The variants are specified per condition by WithIntervention.<name>
+        keys, e.g. WithIntervention.A; if the WithIntervention key is also
+        specified, it's included as the first variant named "default". Every
+        variant is compared with the same reference simulations.
+
+        Arguments
+        ---------
+        config : Optional[configparser.ConfigParser]
+            The variable containing the configuration.
+
+        Raises
+        ------
+        KeyError
+            If a variant isn't specified for every condition.
+
+        Returns
+        -------
+        variant_filenames : Dict[str, Dict[Any, Tuple[str,str]]]
+            Per variant name the file names as returned by get_file_names;
+            empty if the configuration doesn't specify any variant.
+        """
+        sections = self._get_condition_sections(config)
+        variant_keys: Dict[str, str] = {}
+        for section in sections:
+            for option in config.options(section):
+                name = option[len(VARIANT_PREFIX) :]
+                if option.lower().startswith(VARIANT_PREFIX.lower()) and name:
+                    variant_keys.setdefault(name, VARIANT_PREFIX + name)
+        if len(variant_keys) == 0:
+            return {}
+
+        if any(config.has_option(section, "WithIntervention") for section in sections):
+            variant_keys = {DEFAULT_VARIANT: "WithIntervention", **variant_keys}
+        return {
+            name: self._get_file_names_for_key(config, key)
+            for name, key in variant_keys.items()
+        }
+
+    def _get_file_names_for_key(
+        self, config: configparser.ConfigParser, intervention_key: str
+    ) -> Dict[Any, Tuple[str, str]]:
+        """
+        Extract the reference file and the file specified by the given key.
+
+        Arguments
+        ---------
+        config : configparser.ConfigParser
+            The variable containing the configuration.
+        intervention_key : str
+            The key specifying the name of the file with intervention.
+
+        Returns
+        -------
+        filenames : Dict[Any, Tuple[str,str]]
+            Dictionary of string tuples representing the D-Flow FM file names
+            for each reference/with intervention pair.
+        """
         filenames: Dict[Any, Tuple[str, str]]
         key: Union[Tuple[float, int], float]
 
         filenames = {}
-        for section in config.sections():
-            if section[0].lower() != "c":
-                continue
-
+        for section in self._get_condition_sections(config):
             q_string = self._cfg_get(config, section, "Discharge")
 
             try:
@@ -87,7 +153,7 @@ class FileNameRetriever(AFileNameRetriever):
                 ) from exc
 
             reference = self._cfg_get(config, section, "Reference")
-            intervention = self._cfg_get(config, section, "WithIntervention")
+            intervention = self._cfg_get(config, section, intervention_key)
             if self.needs_tide:
                 T = self._cfg_get(config, section, "TideBC")
                 key = (Q, T)
@@ -96,3 +162,10 @@ class FileNameRetriever(AFileNameRetriever):
             filenames[key] = (reference, intervention)
 
         return filenames
+
+    @staticmethod
+    def _get_condition_sections(config: configparser.ConfigParser) -> List[str]:
+        """
+        Return the names of the blocks specifying the conditions.
+        """
+        return [section for section in config.sections() if section[0].lower() == "c"]
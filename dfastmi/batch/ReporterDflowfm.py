@@ -28,14 +28,21 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 """
 
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 import netCDF4
 import numpy
 
+from dfastmi.batch import instrumentation, progress
 from dfastmi.batch.DflowfmReporters import ReporterDflowfmReporter
 from dfastmi.batch.OutputDataDflowfm import OutputDataDflowfm
 from dfastmi.batch.PlotOptions import PlotOptions
-from dfastmi.batch.plotting import plot_overview, savefig, zoom_xy_and_save
+from dfastmi.batch.plotting import (
+    plot_overview,
+    run_in_figure_thread,
+    savefig,
+    zoom_xy_and_save,
+)
 from dfastmi.batch.SedimentationData import SedimentationData
 from dfastmi.batch.XykmData import XykmData
 from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
@@ -56,6 +63,61 @@ class ReporterDflowfm:
             Flag indicating text output to stdout.
         """
         self._reporter = ReporterDflowfmReporter(display)
+        self._block_file: Optional[OutputFile] = None
+
+    def open_blocks(self, outputdir: Path, one_fm_filename: str) -> None:
+        """
+        Prepare the netCDF UGRID files for writing the results block by block.
+
+        Arguments
+        ---------
+        outputdir : Path
+            Path of output directory.
+        one_fm_filename : str
+            Name of the D-Flow FM file of which the mesh is copied.
+        """
+        self._reporter.report_writing_output()
+        with instrumentation.span("write netCDF"):
+            self._block_file = OutputFileFactory.generate(one_fm_filename)
+            self._block_file.copy_ugrid(self._get_netcdf_file(outputdir))
+            self._block_file.copy_ugrid(self._get_projected_mesh_file(outputdir))
+
+    def write_block(
+        self,
+        outputdir: Path,
+        faces: numpy.ndarray,
+        report_data: OutputDataDflowfm,
+    ) -> None:
+        """
+        Write the results for a block of faces to the netCDF UGRID files.
+
+        Arguments
+        ---------
+        outputdir : Path
+            Path of output directory.
+        faces : numpy.ndarray
+            Sorted indices of the faces of the block.
+        report_data : OutputDataDflowfm
+            DTO with the results for the faces of the block.
+        """
+        meshname = self._block_file.mesh2d_name
+        facedim = self._block_file.face_dimension_name
+        with instrumentation.span("write netCDF"):
+            dst_map_file = MapFile(self._get_netcdf_file(outputdir))
+            for name, values, long_name in self._get_face_variables(report_data):
+                dst_map_file.add_variable_block(
+                    name, faces, values, meshname, facedim, long_name, "m"
+                )
+            projmesh_map_file = MapFile(self._get_projected_mesh_file(outputdir))
+            projmesh_map_file.add_variable_block(
+                "avgdzb",
+                faces,
+                report_data.dzgemi,
+                meshname,
+                facedim,
+                "year-averaged bed level change without dredging",
+                "m",
+            )
 
     def report(
         self,
@@ -66,6 +128,9 @@ class ReporterDflowfm:
         """
         write report data to a netCDF UGRID file similar to D-Flow FM.
 
+        If the results have been written block by block, only the remaining
+        output is written.
+
         Arguments
         ---------
         outputdir : Path
@@ -75,46 +140,120 @@ class ReporterDflowfm:
         report_data  : OutputDataDflowfm
             DTO with the data which is needed to create a report.
         """
-        self._reporter.report_writing_output()
-        output_file = OutputFileFactory.generate(report_data.one_fm_filename)
-        meshname = output_file.mesh2d_name
-        facedim = output_file.face_dimension_name
-        dst = Path(outputdir) / ApplicationSettingsHelper.get_filename("netcdf.out")
-        output_file.copy_ugrid(dst)
         nc_fill = netCDF4.default_fillvals["f8"]
-        projmesh = Path(outputdir) / "projected_mesh.nc"
-
-        self._grid_update(
-            report_data,
-            report_data.xykm_data.iface,
-            meshname,
-            facedim,
-            dst,
-            nc_fill,
-            projmesh,
-            output_file,
-        )
+        projmesh = self._get_projected_mesh_file(outputdir)
+        self._reporter.report_progress(progress.WRITING_OUTPUT)
+        if self._block_file is None:
+            self._reporter.report_writing_output()
+            with instrumentation.span("write netCDF"):
+                output_file = OutputFileFactory.generate(report_data.one_fm_filename)
+                meshname = output_file.mesh2d_name
+                facedim = output_file.face_dimension_name
+                dst = self._get_netcdf_file(outputdir)
+                output_file.copy_ugrid(dst)
+
+                self._grid_update(
+                    report_data,
+                    report_data.xykm_data.iface,
+                    meshname,
+                    facedim,
+                    dst,
+                    nc_fill,
+                    projmesh,
+                    output_file,
+                )
+        else:
+            output_file = self._block_file
+            meshname = output_file.mesh2d_name
+            facedim = output_file.face_dimension_name
 
         if report_data.xykm_data.xykm is not None:
-            self._replace_coordinates_in_destination_file(
-                report_data, report_data.xykm_data, meshname, nc_fill, projmesh
-            )
+            with instrumentation.span("write netCDF"):
+                self._replace_coordinates_in_destination_file(
+                    report_data, report_data.xykm_data, meshname, nc_fill, projmesh
+                )
 
-        self._plot_data(plotting_options, report_data.xykm_data, report_data.dzgemi)
+        with instrumentation.span("plotting"):
+            run_in_figure_thread(
+                self._plot_data,
+                plotting_options,
+                report_data.xykm_data,
+                report_data.dzgemi,
+            )
 
+        self._reporter.report_progress(progress.INITIAL_YEAR_DREDGING)
         self._reporter.report_compute_initial_year_dredging()
 
         if report_data.xykm_data.xykm is not None:
-            self._grid_update_xykm(
-                outputdir,
-                report_data.face_node_connectivity,
-                meshname,
-                facedim,
-                nc_fill,
-                report_data.sedimentation_data,
-                report_data.xykm_data,
-                output_file,
+            with instrumentation.span("write netCDF"):
+                self._grid_update_xykm(
+                    outputdir,
+                    report_data.face_node_connectivity,
+                    meshname,
+                    facedim,
+                    nc_fill,
+                    report_data.sedimentation_data,
+                    report_data.xykm_data,
+                    output_file,
+                )
+
+    @staticmethod
+    def _get_netcdf_file(outputdir: Path) -> Path:
+        return Path(outputdir) / ApplicationSettingsHelper.get_filename("netcdf.out")
+
+    @staticmethod
+    def _get_projected_mesh_file(outputdir: Path) -> Path:
+        return Path(outputdir) / "projected_mesh.nc"
+
+    @staticmethod
+    def _get_face_variables(
+        report_data: OutputDataDflowfm,
+    ) -> List[Tuple[str, numpy.ndarray, str]]:
+        """
+        Return the results at the faces of the region of interest to be written.
+
+        Arguments
+        ---------
+        report_data : OutputDataDflowfm
+            DTO with the data which is needed to create a report.
+
+        Returns
+        -------
+        variables : List[Tuple[str, numpy.ndarray, str]]
+            Name, values and long name of every variable in order of writing.
+        """
+        rsigma = report_data.rsigma
+        dzq = report_data.dzq
+        dzbi = report_data.dzbi
+        variables = [
+            (
+                "avgdzb",
+                report_data.dzgemi,
+                "year-averaged bed level change without dredging",
+            ),
+            ("maxdzb", report_data.dzmaxi, report_data.zmax_str),
+            ("mindzb", report_data.dzmini, report_data.zmin_str),
+        ]
+        for i in range(len(dzbi)):
+            j = (i + 1) % len(dzbi)
+            variables.append(
+                (
+                    "dzb_{}".format(i),
+                    dzbi[j],
+                    "bed level change at end of period {}".format(i + 1),
+                )
             )
+            if rsigma[i] < 1 and isinstance(dzq[i], numpy.ndarray):
+                variables.append(
+                    (
+                        "dzq_{}".format(i),
+                        dzq[i],
+                        "equilibrium bed level change aimed for during period {}".format(
+                            i + 1
+                        ),
+                    )
+                )
+        return variables
 
     def _grid_update(
         self,
@@ -127,74 +266,22 @@ class ReporterDflowfm:
         projmesh: Path,
         output_file: OutputFile,
     ):
-
-        rsigma = report_data.rsigma
-        face_node_connectivity = report_data.face_node_connectivity
-        dzq = report_data.dzq
-        dzgemi = report_data.dzgemi
-        dzmaxi = report_data.dzmaxi
-        dzmini = report_data.dzmini
-        dzbi = report_data.dzbi
-        zmax_str = report_data.zmax_str
-        zmin_str = report_data.zmin_str
-
-        dzgem = numpy.repeat(nc_fill, face_node_connectivity.shape[0])
-        dzgem[iface] = dzgemi
+        nfaces = report_data.face_node_connectivity.shape[0]
         dst_map_file = MapFile(dst)
-        dst_map_file.add_variable(
-            "avgdzb",
-            dzgem,
-            meshname,
-            facedim,
-            long_name="year-averaged bed level change without dredging",
-            unit="m",
-        )
-        dzmax = numpy.repeat(nc_fill, face_node_connectivity.shape[0])
-        dzmax[iface] = dzmaxi
-        dst_map_file.add_variable(
-            "maxdzb",
-            dzmax,
-            meshname,
-            facedim,
-            long_name=zmax_str,
-            unit="m",
-        )
-        dzmin = numpy.repeat(nc_fill, face_node_connectivity.shape[0])
-        dzmin[iface] = dzmini
-        dst_map_file.add_variable(
-            "mindzb",
-            dzmin,
-            meshname,
-            facedim,
-            long_name=zmin_str,
-            unit="m",
-        )
-        for i in range(len(dzbi)):
-            j = (i + 1) % len(dzbi)
-            dzb = numpy.repeat(nc_fill, face_node_connectivity.shape[0])
-            dzb[iface] = dzbi[j]
+        for name, values, long_name in self._get_face_variables(report_data):
+            data = numpy.repeat(nc_fill, nfaces)
+            data[iface] = values
             dst_map_file.add_variable(
-                "dzb_{}".format(i),
-                dzb,
+                name,
+                data,
                 meshname,
                 facedim,
-                long_name="bed level change at end of period {}".format(i + 1),
+                long_name=long_name,
                 unit="m",
             )
-            if rsigma[i] < 1 and isinstance(dzq[i], numpy.ndarray):
-                dzq_full = numpy.repeat(nc_fill, face_node_connectivity.shape[0])
-                dzq_full[iface] = dzq[i]
-                dst_map_file.add_variable(
-                    "dzq_{}".format(i),
-                    dzq_full,
-                    meshname,
-                    facedim,
-                    long_name="equilibrium bed level change aimed for during period {}".format(
-                        i + 1
-                    ),
-                    unit="m",
-                )
 
+        dzgem = numpy.repeat(nc_fill, nfaces)
+        dzgem[iface] = report_data.dzgemi
         output_file.copy_ugrid(projmesh)
         projmesh_map_file = MapFile(projmesh)
         projmesh_map_file.add_variable(
@@ -62,26 +62,13 @@ class ReporterWaqua:
         output_data : OutputDataWaqua
             Output data that is to be writen to the related files.
         """
-        avgdzb_file = self._get_file_location(self.avgdzb)
-        DataTextFileOperations.write_simona_box(
-            avgdzb_file,
-            output_data.data_zgem,
-            output_data.first_min_velocity_m,
-            output_data.first_min_velocity_n,
-        )
-
-        maxdzb_file = self._get_file_location(self.maxdzb)
-        DataTextFileOperations.write_simona_box(
-            maxdzb_file,
-            output_data.data_zmax,
-            output_data.first_min_velocity_m,
-            output_data.first_min_velocity_n,
-        )
-
-        mindzb_file = self._get_file_location(self.mindzb)
-        DataTextFileOperations.write_simona_box(
-            mindzb_file,
-            output_data.data_zmin,
+        DataTextFileOperations.write_simona_box_files(
+            [
+                self._get_file_location(self.avgdzb),
+                self._get_file_location(self.maxdzb),
+                self._get_file_location(self.mindzb),
+            ],
+            [output_data.data_zgem, output_data.data_zmax, output_data.data_zmin],
             output_data.first_min_velocity_m,
             output_data.first_min_velocity_n,
         )
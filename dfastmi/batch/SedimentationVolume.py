@@ -29,10 +29,12 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 
 import math
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy
 
+import dfastmi.batch.plotting
+from dfastmi.batch import instrumentation
 from dfastmi.batch.AreaDetector import AreaData, AreaDetector
 from dfastmi.batch.AreaPlotter import ErosionAreaPlotter, SedimentationAreaPlotter
 from dfastmi.batch.Distance import distance_along_line, distance_to_chainage
@@ -41,6 +43,7 @@ from dfastmi.batch.PlotOptions import PlotOptions
 from dfastmi.batch.SedimentationData import SedimentationData
 from dfastmi.batch.XykmData import XykmData
 from dfastmi.batch.XyzFileWriter import XyzFileWriter
+from dfastmi.kernel import precision
 
 
 def stream_bins(min_s, max_s, ds):
@@ -85,10 +88,10 @@ def stream_bins(min_s, max_s, ds):
     # determine per cell a mapping from cell iface to the chainage bin sbin,
     # and determine which fraction of the chainage length associated with the
     # cell is mapped to this particular chainage bin
-    siface = numpy.zeros(nsbin_tot, dtype=numpy.int64)
-    afrac = numpy.zeros(nsbin_tot)
-    sbin = numpy.zeros(nsbin_tot, dtype=numpy.int64)
     nfaces = len(min_s)
+    siface = numpy.zeros(nsbin_tot, dtype=precision.index_dtype(nfaces))
+    afrac = numpy.zeros(nsbin_tot)
+    sbin = numpy.zeros(nsbin_tot, dtype=precision.index_dtype(len(sthresh)))
     j = 0
     for i in range(nfaces):
         s0 = min_s[i]
@@ -134,7 +137,7 @@ def width_bins(
         Signed distance threshold values between the bins [m].
         This array contains nbins+1 values.
     """
-    jbin = numpy.zeros(df.shape, dtype=numpy.int64)
+    jbin = numpy.zeros(df.shape, dtype=precision.index_dtype(nbins))
     binwidth = nwidth / nbins
     wthresh = -nwidth / 2 + binwidth * numpy.arange(nbins + 1)
 
@@ -285,7 +288,7 @@ def comp_sedimentation_volume(
     dzgemi: numpy.ndarray,
     slength: float,
     nwidth: float,
-    outputdir: Path,
+    outputdir: Optional[Path],
     plotting_options: PlotOptions,
 ):
     """
@@ -302,8 +305,8 @@ def comp_sedimentation_volume(
         Array containing the x,y and chainage data of a line.
     simfile : str
         Name of simulation file.
-    outputdir : Path
-        Path of output directory.
+    outputdir : Optional[Path]
+        Path of output directory; the binned volumes aren't written if None.
     plotting_options : PlotOptions
         Class containing the plot options.
     Returns
@@ -370,27 +373,30 @@ def comp_sedimentation_volume(
         sthresh,
     )
 
-    xyz_file_location = outputdir.joinpath("sedimentation_volumes.xyz")
-    XyzFileWriter.write_xyz_file(
-        wbin_labels, kmid, sedimentation_binvol, xyz_file_location
-    )
+    if outputdir is not None:
+        xyz_file_location = outputdir.joinpath("sedimentation_volumes.xyz")
+        XyzFileWriter.write_xyz_file(
+            wbin_labels, kmid, sedimentation_binvol, xyz_file_location
+        )
 
     sedimentation_area_plotter = SedimentationAreaPlotter(
         plotting_options, plot_n, sedimentation_area_data
     )
-    sedimentation_area_plotter.plot_areas(
-        dzgemi,
-        areai,
-        wbin,
-        wbin_labels,
-        wthresh,
-        siface,
-        afrac,
-        sbin,
-        sthresh,
-        kmid,
-        sedimentation_binvol,
-    )
+    with instrumentation.span("plotting"):
+        dfastmi.batch.plotting.run_in_figure_thread(
+            sedimentation_area_plotter.plot_areas,
+            dzgemi,
+            areai,
+            wbin,
+            wbin_labels,
+            wthresh,
+            siface,
+            afrac,
+            sbin,
+            sthresh,
+            kmid,
+            sedimentation_binvol,
+        )
 
     print("-- detecting separate erosion areas")
     erosion_area_detector = AreaDetector()
@@ -422,19 +428,21 @@ def comp_sedimentation_volume(
     erosion_area_plotter = ErosionAreaPlotter(
         plotting_options, plot_n, erosion_area_data
     )
-    erosion_area_plotter.plot_areas(
-        -dzgemi,
-        areai,
-        wbin,
-        wbin_labels,
-        wthresh,
-        siface,
-        afrac,
-        sbin,
-        sthresh,
-        kmid,
-        erosion_binvol,
-    )
+    with instrumentation.span("plotting"):
+        dfastmi.batch.plotting.run_in_figure_thread(
+            erosion_area_plotter.plot_areas,
+            -dzgemi,
+            areai,
+            wbin,
+            wbin_labels,
+            wthresh,
+            siface,
+            afrac,
+            sbin,
+            sthresh,
+            kmid,
+            erosion_binvol,
+        )
 
     return SedimentationData(
         sedimentation_area_data.area,
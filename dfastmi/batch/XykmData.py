@@ -27,14 +27,32 @@ INFORMATION
 This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
 """
 
+from typing import Dict
+
 import numpy
 import shapely
+import shapely.prepared
 from shapely.geometry.linestring import LineString
 
+from dfastmi.batch import instrumentation
 from dfastmi.batch.DflowfmReporters import XykmDataReporter
 from dfastmi.batch.Distance import get_direction
-from dfastmi.batch.Face import face_mean, filter_faces_by_node_condition
+from dfastmi.batch.Face import (
+    face_mean,
+    filter_faces_by_face_condition,
+    filter_faces_by_node_condition,
+    hilbert_index,
+    reorder_faces,
+)
 from dfastmi.batch.Projection import project_xy_point_onto_line
+from dfastmi.config.AConfigurationInitializerBase import CHAINAGE_ORDER, SOURCE_ORDER
+from dfastmi.io.RegionCache import RegionCache
+
+# width of the buffer around the chainage line defining the region of interest [m]
+BUFFER_WIDTH = 3000.0
+
+# arrays stored in the region cache; bounds holds xmin, xmax, ymin and ymax
+CACHED_ARRAYS = ("iface", "inode", "sni", "nni", "dxi", "dyi", "bounds")
 
 
 class XykmData:
@@ -185,10 +203,19 @@ class XykmData:
         xn: numpy.ndarray,
         yn: numpy.ndarray,
         face_node_connectivity: numpy.ndarray,
+        face_order: str = SOURCE_ORDER,
+        region_cache: bool = False,
     ):
         """
         initializes the properties in the XykmData object.
 
+        Unless the face order is "source", the selected faces are renumbered
+        along the chainage line or a Hilbert curve and the nodes in order of
+        first use, such that neighbouring faces are stored close together.
+        The iface and inode arrays map the renumbered faces and nodes back to
+        the original mesh, so results scattered by means of these arrays are
+        written in the original order.
+
         Arguments
         ---------
         xykm : LineString
@@ -200,82 +227,261 @@ class XykmData:
         face_node_connectivity : numpy.ndarray
             Masked M x N array containing the indices of (max N) corner nodes for each of the M cells [-].
             Node indices are 0-based, hence the maximum node index is K-1.
+        face_order : str
+            Order of the selected faces: "source", "chainage" or "hilbert".
+        region_cache : bool
+            Flag indicating whether the region of interest and its projection
+            onto the chainage line may be taken from and stored in the cache
+            on disk.
         """
         self._xykm = xykm
 
         if self._xykm is None:
             # keep all nodes and faces
-            keep = numpy.full(xn.shape, True)
-            (
-                self._xni,
-                self._yni,
-                self._face_node_connectivity_index,
-                self._iface,
-                self._inode,
-            ) = filter_faces_by_node_condition(xn, yn, face_node_connectivity, keep)
-            self._xmin = xn.min()
-            self._xmax = xn.max()
-            self._ymin = yn.min()
-            self._ymax = yn.max()
+            with instrumentation.span("region of interest"):
+                keep = numpy.full(xn.shape, True)
+                (
+                    self._xni,
+                    self._yni,
+                    self._face_node_connectivity_index,
+                    self._iface,
+                    self._inode,
+                ) = filter_faces_by_node_condition(xn, yn, face_node_connectivity, keep)
+                self._xmin = xn.min()
+                self._xmax = xn.max()
+                self._ymin = yn.min()
+                self._ymax = yn.max()
         else:
-            dnmax = 3000.0
-            self._reporter.report_identify_region_of_interest()
-            self._reporter.print_buffer()
-            xybuffer = xykm.buffer(dnmax)
-            bbox = xybuffer.envelope.exterior
-            self._reporter.print_prepare()
-            xybprep = shapely.prepared.prep(xybuffer)
-
-            self._reporter.print_prepare_filter(1)
-            self._xmin = bbox.coords[0][0]
-            self._xmax = bbox.coords[1][0]
-            self._ymin = bbox.coords[0][1]
-            self._ymax = bbox.coords[2][1]
-            keep = (
-                (xn > self._xmin)
-                & (xn < self._xmax)
-                & (yn > self._ymin)
-                & (yn < self._ymax)
-            )
-            self._reporter.print_prepare_filter(2)
-            for i in range(xn.size):
-                if keep[i] and not xybprep.contains(
-                    shapely.geometry.Point((xn[i], yn[i]))
-                ):
-                    keep[i] = False
-
-            self._reporter.print_apply_filter()
-            (
-                self._xni,
-                self._yni,
-                self._face_node_connectivity_index,
-                self._iface,
-                self._inode,
-            ) = filter_faces_by_node_condition(xn, yn, face_node_connectivity, keep)
-            self._interest_region = numpy.zeros(
-                face_node_connectivity.shape[0], dtype=numpy.int64
-            )
-            self._interest_region[self._iface] = 1
+            cache_key = None
+            if region_cache:
+                with instrumentation.span("region of interest"):
+                    cache_key = RegionCache.get_cache_key(
+                        xn, yn, face_node_connectivity, xykm, BUFFER_WIDTH
+                    )
+                    cached = self._load_region(
+                        cache_key, xykm, xn, yn, face_node_connectivity
+                    )
+            if cache_key is None or not cached:
+                with instrumentation.span("region of interest"):
+                    self._filter_region_of_interest(
+                        xykm, xn, yn, face_node_connectivity
+                    )
+                with instrumentation.span("projection"):
+                    self._project_onto_line(xykm)
+                if cache_key is not None:
+                    RegionCache.save(cache_key, self._get_cached_arrays())
+
+        if face_order != SOURCE_ORDER:
+            with instrumentation.span("face order"):
+                self._reorder_faces(face_order)
+
+    def _filter_region_of_interest(
+        self,
+        xykm: LineString,
+        xn: numpy.ndarray,
+        yn: numpy.ndarray,
+        face_node_connectivity: numpy.ndarray,
+    ):
+        """
+        Select the nodes and faces within a buffer around the chainage line.
+
+        Arguments
+        ---------
+        xykm : LineString
+            Array containing the x, y, and chainage; unit m for x and y, km for chainage.
+        xn : numpy.ndarray
+            X-coordinates of the mesh nodes.
+        yn : numpy.ndarray
+            Y-coordinates of the mesh nodes.
+        face_node_connectivity : numpy.ndarray
+            Masked M x N array containing the indices of (max N) corner nodes for each of the M cells [-].
+        """
+        self._reporter.report_identify_region_of_interest()
+        self._reporter.print_buffer()
+        xybuffer = xykm.buffer(BUFFER_WIDTH)
+        bbox = xybuffer.envelope.exterior
+        self._reporter.print_prepare()
+        xybprep = shapely.prepared.prep(xybuffer)
+
+        self._reporter.print_prepare_filter(1)
+        self._xmin = bbox.coords[0][0]
+        self._xmax = bbox.coords[1][0]
+        self._ymin = bbox.coords[0][1]
+        self._ymax = bbox.coords[2][1]
+        keep = (
+            (xn > self._xmin)
+            & (xn < self._xmax)
+            & (yn > self._ymin)
+            & (yn < self._ymax)
+        )
+        self._reporter.print_prepare_filter(2)
+        for i in range(xn.size):
+            if keep[i] and not xybprep.contains(shapely.geometry.Point((xn[i], yn[i]))):
+                keep[i] = False
+
+        self._reporter.print_apply_filter()
+        (
+            self._xni,
+            self._yni,
+            self._face_node_connectivity_index,
+            self._iface,
+            self._inode,
+        ) = filter_faces_by_node_condition(xn, yn, face_node_connectivity, keep)
+        self._interest_region = numpy.zeros(
+            face_node_connectivity.shape[0], dtype=numpy.int64
+        )
+        self._interest_region[self._iface] = 1
+
+    def _get_cached_arrays(self) -> Dict[str, numpy.ndarray]:
+        """
+        Return the arrays from which the region of interest can be restored.
+
+        Returns
+        -------
+        arrays : Dict[str, numpy.ndarray]
+            The arrays per name listed in CACHED_ARRAYS.
+        """
+        return {
+            "iface": self._iface,
+            "inode": self._inode,
+            "sni": self._sni,
+            "nni": self._nni,
+            "dxi": self._dxi,
+            "dyi": self._dyi,
+            "bounds": numpy.array([self._xmin, self._xmax, self._ymin, self._ymax]),
+        }
+
+    def _load_region(
+        self,
+        cache_key: str,
+        xykm: LineString,
+        xn: numpy.ndarray,
+        yn: numpy.ndarray,
+        face_node_connectivity: numpy.ndarray,
+    ) -> bool:
+        """
+        Restore the region of interest and its projection from the cache.
 
-            self._xykline = numpy.array(xykm.coords)
+        The renumbered face node connectivity is derived again from the
+        selected faces, which is cheap compared to selecting them.
 
-            # project all nodes onto the line, obtain the distance along (self._sni) and normal (dni) the line
-            # note: we use distance along line here instead of chainage since the latter may locally not be a linear function of the distance
-            xyline = self._xykline[:, :2]
+        Arguments
+        ---------
+        cache_key : str
+            The key identifying the region of interest.
+        xykm : LineString
+            Array containing the x, y, and chainage; unit m for x and y, km for chainage.
+        xn : numpy.ndarray
+            X-coordinates of the mesh nodes.
+        yn : numpy.ndarray
+            Y-coordinates of the mesh nodes.
+        face_node_connectivity : numpy.ndarray
+            Masked M x N array containing the indices of (max N) corner nodes for each of the M cells [-].
 
-            # project all nodes onto the line, obtain the distance along (sfi) and normal (nfi) the line
-            # note: we use distance along line here instead of chainage since the latter may locally not be a linear function of the distance
-            self._reporter.report_project()
-            self._sni, self._nni = project_xy_point_onto_line(
-                self._xni, self._yni, xyline
-            )
-            sfi = face_mean(self._sni, self._face_node_connectivity_index)
+        Returns
+        -------
+        loaded : bool
+            Flag indicating whether a valid cache entry was found.
+        """
+        arrays = RegionCache.load(cache_key, CACHED_ARRAYS)
+        if arrays is None:
+            return False
+
+        keep = numpy.zeros(face_node_connectivity.shape[0], dtype=bool)
+        keep[arrays["iface"]] = True
+        (
+            xni,
+            yni,
+            face_node_connectivity_index,
+            iface,
+            inode,
+        ) = filter_faces_by_face_condition(xn, yn, face_node_connectivity, keep)
+        if not numpy.array_equal(iface, arrays["iface"]) or not numpy.array_equal(
+            inode, arrays["inode"]
+        ):
+            return False
+
+        self._reporter.report_identify_region_of_interest()
+        self._xni = xni
+        self._yni = yni
+        self._face_node_connectivity_index = face_node_connectivity_index
+        self._iface = arrays["iface"]
+        self._inode = arrays["inode"]
+        self._xmin, self._xmax, self._ymin, self._ymax = arrays["bounds"].tolist()
+        self._interest_region = numpy.zeros(
+            face_node_connectivity.shape[0], dtype=numpy.int64
+        )
+        self._interest_region[self._iface] = 1
+        self._xykline = numpy.array(xykm.coords)
+        self._sni = arrays["sni"]
+        self._nni = arrays["nni"]
+        self._dxi = arrays["dxi"]
+        self._dyi = arrays["dyi"]
+        self._reporter.report_done()
+        return True
+
+    def _project_onto_line(self, xykm: LineString):
+        """
+        Project the selected nodes onto the chainage line and determine the
+        line direction for each selected face.
+
+        Arguments
+        ---------
+        xykm : LineString
+            Array containing the x, y, and chainage; unit m for x and y, km for chainage.
+        """
+        self._xykline = numpy.array(xykm.coords)
+
+        # project all nodes onto the line, obtain the distance along (self._sni) and normal (dni) the line
+        # note: we use distance along line here instead of chainage since the latter may locally not be a linear function of the distance
+        xyline = self._xykline[:, :2]
 
-            # determine chainage values of each cell
-            self._reporter.report_chainage()
+        # project all nodes onto the line, obtain the distance along (sfi) and normal (nfi) the line
+        # note: we use distance along line here instead of chainage since the latter may locally not be a linear function of the distance
+        self._reporter.report_project()
+        self._sni, self._nni = project_xy_point_onto_line(self._xni, self._yni, xyline)
+        sfi = face_mean(self._sni, self._face_node_connectivity_index)
 
-            # determine line direction for each cell
-            self._reporter.report_direction()
-            self._dxi, self._dyi = get_direction(xyline, sfi)
+        # determine chainage values of each cell
+        self._reporter.report_chainage()
+
+        # determine line direction for each cell
+        self._reporter.report_direction()
+        self._dxi, self._dyi = get_direction(xyline, sfi)
+
+        self._reporter.report_done()
+
+    def _reorder_faces(self, face_order: str):
+        """
+        Renumber the selected faces and nodes to improve the locality of the data.
+
+        The chainage order sorts the faces by their mean distance along the
+        chainage line; without chainage line the Hilbert order is used.
+
+        Arguments
+        ---------
+        face_order : str
+            Order of the selected faces: "chainage" or "hilbert".
+        """
+        if face_order == CHAINAGE_ORDER and self._sni is not None:
+            key = face_mean(self._sni, self._face_node_connectivity_index)
+        else:
+            key = hilbert_index(
+                face_mean(self._xni, self._face_node_connectivity_index),
+                face_mean(self._yni, self._face_node_connectivity_index),
+            )
 
-            self._reporter.report_done()
+        (
+            self._face_node_connectivity_index,
+            face_index,
+            node_index,
+        ) = reorder_faces(self._face_node_connectivity_index, key, len(self._xni))
+        self._iface = self._iface[face_index]
+        self._inode = self._inode[node_index]
+        self._xni = self._xni[node_index]
+        self._yni = self._yni[node_index]
+        if self._sni is not None:
+            self._sni = self._sni[node_index]
+            self._nni = self._nni[node_index]
+            self._dxi = self._dxi[face_index]
+            self._dyi = self._dyi[face_index]
@@ -30,13 +30,20 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 import sys
 from configparser import ConfigParser
 from pathlib import Path
-from typing import Any, Dict, Optional, TextIO, Tuple, Union
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
 
-import matplotlib
 from packaging.version import InvalidVersion, Version
 
+import dfastmi.batch.plotting
 import dfastmi.kernel.core
-from dfastmi.batch import AnalyserAndReporterDflowfm, AnalyserAndReporterWaqua
+from dfastmi.batch import (
+    AnalyserAndReporterDflowfm,
+    AnalyserAndReporterWaqua,
+    instrumentation,
+    sweep,
+    variants,
+)
+from dfastmi.batch.AFileNameRetriever import AFileNameRetriever
 from dfastmi.batch.FileNameRetrieverFactory import FileNameRetrieverFactory
 from dfastmi.batch.PlotOptions import PlotOptions
 from dfastmi.config.AConfigurationInitializerBase import AConfigurationInitializerBase
@@ -48,6 +55,7 @@ from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
 from dfastmi.io.Branch import Branch
 from dfastmi.io.DFastAnalysisConfigFileParser import DFastAnalysisConfigFileParser
 from dfastmi.io.IReach import IReach
+from dfastmi.io.PartitionedMapFile import PartitionedMapFile
 from dfastmi.io.Reach import Reach
 from dfastmi.io.RiversObject import RiversObject
 from dfastmi.kernel.typehints import BoolVector, Vector
@@ -129,28 +137,103 @@ def batch_mode_core(
         ApplicationSettingsHelper.get_filename("report.out")
     )
 
-    with report_path.open(mode="w", encoding="utf-8") as report:
-        cfg_version = _get_version(rivers, config)
-        _log_header(report, cfg_version)
+    if _get_timing(config) or instrumentation.is_profiling_enabled():
+        instrumentation.start_recording()
+    try:
+        with report_path.open(mode="w", encoding="utf-8") as report:
+            try:
+                success = _run_and_report(
+                    rivers,
+                    reduced_output,
+                    config,
+                    data,
+                    display,
+                    report,
+                    rootdir,
+                    outputdir,
+                    gui,
+                )
+            finally:
+                spans = instrumentation.stop_recording()
+
+            if _get_timing(config):
+                _report_timing(config, report, outputdir, spans)
+            if instrumentation.is_profiling_enabled():
+                instrumentation.write_profiles(str(outputdir))
+                ApplicationSettingsHelper.log_text(
+                    "profiles_written", dict={"dir": str(outputdir)}, file=report
+                )
+
+            ApplicationSettingsHelper.log_text("end", file=report)
+    finally:
+        PartitionedMapFile.shutdown_executor()
+
+    return success
+
+
+def _run_and_report(
+    rivers: RiversObject,
+    reduced_output: bool,
+    config: ConfigParser,
+    data: DFastAnalysisConfigFileParser,
+    display: bool,
+    report: TextIO,
+    rootdir: Path,
+    outputdir: Path,
+    gui: bool,
+) -> bool:
+    """
+    Run the analysis for a given configuration and report it.
 
-        branch_name = config.get("General", "Branch", fallback="")
-        branch = rivers.get_branch(branch_name)
-        if not branch:
+    Arguments
+    ---------
+    rivers : RiversObject
+        An object containing the river data.
+    reduced_output : bool
+        Flag to indicate whether WAQUA output should be reduced to the area of
+        interest only.
+    config : configparser.ConfigParser
+        Configuration of the analysis to be run.
+    data : DFastAnalysisConfigFileParser
+        DFast MI application config file.
+    display : bool
+        Flag indicating text output to stdout.
+    report : TextIO
+        Text stream for log file.
+    rootdir : Path
+        Reference directory for default folders.
+    outputdir : Path
+        Reference directory for default output folders.
+    gui : bool
+        Flag indicating whether this routine is called from the GUI.
+
+    Return
+    ------
+    success : bool
+        Flag indicating whether the analysis could be completed successfully.
+    """
+    cfg_version = _get_version(rivers, config)
+    _log_header(report, cfg_version)
+
+    branch_name = config.get("General", "Branch", fallback="")
+    branch = rivers.get_branch(branch_name)
+    if not branch:
+        ApplicationSettingsHelper.log_text(
+            "invalid_branch", dict={"branch": branch_name}, file=report
+        )
+        success = False
+    else:
+        reach_name = config.get("General", "Reach", fallback="")
+        reach = branch.get_reach(reach_name)
+        if not reach:
             ApplicationSettingsHelper.log_text(
-                "invalid_branch", dict={"branch": branch_name}, file=report
+                "invalid_reach",
+                dict={"reach": reach_name, "branch": branch_name},
+                file=report,
             )
             success = False
         else:
-            reach_name = config.get("General", "Reach", fallback="")
-            reach = branch.get_reach(reach_name)
-            if not reach:
-                ApplicationSettingsHelper.log_text(
-                    "invalid_reach",
-                    dict={"reach": reach_name, "branch": branch_name},
-                    file=report,
-                )
-                success = False
-            else:
+            with instrumentation.span("analysis"):
                 success = _analyse_and_report(
                     config,
                     data,
@@ -165,11 +248,69 @@ def batch_mode_core(
                     gui,
                 )
 
-        ApplicationSettingsHelper.log_text("end", file=report)
-
     return success
 
 
+def _get_timing(config: ConfigParser) -> bool:
+    """
+    Check whether the timing of the analysis stages should be reported.
+
+    Arguments
+    ---------
+    config : configparser.ConfigParser
+        Configuration of the analysis to be run.
+
+    Returns
+    -------
+    timing : bool
+        Flag indicating whether the analysis stages should be timed.
+    """
+    try:
+        timing = config.getboolean("General", "Timing", fallback=False)
+    except ValueError:
+        timing = False
+    return timing or config.get("General", "TimingFile", fallback="") != ""
+
+
+def _report_timing(
+    config: ConfigParser,
+    report: TextIO,
+    outputdir: Path,
+    spans: List[instrumentation.Span],
+) -> None:
+    """
+    Report the timing of the analysis stages.
+
+    A table is appended to the report, and if requested the spans are also
+    written to a JSON or Chrome trace file.
+
+    Arguments
+    ---------
+    config : configparser.ConfigParser
+        Configuration of the analysis to be run.
+    report : TextIO
+        Text stream for log file.
+    outputdir : Path
+        Reference directory for default output folders.
+    spans : List[instrumentation.Span]
+        The spans recorded for the analysis stages.
+    """
+    instrumentation.write_report(report, spans)
+
+    timing_file = config.get("General", "TimingFile", fallback="")
+    if timing_file:
+        file_format = config.get(
+            "General", "TimingFormat", fallback=instrumentation.JSON_FORMAT
+        )
+        if file_format.strip().lower() == instrumentation.CHROME_FORMAT:
+            file_format = instrumentation.CHROME_FORMAT
+        else:
+            file_format = instrumentation.JSON_FORMAT
+        instrumentation.write_timing_file(
+            str(outputdir / timing_file), spans, file_format
+        )
+
+
 def _report_section_break(report: TextIO):
     ApplicationSettingsHelper.log_text("===", file=report)
 
@@ -251,7 +392,24 @@ def _report_used_file_names(
     report: TextIO,
 ):
     imode = _get_mode_usage(config)
-    filenames = get_filenames(imode, initialized_config.needs_tide, config)
+    variant_filenames = get_variant_filenames(
+        imode, initialized_config.needs_tide, config
+    )
+    if not variant_filenames:
+        filenames = get_filenames(imode, initialized_config.needs_tide, config)
+        _report_condition_file_names(initialized_config, filenames, report)
+    for name, filenames in variant_filenames.items():
+        ApplicationSettingsHelper.log_text(
+            "variant_analysis", dict={"name": name}, file=report
+        )
+        _report_condition_file_names(initialized_config, filenames, report)
+
+
+def _report_condition_file_names(
+    initialized_config: AConfigurationInitializerBase,
+    filenames: Dict[Any, Tuple[str, str]],
+    report: TextIO,
+):
     for i, q in enumerate(initialized_config.discharges):
         if not q:  # should only happen for version 1 files
             continue
@@ -528,7 +686,59 @@ def get_filenames(
         can be the discharge index, discharge value or a tuple of forcing
         conditions, such as a Discharge and Tide forcing tuple.
     """
+    file_name_retriever = _get_file_name_retriever(imode, needs_tide, config)
+    return file_name_retriever.get_file_names(config)
+
+
+def get_variant_filenames(
+    imode: int,
+    needs_tide: bool,
+    config: Optional[ConfigParser] = None,
+) -> Dict[str, Dict[Any, Tuple[str, str]]]:
+    """
+    Extract the file names per variant of the intervention from the configuration.
+
+    Arguments
+    ---------
+    imode : int
+        Specification of run mode (0 = WAQUA, 1 = D-Flow FM).
+    needs_tide : bool
+        Specifies whether the tidal boundary is needed.
+    config : Optional[ConfigParser]
+        The variable containing the configuration (may be None for imode = 0).
+
+    Returns
+    -------
+    variant_filenames : Dict[str, Dict[Any, Tuple[str,str]]]
+        Per variant name the file names as returned by get_filenames; empty if
+        the configuration doesn't compare multiple variants.
+    """
+    file_name_retriever = _get_file_name_retriever(imode, needs_tide, config)
+    return file_name_retriever.get_variant_file_names(config)
+
+
+def _get_file_name_retriever(
+    imode: int,
+    needs_tide: bool,
+    config: Optional[ConfigParser],
+) -> AFileNameRetriever:
+    """
+    Return the file name retriever for the version of the configuration.
+
+    Arguments
+    ---------
+    imode : int
+        Specification of run mode (0 = WAQUA, 1 = D-Flow FM).
+    needs_tide : bool
+        Specifies whether the tidal boundary is needed.
+    config : Optional[ConfigParser]
+        The variable containing the configuration (may be None for imode = 0).
 
+    Returns
+    -------
+    file_name_retriever : AFileNameRetriever
+        The file name retriever matching the version of the configuration.
+    """
     if imode != 0:
         general_version = config.get("General", "Version", fallback=None)
     else:
@@ -539,10 +749,7 @@ def get_filenames(
     else:
         file_name_retriever_version = None
 
-    file_name_retriever = FileNameRetrieverFactory.generate(
-        file_name_retriever_version, needs_tide
-    )
-    return file_name_retriever.get_file_names(config)
+    return FileNameRetrieverFactory.generate(file_name_retriever_version, needs_tide)
 
 
 def _analyse_and_report(
@@ -602,6 +809,7 @@ def _analyse_and_report(
 
     plotting_options = PlotOptions()
     plotting_options.set_plotting_flags(rootdir, display, data)
+    _initialize_plotting(plotting_options, gui)
 
     imode = _get_mode_usage(config)
     _report_analysis_configuration(
@@ -613,7 +821,11 @@ def _analyse_and_report(
         report,
     )
     _report_mode_usage(imode, report)
-    filenames = get_filenames(imode, initialized_config.needs_tide, config)
+    variant_filenames = get_variant_filenames(
+        imode, initialized_config.needs_tide, config
+    )
+    if not variant_filenames:
+        filenames = get_filenames(imode, initialized_config.needs_tide, config)
     success = False
 
     if imode == 0:
@@ -630,6 +842,29 @@ def _analyse_and_report(
             old_zmin_zmax,
             outputdir,
         )
+    elif variant_filenames and sweep.has_sweep(config):
+        ApplicationSettingsHelper.log_text("variants_with_sweep", file=report)
+    elif variant_filenames:
+        success = variants.analyse_and_report_variants(
+            display,
+            report,
+            reach.normal_width,
+            initialized_config,
+            variant_filenames,
+            outputdir,
+            plotting_options,
+        )
+    elif sweep.has_sweep(config):
+        success = sweep.analyse_and_report_sweep(
+            display,
+            report,
+            reach,
+            cfg_version,
+            config,
+            filenames,
+            outputdir,
+            plotting_options,
+        )
     else:
         success = AnalyserAndReporterDflowfm.analyse_and_report_dflowfm(
             display,
@@ -650,6 +885,31 @@ def _analyse_and_report(
     return success
 
 
+def _initialize_plotting(plotting_options: PlotOptions, gui: bool) -> None:
+    """
+    Load the plotting library only when plotting is enabled.
+
+    Figures that are closed directly after saving are never shown, so in batch
+    mode the non-interactive backend is selected for them.
+
+    Arguments
+    ---------
+    plotting_options : PlotOptions
+        Class containing the plot options.
+    gui : bool
+        Flag indicating whether this routine is called from the GUI.
+
+    Returns
+    -------
+    None
+    """
+    if plotting_options.plotting:
+        interactive = gui or not plotting_options.closeplot
+        dfastmi.batch.plotting.run_in_figure_thread(
+            dfastmi.batch.plotting.initialize, interactive=interactive
+        )
+
+
 def _finalize_plotting(plotting_options: PlotOptions, gui: bool) -> None:
     """
     When plotting the analysis results and done analysing we need to
@@ -668,9 +928,13 @@ def _finalize_plotting(plotting_options: PlotOptions, gui: bool) -> None:
     """
     if plotting_options.plotting:
         if plotting_options.closeplot:
-            matplotlib.pyplot.close("all")
+            dfastmi.batch.plotting.run_in_figure_thread(
+                dfastmi.batch.plotting.close_all
+            )
         else:
-            matplotlib.pyplot.show(block=not gui)
+            dfastmi.batch.plotting.run_in_figure_thread(
+                dfastmi.batch.plotting.show, block=not gui
+            )
 
 
 def _log_length_estimate(report: TextIO, slength: float) -> None:
@@ -0,0 +1,479 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+
+# version of the layout of the JSON timing file; increase when it changes
+TIMING_FORMAT = 1
+
+JSON_FORMAT = "json"
+CHROME_FORMAT = "chrome"
+
+MEGABYTE = 1024**2
+
+# number of functions listed per stage in the profile summary
+PROFILE_TOP = 25
+PROFILE_SUMMARY = "profile.txt"
+
+
+@dataclass
+class Span:
+    """
+    Timing and resource usage of a named stage of the analysis.
+
+    Attributes
+    ----------
+    name : str
+        Name of the stage.
+    depth : int
+        Nesting level of the stage (0 for the outermost stages).
+    start : float
+        Start time [s] relative to the start of the recording.
+    wall_time : float
+        Elapsed wall clock time [s].
+    cpu_time : float
+        Processor time [s] of the process (all threads).
+    bytes_read : int
+        Number of bytes read by the process.
+    bytes_written : int
+        Number of bytes written by the process.
+    peak_rss : int
+        Peak resident set size [bytes] of the process at the end of the stage.
+    thread_id : int
+        Identifier of the thread that executed the stage.
+    """
+
+    name: str
+    depth: int
+    start: float
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    peak_rss: int = 0
+    thread_id: int = 0
+
+
+# spans recorded since start_recording was called; None if not recording, such
+# that the instrumented stages cost next to nothing in a normal run
+_spans: Optional[List[Span]] = None
+_depth = 0
+_origin = 0.0
+
+# profiling of the stages; only one profiler can be active at a time, so the
+# outermost stages below the root are profiled in the thread that started
+# the recording, and nested stages are attributed to their parent
+_profiling = False
+_profiles: Dict[str, "pstats.Stats"] = {}
+_profiler_active = False
+_profile_thread = 0
+
+
+def enable_profiling(enabled: bool = True) -> None:
+    """
+    Enable or disable profiling of the analysis stages.
+
+    While enabled, every recorded stage directly below the outermost one is
+    run under cProfile.
+
+    Arguments
+    ---------
+    enabled : bool
+        Flag indicating whether the stages should be profiled.
+    """
+    global _profiling
+    _profiling = enabled
+
+
+def is_profiling_enabled() -> bool:
+    """
+    Check whether the analysis stages are profiled.
+
+    Returns
+    -------
+    profiling : bool
+        True if profiling was enabled using enable_profiling.
+    """
+    return _profiling
+
+
+def start_recording() -> None:
+    """
+    Start recording the spans of the analysis stages.
+
+    Any spans and profiles recorded before are discarded.
+    """
+    global _spans, _depth, _origin, _profiles, _profile_thread
+    _spans = []
+    _depth = 0
+    _origin = time.perf_counter()
+    _profiles = {}
+    _profile_thread = threading.get_ident()
+
+
+def stop_recording() -> List[Span]:
+    """
+    Stop recording and return the spans recorded.
+
+    Returns
+    -------
+    spans : List[Span]
+        The recorded spans in the order in which the stages started.
+    """
+    global _spans
+    spans = _spans or []
+    _spans = None
+    return spans
+
+
+def is_recording() -> bool:
+    """
+    Check whether spans are being recorded.
+
+    Returns
+    -------
+    recording : bool
+        True if start_recording was called and stop_recording wasn't called since.
+    """
+    return _spans is not None
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Record the timing and resource usage of a stage of the analysis.
+
+    Spans may be nested; nothing is recorded unless recording was started.
+
+    Arguments
+    ---------
+    name : str
+        Name of the stage.
+    """
+    global _depth
+    if _spans is None:
+        yield
+        return
+
+    stage = Span(name, _depth, time.perf_counter() - _origin)
+    _spans.append(stage)
+    profiler = _start_profiler()
+    read_start, written_start = get_io_counters()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    _depth += 1
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            _stop_profiler(name, profiler)
+        _depth -= 1
+        stage.wall_time = time.perf_counter() - wall_start
+        stage.cpu_time = time.process_time() - cpu_start
+        read_end, written_end = get_io_counters()
+        stage.bytes_read = read_end - read_start
+        stage.bytes_written = written_end - written_start
+        stage.peak_rss = get_peak_rss()
+        stage.thread_id = threading.get_ident()
+
+
+def get_io_counters() -> Tuple[int, int]:
+    """
+    Return the number of bytes read and written by the process so far.
+
+    The counters include data served from the operating system's file cache.
+    They are only available on Linux and Windows; elsewhere zeros are returned.
+
+    Returns
+    -------
+    bytes_read : int
+        Number of bytes read.
+    bytes_written : int
+        Number of bytes written.
+    """
+    if sys.platform == "win32":
+        return _get_windows_io_counters()
+    try:
+        with open("/proc/self/io", "r") as io_file:
+            counters = dict(line.split(":") for line in io_file if ":" in line)
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (OSError, KeyError, ValueError):
+        return 0, 0
+
+
+def get_peak_rss() -> int:
+    """
+    Return the peak resident set size of the process so far.
+
+    Returns
+    -------
+    peak_rss : int
+        Peak resident set size [bytes], or 0 if it can't be determined.
+    """
+    if sys.platform == "win32":
+        return _get_windows_peak_rss()
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # macOS reports bytes, other platforms kilobytes
+        return peak_rss
+    return peak_rss * 1024
+
+
+def write_report(report: TextIO, spans: List[Span]) -> None:
+    """
+    Append a table with the timing and resource usage per stage to the report.
+
+    Arguments
+    ---------
+    report : TextIO
+        Text stream for log file.
+    spans : List[Span]
+        The recorded spans.
+    """
+    ApplicationSettingsHelper.log_text("timing_header", file=report)
+    for stage in spans:
+        ApplicationSettingsHelper.log_text(
+            "timing_span",
+            file=report,
+            dict={
+                "name": "  " * stage.depth + stage.name,
+                "wall": stage.wall_time,
+                "cpu": stage.cpu_time,
+                "read": stage.bytes_read / MEGABYTE,
+                "written": stage.bytes_written / MEGABYTE,
+                "rss": stage.peak_rss / MEGABYTE,
+            },
+        )
+    ApplicationSettingsHelper.log_text("timing_footer", file=report)
+
+
+def write_timing_file(filename: str, spans: List[Span], file_format: str) -> None:
+    """
+    Write the recorded spans to a machine-readable file.
+
+    Arguments
+    ---------
+    filename : str
+        Name of the file to be written.
+    spans : List[Span]
+        The recorded spans.
+    file_format : str
+        JSON_FORMAT for a plain list of spans, or CHROME_FORMAT for a trace
+        that can be loaded in chrome://tracing or Perfetto.
+    """
+    if file_format == CHROME_FORMAT:
+        pid = os.getpid()
+        content = {
+            "traceEvents": [
+                {
+                    "name": stage.name,
+                    "cat": "dfastmi",
+                    "ph": "X",
+                    "ts": stage.start * 1e6,
+                    "dur": stage.wall_time * 1e6,
+                    "pid": pid,
+                    "tid": stage.thread_id,
+                    "args": {
+                        "cpu_time": stage.cpu_time,
+                        "bytes_read": stage.bytes_read,
+                        "bytes_written": stage.bytes_written,
+                        "peak_rss": stage.peak_rss,
+                    },
+                }
+                for stage in spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+    else:
+        content = {
+            "format": TIMING_FORMAT,
+            "spans": [asdict(stage) for stage in spans],
+        }
+    with open(filename, "w", encoding="utf-8") as timing_file:
+        json.dump(content, timing_file, indent=1)
+
+
+def get_profiles() -> Dict[str, "pstats.Stats"]:
+    """
+    Return the profiles of the stages recorded since start_recording.
+
+    Returns
+    -------
+    profiles : Dict[str, pstats.Stats]
+        Profile per stage name; repeated stages are combined.
+    """
+    return _profiles
+
+
+def write_profiles(outputdir: str, top: int = PROFILE_TOP) -> List[str]:
+    """
+    Write the profiles of the stages to the output directory.
+
+    A pstats file is written per stage, which can be inspected using e.g.
+    snakeviz or the pstats module, and a summary listing the functions with
+    the largest own time per stage.
+
+    Arguments
+    ---------
+    outputdir : str
+        Directory in which the files are written.
+    top : int
+        Number of functions listed per stage in the summary.
+
+    Returns
+    -------
+    filenames : List[str]
+        Names of the files written.
+    """
+    filenames = []
+    summary_file = str(Path(outputdir) / PROFILE_SUMMARY)
+    with open(summary_file, "w", encoding="utf-8") as summary:
+        for name, stats in _profiles.items():
+            filename = str(Path(outputdir) / f"profile_{name.replace(' ', '_')}.pstats")
+            stats.dump_stats(filename)
+            filenames.append(filename)
+
+            summary.write(f"=== {name} ===\n")
+            stats.stream = summary
+            stats.sort_stats("tottime").print_stats(top)
+    filenames.append(summary_file)
+    return filenames
+
+
+def _start_profiler() -> Optional["cProfile.Profile"]:
+    """
+    Start profiling a stage if it qualifies for a profile of its own.
+    """
+    global _profiler_active
+    if (
+        not _profiling
+        or _depth == 0
+        or _profiler_active
+        or threading.get_ident() != _profile_thread
+    ):
+        return None
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # another profiler or debugger is active
+        return None
+    _profiler_active = True
+    return profiler
+
+
+def _stop_profiler(name: str, profiler: "cProfile.Profile") -> None:
+    """
+    Stop profiling a stage and add the profile to that of the stage name.
+    """
+    global _profiler_active
+    import pstats
+
+    profiler.disable()
+    _profiler_active = False
+    if name in _profiles:
+        _profiles[name].add(profiler)
+    else:
+        _profiles[name] = pstats.Stats(profiler)
+
+
+def _get_windows_io_counters() -> Tuple[int, int]:
+    """
+    Return the number of bytes read and written by the process on Windows.
+    """
+    import ctypes
+    import ctypes.wintypes
+
+    class IoCounters(ctypes.Structure):
+        _fields_ = [
+            ("ReadOperationCount", ctypes.c_uint64),
+            ("WriteOperationCount", ctypes.c_uint64),
+            ("OtherOperationCount", ctypes.c_uint64),
+            ("ReadTransferCount", ctypes.c_uint64),
+            ("WriteTransferCount", ctypes.c_uint64),
+            ("OtherTransferCount", ctypes.c_uint64),
+        ]
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GetCurrentProcess.restype = ctypes.wintypes.HANDLE
+    counters = IoCounters()
+    if not kernel32.GetProcessIoCounters(
+        kernel32.GetCurrentProcess(), ctypes.byref(counters)
+    ):
+        return 0, 0
+    return counters.ReadTransferCount, counters.WriteTransferCount
+
+
+def _get_windows_peak_rss() -> int:
+    """
+    Return the peak working set size of the process on Windows.
+    """
+    import ctypes
+    import ctypes.wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", ctypes.wintypes.DWORD),
+            ("PageFaultCount", ctypes.wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GetCurrentProcess.restype = ctypes.wintypes.HANDLE
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(
+        kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb
+    ):
+        return 0
+    return counters.PeakWorkingSetSize
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import glob
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from dfastmi.batch import instrumentation
+from dfastmi.batch.core import batch_mode_core
+from dfastmi.config.ConfigFileOperations import ConfigFileOperations
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.RiversObject import RiversObject
+
+# river data of the case run by a worker process
+_RIVERS: Optional[RiversObject] = None
+
+
+@dataclass
+class CaseResult:
+    """Class for keeping track of the outcome of one case of a multi-case run."""
+
+    config_file: str
+    """
+    name of the configuration file of the case
+    """
+
+    success: bool = False
+    """
+    flag indicating whether the analysis completed successfully
+    """
+
+    runtime: float = 0.0
+    """
+    wall clock time of the analysis [s]
+    """
+
+    peak_memory: float = 0.0
+    """
+    peak resident set size of the process that ran the case [MB]
+    """
+
+    error: str = ""
+    """
+    error message if the analysis failed with an exception
+    """
+
+
+def multi_batch_mode(
+    config_patterns: Sequence[str],
+    rivers: RiversObject,
+    reduced_output: bool,
+    workers: int = 0,
+) -> List[CaseResult]:
+    """
+    Run the program in batch mode for multiple configuration files.
+
+    The rivers configuration and program texts are loaded once and shared
+    with a pool of worker processes. Every case runs in a fresh process, such
+    that the peak memory reported is that of the case only. Cases that would write to the same output or figure directory get
+    a subdirectory named after their configuration file, such that report
+    files and results don't overwrite each other. Figures are never shown.
+
+    Arguments
+    ---------
+    config_patterns : Sequence[str]
+        Names of the configuration files; glob patterns are expanded.
+    rivers : RiversObject
+        An object containing the river data.
+    reduced_output : bool
+        Flag to indicate whether WAQUA output should be reduced to the area of
+        interest only.
+    workers : int
+        Number of cases run concurrently; 0 to use one per CPU (default).
+
+    Return
+    ------
+    results : List[CaseResult]
+        Outcome of each case in the order of the configuration files.
+    """
+    if reduced_output:
+        ApplicationSettingsHelper.log_text("reduce_output")
+
+    config_files = expand_config_patterns(config_patterns)
+    if not config_files:
+        ApplicationSettingsHelper.log_text(
+            "multibatch_no_configs", dict={"patterns": " ".join(config_patterns)}
+        )
+        return []
+
+    overrides = get_case_overrides(config_files)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(config_files))
+
+    # worker processes are started while the pool's threads are running;
+    # spawning them avoids inheriting locks held by those threads
+    with multiprocessing.get_context("spawn").Pool(
+        processes=workers,
+        initializer=_initialize_worker,
+        initargs=(ApplicationSettingsHelper.PROGTEXTS, rivers),
+        maxtasksperchild=1,
+    ) as pool:
+        results = pool.starmap(
+            _run_case,
+            [
+                (config_file, override, reduced_output)
+                for config_file, override in zip(config_files, overrides)
+            ],
+            chunksize=1,
+        )
+
+    report_summary(results)
+    return results
+
+
+def expand_config_patterns(config_patterns: Sequence[str]) -> List[str]:
+    """
+    Expand glob patterns into a list of configuration files.
+
+    Names without wildcards are kept as is, such that a missing file is
+    reported as a failed case. Duplicates are removed.
+
+    Arguments
+    ---------
+    config_patterns : Sequence[str]
+        Names of configuration files or glob patterns.
+
+    Return
+    ------
+    config_files : List[str]
+        Names of the configuration files in the order specified.
+    """
+    config_files: List[str] = []
+    for pattern in config_patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+        else:
+            matches = [pattern]
+        for config_file in matches:
+            if config_file not in config_files:
+                config_files.append(config_file)
+    return config_files
+
+
+def get_case_overrides(config_files: Sequence[str]) -> List[Dict[str, str]]:
+    """
+    Determine the configuration settings to change to isolate the cases.
+
+    Every case writes its report file to its output directory. Output and
+    figure directories shared by multiple cases are replaced by a
+    subdirectory per case. Plots are always closed.
+
+    Arguments
+    ---------
+    config_files : Sequence[str]
+        Names of the configuration files.
+
+    Return
+    ------
+    overrides : List[Dict[str, str]]
+        Settings of the [General] block to change per case.
+    """
+    directories: List[Dict[str, Path]] = []
+    for config_file in config_files:
+        rootdir = Path(config_file).absolute().parent
+        case_dirs = {
+            "OutputDir": rootdir.joinpath("output"),
+            "FigureDir": rootdir.joinpath("figure"),
+        }
+        try:
+            config = ConfigFileOperations.load_configuration_file(config_file)
+        except Exception:
+            # the error is reported when the case is run
+            pass
+        else:
+            for key, default in case_dirs.items():
+                case_dirs[key] = Path(config.get("General", key, fallback=default))
+        directories.append(case_dirs)
+
+    case_names = _get_case_names(config_files)
+    overrides: List[Dict[str, str]] = []
+    for case_dirs, case_name in zip(directories, case_names):
+        override = {"ClosePlots": "True"}
+        for key, directory in case_dirs.items():
+            shared = sum(other[key] == directory for other in directories) > 1
+            if shared:
+                override[key] = str(directory.joinpath(case_name))
+        overrides.append(override)
+    return overrides
+
+
+def report_summary(results: Sequence[CaseResult]) -> None:
+    """
+    Write a table with the outcome of every case to standard out.
+
+    Arguments
+    ---------
+    results : Sequence[CaseResult]
+        Outcome of each case.
+    """
+    ApplicationSettingsHelper.log_text("multibatch_summary_header")
+    for result in results:
+        status = ApplicationSettingsHelper.get_text(
+            "multibatch_success" if result.success else "multibatch_failure"
+        )[0]
+        ApplicationSettingsHelper.log_text(
+            "multibatch_summary_case",
+            dict={
+                "status": status,
+                "runtime": result.runtime,
+                "memory": result.peak_memory,
+                "case": result.config_file,
+            },
+        )
+        if result.error:
+            ApplicationSettingsHelper.log_text(
+                "multibatch_summary_error", dict={"error": result.error}
+            )
+    nsuccess = sum(result.success for result in results)
+    ApplicationSettingsHelper.log_text(
+        "multibatch_summary_total",
+        dict={"nsuccess": nsuccess, "ncases": len(results)},
+    )
+
+
+def _get_case_names(config_files: Sequence[str]) -> List[str]:
+    """
+    Return a unique name per case based on the configuration file names.
+    """
+    stems = [Path(config_file).stem for config_file in config_files]
+    names = []
+    for i, stem in enumerate(stems):
+        if stems.count(stem) > 1:
+            names.append(f"{stem}_{stems[:i].count(stem) + 1}")
+        else:
+            names.append(stem)
+    return names
+
+
+def _initialize_worker(progtexts: Dict[str, List[str]], rivers: RiversObject) -> None:
+    """
+    Make the program texts and river data available to the cases of a worker.
+    """
+    global _RIVERS
+    ApplicationSettingsHelper.PROGTEXTS = progtexts
+    _RIVERS = rivers
+
+
+def _run_case(
+    config_file: str, override: Dict[str, str], reduced_output: bool
+) -> CaseResult:
+    """
+    Run the analysis of a single case and measure its runtime and peak memory.
+
+    The peak memory is the peak resident set size of the process, which only
+    runs this case. Allocations aren't traced since that would slow down the
+    analysis considerably.
+
+    Arguments
+    ---------
+    config_file : str
+        Name of the configuration file.
+    override : Dict[str, str]
+        Settings of the [General] block to change.
+    reduced_output : bool
+        Flag to indicate whether WAQUA output should be reduced to the area of
+        interest only.
+
+    Return
+    ------
+    result : CaseResult
+        Outcome of the case.
+    """
+    result = CaseResult(config_file)
+    start = time.perf_counter()
+    try:
+        config = ConfigFileOperations.load_configuration_file(config_file)
+        for key, value in override.items():
+            config.set("General", key, value)
+        for key in ("OutputDir", "FigureDir"):
+            if key in override:
+                Path(override[key]).mkdir(parents=True, exist_ok=True)
+        rootdir = Path(config_file).parent
+        result.success = batch_mode_core(_RIVERS, reduced_output, config, rootdir)
+    except (SystemExit, KeyboardInterrupt) as exception:
+        raise exception
+    except:
+        result.error = str(sys.exc_info()[1])
+    finally:
+        result.runtime = time.perf_counter() - start
+        result.peak_memory = instrumentation.get_peak_rss() / 1024**2
+    return result
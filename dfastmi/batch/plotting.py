@@ -27,12 +27,134 @@ INFORMATION
 This file is part of D-FAST Bank Erosion: https://github.com/Deltares/D-FAST_Bank_Erosion
 """
 
-from typing import List, Optional, Tuple, Union
+from __future__ import annotations
+
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, TypeVar, Union
 
-import matplotlib
-import matplotlib.pyplot
 import numpy
 
+if TYPE_CHECKING:
+    import matplotlib
+    import matplotlib.axes
+    import matplotlib.collections
+    import matplotlib.colors
+    import matplotlib.figure
+
+# matplotlib is only loaded when the first figure is created, such that runs
+# without plotting don't pay for importing it.
+_matplotlib: Optional[ModuleType] = None
+
+T = TypeVar("T")
+
+# function running a figure related task in the thread owning the figures,
+# e.g. the GUI thread if the analysis runs in a worker thread; None to run the
+# tasks in the calling thread
+_figure_thread_runner: Optional[Callable[[Callable[[], Any]], Any]] = None
+
+
+def set_figure_thread_runner(
+    runner: Optional[Callable[[Callable[[], Any]], Any]],
+) -> None:
+    """
+    Set the function running the figure related tasks.
+
+    Arguments
+    ---------
+    runner : Optional[Callable[[Callable[[], Any]], Any]]
+        Function calling the task given in the thread owning the figures,
+        waiting for it to complete and returning its result, or None to run
+        the tasks in the calling thread.
+    """
+    global _figure_thread_runner
+    _figure_thread_runner = runner
+
+
+def run_in_figure_thread(function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Call a function creating or changing figures in the thread owning them.
+
+    Arguments
+    ---------
+    function : Callable[..., T]
+        The function to call.
+    *args, **kwargs
+        The arguments of the function.
+
+    Returns
+    -------
+    result : T
+        The result of the function.
+    """
+    if _figure_thread_runner is None:
+        return function(*args, **kwargs)
+    return _figure_thread_runner(lambda: function(*args, **kwargs))
+
+
+def initialize(interactive: bool = True) -> ModuleType:
+    """
+    Load matplotlib and select the backend to be used for plotting.
+
+    This routine should be called before the first figure is created. If it
+    isn't called, matplotlib will be loaded with its default backend upon
+    first use.
+
+    Arguments
+    ---------
+    interactive : bool
+        Flag indicating whether figures may be shown on screen. If False, the
+        non-interactive Agg backend is selected such that no GUI toolkit
+        needs to be loaded.
+
+    Returns
+    -------
+    matplotlib : ModuleType
+        The matplotlib module with pyplot loaded.
+    """
+    global _matplotlib
+    if _matplotlib is None:
+        import matplotlib
+
+        if not interactive:
+            matplotlib.use("Agg")
+        import matplotlib.pyplot
+
+        _matplotlib = matplotlib
+    return _matplotlib
+
+
+def is_initialized() -> bool:
+    """
+    Check whether matplotlib has been loaded for plotting.
+
+    Returns
+    -------
+    loaded : bool
+        Flag indicating whether matplotlib has been loaded.
+    """
+    return _matplotlib is not None
+
+
+def show(block: bool = True) -> None:
+    """
+    Show all open figures.
+
+    Arguments
+    ---------
+    block : bool
+        Flag indicating whether to wait until all figures have been closed.
+    """
+    if is_initialized():
+        _matplotlib.pyplot.show(block=block)
+
+
+def close_all() -> None:
+    """
+    Close all open figures.
+    """
+    if is_initialized():
+        _matplotlib.pyplot.close("all")
+
 
 def savefig(fig: matplotlib.figure.Figure, filename: str) -> None:
     """
@@ -46,7 +168,7 @@ def savefig(fig: matplotlib.figure.Figure, filename: str) -> None:
         Name of the file to be written.
     """
     print("saving figure {file}".format(file=filename))
-    matplotlib.pyplot.show(block=False)
+    show(block=False)
     fig.savefig(filename, dpi=300)
 
 
@@ -303,6 +425,7 @@ def plot_overview(
     ax : matplotlib.axes.Axes
         Axes object.
     """
+    matplotlib = initialize()
     fig, ax = matplotlib.pyplot.subplots()
     setsize(fig)
     ax.set_aspect(1)
@@ -368,6 +491,7 @@ def plot_sedimentation(
     ax : matplotlib.axes.Axes
         Axes object.
     """
+    matplotlib = initialize()
     fig, ax = matplotlib.pyplot.subplots()
     setsize(fig)
     #
@@ -405,6 +529,7 @@ def get_colors(cmap_name: str, n: int) -> List[Tuple[float, float, float]]:
     clrcyc : List[Tuple[float, float, float]]
         List of colour tuplets.
     """
+    matplotlib = initialize()
     cmap = matplotlib.cm.get_cmap(cmap_name)
     clrs = [cmap(i / (n - 1)) for i in range(n)]
     return clrs
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import threading
+from typing import Callable, Optional
+
+# stages of a D-Flow FM analysis and the fraction of the analysis completed
+# at their start; reading the simulation results usually takes most time
+LOAD_MESH = "load_mesh"
+REGION_OF_INTEREST = "region_of_interest"
+READ_DZQ = "read_dzq"
+CHAR_BED_CHANGES = "char_bed_changes"
+WRITING_OUTPUT = "writing_output"
+INITIAL_YEAR_DREDGING = "initial_year_dredging"
+STAGE_FRACTIONS = {
+    LOAD_MESH: 0.0,
+    REGION_OF_INTEREST: 0.05,
+    READ_DZQ: 0.1,
+    CHAR_BED_CHANGES: 0.7,
+    WRITING_OUTPUT: 0.8,
+    INITIAL_YEAR_DREDGING: 0.95,
+}
+
+ProgressListener = Callable[[str, float], None]
+
+
+class AnalysisCancelled(Exception):
+    """Raised at the start of a stage after cancellation was requested."""
+
+
+# function notified of the progress of the analysis; None if nobody listens,
+# such that batch runs only pay for a few function calls
+_listener: Optional[ProgressListener] = None
+_cancel_requested = threading.Event()
+
+
+def set_listener(listener: Optional[ProgressListener]) -> None:
+    """
+    Set the function to be notified of the progress of the analysis.
+
+    The listener is called in the thread running the analysis with the name
+    of the stage and the fraction of the analysis completed.
+
+    Arguments
+    ---------
+    listener : Optional[ProgressListener]
+        The function to notify, or None to stop notifying.
+    """
+    global _listener
+    _listener = listener
+
+
+def request_cancel() -> None:
+    """
+    Request the analysis to stop at the start of the next stage.
+
+    May be called from any thread.
+    """
+    _cancel_requested.set()
+
+
+def reset() -> None:
+    """
+    Withdraw any cancellation request before starting a new analysis.
+    """
+    _cancel_requested.clear()
+
+
+def is_cancel_requested() -> bool:
+    """
+    Check whether cancellation of the analysis was requested.
+
+    Returns
+    -------
+    cancel_requested : bool
+        True if request_cancel was called and reset wasn't called since.
+    """
+    return _cancel_requested.is_set()
+
+
+def report_stage(stage: str, done: int = 0, total: int = 1) -> None:
+    """
+    Report progress within a stage of the analysis.
+
+    Arguments
+    ---------
+    stage : str
+        Name of the stage, one of the keys of STAGE_FRACTIONS.
+    done : int
+        Number of steps of the stage completed.
+    total : int
+        Total number of steps of the stage.
+
+    Raises
+    ------
+    AnalysisCancelled
+        If cancellation of the analysis was requested.
+    """
+    if _cancel_requested.is_set():
+        raise AnalysisCancelled()
+    if _listener is not None:
+        _listener(stage, _get_fraction(stage, done, total))
+
+
+def _get_fraction(stage: str, done: int, total: int) -> float:
+    """
+    Return the fraction of the analysis completed.
+    """
+    stages = list(STAGE_FRACTIONS)
+    start = STAGE_FRACTIONS[stage]
+    index = stages.index(stage)
+    if index + 1 < len(stages):
+        end = STAGE_FRACTIONS[stages[index + 1]]
+    else:
+        end = 1.0
+    return start + (end - start) * min(done, total) / max(total, 1)
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import hmac
+import json
+import secrets
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dfastmi.batch import sessioncache
+from dfastmi.batch.core import batch_mode_core
+from dfastmi.batch.DFastUtils import get_progloc
+from dfastmi.config.ConfigFileOperations import ConfigFileOperations
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.DzqCache import DzqCache
+from dfastmi.io.RiversObject import RiversObject
+
+# the server only accepts connections from the local machine
+HOST = "127.0.0.1"
+DEFAULT_PORT = 8095
+
+
+class AnalysisServer:
+    """
+    Run analyses on request while keeping the input data cached in memory.
+
+    The rivers configurations, meshes, regions of interest and grid mappings
+    are kept in memory between the analyses, such that a series of analyses
+    of the same model only reads and processes them once. The least recently
+    used data is evicted first. The analyses are run one at a time.
+    """
+
+    def __init__(
+        self,
+        rivers: RiversObject,
+        reduced_output: bool,
+        max_entries: int = sessioncache.DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Create the server and enable caching of the analysis data.
+
+        Arguments
+        ---------
+        rivers : RiversObject
+            An object containing the default river data.
+        reduced_output : bool
+            Flag to indicate whether WAQUA output should be reduced to the area
+            of interest only, unless specified per request.
+        max_entries : int
+            Maximum number of entries cached per category of data.
+        """
+        self._rivers = rivers
+        self._reduced_output = reduced_output
+        self.stopped = False
+        # secret to be included in every request, such that other programs
+        # and web pages can't use the server
+        self.token = secrets.token_urlsafe(24)
+        sessioncache.enable(max_entries)
+
+    def analyse(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the analysis of one case.
+
+        The case is specified either by the name of a configuration file using
+        the key "config_file", or by the settings per section using the key
+        "config". In the latter case, relative paths are interpreted relative
+        to "rootdir" (default: the working directory of the server). The
+        optional key "rivers" selects another rivers configuration file, and
+        "reduced_output" overrules the reduced output setting of the server.
+        Figures are never shown.
+
+        Arguments
+        ---------
+        request : Dict[str, Any]
+            The specification of the case.
+
+        Raises
+        ------
+        ValueError
+            If the request doesn't specify a configuration.
+
+        Returns
+        -------
+        result : Dict[str, Any]
+            Dictionary with the keys "success", "output_dir", "report_file",
+            "runtime" [s] and "error".
+        """
+        if "config_file" in request:
+            config_file = str(request["config_file"])
+            rootdir = Path(config_file).parent
+        elif "config" in request:
+            config_file = None
+            rootdir = Path(request.get("rootdir", Path.cwd()))
+        else:
+            raise ValueError('The request should contain "config" or "config_file".')
+
+        result: Dict[str, Any] = {
+            "success": False,
+            "output_dir": "",
+            "report_file": "",
+            "runtime": 0.0,
+            "error": "",
+        }
+        start = time.perf_counter()
+        try:
+            if config_file is None:
+                config = ConfigFileOperations.load_configuration_dict(
+                    request["config"], str(rootdir)
+                )
+            else:
+                config = ConfigFileOperations.load_configuration_file(config_file)
+            config.set("General", "ClosePlots", "True")
+            outputdir = Path(
+                config.get(
+                    "General", "OutputDir", fallback=str(rootdir.joinpath("output"))
+                )
+            )
+            result["output_dir"] = str(outputdir)
+            result["report_file"] = str(
+                outputdir.joinpath(ApplicationSettingsHelper.get_filename("report.out"))
+            )
+
+            rivers = self._get_rivers(request.get("rivers"))
+            reduced_output = bool(request.get("reduced_output", self._reduced_output))
+            result["success"] = batch_mode_core(rivers, reduced_output, config, rootdir)
+        except (SystemExit, KeyboardInterrupt) as exception:
+            raise exception
+        except:
+            result["error"] = str(sys.exc_info()[1])
+        finally:
+            result["runtime"] = time.perf_counter() - start
+        return result
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Return the number of cached entries, hits and misses per category.
+
+        Returns
+        -------
+        status : Dict[str, Any]
+            Dictionary with the key "cache" containing the cache statistics.
+        """
+        return {"cache": sessioncache.get_statistics()}
+
+    def _get_rivers(self, rivers_file: Optional[str]) -> RiversObject:
+        """
+        Return the river data to use for an analysis.
+
+        Arguments
+        ---------
+        rivers_file : Optional[str]
+            Name of the rivers configuration file; relative names are
+            interpreted relative to the program location. The default river
+            data is used if not specified.
+
+        Returns
+        -------
+        rivers : RiversObject
+            An object containing the river data.
+        """
+        if not rivers_file:
+            return self._rivers
+        abs_rivers_file = str(get_progloc().absolute().joinpath(rivers_file))
+        return sessioncache.get(
+            "rivers",
+            lambda: DzqCache.get_file_identity(abs_rivers_file),
+            lambda: RiversObject(abs_rivers_file, use_cache=True),
+        )
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    Translate the HTTP requests into calls of the analysis server.
+
+    POST /analyse runs an analysis, GET /status returns the cache statistics
+    and POST /shutdown stops the server. All data is exchanged as JSON. Every
+    request should carry the token of the server as "Authorization: Bearer
+    <token>" header. Requests from web pages, which carry an Origin header,
+    are rejected, and so are posts of which the content type isn't JSON;
+    browsers can't send such requests to another site without permission.
+    """
+
+    analysis_server: AnalysisServer
+
+    def do_GET(self) -> None:
+        if not self._check_request(False):
+            return
+        if self.path.rstrip("/") == "/status":
+            self._send_json(200, self.analysis_server.get_status())
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}."})
+
+    def do_POST(self) -> None:
+        if not self._check_request(True):
+            return
+        path = self.path.rstrip("/")
+        if path == "/analyse":
+            try:
+                request = self._read_json()
+                result = self.analysis_server.analyse(request)
+            except ValueError as exception:
+                self._send_json(400, {"error": str(exception)})
+            else:
+                self._send_json(200, result)
+        elif path == "/shutdown":
+            self.analysis_server.stopped = True
+            self._send_json(200, {})
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}."})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # the analyses report their progress themselves
+        pass
+
+    def _check_request(self, has_body: bool) -> bool:
+        """
+        Check the origin, content type and token of a request.
+
+        An error is sent if the request isn't accepted.
+
+        Arguments
+        ---------
+        has_body : bool
+            Flag indicating whether the request should contain a JSON body.
+
+        Returns
+        -------
+        accepted : bool
+            True if the request may be handled.
+        """
+        if "Origin" in self.headers:
+            self._send_json(403, {"error": "Requests from web pages are refused."})
+            return False
+        content_type = self.headers.get("Content-Type", "")
+        if has_body and content_type.split(";")[0].strip().lower() != (
+            "application/json"
+        ):
+            self._send_json(415, {"error": "The content type should be JSON."})
+            return False
+        token = self.analysis_server.token
+        if not hmac.compare_digest(
+            self.headers.get("Authorization", "").encode("utf-8"),
+            f"Bearer {token}".encode("utf-8"),
+        ):
+            self._send_json(401, {"error": "Missing or invalid token."})
+            return False
+        return True
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+        if not isinstance(request, dict):
+            raise ValueError("The request should be a JSON object.")
+        return request
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_http_server(
+    analysis_server: AnalysisServer, port: int = DEFAULT_PORT
+) -> HTTPServer:
+    """
+    Create an HTTP server on the local machine forwarding to an analysis server.
+
+    Arguments
+    ---------
+    analysis_server : AnalysisServer
+        The analysis server handling the requests.
+    port : int
+        The port number to listen on; 0 to select a free port.
+
+    Returns
+    -------
+    http_server : HTTPServer
+        The HTTP server; the port number used is given by its server_port.
+    """
+    handler = type(
+        "RequestHandler", (_RequestHandler,), {"analysis_server": analysis_server}
+    )
+    return HTTPServer((HOST, port), handler)
+
+
+def server_mode(
+    rivers: RiversObject, reduced_output: bool, port: Optional[int] = None
+) -> None:
+    """
+    Run the program as analysis server until a shutdown request is received.
+
+    Arguments
+    ---------
+    rivers : RiversObject
+        An object containing the default river data.
+    reduced_output : bool
+        Flag to indicate whether WAQUA output should be reduced to the area of
+        interest only, unless specified per request.
+    port : Optional[int]
+        The port number to listen on (DEFAULT_PORT if not specified).
+    """
+    if port is None:
+        port = DEFAULT_PORT
+    analysis_server = AnalysisServer(rivers, reduced_output)
+    with create_http_server(analysis_server, port) as http_server:
+        ApplicationSettingsHelper.log_text(
+            "server_started",
+            dict={
+                "host": HOST,
+                "port": http_server.server_port,
+                "token": analysis_server.token,
+            },
+        )
+        try:
+            while not analysis_server.stopped:
+                http_server.handle_request()
+        except KeyboardInterrupt:
+            pass
+    sessioncache.disable()
+    ApplicationSettingsHelper.log_text("server_stopped")
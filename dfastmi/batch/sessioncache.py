@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import contextlib
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Set, Tuple
+
+import numpy
+
+# default number of entries kept per category of cached data; enough to keep
+# the flow fields of all conditions of a reach
+DEFAULT_MAX_ENTRIES = 16
+
+# default maximum total size of the arrays kept in the cache [bytes]
+DEFAULT_MAX_SIZE = 2048 * 1024**2
+
+# cached data per category in least recently used order; None if caching is
+# disabled, such that every analysis run outside the server reads its data
+_entries: Optional[Dict[str, "OrderedDict[Hashable, Any]"]] = None
+_statistics: Dict[str, Dict[str, int]] = {}
+_max_entries = DEFAULT_MAX_ENTRIES
+# size of every cached value over all categories in least recently used order
+_sizes: "OrderedDict[Tuple[str, Hashable], int]" = OrderedDict()
+_max_size = DEFAULT_MAX_SIZE
+# categories of data that are temporarily computed without being cached
+_excluded: Set[str] = set()
+_lock = threading.RLock()
+
+
+def enable(
+    max_entries: int = DEFAULT_MAX_ENTRIES, max_size: int = DEFAULT_MAX_SIZE
+) -> None:
+    """
+    Enable keeping data in memory for use by subsequent analyses.
+
+    Any data cached before is discarded.
+
+    Arguments
+    ---------
+    max_entries : int
+        Maximum number of entries kept per category; the least recently used
+        entries are evicted first.
+    max_size : int
+        Maximum total size of the arrays kept over all categories [bytes]; the
+        least recently used entries are evicted first and values larger than
+        this aren't cached at all.
+    """
+    global _entries, _statistics, _max_entries, _max_size
+    with _lock:
+        _entries = {}
+        _statistics = {}
+        _sizes.clear()
+        _max_entries = max(1, max_entries)
+        _max_size = max(0, max_size)
+
+
+def disable() -> None:
+    """
+    Disable caching and discard all cached data.
+    """
+    global _entries, _statistics
+    with _lock:
+        _entries = None
+        _statistics = {}
+        _sizes.clear()
+
+
+def is_enabled() -> bool:
+    """
+    Check whether data is cached in memory.
+
+    Returns
+    -------
+    enabled : bool
+        True if enable was called and disable wasn't called since.
+    """
+    return _entries is not None
+
+
+def is_cached(category: str) -> bool:
+    """
+    Check whether data of a category is kept in memory.
+
+    Arguments
+    ---------
+    category : str
+        Name of the category of data, e.g. "flow fields".
+
+    Returns
+    -------
+    cached : bool
+        True if caching is enabled and the category isn't excluded.
+    """
+    return is_enabled() and category not in _excluded
+
+
+def get(
+    category: str, get_key: Callable[[], Hashable], compute: Callable[[], Any]
+) -> Any:
+    """
+    Return the cached value for a key, computing and caching it if needed.
+
+    The cached values are shared between analyses and should therefore not be
+    modified by the caller. If caching is disabled the value is computed.
+
+    Arguments
+    ---------
+    category : str
+        Name of the category of data, e.g. "mesh".
+    get_key : Callable[[], Hashable]
+        Function returning the key identifying the value within the category;
+        the key should change whenever the value changes, see for example
+        DzqCache.get_file_identity. It's only called if caching is enabled.
+    compute : Callable[[], Any]
+        Function computing the value if it isn't cached.
+
+    Returns
+    -------
+    value : Any
+        The cached or computed value.
+    """
+    if not is_cached(category):
+        return compute()
+
+    key = get_key()
+    with _lock:
+        if _entries is not None:
+            entries = _entries.setdefault(category, OrderedDict())
+            statistics = _statistics.setdefault(category, {"hits": 0, "misses": 0})
+            if key in entries:
+                entries.move_to_end(key)
+                _sizes.move_to_end((category, key))
+                statistics["hits"] += 1
+                return entries[key]
+            statistics["misses"] += 1
+
+    # compute outside the lock, such that other threads can use the cache
+    value = compute()
+    size = get_size(value)
+
+    with _lock:
+        if _entries is not None and size <= _max_size:
+            entries = _entries.setdefault(category, OrderedDict())
+            entries[key] = value
+            entries.move_to_end(key)
+            _sizes[(category, key)] = size
+            _sizes.move_to_end((category, key))
+            while len(entries) > _max_entries:
+                _sizes.pop((category, entries.popitem(last=False)[0]), None)
+            while sum(_sizes.values()) > _max_size:
+                (old_category, old_key), _ = _sizes.popitem(last=False)
+                _entries[old_category].pop(old_key, None)
+    return value
+
+
+@contextlib.contextmanager
+def excluding(*categories: str) -> Iterator[None]:
+    """
+    Temporarily compute the data of some categories without caching it.
+
+    This avoids filling the cache with data that won't be used again, e.g.
+    the flow fields of the interventions when comparing many variants.
+
+    Arguments
+    ---------
+    categories : str
+        Names of the categories of data that shouldn't be cached.
+    """
+    with _lock:
+        added = set(categories) - _excluded
+        _excluded.update(added)
+    try:
+        yield
+    finally:
+        with _lock:
+            _excluded.difference_update(added)
+
+
+def clear() -> None:
+    """
+    Discard all cached data, but keep caching enabled if it was.
+    """
+    global _statistics
+    with _lock:
+        if _entries is not None:
+            _entries.clear()
+        _statistics = {}
+        _sizes.clear()
+
+
+def get_statistics() -> Dict[str, Dict[str, int]]:
+    """
+    Return the number of entries, hits and misses per category.
+
+    Returns
+    -------
+    statistics : Dict[str, Dict[str, int]]
+        Dictionary with per category the keys "entries", "hits" and "misses".
+    """
+    with _lock:
+        return {
+            category: {
+                "entries": len((_entries or {}).get(category, ())),
+                **statistics,
+            }
+            for category, statistics in _statistics.items()
+        }
+
+
+def get_size(value: Any) -> int:
+    """
+    Estimate the memory occupied by the arrays contained in a value.
+
+    Arrays are searched for in lists, tuples, dictionaries and the attributes
+    of objects of this package, e.g. flow fields and the region of interest;
+    memory-mapped arrays don't count since they're backed by a file. Other
+    data is assumed to be small.
+
+    Arguments
+    ---------
+    value : Any
+        The value, e.g. a list of flow fields.
+
+    Returns
+    -------
+    size : int
+        Total number of bytes of the arrays.
+    """
+    size = 0
+    seen: Set[int] = set()
+    pending = [value]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, numpy.ndarray):
+            if not isinstance(item, numpy.memmap):
+                size += item.nbytes
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+        elif isinstance(item, dict):
+            pending.extend(item.values())
+        elif type(item).__module__.startswith("dfastmi.") and hasattr(item, "__dict__"):
+            pending.extend(vars(item).values())
+    return size
+
+
+def array_key(array: Optional[numpy.ndarray]) -> str:
+    """
+    Describe the contents of an array by a digest.
+
+    Arguments
+    ---------
+    array : Optional[numpy.ndarray]
+        The array, e.g. a selection of faces.
+
+    Returns
+    -------
+    key : str
+        Hexadecimal SHA-256 digest of the shape, type and values of the array.
+    """
+    if array is None:
+        return ""
+    array = numpy.ascontiguousarray(array)
+    digest = hashlib.sha256(f"{array.dtype.str}|{array.shape}".encode("utf-8"))
+    digest.update(array.tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,552 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import csv
+import itertools
+from configparser import ConfigParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+import netCDF4
+import numpy
+from packaging.version import Version
+
+from dfastmi.batch import instrumentation, sessioncache
+from dfastmi.batch.AnalyserDflowfm import AnalyserDflowfm
+from dfastmi.batch.OutputDataDflowfm import OutputDataDflowfm
+from dfastmi.batch.PlotOptions import PlotOptions
+from dfastmi.batch.SedimentationData import SedimentationData
+from dfastmi.config.AConfigurationInitializerBase import (
+    THREAD_POOL,
+    AConfigurationInitializerBase,
+)
+from dfastmi.config.ConfigurationInitializerFactory import (
+    ConfigurationInitializerFactory,
+)
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.IReach import IReach
+from dfastmi.io.OutputFileFactory import OutputFileFactory
+
+SWEEP_SECTION = "Sweep"
+SCENARIO_DIMENSION = "scenario"
+
+# settings of the [General] block that may be varied, with the name, long name
+# and unit of the netCDF variable listing their value per scenario
+SWEEP_KEYS: Dict[str, Tuple[str, str, str]] = {
+    "Ucrit": ("ucrit", "critical flow velocity", "m/s"),
+    "Qthreshold": (
+        "q_threshold",
+        "discharge at which the intervention becomes active",
+        "m3/s",
+    ),
+    "CelerFactor": ("celer_factor", "factor applied to the bed celerities", "1"),
+}
+
+# columns of the summary files with the sedimentation and erosion areas [m2]
+# and volumes [m3]
+VOLUME_COLUMNS = [
+    "sedimentation_area",
+    "sedimentation_volume_max",
+    "sedimentation_volume_method1",
+    "sedimentation_volume_method2",
+    "erosion_area",
+    "erosion_volume_max",
+    "erosion_volume_method1",
+    "erosion_volume_method2",
+]
+
+# columns of the summary file of a sweep
+SUMMARY_COLUMNS = ["scenario", *SWEEP_KEYS, "sedimentation_length", *VOLUME_COLUMNS]
+
+
+def has_sweep(config: ConfigParser) -> bool:
+    """
+    Check whether the configuration specifies a parameter sweep.
+
+    Arguments
+    ---------
+    config : ConfigParser
+        Configuration of the analysis to be run.
+
+    Returns
+    -------
+    sweep : bool
+        True if the configuration contains a non-empty [Sweep] block.
+    """
+    section = _get_sweep_section(config)
+    return section is not None and len(config[section]) > 0
+
+
+def parse_values(text: str) -> List[float]:
+    """
+    Parse the values of a swept setting.
+
+    The values are either given as range "start:step:stop", which includes
+    the stop value if it's a whole number of steps from the start value, or
+    as list of values separated by commas or spaces.
+
+    Arguments
+    ---------
+    text : str
+        The values as specified in the [Sweep] block.
+
+    Raises
+    ------
+    ValueError
+        If the text doesn't specify any valid value.
+
+    Returns
+    -------
+    values : List[float]
+        The values of the setting in the order specified.
+    """
+    if ":" in text:
+        try:
+            start, step, stop = (float(value) for value in text.split(":"))
+        except ValueError:
+            raise ValueError(f'Invalid range "{text}"; expected start:step:stop.')
+        if step == 0.0 or (stop - start) / step < 0.0:
+            raise ValueError(f'Invalid step in range "{text}".')
+        count = int(numpy.floor((stop - start) / step + 1.0e-9)) + 1
+        return [round(start + i * step, 12) for i in range(count)]
+
+    values = text.replace(",", " ").split()
+    if len(values) == 0:
+        raise ValueError("No values specified.")
+    try:
+        return [float(value) for value in values]
+    except ValueError:
+        raise ValueError(f'Invalid list of values "{text}".')
+
+
+def get_variants(config: ConfigParser) -> List[Dict[str, float]]:
+    """
+    Expand the [Sweep] block into the settings of all variants.
+
+    The variants cover all combinations of the values of the swept settings;
+    the setting listed last varies fastest.
+
+    Arguments
+    ---------
+    config : ConfigParser
+        Configuration of the analysis to be run.
+
+    Raises
+    ------
+    ValueError
+        If a setting can't be swept or its values are invalid.
+
+    Returns
+    -------
+    variants : List[Dict[str, float]]
+        The values of the swept settings per variant.
+    """
+    section = _get_sweep_section(config)
+    if section is None:
+        return []
+
+    keys: List[str] = []
+    values: List[List[float]] = []
+    for key, text in config[section].items():
+        matching_keys = [k for k in SWEEP_KEYS if k.lower() == key.lower()]
+        if len(matching_keys) == 0:
+            raise ValueError(
+                f'Setting "{key}" can\'t be swept; expected one of '
+                + ", ".join(SWEEP_KEYS)
+                + "."
+            )
+        try:
+            values.append(parse_values(text))
+        except ValueError as exception:
+            raise ValueError(f'Sweep of "{key}": {exception}')
+        keys.append(matching_keys[0])
+
+    return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+
+
+def get_variant_configuration(
+    config: ConfigParser, variant: Dict[str, float]
+) -> ConfigParser:
+    """
+    Return a copy of the configuration with the settings of one variant.
+
+    Arguments
+    ---------
+    config : ConfigParser
+        Configuration of the analysis including the [Sweep] block.
+    variant : Dict[str, float]
+        The values of the swept settings.
+
+    Returns
+    -------
+    variant_config : ConfigParser
+        Configuration without [Sweep] block of which the [General] block
+        contains the settings of the variant; the conditions are processed
+        on threads.
+    """
+    sweep_section = _get_sweep_section(config)
+    variant_config = ConfigParser()
+    variant_config.optionxform = str
+    variant_config.read_dict(
+        {
+            section: dict(config.items(section, raw=True))
+            for section in config.sections()
+            if section != sweep_section
+        }
+    )
+    for key, value in variant.items():
+        variant_config.set("General", key, repr(value))
+    # worker processes don't share the session cache, hence they would read
+    # the simulation results again for every variant
+    variant_config.set("General", "WorkerPool", THREAD_POOL)
+    return variant_config
+
+
+def analyse_and_report_sweep(
+    display: bool,
+    report: TextIO,
+    reach: IReach,
+    cfg_version: Version,
+    config: ConfigParser,
+    filenames: Dict[Any, Tuple[str, str]],
+    outputdir: Path,
+    plotting_options: PlotOptions,
+) -> bool:
+    """
+    Perform a D-Flow FM analysis for every variant of a parameter sweep.
+
+    The mesh, the region of interest and the flow fields are kept in memory
+    by the session cache, such that they're only read once; the equilibrium
+    bed level changes, the kernel and the sedimentation volumes are evaluated
+    per variant. The bed level changes of all variants are written to one
+    netCDF file with a scenario dimension, and the sedimentation and erosion
+    volumes per variant to a CSV file. No figures are created. The conditions
+    are processed on threads, or sequentially, even if WorkerPool selects
+    processes, since worker processes don't share the session cache.
+
+    Arguments
+    ---------
+    display : bool
+        Flag indicating text output to stdout.
+    report : TextIO
+        Text stream for log file.
+    reach : IReach
+        Reach object we want to do analysis on.
+    cfg_version : Version
+        Version object extracted from the configuration file.
+    config : ConfigParser
+        Configuration of the analysis including the [Sweep] block.
+    filenames : Dict[Any, Tuple[str,str]]
+        Names of the reference and intervention files per condition.
+    outputdir : Path
+        Path of output directory.
+    plotting_options : PlotOptions
+        Class containing the plot options; the chainage line is required for
+        the sedimentation volumes, plotting is switched off.
+
+    Returns
+    -------
+    success : bool
+        Flag indicating whether the analysis of all variants was carried out.
+    """
+    variants = get_variants(config)
+    xykm = plotting_options.xykm
+    no_plotting = plotting_options.model_copy(update={"plotting": False})
+    netcdf_file = outputdir / ApplicationSettingsHelper.get_filename("netcdf.out")
+    summary_file = outputdir / ApplicationSettingsHelper.get_filename("sweep.csv")
+
+    enabled = sessioncache.is_enabled()
+    if not enabled:
+        sessioncache.enable()
+    try:
+        summary = []
+        for index, variant in enumerate(variants):
+            variant_config = ConfigurationInitializerFactory.generate(
+                cfg_version, reach, get_variant_configuration(config, variant)
+            )
+            ApplicationSettingsHelper.log_text(
+                "sweep_scenario",
+                dict={
+                    "index": index + 1,
+                    "settings": ", ".join(
+                        f"{key} = {value:g}" for key, value in variant.items()
+                    ),
+                },
+                file=report,
+            )
+
+            analyser = AnalyserDflowfm(display, report, False, None, variant_config)
+            report_data = analyser.analyse(
+                reach.normal_width, filenames, xykm, no_plotting
+            )
+            if report_data is None or analyser.missing_data:
+                return False
+
+            with instrumentation.span("write netCDF"):
+                if index == 0:
+                    _create_scenario_file(
+                        netcdf_file,
+                        report_data.one_fm_filename,
+                        config,
+                        variants,
+                        reach,
+                        cfg_version,
+                    )
+                _write_scenario(netcdf_file, index, report_data)
+            summary.append(_get_summary(index, variant_config, report_data))
+    finally:
+        if not enabled:
+            sessioncache.disable()
+
+    write_summary(summary_file, SUMMARY_COLUMNS, summary)
+    ApplicationSettingsHelper.log_text(
+        "sweep_results",
+        dict={
+            "count": len(variants),
+            "netcdf": netcdf_file.name,
+            "summary": summary_file.name,
+        },
+        file=report,
+    )
+    return True
+
+
+def get_volumes(sedimentation_data: Optional[SedimentationData]) -> Dict[str, float]:
+    """
+    Return the total sedimentation and erosion areas and volumes.
+
+    Arguments
+    ---------
+    sedimentation_data : Optional[SedimentationData]
+        The areas and volumes per sedimentation and erosion area; None if no
+        chainage line was specified.
+
+    Returns
+    -------
+    volumes : Dict[str, float]
+        The total area [m2] or volume [m3] per column of VOLUME_COLUMNS; empty
+        if sedimentation_data is None.
+    """
+    volumes: Dict[str, float] = {}
+    if sedimentation_data is not None:
+        for prefix, area, volume in [
+            ("sedimentation", sedimentation_data.sedarea, sedimentation_data.sedvol),
+            ("erosion", sedimentation_data.eroarea, sedimentation_data.erovol),
+        ]:
+            volumes[f"{prefix}_area"] = float(numpy.sum(area))
+            for i, method in enumerate(["max", "method1", "method2"]):
+                volumes[f"{prefix}_volume_{method}"] = float(numpy.sum(volume[i, :]))
+    return volumes
+
+
+def write_summary(
+    summary_file: Path, columns: List[str], summary: List[Dict[str, Any]]
+) -> None:
+    """
+    Write a summary with one row per scenario or variant to a CSV file.
+
+    Arguments
+    ---------
+    summary_file : Path
+        Name of the CSV file.
+    columns : List[str]
+        Names of the columns in order of writing.
+    summary : List[Dict[str, Any]]
+        The value per column per row; missing values are written as empty cells.
+    """
+    with summary_file.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=columns, restval="")
+        writer.writeheader()
+        writer.writerows(summary)
+
+
+def _get_sweep_section(config: ConfigParser) -> Optional[str]:
+    """
+    Return the name of the [Sweep] block, which is matched case insensitively.
+    """
+    matching_sections = [
+        section
+        for section in config.sections()
+        if section.lower() == SWEEP_SECTION.lower()
+    ]
+    if len(matching_sections) > 1:
+        raise LookupError(f"Multiple {SWEEP_SECTION} blocks in the file!")
+    return matching_sections[0] if matching_sections else None
+
+
+def _create_scenario_file(
+    netcdf_file: Path,
+    one_fm_filename: str,
+    config: ConfigParser,
+    variants: List[Dict[str, float]],
+    reach: IReach,
+    cfg_version: Version,
+) -> None:
+    """
+    Create the netCDF file with the mesh and the settings per scenario.
+
+    The effective settings are written for all settings that can be swept,
+    including those that are equal for all variants.
+
+    Arguments
+    ---------
+    netcdf_file : Path
+        Name of the netCDF file to be created.
+    one_fm_filename : str
+        Name of the D-Flow FM file of which the mesh is copied.
+    config : ConfigParser
+        Configuration of the analysis including the [Sweep] block.
+    variants : List[Dict[str, float]]
+        The values of the swept settings per variant.
+    reach : IReach
+        Reach object we want to do analysis on.
+    cfg_version : Version
+        Version object extracted from the configuration file.
+    """
+    output_file = OutputFileFactory.generate(one_fm_filename)
+    output_file.copy_ugrid(netcdf_file)
+    result_file = OutputFileFactory.generate(str(netcdf_file))
+
+    settings = [
+        ConfigurationInitializerFactory.generate(
+            cfg_version, reach, get_variant_configuration(config, variant)
+        )
+        for variant in variants
+    ]
+    for key, (name, long_name, unit) in SWEEP_KEYS.items():
+        values = numpy.array(
+            [_get_setting(variant_config, key) for variant_config in settings]
+        )
+        result_file.add_scenario_parameter(
+            name, values, SCENARIO_DIMENSION, long_name, unit
+        )
+
+
+def _get_setting(variant_config: AConfigurationInitializerBase, key: str) -> float:
+    """
+    Return the effective value of a setting that can be swept.
+    """
+    if key == "Ucrit":
+        return variant_config.ucrit
+    if key == "Qthreshold":
+        return variant_config.q_threshold
+    return variant_config.celer_factor
+
+
+def get_bed_level_changes(
+    report_data: OutputDataDflowfm,
+) -> List[Tuple[str, numpy.ndarray, str]]:
+    """
+    Return the characteristic bed level changes on the full mesh.
+
+    Arguments
+    ---------
+    report_data : OutputDataDflowfm
+        DTO with the results of the analysis.
+
+    Returns
+    -------
+    bed_level_changes : List[Tuple[str, numpy.ndarray, str]]
+        Name, values per face and long name of the year-averaged, maximum and
+        minimum bed level change; the faces outside the region of interest
+        hold the netCDF fill value.
+    """
+    nc_fill = netCDF4.default_fillvals["f8"]
+    nfaces = report_data.face_node_connectivity.shape[0]
+    iface = report_data.xykm_data.iface
+    bed_level_changes = []
+    for name, values, long_name in [
+        (
+            "avgdzb",
+            report_data.dzgemi,
+            "year-averaged bed level change without dredging",
+        ),
+        ("maxdzb", report_data.dzmaxi, report_data.zmax_str),
+        ("mindzb", report_data.dzmini, report_data.zmin_str),
+    ]:
+        data = numpy.repeat(nc_fill, nfaces)
+        data[iface] = values
+        bed_level_changes.append((name, data, long_name))
+    return bed_level_changes
+
+
+def _write_scenario(
+    netcdf_file: Path, index: int, report_data: OutputDataDflowfm
+) -> None:
+    """
+    Write the characteristic bed level changes of one scenario.
+
+    Arguments
+    ---------
+    netcdf_file : Path
+        Name of the netCDF file created by _create_scenario_file.
+    index : int
+        Index of the scenario.
+    report_data : OutputDataDflowfm
+        DTO with the results of the scenario.
+    """
+    result_file = OutputFileFactory.generate(str(netcdf_file))
+    meshname = result_file.mesh2d_name
+    facedim = result_file.face_dimension_name
+    for name, data, long_name in get_bed_level_changes(report_data):
+        result_file.add_scenario_variable(
+            name, index, data, meshname, facedim, SCENARIO_DIMENSION, long_name, "m"
+        )
+
+
+def _get_summary(
+    index: int,
+    variant_config: AConfigurationInitializerBase,
+    report_data: OutputDataDflowfm,
+) -> Dict[str, Any]:
+    """
+    Summarise the sedimentation and erosion of one scenario.
+
+    Arguments
+    ---------
+    index : int
+        Index of the scenario.
+    variant_config : AConfigurationInitializerBase
+        DTO with discharges, times, etc. of the scenario.
+    report_data : OutputDataDflowfm
+        DTO with the results of the scenario.
+
+    Returns
+    -------
+    row : Dict[str, Any]
+        The value per column of the summary; the areas [m2] and volumes [m3]
+        are empty if no chainage line was specified.
+    """
+    row: Dict[str, Any] = {"scenario": index + 1}
+    for key in SWEEP_KEYS:
+        row[key] = _get_setting(variant_config, key)
+    row["sedimentation_length"] = variant_config.slength
+
+    row.update(get_volumes(report_data.sedimentation_data))
+    return row
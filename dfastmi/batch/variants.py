@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, TextIO, Tuple
+
+from dfastmi.batch import instrumentation, sessioncache
+from dfastmi.batch.AnalyserDflowfm import AnalyserDflowfm
+from dfastmi.batch.OutputDataDflowfm import OutputDataDflowfm
+from dfastmi.batch.PlotOptions import PlotOptions
+from dfastmi.batch.sweep import (
+    VOLUME_COLUMNS,
+    get_bed_level_changes,
+    get_volumes,
+    write_summary,
+)
+from dfastmi.config.AConfigurationInitializerBase import AConfigurationInitializerBase
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.MapFile import MapFile
+from dfastmi.io.OutputFileFactory import OutputFileFactory
+
+# columns of the summary file with the sedimentation and erosion per variant
+SUMMARY_COLUMNS = ["variant", *VOLUME_COLUMNS]
+
+
+def analyse_and_report_variants(
+    display: bool,
+    report: TextIO,
+    nwidth: float,
+    config: AConfigurationInitializerBase,
+    variant_filenames: Dict[str, Dict[Any, Tuple[str, str]]],
+    outputdir: Path,
+    plotting_options: PlotOptions,
+) -> bool:
+    """
+    Compare multiple variants of an intervention with the same reference.
+
+    The variants are analysed one after the other. The session cache keeps
+    the mesh, the region of interest and the flow fields of the reference
+    simulations in memory, such that every reference file is read only once;
+    the flow fields of the variants are streamed. The bed level changes of
+    all variants are written to one netCDF file with variables per variant,
+    and the sedimentation and erosion volumes per variant to a CSV file. No
+    figures are created.
+
+    Arguments
+    ---------
+    display : bool
+        Flag indicating text output to stdout.
+    report : TextIO
+        Text stream for log file.
+    nwidth : float
+        Normal width of the reach.
+    config : AConfigurationInitializerBase
+        DTO with discharges, times, etc. for analysis.
+    variant_filenames : Dict[str, Dict[Any, Tuple[str,str]]]
+        Names of the reference and intervention files per condition per variant.
+    outputdir : Path
+        Path of output directory.
+    plotting_options : PlotOptions
+        Class containing the plot options; the chainage line is required for
+        the sedimentation volumes, plotting is switched off.
+
+    Returns
+    -------
+    success : bool
+        Flag indicating whether the analysis of all variants was carried out.
+    """
+    xykm = plotting_options.xykm
+    no_plotting = plotting_options.model_copy(update={"plotting": False})
+    netcdf_file = outputdir / ApplicationSettingsHelper.get_filename("netcdf.out")
+    summary_file = outputdir / ApplicationSettingsHelper.get_filename("variants.csv")
+    variable_suffixes = get_variable_suffixes(list(variant_filenames))
+
+    enabled = sessioncache.is_enabled()
+    if not enabled:
+        sessioncache.enable()
+    try:
+        summary = []
+        # the flow fields of every variant are used only once
+        with sessioncache.excluding("flow fields"):
+            for index, (name, filenames) in enumerate(variant_filenames.items()):
+                ApplicationSettingsHelper.log_text(
+                    "variant_analysis", dict={"name": name}, file=report
+                )
+
+                analyser = AnalyserDflowfm(display, report, False, None, config)
+                report_data = analyser.analyse(nwidth, filenames, xykm, no_plotting)
+                if report_data is None or analyser.missing_data:
+                    return False
+
+                with instrumentation.span("write netCDF"):
+                    if index == 0:
+                        output_file = OutputFileFactory.generate(
+                            report_data.one_fm_filename
+                        )
+                        output_file.copy_ugrid(netcdf_file)
+                    _write_variant(netcdf_file, variable_suffixes[name], report_data)
+                summary.append(
+                    {
+                        "variant": name,
+                        **get_volumes(report_data.sedimentation_data),
+                    }
+                )
+    finally:
+        if not enabled:
+            sessioncache.disable()
+
+    write_summary(summary_file, SUMMARY_COLUMNS, summary)
+    ApplicationSettingsHelper.log_text(
+        "variant_results",
+        dict={
+            "count": len(variant_filenames),
+            "netcdf": netcdf_file.name,
+            "summary": summary_file.name,
+        },
+        file=report,
+    )
+    return True
+
+
+def get_variable_suffixes(names: List[str]) -> Dict[str, str]:
+    """
+    Return the suffix of the netCDF variable names per variant.
+
+    Characters that aren't allowed in netCDF variable names are replaced by
+    underscores; a number is appended to suffixes that would otherwise be
+    equal.
+
+    Arguments
+    ---------
+    names : List[str]
+        Names of the variants.
+
+    Returns
+    -------
+    suffixes : Dict[str, str]
+        The unique suffix per variant name.
+    """
+    suffixes: Dict[str, str] = {}
+    for name in names:
+        suffix = re.sub(r"\W", "_", name, flags=re.ASCII) or "_"
+        unique_suffix = suffix
+        count = 1
+        while unique_suffix in suffixes.values():
+            count += 1
+            unique_suffix = f"{suffix}_{count}"
+        suffixes[name] = unique_suffix
+    return suffixes
+
+
+def _write_variant(
+    netcdf_file: Path, suffix: str, report_data: OutputDataDflowfm
+) -> None:
+    """
+    Write the characteristic bed level changes of one variant.
+
+    Arguments
+    ---------
+    netcdf_file : Path
+        Name of the netCDF file with the mesh.
+    suffix : str
+        Suffix of the variable names of the variant.
+    report_data : OutputDataDflowfm
+        DTO with the results of the variant.
+    """
+    result_file = MapFile(str(netcdf_file))
+    meshname = result_file.mesh2d_name
+    facedim = result_file.face_dimension_name
+    for name, data, long_name in get_bed_level_changes(report_data):
+        result_file.add_variable(
+            f"{name}_{suffix}", data, meshname, facedim, long_name, "m"
+        )
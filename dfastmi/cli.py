@@ -42,7 +42,9 @@ from dfastmi.io.RiversObject import RiversObject
 from dfastmi.kernel.typehints import BoolVector, QRuns
 
 
-def interactive_mode(src: TextIO, rivers: RiversObject, reduced_output: bool) -> None:
+def interactive_mode(
+    src: TextIO, rivers: RiversObject, reduced_output: bool, cache_xyz: bool = False
+) -> None:
     """
     Run the analysis in interactive mode.
 
@@ -57,6 +59,9 @@ def interactive_mode(src: TextIO, rivers: RiversObject, reduced_output: bool) ->
     reduced_output : bool
         Flag to indicate whether WAQUA output should be reduced to the area of
         interest only.
+    cache_xyz : bool
+        Flag indicating whether parsed xyz files may be cached in binary
+        sidecar files, such that repeated runs skip parsing (default False).
     """
     if reduced_output:
         ApplicationSettingsHelper.log_text("reduce_output")
@@ -69,7 +74,7 @@ def interactive_mode(src: TextIO, rivers: RiversObject, reduced_output: bool) ->
     all_done = False
     while not all_done:
         all_done = _run_interactive_mode_once(
-            src, rivers, reduced_output, report, have_files
+            src, rivers, reduced_output, report, have_files, cache_xyz
         )
 
     ApplicationSettingsHelper.log_text("end")
@@ -83,6 +88,7 @@ def _run_interactive_mode_once(
     reduced_output: bool,
     report: TextIO,
     have_files: bool,
+    cache_xyz: bool = False,
 ) -> bool:
     """
     Run the analysis in interactive mode.
@@ -103,6 +109,9 @@ def _run_interactive_mode_once(
     have_files : bool
         Flag indicating whether the user specified that the simulation results
         are available or not.
+    cache_xyz : bool
+        Flag indicating whether parsed xyz files may be cached in binary
+        sidecar files (default False).
 
     Returns
     -------
@@ -155,6 +164,7 @@ def _run_interactive_mode_once(
             fraction_of_year,
             rsigma,
             nlength,
+            cache_xyz,
         )
         all_done = True
     else:
@@ -493,6 +503,7 @@ def _write_report_data(
     fraction_of_year: Tuple[float, float, float],
     rsigma: Tuple[float, float, float],
     nlength: float,
+    cache_xyz: bool = False,
 ) -> None:
     """
     Write the screen log and report file if simulation input is available.
@@ -510,6 +521,9 @@ def _write_report_data(
         interest only.
     tstag : float
         Fraction of year that the river is stagnant.
+    cache_xyz : bool
+        Flag indicating whether parsed xyz files may be cached in binary
+        sidecar files (default False).
     """
 
     # determine critical flow velocity
@@ -546,6 +560,7 @@ def _write_report_data(
         ucrit,
         old_zmin_zmax,
         outputdir,
+        cache_xyz,
     )
 
     if success:
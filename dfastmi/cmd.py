@@ -28,14 +28,15 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 """
 import pathlib
 import sys
+from typing import List, Optional
 
-import dfastmi.batch.core
-import dfastmi.cli
 from dfastmi.batch.DFastUtils import get_progloc
-from dfastmi.gui.dialog_view import main
 from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
 from dfastmi.io.RiversObject import RiversObject
 
+# The modules implementing the run modes are imported only when the run mode
+# is selected, such that e.g. a batch run doesn't load the Qt GUI libraries.
+
 
 def run(
     language: str = "UK",
@@ -43,6 +44,11 @@ def run(
     configfile: str = "dfastmi.cfg",
     rivers_file: str = "Dutch_rivers_v3.ini",
     reduced_output: bool = False,
+    cache_xyz: bool = False,
+    configfiles: Optional[List[str]] = None,
+    workers: int = 0,
+    profile: bool = False,
+    port: Optional[int] = None,
 ) -> None:
     """
     Main routine initializing the language file and starting the chosen run mode.
@@ -52,7 +58,7 @@ def run(
     language: str
         Display language 'NL' or 'UK' ('UK' is default)
     runmode: str
-        Run mode 'BATCH', 'CLI' or 'GUI' ('GUI' is default)
+        Run mode 'BATCH', 'MULTIBATCH', 'SERVER', 'CLI' or 'GUI' ('GUI' is default)
     configfile: str
         Configuration file ('dfastmi.cfg' is default)
     rivers_file : str
@@ -60,6 +66,21 @@ def run(
     reduced_output : bool
         Flag to indicate whether WAQUA output should be reduced to the area of
         interest only (False is default).
+    cache_xyz : bool
+        Flag to indicate whether parsed WAQUA xyz files may be cached in binary
+        sidecar files (False is default).
+    configfiles : Optional[List[str]]
+        Names of (or glob patterns for) the configuration files of the cases to
+        run in MULTIBATCH mode (configfile is used if not specified).
+    workers : int
+        Number of worker processes in MULTIBATCH mode (0 for one per CPU is
+        default).
+    profile : bool
+        Flag to indicate whether the analysis stages should be profiled in
+        BATCH and GUI mode (False is default).
+    port : Optional[int]
+        Port number on which the analysis server listens in SERVER mode (8095
+        is default).
     """
 
     progloc = get_progloc()
@@ -78,18 +99,38 @@ def run(
             print("Unable to load language file 'messages." + language + ".ini'")
     else:
         abs_rivers_file = str(pathlib.Path(progloc).absolute().joinpath(rivers_file))
-        rivers = RiversObject(abs_rivers_file)
+        rivers = RiversObject(abs_rivers_file, use_cache=True)
+        if profile:
+            import dfastmi.batch.instrumentation
+
+            dfastmi.batch.instrumentation.enable_profiling()
         if runmode == "BATCH":
+            import dfastmi.batch.core
+
             dfastmi.batch.core.batch_mode(configfile, rivers, reduced_output)
+        elif runmode == "MULTIBATCH":
+            import dfastmi.batch.multibatch
+
+            dfastmi.batch.multibatch.multi_batch_mode(
+                configfiles or [configfile], rivers, reduced_output, workers
+            )
+        elif runmode == "SERVER":
+            import dfastmi.batch.server
+
+            dfastmi.batch.server.server_mode(rivers, reduced_output, port)
         elif runmode == "CLI":
+            import dfastmi.cli
+
             if configfile != "dfastmi.cfg":
                 ApplicationSettingsHelper.log_text("ignoring_config")
-            dfastmi.cli.interactive_mode(sys.stdin, rivers, reduced_output)
+            dfastmi.cli.interactive_mode(sys.stdin, rivers, reduced_output, cache_xyz)
         elif runmode == "GUI":
+            from dfastmi.gui.dialog_view import main
+
             main(rivers, configfile)
         else:
             raise Exception(
-                'Invalid run mode "{}" specified. Should read "BATCH", "CLI" or "GUI".'.format(
+                'Invalid run mode "{}" specified. Should read "BATCH", "MULTIBATCH", "SERVER", "CLI" or "GUI".'.format(
                     runmode
                 )
             )
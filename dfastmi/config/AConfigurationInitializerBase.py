@@ -26,14 +26,28 @@ Stichting Deltares. All rights reserved.
 INFORMATION
 This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
 """
+import os
 from abc import ABC
 from configparser import ConfigParser
 from typing import Tuple
 
 from dfastmi.io.IReach import IReach
+from dfastmi.kernel import precision
 from dfastmi.kernel.core import estimate_sedimentation_length
 from dfastmi.kernel.typehints import BoolVector, Vector
 
+THREAD_POOL = "threads"
+PROCESS_POOL = "processes"
+
+SOURCE_ORDER = "source"
+CHAINAGE_ORDER = "chainage"
+HILBERT_ORDER = "hilbert"
+FACE_ORDERS = (SOURCE_ORDER, CHAINAGE_ORDER, HILBERT_ORDER)
+
+# default maximum total size of the cache of equilibrium bed level changes [MB]
+DEFAULT_DZQ_CACHE_SIZE_MB = 2048
+DEFAULT_DZQ_CACHE_SIZE = DEFAULT_DZQ_CACHE_SIZE_MB * 1024**2
+
 
 class AConfigurationInitializerBase(ABC):
     """
@@ -56,7 +70,23 @@ class AConfigurationInitializerBase(ABC):
         self._n_fields: int = 1
         self._slength: float = 0.0
         self._needs_tide: bool = False
+        self._workers: int = 1
+        self._worker_pool: str = THREAD_POOL
+        self._dzq_cache: bool = False
+        self._dzq_cache_size: int = DEFAULT_DZQ_CACHE_SIZE
+        self._region_cache: bool = False
+        self._block_size: int = 0
+        self._face_order: str = SOURCE_ORDER
+        self._precision: str = precision.DOUBLE
+        self._celer_factor: float = 1.0
         self._set_ucrit(reach, config)
+        self._set_workers(config)
+        self._set_dzq_cache(config)
+        self._set_region_cache(config)
+        self._set_block_size(config)
+        self._set_face_order(config)
+        self._set_precision(config)
+        self._set_celer_factor(config)
         self._case_description = config.get("General", "CaseDescription", fallback="")
 
     @property
@@ -124,6 +154,51 @@ class AConfigurationInitializerBase(ABC):
         """Case description of the model."""
         return self._case_description
 
+    @property
+    def workers(self) -> int:
+        """Number of conditions to process concurrently (1 for sequential processing)."""
+        return self._workers
+
+    @property
+    def worker_pool(self) -> str:
+        """Type of pool used to process conditions concurrently ("threads" or "processes")."""
+        return self._worker_pool
+
+    @property
+    def dzq_cache(self) -> bool:
+        """Flag indicating whether equilibrium bed level changes may be cached."""
+        return self._dzq_cache
+
+    @property
+    def dzq_cache_size(self) -> int:
+        """Maximum total size [bytes] of the cache of equilibrium bed level changes."""
+        return self._dzq_cache_size
+
+    @property
+    def region_cache(self) -> bool:
+        """Flag indicating whether regions of interest and their projection may be cached."""
+        return self._region_cache
+
+    @property
+    def block_size(self) -> int:
+        """Number of faces processed per block (0 to process all faces at once)."""
+        return self._block_size
+
+    @property
+    def face_order(self) -> str:
+        """Order of the faces in the region of interest ("source", "chainage" or "hilbert")."""
+        return self._face_order
+
+    @property
+    def precision(self) -> str:
+        """Floating point precision of the field arrays ("double" or "single")."""
+        return self._precision
+
+    @property
+    def celer_factor(self) -> float:
+        """Factor applied to the bed celerities of the reach [-]."""
+        return self._celer_factor
+
     def _set_ucrit(self, reach: IReach, config: ConfigParser) -> None:
         """
         Set critical flow velocity [m/s] based on dfast mi configuration
@@ -149,6 +224,169 @@ class AConfigurationInitializerBase(ABC):
         ucrit = max(ucrit_min, ucrit)
         self._ucrit = ucrit
 
+    def _set_workers(self, config: ConfigParser) -> None:
+        """
+        Set the number and type of workers used to process the conditions
+        based on dfast mi configuration; 0 workers means one per CPU.
+
+        Arguments
+        ---------
+        config : ConfigParser
+            The variable containing the configuration.
+
+        Return
+        ------
+        None
+        """
+        try:
+            workers = int(config.get("General", "Workers", fallback="1"))
+        except ValueError:
+            workers = 1
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+
+        worker_pool = config.get("General", "WorkerPool", fallback=THREAD_POOL)
+        if worker_pool.strip().lower() == PROCESS_POOL:
+            self._worker_pool = PROCESS_POOL
+        else:
+            self._worker_pool = THREAD_POOL
+
+    def _set_dzq_cache(self, config: ConfigParser) -> None:
+        """
+        Set whether and how much equilibrium bed level changes may be cached
+        based on dfast mi configuration.
+
+        Arguments
+        ---------
+        config : ConfigParser
+            The variable containing the configuration.
+
+        Return
+        ------
+        None
+        """
+        try:
+            self._dzq_cache = config.getboolean("General", "DzqCache", fallback=False)
+        except ValueError:
+            self._dzq_cache = False
+
+        try:
+            size_mb = float(
+                config.get(
+                    "General", "DzqCacheSize", fallback=str(DEFAULT_DZQ_CACHE_SIZE_MB)
+                )
+            )
+        except ValueError:
+            size_mb = DEFAULT_DZQ_CACHE_SIZE_MB
+        self._dzq_cache_size = int(max(size_mb, 0.0) * 1024**2)
+
+    def _set_region_cache(self, config: ConfigParser) -> None:
+        """
+        Set whether the region of interest and its projection onto the
+        chainage line may be cached based on dfast mi configuration.
+
+        Arguments
+        ---------
+        config : ConfigParser
+            The variable containing the configuration.
+
+        Return
+        ------
+        None
+        """
+        try:
+            self._region_cache = config.getboolean(
+                "General", "RegionCache", fallback=False
+            )
+        except ValueError:
+            self._region_cache = False
+
+    def _set_block_size(self, config: ConfigParser) -> None:
+        """
+        Set the number of faces processed per block based on dfast mi
+        configuration; 0 means that all faces are processed at once.
+
+        Arguments
+        ---------
+        config : ConfigParser
+            The variable containing the configuration.
+
+        Return
+        ------
+        None
+        """
+        try:
+            block_size = int(config.get("General", "BlockSize", fallback="0"))
+        except ValueError:
+            block_size = 0
+        self._block_size = max(block_size, 0)
+
+    def _set_face_order(self, config: ConfigParser) -> None:
+        """
+        Set the order in which the faces in the region of interest are
+        processed based on dfast mi configuration.
+
+        Arguments
+        ---------
+        config : ConfigParser
+            The variable containing the configuration.
+
+        Return
+        ------
+        None
+        """
+        face_order = config.get("General", "FaceOrder", fallback=SOURCE_ORDER)
+        face_order = face_order.strip().lower()
+        if face_order in FACE_ORDERS:
+            self._face_order = face_order
+        else:
+            self._face_order = SOURCE_ORDER
+
+    def _set_precision(self, config: ConfigParser) -> None:
+        """
+        Set the floating point precision of the flow fields and bed level
+        changes based on dfast mi configuration.
+
+        Arguments
+        ---------
+        config : ConfigParser
+            The variable containing the configuration.
+
+        Return
+        ------
+        None
+        """
+        value = config.get("General", "Precision", fallback=precision.DOUBLE)
+        value = value.strip().lower()
+        if value in precision.PRECISIONS:
+            self._precision = value
+        else:
+            self._precision = precision.DOUBLE
+
+    def _set_celer_factor(self, config: ConfigParser) -> None:
+        """
+        Set the factor applied to the bed celerities of the reach based on
+        dfast mi configuration; non-positive values are ignored.
+
+        Arguments
+        ---------
+        config : ConfigParser
+            The variable containing the configuration.
+
+        Return
+        ------
+        None
+        """
+        try:
+            celer_factor = float(config.get("General", "CelerFactor", fallback="1"))
+        except ValueError:
+            celer_factor = 1.0
+        if celer_factor > 0.0:
+            self._celer_factor = celer_factor
+        else:
+            self._celer_factor = 1.0
+
     def _set_slength(self) -> None:
         """
         Should only be called AFTER(!) init.
@@ -163,4 +401,6 @@ class AConfigurationInitializerBase(ABC):
         ------
         None
         """
-        self._slength = estimate_sedimentation_length(self.time_fractions_of_the_year, self.celerity)
+        self._slength = estimate_sedimentation_length(
+            self.time_fractions_of_the_year, self.celerity
+        )
@@ -30,12 +30,26 @@ import configparser
 import os
 from configparser import ConfigParser
 from pathlib import Path
+from typing import Dict, List
 
 from packaging.version import Version
 
 from dfastmi.config.ConfigurationCheckerFactory import ConfigurationCheckerFactory
 from dfastmi.io.RiversObject import RiversObject
 
+# keys of which the values are paths relative to the configuration file
+PATH_KEYS = (
+    "RiverKM",
+    "FigureDir",
+    "OutputDir",
+    "Reference",
+    "WithMeasure",
+    "WithIntervention",
+)
+
+# prefix of the keys specifying the file of a variant of the intervention
+VARIANT_PREFIX = "WithIntervention."
+
 
 class ConfigFileOperations:
     @staticmethod
@@ -113,21 +127,25 @@ class ConfigFileOperations:
         rconfig : configparser.ConfigParser
             Configuration for the D-FAST Morphological Impact analysis with as much as possible relative paths.
         """
-        for key in (
-            "RiverKM",
-            "FigureDir",
-            "OutputDir",
-            "Reference",
-            "WithMeasure",
-            "WithIntervention",
-        ):
-            for qstr in config.keys():
-                if key in config[qstr]:
-                    ConfigFileOperations._update_to_relative_path(
-                        rootdir, config, qstr, key
-                    )
+        for qstr in config.keys():
+            for key in ConfigFileOperations._get_path_keys(config[qstr]):
+                ConfigFileOperations._update_to_relative_path(
+                    rootdir, config, qstr, key
+                )
         return config
 
+    @staticmethod
+    def _get_path_keys(section: configparser.SectionProxy) -> List[str]:
+        """
+        Return the keys of a block of which the values are paths.
+
+        Besides the fixed keys these are the WithIntervention.<name> keys
+        specifying the files of the variants of an intervention.
+        """
+        return [key for key in PATH_KEYS if key in section] + [
+            key for key in section if key.lower().startswith(VARIANT_PREFIX.lower())
+        ]
+
     @staticmethod
     def _update_to_relative_path(
         rootdir: Path, config: configparser.ConfigParser, section: str, key: str
@@ -191,6 +209,51 @@ class ConfigFileOperations:
         with Path(filename).open("r", encoding="utf-8") as configfile:
             config.read_file(configfile)
 
+        rootdir = os.path.dirname(filename)
+        return ConfigFileOperations._prepare_configuration(rootdir, config)
+
+    @staticmethod
+    def load_configuration_dict(
+        sections: Dict[str, Dict[str, str]], rootdir: str
+    ) -> configparser.ConfigParser:
+        """
+        Convert a dictionary to a configuration object with absolute paths.
+
+        Arguments
+        ---------
+        sections : Dict[str, Dict[str, str]]
+            The settings per section, as they would appear in a configuration file.
+        rootdir : str
+            The directory relative to which all relative paths in the configuration are assumed.
+
+        Raises
+        ------
+        Exception
+            If the configuration does not include version information.
+            If the version number in the configuration is not supported.
+
+        Returns
+        -------
+        aconfig : configparser.ConfigParser
+            Configuration for the D-FAST Morphological Impact analysis with only absolute paths.
+        """
+        config = configparser.ConfigParser()
+        config.optionxform = str
+        config.read_dict(
+            {
+                section: {key: str(value) for key, value in settings.items()}
+                for section, settings in sections.items()
+            }
+        )
+        return ConfigFileOperations._prepare_configuration(rootdir, config)
+
+    @staticmethod
+    def _prepare_configuration(
+        rootdir: str, config: configparser.ConfigParser
+    ) -> configparser.ConfigParser:
+        """
+        Check the version of a configuration and convert it to absolute paths.
+        """
         config = ConfigFileOperations._config_case_check(config)
         file_version = config.get("General", "Version", fallback="")
         if len(file_version) == 0:
@@ -203,7 +266,6 @@ class ConfigFileOperations:
         ):
             raise ValueError(f"Unsupported version number {file_version} in the file!")
 
-        rootdir = os.path.dirname(filename)
         return ConfigFileOperations._config_to_absolute_paths(rootdir, config)
 
     @staticmethod
@@ -224,6 +286,18 @@ class ConfigFileOperations:
             "FigureDir",
             "ClosePlots",
             "RiverKM",
+            "Workers",
+            "WorkerPool",
+            "DzqCache",
+            "DzqCacheSize",
+            "RegionCache",
+            "BlockSize",
+            "FaceOrder",
+            "Precision",
+            "CelerFactor",
+            "Timing",
+            "TimingFile",
+            "TimingFormat",
         ]:
             config = ConfigFileOperations._config_case_check_key(config, "General", key)
 
@@ -287,19 +361,11 @@ class ConfigFileOperations:
         aconfig : configparser.ConfigParser
             Configuration for the D-FAST Morphological Impact analysis with only absolute paths.
         """
-        for key in (
-            "RiverKM",
-            "FigureDir",
-            "OutputDir",
-            "Reference",
-            "WithMeasure",
-            "WithIntervention",
-        ):
-            for qstr in config.keys():
-                if key in config[qstr]:
-                    ConfigFileOperations._update_to_absolute_path(
-                        rootdir, config, qstr, key
-                    )
+        for qstr in config.keys():
+            for key in ConfigFileOperations._get_path_keys(config[qstr]):
+                ConfigFileOperations._update_to_absolute_path(
+                    rootdir, config, qstr, key
+                )
         return config
 
     @staticmethod
@@ -66,7 +66,10 @@ class ConfigurationInitializer(AConfigurationInitializerBase):
         self._set_fraction_times(reach)
 
         # determine the bed celerity based on the input settings
-        self._celerity = self.get_bed_celerity(reach, self.discharges)
+        self._celerity = tuple(
+            self.celer_factor * celerity
+            for celerity in self.get_bed_celerity(reach, self.discharges)
+        )
 
         self._rsigma = relax_factors(
             self.discharges,
@@ -57,8 +57,8 @@ class ConfigurationInitializerLegacy(AConfigurationInitializerBase):
         """
 
         super().__init__(reach, config)
-        celerity_hg = reach.proprate_high
-        celerity_lw = reach.proprate_low
+        celerity_hg = self.celer_factor * reach.proprate_high
+        celerity_lw = self.celer_factor * reach.proprate_low
         self._q_threshold = self._get_q_threshold_from_config(config)
 
         self._set_discharges(reach, config, celerity_hg, celerity_lw)
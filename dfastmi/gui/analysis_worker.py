@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+from typing import Any, Callable, Dict, Tuple
+
+from PyQt5.QtCore import QObject, Qt, QThread, pyqtSignal
+
+import dfastmi.batch.plotting
+from dfastmi.batch import progress
+
+
+class FigureThreadRunner(QObject):
+    """
+    Run figure related tasks in the GUI thread on behalf of a worker thread.
+
+    matplotlib figures shown on screen are Qt widgets, which may only be
+    created and changed in the GUI thread. The worker thread waits until the
+    GUI thread has completed the task.
+    """
+
+    _task_submitted = pyqtSignal(object)
+
+    def __init__(self):
+        """
+        Create the runner; it should be created in the GUI thread.
+        """
+        super().__init__()
+        self._task_submitted.connect(self._run_task, Qt.BlockingQueuedConnection)
+
+    def __call__(self, task: Callable[[], Any]) -> Any:
+        """
+        Run a task in the GUI thread and return its result.
+
+        Arguments
+        ---------
+        task : Callable[[], Any]
+            The task to run.
+
+        Returns
+        -------
+        result : Any
+            The result of the task; any exception raised is raised again.
+        """
+        if QThread.currentThread() == self.thread():
+            return task()
+        outcome: Dict[str, Any] = {}
+        self._task_submitted.emit((task, outcome))
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("result")
+
+    def _run_task(self, submission: Tuple[Callable[[], Any], Dict[str, Any]]) -> None:
+        task, outcome = submission
+        try:
+            outcome["result"] = task()
+        except BaseException as exception:
+            outcome["error"] = exception
+
+
+class AnalysisWorker(QThread):
+    """
+    Run an analysis in a separate thread such that the GUI stays responsive.
+
+    The progress of the analysis is reported as the name of the stage and the
+    percentage completed. The analysis stops at the start of the next stage
+    if it's cancelled.
+    """
+
+    progress_changed = pyqtSignal(str, int)
+    analysis_finished = pyqtSignal(bool)
+    analysis_cancelled = pyqtSignal()
+
+    def __init__(self, analysis: Callable[[], bool]):
+        """
+        Create the worker; it should be created in the GUI thread.
+
+        Arguments
+        ---------
+        analysis : Callable[[], bool]
+            The function running the analysis and returning whether it
+            completed successfully.
+        """
+        super().__init__()
+        self._analysis = analysis
+        self._figure_thread_runner = FigureThreadRunner()
+
+    def run(self) -> None:
+        """
+        Run the analysis; called in the worker thread after start.
+
+        Any cancellation request should be withdrawn before start, such that
+        a request made before this thread runs isn't lost.
+        """
+        progress.set_listener(self._report_progress)
+        dfastmi.batch.plotting.set_figure_thread_runner(self._figure_thread_runner)
+        success = False
+        try:
+            success = self._analysis()
+        except progress.AnalysisCancelled:
+            pass
+        finally:
+            progress.set_listener(None)
+            dfastmi.batch.plotting.set_figure_thread_runner(None)
+            # a late cancellation request shouldn't affect later analyses
+            cancelled = progress.is_cancel_requested()
+            progress.reset()
+        if cancelled:
+            self.analysis_cancelled.emit()
+        else:
+            self.analysis_finished.emit(success)
+
+    def cancel(self) -> None:
+        """
+        Request the analysis to stop at the start of the next stage.
+        """
+        progress.request_cancel()
+
+    def _report_progress(self, stage: str, fraction: float) -> None:
+        self.progress_changed.emit(stage, round(100 * fraction))
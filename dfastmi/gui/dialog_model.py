@@ -34,6 +34,7 @@ from packaging.version import Version
 from pydantic import BaseModel
 
 import dfastmi
+from dfastmi.batch import sessioncache
 from dfastmi.config.ConfigFileOperations import (
     ConfigFileOperations,
     check_configuration,
@@ -177,6 +178,8 @@ class DialogModel:
 
     def create_configuration(self) -> bool:
         """Create configuration."""
+        # data of a previous case isn't likely to be used again
+        sessioncache.clear()
         self.config = ConfigParser()
         self.config.optionxform = str
         self.config["General"] = GeneralConfig().model_dump()
@@ -193,6 +196,8 @@ class DialogModel:
                 return False
             return True
 
+        # data of a previous case isn't likely to be used again
+        sessioncache.clear()
         self.section = self.config["General"]
         return True
 
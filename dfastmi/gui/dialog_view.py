@@ -48,12 +48,14 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
 import dfastmi.kernel.core
+from dfastmi.batch import sessioncache
 from dfastmi.gui.dialog_model import DialogModel
 from dfastmi.gui.dialog_utils import (
     FileExistValidator,
@@ -103,6 +105,9 @@ class DialogView:
         _save_plots_edit (QCheckBox): The check box for toggling saving plots.
         _figure_dir_edit (QLineEdit): The line edit for specifying the output figure directory.
         _close_plots_edit (QCheckBox): The check box for toggling closing plots.
+        _run_button (QPushButton): The button for starting the analysis.
+        _cancel_button (QPushButton): The button for cancelling the running analysis.
+        _progress_bar (QProgressBar): The bar showing the progress of the analysis.
     """
 
     _app: QApplication = None
@@ -130,6 +135,10 @@ class DialogView:
     _close_plots: QLabel = None
     _close_plots_edit: QCheckBox = None
 
+    _run_button: QPushButton = None
+    _cancel_button: QPushButton = None
+    _progress_bar: QProgressBar = None
+
     def __init__(self, view_model: DialogViewModel):
         """
         Initialize the DialogView.
@@ -169,6 +178,9 @@ class DialogView:
         )
 
         self._view_model.analysis_exception.connect(self._show_error)
+        self._view_model.analysis_progress.connect(self._update_analysis_progress)
+        self._view_model.analysis_finished.connect(self._analysis_finished)
+        self._view_model.analysis_cancelled.connect(self._analysis_cancelled)
         self._update_qvalues_table()
 
     def _update_branch(self, data):
@@ -213,7 +225,7 @@ class DialogView:
 
         # Update reach label
         self._reach.setCurrentText(reach.name)
-        
+
         # Refresh threshold and list of simulations
         self._update_qthreshold(self._view_model._qthreshold)
 
@@ -854,7 +866,7 @@ class DialogView:
 
     def _create_button_bar(self) -> None:
         """
-        Create button bar with run and close buttons.
+        Create button bar with run, cancel and close buttons and a progress bar.
 
         Returns:
             None
@@ -865,9 +877,19 @@ class DialogView:
         button_bar_layout.setContentsMargins(0, 0, 0, 0)
         self._layout.addWidget(button_bar)
 
-        run = QPushButton(gui_text("action_run"), self._win)
-        run.clicked.connect(self._run_analysis)
-        button_bar_layout.addWidget(run)
+        self._progress_bar = QProgressBar(self._win)
+        self._progress_bar.setRange(0, 100)
+        self._progress_bar.setVisible(False)
+        button_bar_layout.addWidget(self._progress_bar, stretch=1)
+
+        self._run_button = QPushButton(gui_text("action_run"), self._win)
+        self._run_button.clicked.connect(self._run_analysis)
+        button_bar_layout.addWidget(self._run_button)
+
+        self._cancel_button = QPushButton(gui_text("action_cancel"), self._win)
+        self._cancel_button.clicked.connect(self._cancel_analysis)
+        self._cancel_button.setEnabled(False)
+        button_bar_layout.addWidget(self._cancel_button)
 
         done = QPushButton(gui_text("action_close"), self._win)
         done.clicked.connect(self._close_dialog)
@@ -875,52 +897,105 @@ class DialogView:
 
     def _run_analysis(self) -> None:
         """
-        Run analysis when the 'Run' button is clicked.
+        Start the analysis in the background when the 'Run' button is clicked.
 
         Returns:
             None
         """
         if self._view_model.check_configuration():
-            try:
-                success = self._view_model.run_analysis()
-            except (SystemExit, KeyboardInterrupt) as exception:
-                raise exception
-            except:
-                self._show_error(
-                    "A run-time exception occurred. Press 'Show Details...' for the full stack trace.",
-                    traceback.format_exc(),
-                )
-                return
-
-            if success:
-                self._show_message(
-                    gui_text(
-                        "end_of_analysis",
-                        placeholder_dictionary={"report": self._view_model.report},
-                    )
+            self._set_analysis_running(True)
+            self._progress_bar.setValue(0)
+            self._progress_bar.setFormat("%p%")
+            self._view_model.start_analysis()
+        else:
+            self._show_error(
+                gui_text(
+                    "analysis_config_incomplete",
                 )
-            else:
-                self._show_error(
-                    gui_text(
-                        "error_during_analysis",
-                        placeholder_dictionary={"report": self._view_model.report},
-                    )
+            )
+
+    def _cancel_analysis(self) -> None:
+        """
+        Request the running analysis to stop when the 'Cancel' button is clicked.
+
+        Returns:
+            None
+        """
+        self._cancel_button.setEnabled(False)
+        self._view_model.cancel_analysis()
+
+    def _set_analysis_running(self, running: bool) -> None:
+        """
+        Update the enabled state of the buttons and progress bar visibility.
+
+        Arguments
+        ---------
+        running : bool
+            Flag indicating whether an analysis is running.
+        """
+        self._run_button.setEnabled(not running)
+        self._cancel_button.setEnabled(running)
+        self._progress_bar.setVisible(running)
+
+    def _update_analysis_progress(self, stage: str, percentage: int) -> None:
+        """
+        Show the current stage and progress of the running analysis.
+
+        Arguments
+        ---------
+        stage : str
+            Name of the stage of the analysis.
+        percentage : int
+            Percentage of the analysis completed.
+        """
+        label = gui_text("progress_" + stage).replace("%", "%%")
+        self._progress_bar.setFormat(label + " (%p%)")
+        self._progress_bar.setValue(percentage)
+
+    def _analysis_finished(self, success: bool) -> None:
+        """
+        Report the outcome of the analysis once it has finished.
+
+        Arguments
+        ---------
+        success : bool
+            Flag indicating whether the analysis completed successfully.
+        """
+        self._set_analysis_running(False)
+        if success:
+            self._show_message(
+                gui_text(
+                    "end_of_analysis",
+                    placeholder_dictionary={"report": self._view_model.report},
                 )
+            )
         else:
             self._show_error(
                 gui_text(
-                    "analysis_config_incomplete",
+                    "error_during_analysis",
+                    placeholder_dictionary={"report": self._view_model.report},
                 )
             )
 
+    def _analysis_cancelled(self) -> None:
+        """
+        Report that the analysis has been cancelled.
+
+        Returns:
+            None
+        """
+        self._set_analysis_running(False)
+        self._show_message(gui_text("analysis_cancelled"))
+
     def _close_dialog(self) -> None:
         """
-        Close the dialog and program.
+        Close the dialog and program; a running analysis is cancelled first.
 
         Arguments
         ---------
         None
         """
+        self._view_model.cancel_analysis(wait=True)
         self._win.close()
 
     def activate_dialog(self) -> None:
@@ -1227,6 +1302,12 @@ def main(rivers_configuration: RiversObject, config_file: Optional[str] = None)
         rivers_configuration (RiversObject): The rivers configuration object.
         config_file (Optional[str], optional): The configuration file path. Defaults to None.
     """
+    # Keep the mesh and flow fields in memory, such that rerunning the analysis
+    # with a different ucrit or Qthreshold doesn't read the simulation results;
+    # the memory use is bounded and the data is discarded when another case is
+    # loaded
+    sessioncache.enable(max_size=sessioncache.DEFAULT_MAX_SIZE)
+
     # Create Model instance
     model = DialogModel(rivers_configuration)
 
@@ -30,14 +30,16 @@ import traceback
 
 # ViewModel
 from configparser import ConfigParser
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
 import dfastmi
+from dfastmi.batch import progress
 from dfastmi.batch.DFastUtils import get_progloc
 from dfastmi.config.ConfigFileOperations import ConfigFileOperations
 from dfastmi.config.ConfigurationInitializer import ConfigurationInitializer
+from dfastmi.gui.analysis_worker import AnalysisWorker
 from dfastmi.gui.dialog_model import DialogModel
 from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
 from dfastmi.io.AReach import AReach
@@ -61,6 +63,9 @@ class DialogViewModel(QObject):
     analysis_exception = pyqtSignal(str, str)
     reference_files_changed = pyqtSignal(str, float, str)
     intervention_files_changed = pyqtSignal(str, float, str)
+    analysis_progress = pyqtSignal(str, int)
+    analysis_finished = pyqtSignal(bool)
+    analysis_cancelled = pyqtSignal()
     _reference_files: FilenameDict = {}
     _intervention_files: FilenameDict = {}
     _ucrit_cache: Dict[Tuple[Branch, AReach], float] = {}
@@ -79,6 +84,7 @@ class DialogViewModel(QObject):
         self._current_branch: Branch = model.rivers.branches[0]
         self._current_reach: AReach = self._current_branch.reaches[0]
         self._qthreshold: float = 0.0
+        self._analysis_worker: Optional[AnalysisWorker] = None
         self.model = model
         self._initialize_qthreshold()
         self._initialize_ucritical()
@@ -291,7 +297,7 @@ class DialogViewModel(QObject):
             return dfastmi.batch.core.batch_mode_core(
                 self.model.rivers, False, run_config, gui=True
             )
-        except (SystemExit, KeyboardInterrupt) as exception:
+        except (SystemExit, KeyboardInterrupt, progress.AnalysisCancelled) as exception:
             raise exception
         except:
             stack_trace = traceback.format_exc()
@@ -303,6 +309,45 @@ class DialogViewModel(QObject):
 
         return False
 
+    @property
+    def is_analysis_running(self) -> bool:
+        """
+        bool: Whether an analysis started by start_analysis is still running.
+        """
+        return self._analysis_worker is not None and self._analysis_worker.isRunning()
+
+    def start_analysis(self) -> None:
+        """
+        Start the analysis in a worker thread.
+
+        The progress and outcome of the analysis are reported via the
+        analysis_progress, analysis_finished and analysis_cancelled signals.
+        """
+        if self.is_analysis_running:
+            return
+        worker = AnalysisWorker(self.run_analysis)
+        worker.progress_changed.connect(self.analysis_progress)
+        worker.analysis_finished.connect(self.analysis_finished)
+        worker.analysis_cancelled.connect(self.analysis_cancelled)
+        self._analysis_worker = worker
+        progress.reset()
+        worker.start()
+
+    def cancel_analysis(self, wait: bool = False) -> None:
+        """
+        Request the running analysis to stop at the start of its next stage.
+
+        Arguments
+        ---------
+        wait : bool
+            Flag indicating whether to wait until the analysis has stopped.
+        """
+        if not self.is_analysis_running:
+            return
+        self._analysis_worker.cancel()
+        if wait:
+            self._analysis_worker.wait()
+
     @property
     def manual_filename(self) -> str:
         """
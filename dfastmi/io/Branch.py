@@ -33,6 +33,8 @@ Classes:
     Branch
 
 """
+from typing import Dict
+
 from dfastmi.io.AReach import AReach
 from dfastmi.io.IBranch import IBranch
 from dfastmi.io.IReach import IReach
@@ -47,6 +49,7 @@ class Branch(IBranch, IObserver[AReach]):
     _reaches: ObservableList[
         AReach
     ]  # Specify the type parameter AReach for ObservableList
+    _reaches_by_name: Dict[str, AReach]
 
     def __init__(self, branch_name: str = "Branch"):
         """
@@ -59,6 +62,7 @@ class Branch(IBranch, IObserver[AReach]):
         super().__init__(_name=branch_name)
         self._name = branch_name
         self._reaches: ObservableList[AReach] = ObservableList[AReach]()
+        self._reaches_by_name: Dict[str, AReach] = {}
         self._reaches.add_observer(self)
 
     def __hash__(self):
@@ -82,10 +86,8 @@ class Branch(IBranch, IObserver[AReach]):
         reach_name : str
             The name of the reach in the branch of the river configuration
         """
-        for reach in self._reaches:
-            if reach.name == reach_name:
-                return reach
-        return None  # Return None if the reach with the given name is not found
+        # Return None if the reach with the given name is not found
+        return self._reaches_by_name.get(reach_name)
 
     @property
     def name(self) -> str:
@@ -107,5 +109,9 @@ class Branch(IBranch, IObserver[AReach]):
         return self._reaches
 
     def notify(self, reach: AReach) -> None:
-        """When a reach is added to the reaches list we want to set the parent branch in the reach element"""
+        """
+        When a reach is added to the reaches list we want to set the parent branch in the reach element
+        and make the reach available for lookup by name (the first reach with a given name is returned).
+        """
         reach.parent_branch = self
+        self._reaches_by_name.setdefault(reach.name, reach)
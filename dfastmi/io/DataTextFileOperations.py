@@ -26,27 +26,39 @@ INFORMATION
 This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
 """
 
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence, Tuple
 
-import fiona
 import numpy
 import shapely
 import shapely.geometry
-from dfastio.xyc.models import XYCModel
 
-fiona.supported_drivers["kml"] = "rw"  # enable KML support which is disabled by default
-fiona.supported_drivers["KML"] = "rw"  # enable KML support which is disabled by default
-fiona.supported_drivers["libkml"] = (
-    "rw"  # enable KML support which is disabled by default
-)
-fiona.supported_drivers["LIBKML"] = (
-    "rw"  # enable KML support which is disabled by default
-)
+from dfastmi.io.XyzCache import XyzCache
+
+# buffer size used for writing SIMONA BOX files
+_BOX_BUFFER_SIZE = 1024 * 1024
+
+
+def _enable_kml_support() -> None:
+    """
+    Enable KML support in fiona which is disabled by default.
+
+    fiona (and thereby GDAL) is only loaded when a chainage file is read, such
+    that runs without chainage file don't pay for loading it.
+    """
+    import fiona
+
+    fiona.supported_drivers["kml"] = "rw"
+    fiona.supported_drivers["KML"] = "rw"
+    fiona.supported_drivers["libkml"] = "rw"
+    fiona.supported_drivers["LIBKML"] = "rw"
 
 
 class DataTextFileOperations:
     @staticmethod
-    def read_waqua_xyz(filename: str, cols: Tuple[int, ...] = (2,)) -> numpy.ndarray:
+    def read_waqua_xyz(
+        filename: str, cols: Tuple[int, ...] = (2,), use_cache: bool = False
+    ) -> numpy.ndarray:
         """
         Read data columns from a SIMONA XYZ file.
 
@@ -56,14 +68,73 @@ class DataTextFileOperations:
             Name of file to be read.
         cols : Tuple[int]
             List of column numbers for which to return the data.
+        use_cache : bool
+            Flag indicating whether the data may be loaded from and stored in
+            the XyzCache sidecar files (default False).
 
         Returns
         -------
         data : numpy.ndarray
             Data read from the file.
         """
-        data = numpy.genfromtxt(filename, delimiter=",", skip_header=1, usecols=cols)
-        return data
+        if use_cache:
+            data = XyzCache.load(filename, cols)
+            if data is None:
+                data = DataTextFileOperations.read_waqua_xyz(filename, cols)
+                XyzCache.save(filename, cols, data)
+            return data
+
+        # pandas parses the fixed comma-separated columns in C and releases the
+        # GIL while doing so, such that multiple files can be read concurrently.
+        # It's only loaded when WAQUA exports are read.
+        import pandas
+
+        frame = pandas.read_csv(
+            filename,
+            header=None,
+            skiprows=1,
+            usecols=list(cols),
+            comment="#",
+            dtype=numpy.float64,
+            engine="c",
+        )
+        data = frame[list(cols)].to_numpy()
+        # squeeze like numpy.genfromtxt: one column gives a one-dimensional array
+        return numpy.squeeze(data)
+
+    @staticmethod
+    def read_waqua_xyz_files(
+        filenames: Sequence[str],
+        cols: Sequence[Tuple[int, ...]],
+        use_cache: bool = False,
+    ) -> List[numpy.ndarray]:
+        """
+        Read data columns from multiple SIMONA XYZ files concurrently.
+
+        Arguments
+        ---------
+        filenames : Sequence[str]
+            Names of the files to be read.
+        cols : Sequence[Tuple[int]]
+            List of column numbers to return for each file.
+        use_cache : bool
+            Flag indicating whether the data may be loaded from and stored in
+            the XyzCache sidecar files (default False).
+
+        Returns
+        -------
+        data : List[numpy.ndarray]
+            Data read from each file.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, len(filenames))) as executor:
+            return list(
+                executor.map(
+                    DataTextFileOperations.read_waqua_xyz,
+                    filenames,
+                    cols,
+                    [use_cache] * len(filenames),
+                )
+            )
 
     @staticmethod
     def write_simona_box(
@@ -83,9 +154,6 @@ class DataTextFileOperations:
         firstn : int
             First N index to be written.
         """
-        # open the data file
-        boxfile = open(filename, "w")
-
         # get shape and prepare block header; data will be written in blocks of 10
         # N-lines
         shp = numpy.shape(rdata)
@@ -94,17 +162,51 @@ class DataTextFileOperations:
         boxheader = "      BOX MNMN=({m1:4d},{n1:5d},{m2:5d},{n2:5d}), VARIABLE_VAL=\n"
         nstep = 10
 
-        # Loop over all N-blocks and write data to file
-        for j in range(firstn, nmax, nstep):
-            k = min(nmax, j + nstep)
-            boxfile.write(boxheader.format(m1=firstm + 1, n1=j + 1, m2=mmax, n2=k))
-            nvalues = (mmax - firstm) * (k - j)
-            boxdata = ("   " + "{:12.3f}" * (k - j) + "\n") * (mmax - firstm)
-            values = tuple(rdata[firstm:mmax, j:k].reshape(nvalues))
-            boxfile.write(boxdata.format(*values))
+        # Loop over all N-blocks and write data to file; each block is formatted
+        # at once from a flat list of Python floats, which is much faster than
+        # formatting NumPy scalars one by one
+        with open(filename, "w", buffering=_BOX_BUFFER_SIZE) as boxfile:
+            for j in range(firstn, nmax, nstep):
+                k = min(nmax, j + nstep)
+                boxfile.write(boxheader.format(m1=firstm + 1, n1=j + 1, m2=mmax, n2=k))
+                boxdata = ("   " + "%12.3f" * (k - j) + "\n") * (mmax - firstm)
+                values = rdata[firstm:mmax, j:k].ravel().tolist()
+                boxfile.write(boxdata % tuple(values))
 
-        # close the file
-        boxfile.close()
+    @staticmethod
+    def write_simona_box_files(
+        filenames: Sequence[str],
+        rdatas: Sequence[numpy.ndarray],
+        firstm: int,
+        firstn: int,
+    ) -> None:
+        """
+        Write multiple SIMONA BOX files concurrently.
+
+        Arguments
+        ---------
+        filenames : Sequence[str]
+            Names of the files to be written.
+        rdatas : Sequence[numpy.ndarray]
+            Two-dimensional NumPy arrays containing the data to be written to each file.
+        firstm : int
+            Firt M index to be written.
+        firstn : int
+            First N index to be written.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, len(filenames))) as executor:
+            futures = [
+                executor.submit(
+                    DataTextFileOperations.write_simona_box,
+                    filename,
+                    rdata,
+                    firstm,
+                    firstn,
+                )
+                for filename, rdata in zip(filenames, rdatas)
+            ]
+            for future in futures:
+                future.result()
 
     @staticmethod
     def get_xykm(
@@ -122,6 +224,9 @@ class DataTextFileOperations:
         xykm : shapely.geometry.linestring.LineString
 
         """
+        _enable_kml_support()
+        from dfastio.xyc.models import XYCModel
+
         # get the chainage file
         xykm = XYCModel.read(kmfile, num_columns=3)
 
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+"""
+Module for DzqCache implementation
+
+Classes:
+    DzqCache
+
+"""
+import contextlib
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy
+
+import dfastmi
+from dfastmi.io import cachedir
+from dfastmi.io.PartitionedMapFile import PartitionedMapFile
+from dfastmi.kernel import precision
+
+# version of the layout of the cache files; increase when it changes
+CACHE_FORMAT = 1
+
+
+class DzqCache:
+    """
+    Content-addressed cache of equilibrium bed level changes per condition.
+
+    The equilibrium bed level change computed from a pair of D-Flow FM files
+    is stored as a NumPy .npy file named after a hash of everything it depends
+    on: the identity (path, size and modification time) of both files, the
+    critical flow velocity, the number of fields processed, the selected faces
+    and, for tidal conditions, the flow direction. A rerun of a case in which
+    only e.g. the chainage file, the plot settings or the output directory
+    changed, thus skips reading the map files. The total size of the cache is
+    bounded by evicting the least recently used files.
+    """
+
+    @staticmethod
+    def get_cache_dir() -> Path:
+        """
+        Return the directory in which the cache files are stored.
+
+        Returns
+        -------
+        cache_dir : Path
+            Directory for the cache files.
+        """
+        return cachedir.get_cache_dir() / "dzq"
+
+    @staticmethod
+    def get_file_identity(filename: str) -> str:
+        """
+        Describe a file by its absolute path, size and modification time.
+
+        The map files of a partitioned run are described together.
+
+        Arguments
+        ---------
+        filename : str
+            Name of the file.
+
+        Returns
+        -------
+        identity : str
+            Text changing whenever the file is replaced or modified.
+        """
+        partitions = PartitionedMapFile.find_partitions(filename)
+        if len(partitions) > 1:
+            return "|".join(
+                DzqCache._get_single_file_identity(file) for file in partitions
+            )
+        return DzqCache._get_single_file_identity(filename)
+
+    @staticmethod
+    def _get_single_file_identity(filename: str) -> str:
+        stat = os.stat(filename)
+        return f"{os.path.abspath(filename)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    @staticmethod
+    def get_cache_key(
+        filenames: Tuple[str, str],
+        ucrit: float,
+        n_fields: int,
+        dx: numpy.ndarray,
+        dy: numpy.ndarray,
+        iface: numpy.ndarray,
+    ) -> str:
+        """
+        Determine the key identifying the equilibrium bed level change.
+
+        Arguments
+        ---------
+        filenames : Tuple[str, str]
+            Names of the reference simulation file and file with the implemented intervention.
+        ucrit : float
+            Critical flow velocity.
+        n_fields : int
+            Number of fields to process (e.g. to cover a tidal period).
+        dx : numpy.ndarray
+            Array containing the x-component of the direction vector at each cell.
+        dy : numpy.ndarray
+            Array containing the y-component of the direction vector at each cell.
+        iface : numpy.ndarray
+            Array containing the subselection of cells.
+
+        Returns
+        -------
+        key : str
+            Hexadecimal SHA-256 digest.
+        """
+        key = hashlib.sha256()
+        key.update(f"{CACHE_FORMAT}|{dfastmi.__version__}\n".encode("utf-8"))
+        for filename in filenames:
+            key.update(DzqCache.get_file_identity(filename).encode("utf-8") + b"\n")
+        key.update(f"{ucrit!r}|{n_fields}\n".encode("utf-8"))
+        key.update(numpy.ascontiguousarray(iface, dtype=numpy.int64).tobytes())
+        if n_fields > 1:
+            key.update(numpy.ascontiguousarray(dx, dtype=numpy.float64).tobytes())
+            key.update(numpy.ascontiguousarray(dy, dtype=numpy.float64).tobytes())
+        if precision.get_precision() != precision.DOUBLE:
+            key.update(f"{precision.get_precision()}\n".encode("utf-8"))
+        return key.hexdigest()
+
+    @staticmethod
+    def get_cache_file(key: str) -> Path:
+        """
+        Return the name of the cache file for a key.
+
+        Arguments
+        ---------
+        key : str
+            The key identifying the equilibrium bed level change.
+
+        Returns
+        -------
+        cache_file : Path
+            The name of the .npy file.
+        """
+        return DzqCache.get_cache_dir() / f"{key}.npy"
+
+    @staticmethod
+    def load(key: str) -> Optional[numpy.ndarray]:
+        """
+        Load the equilibrium bed level change from the cache.
+
+        Arguments
+        ---------
+        key : str
+            The key identifying the equilibrium bed level change.
+
+        Returns
+        -------
+        dzq : Optional[numpy.ndarray]
+            Read-only memory-mapped data, or None if there is no cache entry.
+        """
+        cache_file = DzqCache.get_cache_file(key)
+        try:
+            dzq = numpy.load(cache_file, mmap_mode="r")
+            # mark the entry as recently used
+            os.utime(cache_file)
+            return dzq
+        except Exception:
+            return None
+
+    @staticmethod
+    def save(key: str, dzq: numpy.ndarray, max_size: int) -> None:
+        """
+        Store the equilibrium bed level change in the cache.
+
+        Failure to write the cache isn't considered an error; the value will
+        just be computed again next time.
+
+        Arguments
+        ---------
+        key : str
+            The key identifying the equilibrium bed level change.
+        dzq : numpy.ndarray
+            Array containing equilibrium bed level change.
+        max_size : int
+            Maximum total size of the cache files [bytes].
+        """
+        cache_file = DzqCache.get_cache_file(key)
+        tmp_name = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            handle, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(handle, "wb") as cache:
+                numpy.save(cache, numpy.ascontiguousarray(dzq))
+            os.replace(tmp_name, cache_file)
+        except Exception:
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_name)
+            return
+        DzqCache.evict(max_size)
+
+    @staticmethod
+    def evict(max_size: int) -> None:
+        """
+        Remove the least recently used cache files until the total size fits.
+
+        Arguments
+        ---------
+        max_size : int
+            Maximum total size of the cache files [bytes].
+        """
+        cachedir.evict_entries(DzqCache.get_cache_dir().glob("*.npy"), max_size)
@@ -40,12 +40,15 @@ class FouFile(OutputFile):
     def x_velocity(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Get the x-velocity at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -55,18 +58,22 @@ class FouFile(OutputFile):
         u0 = self.read_face_variable(
             "Last 003: U-component of cell-centre velocity, last values",
             time_index_from_last=time_index_from_last,
+            faces=faces,
         )
         return u0
 
     def y_velocity(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Get the y-velocity at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -76,18 +83,22 @@ class FouFile(OutputFile):
         v0 = self.read_face_variable(
             "Last 004: V-component of cell-centre velocity, last values",
             time_index_from_last=time_index_from_last,
+            faces=faces,
         )
         return v0
 
     def water_depth(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Get the water depth at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -97,7 +108,8 @@ class FouFile(OutputFile):
         s0 = self.read_face_variable(
             "Last 001: water level, last values",
             time_index_from_last=time_index_from_last,
+            faces=faces,
         )
-        zb = self.read_face_variable("flow element center bedlevel (bl)")
+        zb = self.read_face_variable("flow element center bedlevel (bl)", faces=faces)
         h0 = s0 - zb
         return h0
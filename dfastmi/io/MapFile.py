@@ -40,12 +40,15 @@ class MapFile(OutputFile):
     def x_velocity(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Get the x-velocity at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -53,19 +56,24 @@ class MapFile(OutputFile):
             Array with shape (N,) where N is the number of faces.
         """
         u0 = self.read_face_variable(
-            "sea_water_x_velocity", time_index_from_last=time_index_from_last
+            "sea_water_x_velocity",
+            time_index_from_last=time_index_from_last,
+            faces=faces,
         )
         return u0
 
     def y_velocity(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Get the y-velocity at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -73,19 +81,24 @@ class MapFile(OutputFile):
             Array with shape (N,) where N is the number of faces.
         """
         v0 = self.read_face_variable(
-            "sea_water_y_velocity", time_index_from_last=time_index_from_last
+            "sea_water_y_velocity",
+            time_index_from_last=time_index_from_last,
+            faces=faces,
         )
         return v0
 
     def water_depth(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Get the water depth at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -95,5 +108,6 @@ class MapFile(OutputFile):
         h0 = self.read_face_variable(
             "sea_floor_depth_below_sea_surface",
             time_index_from_last=time_index_from_last,
+            faces=faces,
         )
         return h0
@@ -87,6 +87,12 @@ class ObservableList(Generic[T]):
         """
         self._observers.append(observer)
 
+    def remove_observer(self, observer: "IObserver[T]") -> None:
+        """
+        Remove an object from the observers of the list.
+        """
+        self._observers.remove(observer)
+
     def _notify_observers(self, element: T) -> None:
         """
         Notify all observers about the added element.
@@ -30,14 +30,24 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from threading import RLock
 from typing import List, Optional
 
 import netCDF4 as nc
 import numpy as np
 import numpy.ma as ma
 
+from dfastmi.kernel import precision
+
 FACE_LOCATION = "face"
 
+# The netCDF and HDF5 libraries aren't thread-safe, while netCDF4 releases the
+# GIL when calling them; files are therefore only accessed by one thread at a time.
+NETCDF_LOCK = RLock()
+
+# Number of faces read at once when converting data to a smaller data type.
+READ_CHUNK = 131072
+
 
 class OutputFile(ABC):
     """BaseClass of the 'output' data for the provided dflowfm netcdf output file."""
@@ -58,12 +68,15 @@ class OutputFile(ABC):
     def x_velocity(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:  # pragma: no cover
         """Get the x-velocity at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -76,12 +89,15 @@ class OutputFile(ABC):
     def y_velocity(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:  # pragma: no cover
         """Get the y-velocity at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -94,12 +110,15 @@ class OutputFile(ABC):
     def water_depth(
         self,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:  # pragma: no cover
         """Get the water depth at faces.
         Arguments
         ---------
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified).
 
         Returns
         -------
@@ -118,7 +137,7 @@ class OutputFile(ABC):
             String containing the name of the face dimension.
         """
         if not self._face_dimension_name:
-            with nc.Dataset(self._file) as dataset:
+            with NETCDF_LOCK, nc.Dataset(self._file) as dataset:
                 mesh2d = dataset.variables[self.mesh2d_name]
                 facenodeconnect_varname = mesh2d.face_node_connectivity
                 fnc = dataset.get_variables_by_attributes(name=facenodeconnect_varname)[
@@ -159,15 +178,16 @@ class OutputFile(ABC):
         ma.masked_array
             Array with shape (N,M) where N is the number of faces and M the maximum number of nodes per face.
             If not all the faces have the same number of nodes, a boolean mask is provided with shape (N,M)
-            where each True value indicates a fill value.
+            where each True value indicates a fill value. The indices are 32-bit
+            integers unless the mesh has too many nodes.
         """
-        with nc.Dataset(self._file) as dataset:
+        with NETCDF_LOCK, nc.Dataset(self._file) as dataset:
             mesh2d = dataset.variables[self.mesh2d_name]
             var_name = mesh2d.getncattr("face_node_connectivity")
             var = dataset.variables[var_name]
             data = var[...] - self._get_start_index(var)
 
-        return data
+        return precision.as_index(data)
 
     def _get_start_index(self, var: nc.Variable) -> int:
         if "start_index" in var.ncattrs():
@@ -175,7 +195,7 @@ class OutputFile(ABC):
         return 0
 
     def _get_node_coordinate_data(self, standard_names: List[str]) -> np.ndarray:
-        with nc.Dataset(self._file) as dataset:
+        with NETCDF_LOCK, nc.Dataset(self._file) as dataset:
             mesh2d = dataset.variables[self.mesh2d_name]
 
             coord_var_names = mesh2d.getncattr("node_coordinates").split()
@@ -193,6 +213,7 @@ class OutputFile(ABC):
         self,
         varname: str,
         time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Read the last time step of any quantity defined at faces from a D-Flow FM map-file.
@@ -203,6 +224,9 @@ class OutputFile(ABC):
             Name of the netCDF variable to be read.
         time_index_from_last : Optional[int]
             Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Indices of the faces to be read (all faces if not specified). Only
+            the range of faces spanned by the indices is read from the file.
 
         Raises
         ------
@@ -213,31 +237,49 @@ class OutputFile(ABC):
         Returns
         -------
         numpy.ndarray
-            1D data of the requested variable. If the variable is time-dependent,
-            the time_index_from_last is used.
+            1D data of the requested variable in the configured floating point
+            precision. If the variable is time-dependent, the time_index_from_last
+            is used.
         """
-        with nc.Dataset(self._file) as dataset:
+        with NETCDF_LOCK, nc.Dataset(self._file) as dataset:
             var = self._get_face_var_by_name(varname, dataset)
-            data = self._get_var_data(var, time_index_from_last)
+            data = self._get_var_data(var, time_index_from_last, faces)
 
-        return data
+        return precision.as_float(data)
+
+    def _get_var_data(
+        self,
+        var: nc.Variable,
+        time_index_from_last: Optional[int],
+        faces: Optional[np.ndarray] = None,
+    ):
+        first = 0
+        if faces is None:
+            face_range = slice(None)
+        elif len(faces) == 0:
+            face_range = slice(0, 0)
+        else:
+            first = int(faces.min())
+            face_range = slice(first, int(faces.max()) + 1)
 
-    def _get_var_data(self, var: nc.Variable, time_index_from_last: Optional[int]):
         if var.get_dims()[0].isunlimited():
             # assume that time dimension is unlimited and is the first dimension
             # slice to obtain last time step or earlier as requested
             if time_index_from_last is None:
                 time_index_from_last = 0
-            return var[-1 - time_index_from_last, :]
-
-        if time_index_from_last is not None:
+            data = _read_as_float(var, (-1 - time_index_from_last,), face_range)
+        elif time_index_from_last is not None:
             raise ValueError(
                 'Trying to access time-independent variable "{}" with time offset {}.'.format(
                     var.name, -1 - time_index_from_last
                 )
             )
+        else:
+            data = _read_as_float(var, (), face_range)
 
-        return var[...]
+        if faces is None or len(faces) == 0:
+            return data
+        return data[faces - first]
 
     def _get_face_var_by_name(self, varname: str, dataset: nc.Dataset) -> nc.Variable:
         variables = self._get_face_vars_by_standard_name(dataset, varname)
@@ -275,7 +317,7 @@ class OutputFile(ABC):
             String containing the name of the mesh2d variable.
         """
         if not self._mesh2d_name:
-            with nc.Dataset(self._file) as dataset:
+            with NETCDF_LOCK, nc.Dataset(self._file) as dataset:
                 mesh2d = self._get_mesh2d_variable(dataset)
                 self._mesh2d_name = mesh2d.name
 
@@ -308,7 +350,7 @@ class OutputFile(ABC):
         """
         target_file.unlink(missing_ok=True)
 
-        with nc.Dataset(self._file) as source_dataset:
+        with NETCDF_LOCK, nc.Dataset(self._file) as source_dataset:
             with nc.Dataset(target_file, "w", format="NETCDF4") as target_dataset:
 
                 mesh_variable = source_dataset.variables[self.mesh2d_name]
@@ -434,3 +476,176 @@ class OutputFile(ABC):
             var.long_name = long_name
             var.units = unit
             var[:] = data[:]
+
+    def add_variable_block(
+        self,
+        variable_name: str,
+        faces: np.ndarray,
+        data: np.ndarray,
+        mesh_name: str,
+        face_dimension_name: str,
+        long_name: str,
+        unit: str,
+    ) -> None:
+        """
+        Write the values of a variable defined at faces for a block of faces.
+
+        The variable is added to the existing UGRID netCDF file when the first
+        block is written; faces that are never written hold the fill value.
+        The faces of consecutive blocks must be sorted and must not interleave.
+
+        Arguments
+        ---------
+        variable_name : str
+            Name of netCDF variable to be written.
+        faces : numpy.ndarray
+            Sorted indices of the faces of the block.
+        data : numpy.ndarray
+            Linear array containing the data to be written for these faces.
+        mesh_name : str
+            Name of mesh variable in the netCDF file.
+        face_dimension_name : str
+            Name of the face dimension of the selected mesh.
+        long_name : str
+            Long descriptive name for the variable ("None" if no long name attribute
+            should be written).
+        unit : str
+            String indicating the unit ("None" if no unit attribute should be written).
+        """
+        with NETCDF_LOCK, nc.Dataset(self._file, "a") as dst:
+            if variable_name in dst.variables:
+                var = dst.variables[variable_name]
+            else:
+                var = dst.createVariable(variable_name, "f8", (face_dimension_name,))
+                var.mesh = mesh_name
+                var.location = "face"
+                var.long_name = long_name
+                var.units = unit
+
+            if len(faces) == 0:
+                return
+            first = int(faces[0])
+            values = np.full(int(faces[-1]) + 1 - first, nc.default_fillvals["f8"])
+            values[faces - first] = data
+            var[first : first + len(values)] = values
+
+    def add_scenario_parameter(
+        self,
+        variable_name: str,
+        values: np.ndarray,
+        scenario_dimension_name: str,
+        long_name: str,
+        unit: str,
+    ) -> None:
+        """
+        Add a variable defined per scenario to an existing netCDF file.
+
+        The scenario dimension is created if it doesn't exist yet.
+
+        Arguments
+        ---------
+        variable_name : str
+            Name of netCDF variable to be written.
+        values : numpy.ndarray
+            Linear array containing the value per scenario.
+        scenario_dimension_name : str
+            Name of the scenario dimension.
+        long_name : str
+            Long descriptive name for the variable.
+        unit : str
+            String indicating the unit.
+        """
+        with NETCDF_LOCK, nc.Dataset(self._file, "a") as dst:
+            if scenario_dimension_name not in dst.dimensions:
+                dst.createDimension(scenario_dimension_name, len(values))
+            var = dst.createVariable(variable_name, "f8", (scenario_dimension_name,))
+            var.long_name = long_name
+            var.units = unit
+            var[:] = values
+
+    def add_scenario_variable(
+        self,
+        variable_name: str,
+        scenario: int,
+        data: np.ndarray,
+        mesh_name: str,
+        face_dimension_name: str,
+        scenario_dimension_name: str,
+        long_name: str,
+        unit: str,
+    ) -> None:
+        """
+        Write the values of a variable defined at faces for one scenario.
+
+        The variable is added to the existing UGRID netCDF file when the first
+        scenario is written; the scenario dimension must already exist.
+
+        Arguments
+        ---------
+        variable_name : str
+            Name of netCDF variable to be written.
+        scenario : int
+            Index of the scenario.
+        data : numpy.ndarray
+            Linear array containing the data to be written for all faces.
+        mesh_name : str
+            Name of mesh variable in the netCDF file.
+        face_dimension_name : str
+            Name of the face dimension of the selected mesh.
+        scenario_dimension_name : str
+            Name of the scenario dimension.
+        long_name : str
+            Long descriptive name for the variable.
+        unit : str
+            String indicating the unit.
+        """
+        with NETCDF_LOCK, nc.Dataset(self._file, "a") as dst:
+            if variable_name in dst.variables:
+                var = dst.variables[variable_name]
+            else:
+                var = dst.createVariable(
+                    variable_name,
+                    "f8",
+                    (scenario_dimension_name, face_dimension_name),
+                )
+                var.mesh = mesh_name
+                var.location = "face"
+                var.long_name = long_name
+                var.units = unit
+            var[scenario, :] = data
+
+
+def _read_as_float(var: nc.Variable, index: tuple, face_range: slice) -> np.ndarray:
+    """
+    Read a range of faces of a variable in the configured floating point precision.
+
+    If the variable is stored with a larger floating point type, the data is
+    read and converted in chunks of READ_CHUNK faces, such that the data is
+    never held in memory with both data types at once.
+
+    Arguments
+    ---------
+    var : nc.Variable
+        The netCDF variable to be read.
+    index : tuple
+        Indices of the dimensions preceding the face dimension.
+    face_range : slice
+        Range of faces to be read.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        1D data of the variable, masked where the file contains fill values.
+    """
+    dtype = precision.float_dtype()
+    if var.dtype.kind != "f" or var.dtype.itemsize <= dtype.itemsize:
+        return var[index + (face_range,)]
+
+    first, last, _ = face_range.indices(var.shape[len(index)])
+    last = max(first, last)
+    data = ma.masked_array(np.empty(last - first, dtype=dtype))
+    for start in range(first, last, READ_CHUNK):
+        stop = min(start + READ_CHUNK, last)
+        chunk = var[index + (slice(start, stop),)]
+        data[start - first : stop - first] = chunk
+    return data
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from dfastmi.io.OutputFile import OutputFile
+
+
+class OutputFileBlock:
+    """Results at a block of faces of a D-Flow FM output file."""
+
+    def __init__(self, output_file: OutputFile, faces: np.ndarray):
+        """Initializes a new instance of the 'OutputFileBlock' class.
+
+        Arguments
+        ---------
+            output_file : OutputFile
+                The D-Flow FM output file.
+            faces : numpy.ndarray
+                Indices of the faces of the block.
+        """
+        self._output_file = output_file
+        self._faces = faces
+
+    def x_velocity(self, time_index_from_last: Optional[int] = None) -> np.ndarray:
+        """Get the x-velocity at the faces of the block.
+        Arguments
+        ---------
+        time_index_from_last : Optional[int]
+            Time step offset index from the last time step written.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape (N,) where N is the number of faces of the block.
+        """
+        return self._output_file.x_velocity(time_index_from_last, faces=self._faces)
+
+    def y_velocity(self, time_index_from_last: Optional[int] = None) -> np.ndarray:
+        """Get the y-velocity at the faces of the block.
+        Arguments
+        ---------
+        time_index_from_last : Optional[int]
+            Time step offset index from the last time step written.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape (N,) where N is the number of faces of the block.
+        """
+        return self._output_file.y_velocity(time_index_from_last, faces=self._faces)
+
+    def water_depth(self, time_index_from_last: Optional[int] = None) -> np.ndarray:
+        """Get the water depth at the faces of the block.
+        Arguments
+        ---------
+        time_index_from_last : Optional[int]
+            Time step offset index from the last time step written.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape (N,) where N is the number of faces of the block.
+        """
+        return self._output_file.water_depth(time_index_from_last, faces=self._faces)
@@ -33,6 +33,7 @@ from typing import Callable
 from dfastmi.io.FouFile import FouFile
 from dfastmi.io.MapFile import MapFile
 from dfastmi.io.OutputFile import OutputFile
+from dfastmi.io.PartitionedMapFile import PartitionedMapFile
 
 
 class OutputFileFactory:
@@ -72,6 +73,7 @@ class OutputFileFactory:
         -------
         OutputFile : OutputFile
             OutputFile object based on the given file suffix, if no valid FileNameRetriever can be found default MapFile is returned.
+            The map files of a partitioned run are combined into one PartitionedMapFile.
         """
         file_name_suffix = str(file).lower()[-7:]
         constructor = OutputFileFactory._creators.get(file_name_suffix)
@@ -81,5 +83,12 @@ class OutputFileFactory:
             return MapFile(file)
 
 
+def _generate_map_file(file: Path) -> OutputFile:
+    """Generate a MapFile, or a PartitionedMapFile for the map files of a partitioned run."""
+    if PartitionedMapFile.is_partitioned(file):
+        return PartitionedMapFile(file)
+    return MapFile(file)
+
+
 OutputFileFactory.register_creator("_fou.nc", FouFile)
-OutputFileFactory.register_creator("_map.nc", MapFile)
+OutputFileFactory.register_creator("_map.nc", _generate_map_file)
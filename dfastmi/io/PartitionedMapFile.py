@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import atexit
+import glob
+import multiprocessing
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import List, Optional, Tuple
+
+import netCDF4 as nc
+import numpy as np
+import numpy.ma as ma
+
+from dfastmi.io.MapFile import MapFile
+from dfastmi.io.OutputFile import NETCDF_LOCK
+from dfastmi.kernel import precision
+
+# D-Flow FM names the map files of a run on N domains <name>_0000_map.nc up to
+# <name>_<N-1>_map.nc
+PARTITION_PATTERN = re.compile(r"^(?P<prefix>.+)_(?P<domain>\d{4})_map\.nc$")
+
+# the mesh attributes of which the variables aren't merged and hence not written
+UNMERGED_MESH_ATTRIBUTES = [
+    "edge_dimension",
+    "edge_node_connectivity",
+    "edge_face_connectivity",
+    "edge_coordinates",
+    "face_coordinates",
+    "face_face_connectivity",
+    "face_edge_connectivity",
+]
+
+# processes reading the partitions in parallel; shared by all partitioned files
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = Lock()
+
+
+def _read_partition_variable(
+    file: Path,
+    varname: str,
+    time_index_from_last: Optional[int],
+    faces: np.ndarray,
+) -> np.ndarray:
+    """
+    Read a variable for a selection of faces of one partition.
+
+    Defined at module level, such that it can run in a worker process.
+    """
+    return MapFile(file).read_face_variable(
+        varname, time_index_from_last=time_index_from_last, faces=faces
+    )
+
+
+def _get_executor(max_workers: int) -> Executor:
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None and _executor_workers != max_workers:
+            _executor.shutdown()
+            _executor = None
+        if _executor is None:
+            _executor_workers = max_workers
+            # the pool may be started from a worker thread while other threads
+            # hold the netCDF lock; spawned processes don't inherit that lock
+            _executor = ProcessPoolExecutor(
+                max_workers=_executor_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+class PartitionedMapFile(MapFile):
+    """
+    D-Flow FM map output of a run on multiple domains, presented as one file.
+
+    Each domain writes its own map file which includes ghost cells: faces
+    of neighbouring domains that are needed for the computation. The ghost
+    cells are dropped using the domain number of the faces, and the faces
+    are numbered globally using the global face number if available. Nodes
+    shared by multiple domains are merged based on their coordinates. No
+    merged map file is written; the partitions are read on request.
+    """
+
+    def __init__(self, file: Path, max_workers: int = 1):
+        """Initializes a new instance of the 'PartitionedMapFile' class.
+
+        Arguments
+        ---------
+            file : Path
+                The path to the map file of any of the domains.
+            max_workers : int
+                Maximum number of processes reading the partitions concurrently.
+                The partitions are always read sequentially within a worker
+                process, such that the machine isn't oversubscribed.
+        """
+        super().__init__(file)
+        self.max_workers = max_workers
+        self._partitions = PartitionedMapFile.find_partitions(file)
+        self._face_partition: Optional[np.ndarray] = None
+        self._face_local: Optional[np.ndarray] = None
+        self._mesh: Optional[Tuple[np.ndarray, np.ndarray, ma.masked_array]] = None
+
+    @staticmethod
+    def shutdown_executor() -> None:
+        """
+        Stop the processes reading the partitions in parallel, if any.
+
+        A new pool of processes is started when partitions are read again.
+        """
+        global _executor
+        with _executor_lock:
+            if _executor is not None:
+                _executor.shutdown()
+                _executor = None
+
+    @staticmethod
+    def find_partitions(file: Path) -> List[Path]:
+        """
+        Find the map files of all domains of a partitioned D-Flow FM run.
+
+        Arguments
+        ---------
+        file : Path
+            The path to the map file of any of the domains.
+
+        Returns
+        -------
+        partitions : List[Path]
+            The map files of the domains sorted by domain number; empty if the
+            file name doesn't follow the naming of partitioned map files.
+        """
+        match = PARTITION_PATTERN.match(Path(file).name)
+        if not match:
+            return []
+        pattern = glob.escape(match.group("prefix")) + "_[0-9][0-9][0-9][0-9]_map.nc"
+        return sorted(Path(file).parent.glob(pattern))
+
+    @staticmethod
+    def is_partitioned(file: Path) -> bool:
+        """
+        Check whether a file is one of the map files of a partitioned run.
+
+        Arguments
+        ---------
+        file : Path
+            The path to the map file.
+
+        Returns
+        -------
+        partitioned : bool
+            True if map files of multiple domains are found.
+        """
+        return len(PartitionedMapFile.find_partitions(file)) > 1
+
+    @property
+    def partitions(self) -> List[Path]:
+        """Get the map files of the domains sorted by domain number."""
+        return self._partitions
+
+    @property
+    def node_x_coordinates(self) -> np.ndarray:
+        """Get the x-coordinates of the merged nodes.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape (N,) where N is the number of nodes.
+        """
+        return self._get_mesh()[0]
+
+    @property
+    def node_y_coordinates(self) -> np.ndarray:
+        """Get the y-coordinates of the merged nodes.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape (N,) where N is the number of nodes.
+        """
+        return self._get_mesh()[1]
+
+    @property
+    def face_node_connectivity(self) -> ma.masked_array:
+        """Get the face-node connectivity of the faces owned by the domains.
+
+        Returns
+        -------
+        ma.masked_array
+            Array with shape (N,M) where N is the number of faces and M the maximum number of nodes per face.
+            A boolean mask is provided with shape (N,M) where each True value indicates a fill value.
+        """
+        return self._get_mesh()[2].copy()
+
+    def read_face_variable(
+        self,
+        varname: str,
+        time_index_from_last: Optional[int] = None,
+        faces: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Read the last time step of any quantity defined at faces from all domains.
+
+        The domains are read concurrently by worker processes if the faces
+        requested belong to multiple domains and multiple workers are allowed.
+
+        Arguments
+        ---------
+        varname : str
+            Name of the netCDF variable to be read.
+        time_index_from_last : Optional[int]
+            Time step offset index from the last time step written.
+        faces : Optional[numpy.ndarray]
+            Global indices of the faces to be read (all faces if not specified).
+
+        Returns
+        -------
+        numpy.ndarray
+            1D data of the requested variable. If the variable is time-dependent,
+            the time_index_from_last is used.
+        """
+        face_partition, face_local = self._get_face_layout()
+        if faces is None:
+            faces = np.arange(len(face_partition))
+        partition = face_partition[faces]
+        local = face_local[faces]
+
+        selections = [
+            (index, partition == index) for index in np.unique(partition).tolist()
+        ]
+        arguments = [
+            (self._partitions[index], varname, time_index_from_last, local[selected])
+            for index, selected in selections
+        ]
+        if (
+            len(arguments) > 1
+            and self.max_workers > 1
+            and multiprocessing.parent_process() is None
+        ):
+            executor = _get_executor(self.max_workers)
+            futures = [
+                executor.submit(_read_partition_variable, *args) for args in arguments
+            ]
+            values = [future.result() for future in futures]
+        else:
+            values = [_read_partition_variable(*args) for args in arguments]
+
+        if len(values) == 0:
+            return precision.as_float(
+                _read_partition_variable(
+                    self._partitions[0], varname, time_index_from_last, faces[:0]
+                )
+            )
+        data = ma.zeros(len(faces), dtype=precision.float_dtype())
+        for (_, selected), partition_values in zip(selections, values):
+            data[selected] = partition_values
+        return data
+
+    def copy_ugrid(self, target_file: Path) -> None:
+        """
+        Write the merged UGRID mesh of all domains to a netCDF file.
+
+        Only the nodes and faces are written; the variables of the edges and
+        the face coordinates of the domains aren't merged.
+
+        Arguments
+        ---------
+        target_file : Path
+            Path to the target file.
+        """
+        xn, yn, face_node_connectivity = self._get_mesh()
+        target_file.unlink(missing_ok=True)
+
+        with NETCDF_LOCK, nc.Dataset(self._partitions[0]) as source_dataset:
+            with nc.Dataset(target_file, "w", format="NETCDF4") as target_dataset:
+                mesh_variable = source_dataset.variables[self.mesh2d_name]
+                mesh_copy = target_dataset.createVariable(
+                    self.mesh2d_name, mesh_variable.datatype
+                )
+                mesh_copy.setncatts(
+                    {
+                        name: value
+                        for name, value in mesh_variable.__dict__.items()
+                        if name not in UNMERGED_MESH_ATTRIBUTES
+                    }
+                )
+
+                coordinates = {"projection_x_coordinate": xn, "longitude": xn}
+                coordinates.update({"projection_y_coordinate": yn, "latitude": yn})
+                for var_name in mesh_variable.node_coordinates.split():
+                    variable = source_dataset.variables[var_name]
+                    node_dimension = variable.dimensions[0]
+                    if node_dimension not in target_dataset.dimensions:
+                        target_dataset.createDimension(node_dimension, len(xn))
+                    self._copy_merged_variable(
+                        variable, target_dataset, coordinates[variable.standard_name]
+                    )
+
+                variable = source_dataset.variables[
+                    mesh_variable.face_node_connectivity
+                ]
+                for dimension, length in zip(
+                    variable.dimensions, face_node_connectivity.shape
+                ):
+                    target_dataset.createDimension(dimension, length)
+                self._copy_merged_variable(
+                    variable, target_dataset, face_node_connectivity, start_index=0
+                )
+
+    def _copy_merged_variable(
+        self,
+        variable: nc.Variable,
+        target_dataset: nc.Dataset,
+        data: np.ndarray,
+        **attributes,
+    ) -> None:
+        """
+        Create a variable like one of a domain and write the merged data.
+
+        Arguments
+        ---------
+        variable : netCDF4.Variable
+            The variable of one of the domains.
+        target_dataset : netCDF4.Dataset
+            Dataset object representing the destination file.
+        data : numpy.ndarray
+            The merged data.
+        **attributes
+            Attributes overruling those of the variable of the domain.
+        """
+        attributes = {**variable.__dict__, **attributes}
+        fill_value = attributes.pop("_FillValue", None)
+        variable_copy = target_dataset.createVariable(
+            variable.name,
+            variable.datatype,
+            variable.dimensions,
+            fill_value=fill_value,
+        )
+        variable_copy.setncatts(attributes)
+        variable_copy[:] = data
+
+    def _get_face_layout(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Determine per global face the domain and the local index of the face.
+
+        Returns
+        -------
+        face_partition : numpy.ndarray
+            Index of the partition per global face.
+        face_local : numpy.ndarray
+            Index of the face within its partition per global face.
+        """
+        if self._face_partition is None:
+            partition = []
+            local = []
+            global_number = []
+            for index, file in enumerate(self._partitions):
+                domain = int(PARTITION_PATTERN.match(file.name).group("domain"))
+                domains, numbers = self._read_domain_numbers(file)
+                owned = np.flatnonzero(domains == domain)
+                partition.append(np.full(len(owned), index))
+                local.append(owned)
+                global_number.append(None if numbers is None else numbers[owned])
+
+            partition = np.concatenate(partition)
+            local = np.concatenate(local)
+            if any(numbers is None for numbers in global_number):
+                order = np.arange(len(local))
+            else:
+                order = np.argsort(np.concatenate(global_number), kind="stable")
+            self._face_partition = partition[order]
+            self._face_local = local[order]
+
+        return self._face_partition, self._face_local
+
+    def _read_domain_numbers(
+        self, file: Path
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Read the domain number and global number of the faces of a partition.
+
+        Arguments
+        ---------
+        file : Path
+            The map file of the domain.
+
+        Raises
+        ------
+        ValueError
+            If the map file doesn't include the domain numbers of the faces.
+
+        Returns
+        -------
+        domains : numpy.ndarray
+            Domain number per face.
+        numbers : Optional[numpy.ndarray]
+            Global face number per face; None if not available.
+        """
+        with NETCDF_LOCK, nc.Dataset(file) as dataset:
+            variables = dataset.variables
+            domain_name = self.mesh2d_name + "_flowelem_domain"
+            if domain_name not in variables:
+                raise ValueError(
+                    'Partitioned map file "{}" doesn\'t contain variable "{}".'.format(
+                        file, domain_name
+                    )
+                )
+            domains = np.asarray(variables[domain_name][...])
+            number_name = self.mesh2d_name + "_flowelem_globalnr"
+            numbers = None
+            if number_name in variables:
+                numbers = np.asarray(variables[number_name][...])
+        return domains, numbers
+
+    def _get_mesh(self) -> Tuple[np.ndarray, np.ndarray, ma.masked_array]:
+        """
+        Merge the meshes of the domains into one mesh.
+
+        Only the faces owned by the domains are kept, and nodes with equal
+        coordinates are merged. The nodes are numbered in order of first use.
+
+        Returns
+        -------
+        xn : numpy.ndarray
+            The x-coordinates of the nodes.
+        yn : numpy.ndarray
+            The y-coordinates of the nodes.
+        face_node_connectivity : ma.masked_array
+            The node indices per face in global face order.
+        """
+        if self._mesh is None:
+            face_partition, face_local = self._get_face_layout()
+            xn = []
+            yn = []
+            connectivity = []
+            max_nodes = 0
+            offset = 0
+            for file in self._partitions:
+                partition_file = MapFile(file)
+                xn.append(np.asarray(partition_file.node_x_coordinates))
+                yn.append(np.asarray(partition_file.node_y_coordinates))
+                face_nodes = ma.masked_less(partition_file.face_node_connectivity, 0)
+                connectivity.append(face_nodes + offset)
+                max_nodes = max(max_nodes, face_nodes.shape[1])
+                offset += len(xn[-1])
+
+            # global face order
+            nfaces = len(face_partition)
+            face_nodes = ma.masked_all(
+                (nfaces, max_nodes), dtype=precision.index_dtype(offset)
+            )
+            for index, partition_nodes in enumerate(connectivity):
+                selected = face_partition == index
+                columns = partition_nodes.shape[1]
+                face_nodes[selected, :columns] = partition_nodes[face_local[selected]]
+
+            # merge the nodes used by the faces based on their coordinates
+            xn = np.concatenate(xn)
+            yn = np.concatenate(yn)
+            used = face_nodes.compressed()
+            keys = xn[used] + 1j * yn[used]
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            rank = np.empty(len(first), dtype=precision.index_dtype(len(first)))
+            rank[np.argsort(first, kind="stable")] = np.arange(len(first))
+            nodes = used[np.sort(first)]
+
+            merged = np.full(face_nodes.shape, -1, dtype=rank.dtype)
+            merged[~ma.getmaskarray(face_nodes)] = rank[inverse.reshape(-1)]
+            self._mesh = (
+                xn[nodes],
+                yn[nodes],
+                ma.masked_array(merged, mask=ma.getmaskarray(face_nodes)),
+            )
+
+        return self._mesh
+
+
+atexit.register(PartitionedMapFile.shutdown_executor)
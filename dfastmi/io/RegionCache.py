@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+"""
+Module for RegionCache implementation
+
+Classes:
+    RegionCache
+
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy
+from shapely.geometry.linestring import LineString
+
+import dfastmi
+from dfastmi.io import cachedir
+
+# version of the layout of the cache entries; increase when it changes
+CACHE_FORMAT = 1
+
+# default maximum total size of the cache of regions of interest [bytes]
+DEFAULT_MAX_SIZE = 1024 * 1024**2
+
+
+class RegionCache:
+    """
+    Content-addressed cache of regions of interest and their projection.
+
+    Selecting the faces near the chainage line and projecting them onto that
+    line only depends on the mesh geometry, the chainage line and the width
+    of the buffer around the line; it's independent of the flow conditions
+    and the intervention. The resulting arrays are stored as NumPy .npy files
+    in a directory named after a hash of these inputs, such that analyses of
+    other interventions on the same river stretch load them memory-mapped
+    instead of recomputing them. The total size of the cache is bounded by
+    evicting the least recently used entries.
+    """
+
+    @staticmethod
+    def get_cache_dir() -> Path:
+        """
+        Return the directory in which the cache entries are stored.
+
+        Returns
+        -------
+        cache_dir : Path
+            Directory for the cache entries.
+        """
+        return cachedir.get_cache_dir() / "region"
+
+    @staticmethod
+    def get_cache_key(
+        xn: numpy.ndarray,
+        yn: numpy.ndarray,
+        face_node_connectivity: numpy.ndarray,
+        xykm: LineString,
+        buffer_width: float,
+    ) -> str:
+        """
+        Determine the key identifying the region of interest.
+
+        Arguments
+        ---------
+        xn : numpy.ndarray
+            X-coordinates of the mesh nodes.
+        yn : numpy.ndarray
+            Y-coordinates of the mesh nodes.
+        face_node_connectivity : numpy.ndarray
+            Masked M x N array containing the indices of (max N) corner nodes for each of the M cells [-].
+        xykm : LineString
+            Chainage line; unit m for x and y, km for chainage.
+        buffer_width : float
+            Width of the buffer around the chainage line [m].
+
+        Returns
+        -------
+        key : str
+            Hexadecimal SHA-256 digest.
+        """
+        key = hashlib.sha256()
+        key.update(f"{CACHE_FORMAT}|{dfastmi.__version__}\n".encode("utf-8"))
+        key.update(f"{buffer_width!r}|{face_node_connectivity.shape}\n".encode("utf-8"))
+        key.update(numpy.ascontiguousarray(xn, dtype=numpy.float64).tobytes())
+        key.update(numpy.ascontiguousarray(yn, dtype=numpy.float64).tobytes())
+        key.update(
+            numpy.ascontiguousarray(
+                numpy.ma.filled(face_node_connectivity, -1), dtype=numpy.int64
+            ).tobytes()
+        )
+        key.update(
+            numpy.ascontiguousarray(
+                numpy.array(xykm.coords), dtype=numpy.float64
+            ).tobytes()
+        )
+        return key.hexdigest()
+
+    @staticmethod
+    def get_cache_entry(key: str) -> Path:
+        """
+        Return the name of the directory holding the cache entry for a key.
+
+        Arguments
+        ---------
+        key : str
+            The key identifying the region of interest.
+
+        Returns
+        -------
+        cache_entry : Path
+            The directory containing one .npy file per array.
+        """
+        return RegionCache.get_cache_dir() / key
+
+    @staticmethod
+    def load(key: str, names: Tuple[str, ...]) -> Optional[Dict[str, numpy.ndarray]]:
+        """
+        Load the arrays describing the region of interest from the cache.
+
+        Arguments
+        ---------
+        key : str
+            The key identifying the region of interest.
+        names : Tuple[str, ...]
+            Names of the arrays to load.
+
+        Returns
+        -------
+        arrays : Optional[Dict[str, numpy.ndarray]]
+            Read-only memory-mapped arrays per name, or None if there is no
+            complete cache entry.
+        """
+        cache_entry = RegionCache.get_cache_entry(key)
+        try:
+            arrays = {
+                name: numpy.load(cache_entry / f"{name}.npy", mmap_mode="r")
+                for name in names
+            }
+            # mark the entry as recently used
+            os.utime(cache_entry)
+            return arrays
+        except Exception:
+            return None
+
+    @staticmethod
+    def save(
+        key: str,
+        arrays: Dict[str, numpy.ndarray],
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """
+        Store the arrays describing the region of interest in the cache.
+
+        The entry is written to a temporary directory that is renamed when
+        complete. Failure to write the cache isn't considered an error; the
+        region will just be determined again next time.
+
+        Arguments
+        ---------
+        key : str
+            The key identifying the region of interest.
+        arrays : Dict[str, numpy.ndarray]
+            The arrays per name.
+        max_size : int
+            Maximum total size of the cache entries [bytes].
+        """
+        cache_entry = RegionCache.get_cache_entry(key)
+        tmp_dir = None
+        try:
+            cache_entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(dir=cache_entry.parent, suffix=".tmp")
+            for name, array in arrays.items():
+                numpy.save(
+                    os.path.join(tmp_dir, f"{name}.npy"),
+                    numpy.ascontiguousarray(array),
+                )
+            os.replace(tmp_dir, cache_entry)
+        except Exception:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+        RegionCache.evict(max_size)
+
+    @staticmethod
+    def evict(max_size: int) -> None:
+        """
+        Remove the least recently used cache entries until the total size fits.
+
+        Arguments
+        ---------
+        max_size : int
+            Maximum total size of the cache entries [bytes].
+        """
+        try:
+            entries = [
+                cache_entry
+                for cache_entry in RegionCache.get_cache_dir().iterdir()
+                if cache_entry.suffix != ".tmp" and cache_entry.is_dir()
+            ]
+        except OSError:
+            return
+        cachedir.evict_entries(entries, max_size)
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+"""
+Module for RiversCache implementation
+
+Classes:
+    RiversCache
+
+"""
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import pydantic
+
+import dfastmi
+from dfastmi.io import cachedir
+from dfastmi.io.Branch import Branch
+from dfastmi.io.CelerObject import CelerDischarge, CelerProperties
+from dfastmi.io.Reach import Reach
+from dfastmi.io.ReachLegacy import ReachLegacy
+
+if TYPE_CHECKING:
+    from dfastmi.io.RiversObject import RiversObject
+
+
+class RiversCache:
+    """
+    Binary cache of parsed and validated rivers configuration files.
+
+    The cache entry of a rivers configuration file is only used if it was
+    created from a file with identical content by the same program version
+    using the same data model; otherwise the file is parsed again and the
+    cache entry is replaced. The cache is stored in a per user directory,
+    which may be overruled by setting the DFASTMI_CACHE_DIR environment
+    variable.
+    """
+
+    @staticmethod
+    def get_cache_file(filename: str) -> Path:
+        """
+        Return the name of the cache file for a rivers configuration file.
+
+        Arguments
+        ---------
+        filename : str
+            The name of the rivers configuration file.
+
+        Returns
+        -------
+        cache_file : Path
+            The name of the cache file.
+        """
+        path = Path(filename).absolute()
+        path_hash = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:16]
+        return cachedir.get_cache_dir() / f"{path.stem}-{path_hash}.pickle"
+
+    @staticmethod
+    def get_cache_key(filename: str) -> str:
+        """
+        Determine the key identifying the content of a rivers configuration file.
+
+        The key combines the content of the file, the program version and a
+        fingerprint of the data model.
+
+        Arguments
+        ---------
+        filename : str
+            The name of the rivers configuration file.
+
+        Returns
+        -------
+        key : str
+            Hexadecimal digest identifying the file content.
+        """
+        key = hashlib.sha256()
+        key.update(Path(filename).read_bytes())
+        key.update(RiversCache._get_schema_fingerprint().encode("utf-8"))
+        return key.hexdigest()
+
+    @staticmethod
+    def load(filename: str, key: str) -> Optional["RiversObject"]:
+        """
+        Load the rivers object from the cache.
+
+        Arguments
+        ---------
+        filename : str
+            The name of the rivers configuration file.
+        key : str
+            The key identifying the current content of the file.
+
+        Returns
+        -------
+        rivers : Optional[RiversObject]
+            The cached rivers object, or None if there is no valid cache entry.
+        """
+        cache_file = RiversCache.get_cache_file(filename)
+        try:
+            with cache_file.open("rb") as cache:
+                cached_key, rivers = pickle.load(cache)
+        except Exception:
+            return None
+        if cached_key != key:
+            return None
+        return rivers
+
+    @staticmethod
+    def save(filename: str, key: str, rivers: "RiversObject") -> None:
+        """
+        Store the rivers object in the cache.
+
+        Failure to write the cache isn't considered an error; the file will
+        just be parsed again next time.
+
+        Arguments
+        ---------
+        filename : str
+            The name of the rivers configuration file.
+        key : str
+            The key identifying the content of the file that was parsed.
+        rivers : RiversObject
+            The rivers object to be stored.
+        """
+        cache_file = RiversCache.get_cache_file(filename)
+        tmp_name = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            handle, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(handle, "wb") as cache:
+                pickle.dump((key, rivers), cache, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except Exception:
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_name)
+
+    @staticmethod
+    def _get_schema_fingerprint() -> str:
+        """
+        Describe the program version and data model stored in the cache.
+
+        Returns
+        -------
+        fingerprint : str
+            Text changing whenever the program version or the (private)
+            fields of the branch, reach or celerity classes change.
+        """
+        parts = [dfastmi.__version__, pydantic.VERSION, str(pickle.HIGHEST_PROTOCOL)]
+        for model in (Branch, Reach, ReachLegacy, CelerDischarge, CelerProperties):
+            parts.append(f"{model.__module__}.{model.__qualname__}")
+            for name, field in sorted(model.model_fields.items()):
+                parts.append(f"{name}:{field.annotation}={field.default!r}")
+            parts.extend(sorted(model.__private_attributes__))
+        return "\n".join(parts)
@@ -28,8 +28,9 @@ This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-
 """
 import configparser
 import zlib
-from typing import List
+from typing import Dict
 
+import numpy
 from packaging.version import Version
 
 from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
@@ -38,16 +39,44 @@ from dfastmi.io.CelerObject import CelerDischarge, CelerProperties
 from dfastmi.io.DFastRiverConfigFileParser import DFastRiverConfigFileParser
 from dfastmi.io.IBranch import IBranch
 from dfastmi.io.IReach import IReach
+from dfastmi.io.ObservableList import IObserver, ObservableList
 from dfastmi.io.Reach import Reach
 from dfastmi.io.ReachLegacy import ReachLegacy
+from dfastmi.io.RiversCache import RiversCache
 
 
-class RiversObject:
-    branches: List[IBranch]
+class RiversObject(IObserver[IBranch]):
+    branches: ObservableList[IBranch]
     version: Version
+    _branches_by_name: Dict[str, IBranch]
 
-    def __init__(self, filename: str = "rivers.ini"):
-        self._read_rivers_file(filename)
+    def __init__(self, filename: str = "rivers.ini", use_cache: bool = False):
+        """
+        Read the river data from a rivers configuration file.
+
+        Arguments
+        ---------
+        filename : str
+            The name of the river configuration file (default "rivers.ini").
+        use_cache : bool
+            Flag indicating whether the parsed and validated river data may be
+            loaded from and stored in the RiversCache (default False).
+        """
+        if not use_cache:
+            self._read_rivers_file(filename)
+            return
+
+        key = RiversCache.get_cache_key(filename)
+        rivers = RiversCache.load(filename, key)
+        if rivers is None:
+            self._read_rivers_file(filename)
+            RiversCache.save(filename, key, self)
+        else:
+            self.__dict__.update(rivers.__dict__)
+            self.branches.remove_observer(rivers)
+            self.branches.add_observer(self)
+            if not self._checksum_found:
+                self._report_missing_checksum(filename)
 
     def get_branch(self, branch_name: str) -> Branch:
         """
@@ -57,10 +86,78 @@ class RiversObject:
         branch_name : str
             The name of the branch in the river configuration
         """
-        for branch in self.branches:
-            if branch.name == branch_name:
-                return branch
-        return None  # Return None if the branch with the given name is not found
+        # Return None if the branch with the given name is not found
+        return self._branches_by_name.get(branch_name)
+
+    def notify(self, branch: IBranch) -> None:
+        """When a branch is added to the branches list we want to make it available for lookup by name"""
+        self._branches_by_name.setdefault(branch.name, branch)
+
+    def get_reach_parameters(self) -> Dict[str, numpy.ndarray]:
+        """
+        Return the parameters of all reaches in the river configuration as columns.
+
+        The reaches are ordered by branch and reach as in the configuration
+        file, such that element i of every column belongs to the same reach.
+        Parameters that are not defined for a reach (e.g. the celerity settings
+        of a version 1 configuration) are set to NaN.
+
+        Returns
+        -------
+        parameters : Dict[str, numpy.ndarray]
+            Dictionary containing the following columns:
+            "branch" : names of the branches (object array of str)
+            "reach" : names of the reaches (object array of str)
+            "normal_width" : normal widths of the reaches [m]
+            "ucritical" : critical flow velocities [m/s]
+            "qstagnant" : discharges below which the main channel is stagnant [m3/s]
+            "celer_form" : celerity specification forms, 0 if not defined (int)
+            "celer_q_coefficient" : coefficients of the celerity-discharge relation (CelerForm 2)
+            "celer_q_exponent" : exponents of the celerity-discharge relation (CelerForm 2)
+            "prop_q" : discharges of the piecewise celerity relation (CelerForm 1, object array of tuples)
+            "prop_c" : celerities of the piecewise celerity relation (CelerForm 1, object array of tuples)
+        """
+        reaches = [reach for branch in self.branches for reach in branch.reaches]
+        nreaches = len(reaches)
+
+        branch_names = numpy.empty(nreaches, dtype=object)
+        reach_names = numpy.empty(nreaches, dtype=object)
+        normal_width = numpy.full(nreaches, numpy.nan)
+        ucritical = numpy.full(nreaches, numpy.nan)
+        qstagnant = numpy.full(nreaches, numpy.nan)
+        celer_form = numpy.zeros(nreaches, dtype=numpy.int64)
+        celer_q_coefficient = numpy.full(nreaches, numpy.nan)
+        celer_q_exponent = numpy.full(nreaches, numpy.nan)
+        prop_q = numpy.empty(nreaches, dtype=object)
+        prop_c = numpy.empty(nreaches, dtype=object)
+
+        for i, reach in enumerate(reaches):
+            branch_names[i] = reach.parent_branch.name
+            reach_names[i] = reach.name
+            normal_width[i] = reach.normal_width
+            ucritical[i] = reach.ucritical
+            qstagnant[i] = reach.qstagnant
+
+            celer_object = getattr(reach, "celer_object", None)
+            if isinstance(celer_object, CelerDischarge):
+                celer_q_coefficient[i], celer_q_exponent[i] = celer_object.cdisch
+            elif isinstance(celer_object, CelerProperties):
+                prop_q[i] = tuple(celer_object.prop_q)
+                prop_c[i] = tuple(celer_object.prop_c)
+            celer_form[i] = getattr(reach, "celer_form", 0)
+
+        return {
+            "branch": branch_names,
+            "reach": reach_names,
+            "normal_width": normal_width,
+            "ucritical": ucritical,
+            "qstagnant": qstagnant,
+            "celer_form": celer_form,
+            "celer_q_coefficient": celer_q_coefficient,
+            "celer_q_exponent": celer_q_exponent,
+            "prop_q": prop_q,
+            "prop_c": prop_c,
+        }
 
     def _read_rivers_file(self, filename):
         """
@@ -90,7 +187,9 @@ class RiversObject:
         self._verify_checksum_rivers(config, filename)
 
         # parse branches
-        self.branches = []
+        self.branches = ObservableList[IBranch]()
+        self._branches_by_name = {}
+        self.branches.add_observer(self)
         self._parse_branches(config)
 
         # parse reaches and discharge locations
@@ -241,8 +340,9 @@ class RiversObject:
                         zlib.adler32(ini_value.encode("utf-8"), checkval) & 0xFFFFFFFF
                     )
         # print("Expected checksum: ", checkval)
-        if checksum == "":
-            ApplicationSettingsHelper.log_text("checksum", dict={"filename": filename})
+        self._checksum_found = checksum != ""
+        if not self._checksum_found:
+            self._report_missing_checksum(filename)
         else:
             checkval2 = int(checksum)
             if checkval2 != checkval:
@@ -251,3 +351,6 @@ class RiversObject:
                         filename
                     )
                 )
+
+    def _report_missing_checksum(self, filename: str):
+        ApplicationSettingsHelper.log_text("checksum", dict={"filename": filename})
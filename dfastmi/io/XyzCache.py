@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+"""
+Module for XyzCache implementation
+
+Classes:
+    XyzCache
+
+"""
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy
+
+# version of the layout of the sidecar files; increase when it changes
+CACHE_FORMAT = 1
+
+
+class XyzCache:
+    """
+    Binary sidecar cache of parsed WAQUA xyz exports.
+
+    The columns read from an xyz export are stored as a NumPy .npy file next
+    to the export, together with a small .json file describing the export it
+    was created from. A cache entry is used if the size and modification time
+    of the export are unchanged, or if its content hash is unchanged (e.g.
+    after copying the file); otherwise the export is parsed again. Cached data
+    is memory-mapped, such that repeated runs skip text parsing entirely.
+    """
+
+    @staticmethod
+    def get_cache_files(filename: str, cols: Tuple[int, ...]) -> Tuple[Path, Path]:
+        """
+        Return the names of the sidecar files for an xyz export.
+
+        Arguments
+        ---------
+        filename : str
+            Name of the xyz export.
+        cols : Tuple[int]
+            List of column numbers read from the export.
+
+        Returns
+        -------
+        data_file : Path
+            Name of the .npy file containing the data.
+        key_file : Path
+            Name of the .json file describing the export.
+        """
+        path = Path(filename)
+        suffix = ".cols-" + "-".join(str(col) for col in cols)
+        data_file = path.with_name(path.name + suffix + ".npy")
+        key_file = path.with_name(path.name + suffix + ".json")
+        return data_file, key_file
+
+    @staticmethod
+    def get_content_hash(filename: str) -> str:
+        """
+        Determine the hash of the content of a file.
+
+        Arguments
+        ---------
+        filename : str
+            Name of the file.
+
+        Returns
+        -------
+        content_hash : str
+            Hexadecimal SHA-256 digest of the file content.
+        """
+        content_hash = hashlib.sha256()
+        with open(filename, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                content_hash.update(block)
+        return content_hash.hexdigest()
+
+    @staticmethod
+    def load(filename: str, cols: Tuple[int, ...]) -> Optional[numpy.ndarray]:
+        """
+        Load the data of an xyz export from the cache.
+
+        Arguments
+        ---------
+        filename : str
+            Name of the xyz export.
+        cols : Tuple[int]
+            List of column numbers to return.
+
+        Returns
+        -------
+        data : Optional[numpy.ndarray]
+            Read-only memory-mapped data, or None if there is no valid cache entry.
+        """
+        data_file, key_file = XyzCache.get_cache_files(filename, cols)
+        try:
+            key = json.loads(key_file.read_text())
+            stat = os.stat(filename)
+            if key["format"] != CACHE_FORMAT or key["size"] != stat.st_size:
+                return None
+            if key["mtime"] != stat.st_mtime_ns:
+                if key["sha256"] != XyzCache.get_content_hash(filename):
+                    return None
+                key["mtime"] = stat.st_mtime_ns
+                XyzCache._write_key(key_file, key)
+            return numpy.load(data_file, mmap_mode="r")
+        except Exception:
+            return None
+
+    @staticmethod
+    def save(filename: str, cols: Tuple[int, ...], data: numpy.ndarray) -> None:
+        """
+        Store the data of an xyz export in the cache.
+
+        Failure to write the cache isn't considered an error; the export will
+        just be parsed again next time.
+
+        Arguments
+        ---------
+        filename : str
+            Name of the xyz export.
+        cols : Tuple[int]
+            List of column numbers that were read.
+        data : numpy.ndarray
+            Data read from the export.
+        """
+        data_file, key_file = XyzCache.get_cache_files(filename, cols)
+        tmp_name = None
+        try:
+            stat = os.stat(filename)
+            key = {
+                "format": CACHE_FORMAT,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "sha256": XyzCache.get_content_hash(filename),
+            }
+            handle, tmp_name = tempfile.mkstemp(dir=data_file.parent, suffix=".tmp")
+            with os.fdopen(handle, "wb") as cache:
+                numpy.save(cache, numpy.ascontiguousarray(data))
+            os.replace(tmp_name, data_file)
+            tmp_name = None
+            XyzCache._write_key(key_file, key)
+        except Exception:
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_name)
+
+    @staticmethod
+    def _write_key(key_file: Path, key: Dict[str, Any]) -> None:
+        """
+        Atomically write the description of the export.
+
+        Arguments
+        ---------
+        key_file : Path
+            Name of the .json file describing the export.
+        key : Dict[str, Any]
+            Size, modification time and content hash of the export.
+        """
+        handle, tmp_name = tempfile.mkstemp(dir=key_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as file:
+                json.dump(key, file)
+            os.replace(tmp_name, key_file)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_name)
+            raise
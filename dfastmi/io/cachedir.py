@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Iterable
+
+# environment variable overruling the directory of the cache files
+CACHE_DIR_VARIABLE = "DFASTMI_CACHE_DIR"
+
+
+def get_cache_dir() -> Path:
+    """
+    Return the directory in which the cache files are stored.
+
+    The caches use a per user directory, which may be overruled by setting
+    the DFASTMI_CACHE_DIR environment variable.
+
+    Returns
+    -------
+    cache_dir : Path
+        Directory for the cache files.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_VARIABLE)
+    if cache_dir:
+        return Path(cache_dir)
+    if sys.platform == "win32":
+        base_dir = os.environ.get("LOCALAPPDATA", str(Path.home()))
+        return Path(base_dir) / "Deltares" / "dfastmi" / "cache"
+    base_dir = os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache"))
+    return Path(base_dir) / "dfastmi"
+
+
+def evict_entries(entries: Iterable[Path], max_size: int) -> None:
+    """
+    Remove the least recently used cache entries until the total size fits.
+
+    An entry is either a file or a directory of files; its last use is given
+    by its modification time. Entries that can't be removed are skipped.
+
+    Arguments
+    ---------
+    entries : Iterable[Path]
+        The cache entries.
+    max_size : int
+        Maximum total size of the cache entries [bytes].
+    """
+    sized_entries = []
+    try:
+        for entry in entries:
+            stat = entry.stat()
+            if entry.is_dir():
+                size = sum(file.stat().st_size for file in entry.iterdir())
+            else:
+                size = stat.st_size
+            sized_entries.append((stat.st_mtime_ns, size, entry))
+    except OSError:
+        return
+    total_size = sum(size for _, size, _ in sized_entries)
+    for _, size, entry in sorted(sized_entries, key=lambda item: item[0]):
+        if total_size <= max_size:
+            break
+        try:
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+        except OSError:
+            continue
+        total_size -= size
@@ -34,6 +34,7 @@ from typing import List, Tuple
 
 import numpy
 
+from dfastmi.kernel import precision
 from dfastmi.kernel.BedLevelCalculator import BedLevelCalculator
 from dfastmi.kernel.typehints import Vector
 
@@ -147,9 +148,12 @@ def main_computation(
     """
     number_of_periods = len(dzq)
     blc = BedLevelCalculator(number_of_periods)
+    # the bed level changes are accumulated in double precision and only
+    # stored in the configured precision
     dzb = blc.get_bed_level_changes(dzq, rsigma)
+    dzgem = precision.as_float(blc.get_linear_average(time_fractions_of_the_year, dzb))
+    dzb = [precision.as_float(dzb_period) for dzb_period in dzb]
     dzmax = blc.get_element_wise_maximum(dzb)
     dzmin = blc.get_element_wise_minimum(dzb)
-    dzgem = blc.get_linear_average(time_fractions_of_the_year, dzb)
 
     return dzgem, dzmax, dzmin, dzb
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright © 2026 Stichting Deltares.
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+contact: delft3d.support@deltares.nl
+Stichting Deltares
+P.O. Box 177
+2600 MH Delft, The Netherlands
+
+All indications and logos of, and references to, "Delft3D" and "Deltares"
+are registered trademarks of Stichting Deltares, and remain the property of
+Stichting Deltares. All rights reserved.
+
+INFORMATION
+This file is part of D-FAST Morphological Impact: https://github.com/Deltares/D-FAST_Morphological_Impact
+"""
+
+import contextlib
+from typing import Iterator, Optional
+
+import numpy
+
+DOUBLE = "double"
+SINGLE = "single"
+PRECISIONS = (DOUBLE, SINGLE)
+
+# largest index that can be stored in a 32-bit index array
+INT32_MAX = numpy.iinfo(numpy.int32).max
+
+# floating point precision of the arrays of flow fields and bed level changes;
+# sums over periods and cells are always accumulated in double precision
+_precision = DOUBLE
+
+
+def set_precision(precision: str) -> None:
+    """
+    Set the floating point precision of the field arrays.
+
+    Arguments
+    ---------
+    precision : str
+        Either "double" or "single".
+
+    Raises
+    ------
+    ValueError
+        If the precision isn't supported.
+    """
+    global _precision
+    if precision not in PRECISIONS:
+        raise ValueError(f'Unsupported precision "{precision}".')
+    _precision = precision
+
+
+def get_precision() -> str:
+    """
+    Return the floating point precision of the field arrays ("double" or "single").
+    """
+    return _precision
+
+
+@contextlib.contextmanager
+def policy(precision: str) -> Iterator[None]:
+    """
+    Use the given floating point precision within the context.
+
+    Arguments
+    ---------
+    precision : str
+        Either "double" or "single".
+    """
+    previous = get_precision()
+    set_precision(precision)
+    try:
+        yield
+    finally:
+        set_precision(previous)
+
+
+def float_dtype() -> numpy.dtype:
+    """
+    Return the data type of the field arrays.
+    """
+    if _precision == SINGLE:
+        return numpy.dtype(numpy.float32)
+    return numpy.dtype(numpy.float64)
+
+
+def index_dtype(size: int) -> numpy.dtype:
+    """
+    Return the data type of arrays of indices into arrays of the given size.
+
+    Arguments
+    ---------
+    size : int
+        Number of elements of the indexed array.
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        32-bit integers if all indices fit, otherwise 64-bit integers.
+    """
+    if size <= INT32_MAX:
+        return numpy.dtype(numpy.int32)
+    return numpy.dtype(numpy.int64)
+
+
+def as_float(data: numpy.ndarray) -> numpy.ndarray:
+    """
+    Convert a field array to the configured floating point precision.
+
+    Masked arrays remain masked; the data isn't copied if it already has the
+    configured data type. Scalars are returned unchanged.
+
+    Arguments
+    ---------
+    data : numpy.ndarray
+        Array of floating point values.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The values with the configured data type.
+    """
+    if not isinstance(data, numpy.ndarray):
+        return data
+    return data.astype(float_dtype(), copy=False)
+
+
+def as_index(data: numpy.ndarray, size: Optional[int] = None) -> numpy.ndarray:
+    """
+    Convert an array of indices to the smallest sufficient integer type.
+
+    Masked arrays remain masked; the data isn't copied if it already has the
+    required data type.
+
+    Arguments
+    ---------
+    data : numpy.ndarray
+        Array of indices.
+    size : Optional[int]
+        Number of elements of the indexed array; derived from the largest
+        index if not specified.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The indices with the required data type.
+    """
+    if size is None:
+        size = int(data.max()) + 1 if data.size > 0 else 0
+    return data.astype(index_dtype(size), copy=False)
@@ -57,6 +57,13 @@ class Test_analyse_and_report_dflowfm_mode:
         initialized_config.n_fields = 3
         initialized_config.tide_bc: Tuple[str, ...] = ("name1", "name2")
         initialized_config.ucrit = 0.3
+        initialized_config.workers = 1
+        initialized_config.worker_pool = "threads"
+        initialized_config.dzq_cache = False
+        initialized_config.block_size = 0
+        initialized_config.face_order = "source"
+        initialized_config.precision = "double"
+        initialized_config.region_cache = False
         self.initialized_config = initialized_config
 
     def set_file_names(self):
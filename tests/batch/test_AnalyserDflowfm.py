@@ -1,22 +1,31 @@
-from typing import Any, Dict, TextIO, Tuple
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, Iterator, TextIO, Tuple
 
+import netCDF4
 import numpy
 import pytest
 import shapely
-from mock import Mock, patch
+from mock import Mock, call, patch
 from shapely.geometry.linestring import LineString
 
-from dfastmi.batch.AnalyserDflowfm import AnalyserDflowfm
+import dfastmi.io.PartitionedMapFile
+from dfastmi.batch import sessioncache
+from dfastmi.batch.AnalyserDflowfm import AnalyserDflowfm, FlowField
 from dfastmi.batch.SedimentationData import SedimentationData
 from dfastmi.batch.XykmData import XykmData
 from dfastmi.config.AConfigurationInitializerBase import AConfigurationInitializerBase
 from dfastmi.io.MapFile import MapFile
+from dfastmi.io.PartitionedMapFile import PartitionedMapFile
+from dfastmi.kernel.core import dzq_from_du_and_h
 from tests.batch.Helper_AnalyserAndReporterDflowfm import (  # needed for fixture
     TestCase_display_needs_tide_old_zmin_zmax,
     TestCase_display_old_zmin_zmax,
     display_needs_tide_old_zmin_zmax,
     display_old_zmin_zmax,
 )
+from tests.io.test_PartitionedMapFile import write_partitions
 
 
 class Test_AnalyserDflowfm:
@@ -45,6 +54,13 @@ class Test_AnalyserDflowfm:
         initialized_config.n_fields = 1
         initialized_config.tide_bc: Tuple[str, ...] = ("name1", "name2")
         initialized_config.ucrit = 0.3
+        initialized_config.workers = 1
+        initialized_config.worker_pool = "threads"
+        initialized_config.dzq_cache = False
+        initialized_config.block_size = 0
+        initialized_config.face_order = "source"
+        initialized_config.precision = "double"
+        initialized_config.region_cache = False
         self.initialized_config = initialized_config
 
     def _get_mocked_xykm_data(self, xykm):
@@ -395,3 +411,436 @@ class Test_AnalyserDflowfm:
             )
             assert dzq_from_du_and_h.call_count == 2
             assert main_computation.call_count == 1
+
+
+class Test_AnalyserDflowfm_workers:
+    @pytest.fixture
+    def filenames(self, tmp_path) -> Dict[Any, Tuple[str, str]]:
+        reference = "tests/files/e02_f001_c011_simplechannel_map.nc"
+        filenames = {}
+        for i, factor in enumerate([1.1, 1.2, 0.9]):
+            intervention = tmp_path / f"intervention{i}.nc"
+            shutil.copy(reference, intervention)
+            with netCDF4.Dataset(intervention, "a") as dataset:
+                dataset.variables["mesh2d_ucx"][-1, :] *= factor
+            filenames[i] = (reference, str(intervention))
+        return filenames
+
+    def _get_analyser(
+        self,
+        workers: int,
+        worker_pool: str,
+        dzq_cache: bool = False,
+        ucrit: float = 0.3,
+        q_threshold: float = None,
+        face_order: str = "source",
+    ) -> AnalyserDflowfm:
+        initialized_config = Mock(spec=AConfigurationInitializerBase)
+        initialized_config.q_threshold = q_threshold
+        initialized_config.tstag = 0.0
+        initialized_config.discharges = [1000.0, 2000.0, 3000.0]
+        initialized_config.time_fractions_of_the_year = [0.5, 0.3, 0.2]
+        initialized_config.rsigma = [0.1, 0.2, 0.3]
+        initialized_config.slength = 1.0
+        initialized_config.n_fields = 1
+        initialized_config.tide_bc = ()
+        initialized_config.ucrit = ucrit
+        initialized_config.workers = workers
+        initialized_config.worker_pool = worker_pool
+        initialized_config.dzq_cache = dzq_cache
+        initialized_config.dzq_cache_size = 1024**2
+        initialized_config.block_size = 0
+        initialized_config.face_order = face_order
+        initialized_config.precision = "double"
+        initialized_config.region_cache = False
+        return AnalyserDflowfm(False, None, False, "", initialized_config)
+
+    @pytest.mark.parametrize(
+        "workers, worker_pool",
+        [(3, "threads"), (3, "processes")],
+    )
+    def given_multiple_workers_when_get_dzq_then_same_result_as_sequential(
+        self, filenames: Dict[Any, Tuple[str, str]], workers: int, worker_pool: str
+    ):
+        iface = numpy.arange(8)
+        dxi = numpy.ones(8)
+        dyi = numpy.zeros(8)
+
+        expected = self._get_analyser(1, "threads")._get_dzq(filenames, iface, dxi, dyi)
+        dzq = self._get_analyser(workers, worker_pool)._get_dzq(
+            filenames, iface, dxi, dyi
+        )
+
+        assert any(numpy.any(values != 0.0) for values in expected)
+        for values, expected_values in zip(dzq, expected):
+            numpy.testing.assert_array_equal(values, expected_values)
+
+    def given_missing_files_and_multiple_workers_when_get_dzq_then_reported_in_order(
+        self, filenames: Dict[Any, Tuple[str, str]]
+    ):
+        filenames[0] = ("", filenames[0][1])
+        filenames[2] = (filenames[2][0], "missing.nc")
+        analyser = self._get_analyser(3, "threads")
+        reporter = Mock()
+        analyser._reporter = reporter
+
+        dzq = analyser._get_dzq(
+            filenames, numpy.arange(8), numpy.ones(8), numpy.zeros(8)
+        )
+
+        assert analyser.missing_data
+        assert dzq[0] is None and dzq[2] is None
+        assert dzq[1] is not None
+        file_reports = [
+            method_call
+            for method_call in reporter.method_calls
+            if method_call[0] != "report_progress"
+        ]
+        assert file_reports == [
+            call.report_file_not_specified(1000.0),
+            call.report_file_not_found("missing.nc"),
+        ]
+
+    def given_dzq_cache_when_get_dzq_twice_then_files_read_once(
+        self, filenames: Dict[Any, Tuple[str, str]], tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv("DFASTMI_CACHE_DIR", str(tmp_path / "cache"))
+        iface = numpy.arange(8)
+        dxi = numpy.ones(8)
+        dyi = numpy.zeros(8)
+        expected = self._get_analyser(1, "threads", dzq_cache=True)._get_dzq(
+            filenames, iface, dxi, dyi
+        )
+
+        with patch(
+            "dfastmi.batch.AnalyserDflowfm.OutputFileFactory.generate"
+        ) as generate:
+            dzq = self._get_analyser(3, "threads", dzq_cache=True)._get_dzq(
+                filenames, iface, dxi, dyi
+            )
+
+        generate.assert_not_called()
+        for values, expected_values in zip(dzq, expected):
+            numpy.testing.assert_array_equal(values, expected_values)
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def given_session_cache_when_ucrit_changed_then_dzq_recomputed_without_reading_files(
+        self, filenames: Dict[Any, Tuple[str, str]], workers: int
+    ):
+        iface = numpy.arange(8)
+        dxi = numpy.ones(8)
+        dyi = numpy.zeros(8)
+        expected = self._get_analyser(1, "threads", ucrit=0.5)._get_dzq(
+            filenames, iface, dxi, dyi
+        )
+
+        sessioncache.enable()
+        try:
+            self._get_analyser(workers, "threads")._get_dzq(filenames, iface, dxi, dyi)
+            with patch.object(AnalyserDflowfm, "_read_flow_fields") as read_flow_fields:
+                dzq = self._get_analyser(workers, "threads", ucrit=0.5)._get_dzq(
+                    filenames, iface, dxi, dyi
+                )
+        finally:
+            sessioncache.disable()
+
+        read_flow_fields.assert_not_called()
+        for values, expected_values in zip(dzq, expected):
+            numpy.testing.assert_array_equal(values, expected_values)
+
+    def given_session_cache_when_q_threshold_changed_then_files_not_read(
+        self, filenames: Dict[Any, Tuple[str, str]]
+    ):
+        iface = numpy.arange(8)
+        dxi = numpy.ones(8)
+        dyi = numpy.zeros(8)
+
+        sessioncache.enable()
+        try:
+            expected = self._get_analyser(1, "threads")._get_dzq(
+                filenames, iface, dxi, dyi
+            )
+            with patch.object(AnalyserDflowfm, "_read_flow_fields") as read_flow_fields:
+                dzq = self._get_analyser(1, "threads", q_threshold=1500.0)._get_dzq(
+                    filenames, iface, dxi, dyi
+                )
+        finally:
+            sessioncache.disable()
+
+        read_flow_fields.assert_not_called()
+        numpy.testing.assert_array_equal(dzq[0], numpy.zeros(8))
+        for values, expected_values in zip(dzq[1:], expected[1:]):
+            numpy.testing.assert_array_equal(values, expected_values)
+
+    def given_session_cache_when_get_dzq_for_two_variants_then_reference_read_once(
+        self, filenames: Dict[Any, Tuple[str, str]]
+    ):
+        iface = numpy.arange(8)
+        dxi = numpy.ones(8)
+        dyi = numpy.zeros(8)
+        variant = {i: (reference, reference) for i, (reference, _) in filenames.items()}
+        expected = [
+            self._get_analyser(1, "threads")._get_dzq(files, iface, dxi, dyi)
+            for files in [filenames, variant]
+        ]
+
+        sessioncache.enable()
+        try:
+            with (
+                sessioncache.excluding("flow fields"),
+                patch.object(
+                    AnalyserDflowfm,
+                    "_read_reference_fields",
+                    wraps=AnalyserDflowfm._read_reference_fields,
+                ) as read_reference_fields,
+            ):
+                dzq = [
+                    self._get_analyser(1, "threads")._get_dzq(files, iface, dxi, dyi)
+                    for files in [filenames, variant]
+                ]
+        finally:
+            sessioncache.disable()
+
+        references = {reference for reference, _ in filenames.values()}
+        assert read_reference_fields.call_count == len(references)
+        for variant_dzq, expected_dzq in zip(dzq, expected):
+            for values, expected_values in zip(variant_dzq, expected_dzq):
+                numpy.testing.assert_array_equal(values, expected_values)
+
+    def given_excluded_flow_fields_when_get_dzq_then_flow_fields_streamed(
+        self, filenames: Dict[Any, Tuple[str, str]]
+    ):
+        iface = numpy.arange(8)
+        dxi = numpy.ones(8)
+        dyi = numpy.zeros(8)
+
+        sessioncache.enable()
+        try:
+            with (
+                sessioncache.excluding("flow fields"),
+                patch.object(
+                    AnalyserDflowfm,
+                    "_dzq_from_flow_fields",
+                    wraps=AnalyserDflowfm._dzq_from_flow_fields,
+                ) as dzq_from_flow_fields,
+            ):
+                self._get_analyser(1, "threads")._get_dzq(filenames, iface, dxi, dyi)
+            statistics = sessioncache.get_statistics()
+        finally:
+            sessioncache.disable()
+
+        assert dzq_from_flow_fields.call_count > 0
+        for call in dzq_from_flow_fields.call_args_list:
+            flow_fields = call.args[0]
+            assert isinstance(flow_fields, Iterator)
+            assert not isinstance(flow_fields, list)
+        assert "flow fields" not in statistics
+        assert statistics["reference fields"]["entries"] > 0
+
+    def given_partitioned_map_files_when_get_dzq_then_same_result_as_merged_files(
+        self, filenames: Dict[Any, Tuple[str, str]], tmp_path
+    ):
+        iface = numpy.arange(0, 4132, 3)
+        dxi = numpy.ones(len(iface))
+        dyi = numpy.zeros(len(iface))
+        partitioned = {}
+        for i, (reference, intervention) in filenames.items():
+            partitioned[i] = tuple(
+                str(write_partitions(file, tmp_path, f"{kind}{i}")[0])
+                for kind, file in [
+                    ("reference", reference),
+                    ("intervention", intervention),
+                ]
+            )
+
+        expected = self._get_analyser(1, "threads")._get_dzq(filenames, iface, dxi, dyi)
+        dzq = self._get_analyser(1, "threads")._get_dzq(partitioned, iface, dxi, dyi)
+
+        for values, expected_values in zip(dzq, expected):
+            numpy.testing.assert_array_equal(values, expected_values)
+
+    def given_workers_when_get_dzq_of_partitioned_map_files_then_partitions_read_by_workers(
+        self, filenames: Dict[Any, Tuple[str, str]], tmp_path, mocker
+    ):
+        iface = numpy.arange(0, 4132, 3)
+        partitioned = {
+            i: tuple(
+                str(write_partitions(file, tmp_path, f"{kind}{i}")[0])
+                for kind, file in [
+                    ("reference", reference),
+                    ("intervention", intervention),
+                ]
+            )
+            for i, (reference, intervention) in filenames.items()
+        }
+        get_executor = mocker.spy(dfastmi.io.PartitionedMapFile, "_get_executor")
+
+        try:
+            self._get_analyser(2, "threads")._get_dzq(partitioned, iface, None, None)
+        finally:
+            PartitionedMapFile.shutdown_executor()
+
+        assert get_executor.call_count > 0
+        assert all(call.args == (2,) for call in get_executor.call_args_list)
+
+    def given_hilbert_face_order_when_get_dzq_then_same_result_in_source_order(
+        self, filenames: Dict[Any, Tuple[str, str]]
+    ):
+        reference = filenames[0][0]
+        results = []
+        for face_order in ["source", "hilbert"]:
+            analyser = self._get_analyser(1, "threads", face_order=face_order)
+            xn, yn, face_node_connectivity = analyser._load_mesh(reference)
+            xykm_data = analyser._get_xykm_data(None, xn, yn, face_node_connectivity)
+            dzq = analyser._get_dzq(filenames, xykm_data.iface, None, None)
+            nfaces = face_node_connectivity.shape[0]
+            mesh_dzq = numpy.zeros((len(dzq), nfaces))
+            for i, values in enumerate(dzq):
+                mesh_dzq[i, xykm_data.iface] = values
+            results.append((xykm_data.iface, mesh_dzq))
+
+        (source_iface, expected), (iface, dzq) = results
+        assert (numpy.diff(source_iface) > 0).all()
+        assert not (numpy.diff(iface) > 0).all()
+        numpy.testing.assert_array_equal(numpy.sort(iface), source_iface)
+        numpy.testing.assert_array_equal(dzq, expected)
+
+
+class Test_AnalyserDflowfm_blocks:
+    @pytest.fixture
+    def filenames(self, tmp_path) -> Dict[Any, Tuple[str, str]]:
+        reference = "tests/files/e02_f001_c011_simplechannel_map.nc"
+        filenames = {}
+        for i, factor in enumerate([1.1, 1.2, 0.9]):
+            intervention = tmp_path / f"intervention{i}.nc"
+            shutil.copy(reference, intervention)
+            with netCDF4.Dataset(intervention, "a") as dataset:
+                dataset.variables["mesh2d_ucx"][:] *= factor
+            filenames[i] = (reference, str(intervention))
+        return filenames
+
+    def _get_analyser(self, n_fields: int, workers: int = 1) -> AnalyserDflowfm:
+        initialized_config = Mock(spec=AConfigurationInitializerBase)
+        initialized_config.q_threshold = 1500.0
+        initialized_config.tstag = 0.0
+        initialized_config.discharges = [1000.0, 2000.0, 3000.0]
+        initialized_config.time_fractions_of_the_year = [0.5, 0.3, 0.2]
+        initialized_config.rsigma = [0.1, 0.2, 0.3]
+        initialized_config.slength = 1.0
+        initialized_config.n_fields = n_fields
+        initialized_config.tide_bc = ()
+        initialized_config.ucrit = 0.3
+        initialized_config.workers = workers
+        initialized_config.worker_pool = "threads"
+        initialized_config.dzq_cache = False
+        initialized_config.dzq_cache_size = 0
+        initialized_config.block_size = 100
+        initialized_config.precision = "double"
+        initialized_config.region_cache = False
+        return AnalyserDflowfm(False, None, False, "", initialized_config)
+
+    @pytest.mark.parametrize("meshes_equal", [True, False])
+    @pytest.mark.parametrize("n_fields, workers", [(1, 1), (2, 1), (1, 3)])
+    def given_blocks_when_compute_dzq_per_block_then_same_as_all_faces_at_once(
+        self,
+        filenames: Dict[Any, Tuple[str, str]],
+        meshes_equal: bool,
+        n_fields: int,
+        workers: int,
+    ):
+        iface = numpy.arange(0, 4132, 3)
+        xykm_data = Mock(spec=XykmData)
+        xykm_data.iface = iface
+        xykm_data.dxi = numpy.ones(iface.shape)
+        xykm_data.dyi = numpy.full(iface.shape, 0.5)
+        expected = self._get_analyser(n_fields)._get_dzq(
+            filenames, iface, xykm_data.dxi, xykm_data.dyi
+        )
+
+        analyser = self._get_analyser(n_fields, workers)
+        dzq_inactive, jobs = analyser._get_dzq_jobs(filenames, 0)
+        with patch.object(AnalyserDflowfm, "_meshes_equal", return_value=meshes_equal):
+            sources = {
+                i: AnalyserDflowfm._open_dzq_source(job_filenames, iface, 1)
+                for i, (job_filenames, _) in jobs.items()
+            }
+        blocks = []
+        with ThreadPoolExecutor(workers) if workers > 1 else nullcontext() as executor:
+            for start in range(0, len(iface), 100):
+                stop = min(start + 100, len(iface))
+                blocks.append(
+                    analyser._compute_dzq_block(
+                        dzq_inactive, jobs, sources, xykm_data, start, stop, executor
+                    )
+                )
+
+        assert list(jobs) == [1, 2]
+        assert any(numpy.any(values != 0.0) for values in expected[1:])
+        for i, expected_values in enumerate(expected):
+            values = numpy.concatenate([block[i] for block in blocks])
+            numpy.testing.assert_array_equal(values, expected_values)
+
+
+def tidal_dzq_per_time_step(
+    flow_fields, ucrit: float, dx: numpy.ndarray, dy: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    Reference implementation updating the ebb and flood peaks per time step.
+    """
+    ustream_pos = numpy.zeros(dx.shape)
+    ustream_neg = numpy.zeros(dx.shape)
+    dzq_pos = numpy.zeros(dx.shape)
+    dzq_neg = numpy.zeros(dx.shape)
+    t_pos = numpy.zeros(dx.shape)
+    t_neg = numpy.zeros(dx.shape)
+    for flow_field in flow_fields:
+        dzq2 = dzq_from_du_and_h(
+            flow_field.umag1, flow_field.h1, flow_field.umag2, ucrit, default=0.0
+        )
+        ustream = flow_field.u1 * dx + flow_field.v1 * dy
+
+        ipos = ustream > 0.0
+        t_pos[ipos] = t_pos[ipos] + 1
+        ipos = ustream > ustream_pos
+        ustream_pos[ipos] = ustream[ipos]
+        dzq_pos[ipos] = dzq2[ipos]
+
+        ineg = ustream < 0.0
+        t_neg[ineg] = t_neg[ineg] + 1
+        ineg = ustream < ustream_neg
+        ustream_neg[ineg] = ustream[ineg]
+        dzq_neg[ineg] = dzq2[ineg]
+    return (t_pos * dzq_pos + t_neg * dzq_neg) / numpy.maximum(t_pos + t_neg, 1)
+
+
+class Test_AnalyserDflowfm_tidal:
+    @pytest.fixture
+    def flow_fields(self):
+        rng = numpy.random.default_rng(42)
+        nfaces = 200
+        fields = []
+        for _ in range(13):
+            # rounded velocities, such that peaks occur at multiple time steps
+            u1 = numpy.round(rng.uniform(-1.5, 1.5, nfaces), 1)
+            v1 = numpy.round(rng.uniform(-0.5, 0.5, nfaces), 1)
+            u1[rng.integers(0, nfaces, 5)] = numpy.nan
+            umag1 = numpy.sqrt(u1**2 + v1**2)
+            h1 = rng.uniform(1.0, 10.0, nfaces)
+            umag2 = umag1 * rng.uniform(0.8, 1.2, nfaces)
+            fields.append(FlowField(umag1, h1, umag2, u1, v1))
+        return fields
+
+    @pytest.mark.parametrize("fields_per_chunk", [1, 4, 13, 16])
+    def given_tidal_flow_fields_when_dzq_computed_in_chunks_then_equal_to_per_time_step(
+        self, flow_fields, fields_per_chunk: int
+    ):
+        dx = numpy.full(200, 0.8)
+        dy = numpy.full(200, 0.6)
+        expected = tidal_dzq_per_time_step(flow_fields, 0.3, dx, dy)
+
+        dzq = AnalyserDflowfm._dzq_from_tidal_flow_fields(
+            iter(flow_fields), 0.3, dx, dy, fields_per_chunk
+        )
+
+        assert numpy.any(expected != 0.0)
+        numpy.testing.assert_array_equal(dzq, expected)
@@ -0,0 +1,71 @@
+import numpy
+
+from dfastmi.batch.Face import (
+    filter_faces_by_face_condition,
+    hilbert_index,
+    reorder_faces,
+)
+
+
+class Test_hilbert_index:
+    def given_grid_of_points_when_hilbert_index_then_consecutive_points_adjacent(
+        self,
+    ):
+        x, y = numpy.meshgrid(numpy.arange(8.0), numpy.arange(8.0))
+        x = x.flatten()
+        y = y.flatten()
+
+        d = hilbert_index(x, y, order=3)
+
+        order = numpy.argsort(d)
+        assert sorted(d) == list(range(64))
+        steps = numpy.abs(numpy.diff(x[order])) + numpy.abs(numpy.diff(y[order]))
+        assert (steps == 1).all()
+
+    def given_no_points_when_hilbert_index_then_empty(self):
+        d = hilbert_index(numpy.zeros(0), numpy.zeros(0))
+
+        assert len(d) == 0
+
+
+class Test_reorder_faces:
+    def given_key_when_reorder_faces_then_faces_sorted_and_nodes_renumbered(self):
+        face_node_connectivity = numpy.ma.masked_array(
+            [[0, 1, 2, 0], [1, 3, 4, 2], [3, 5, 6, 4]],
+            mask=[[False, False, False, True], [False] * 4, [False] * 4],
+        )
+        key = numpy.array([2.0, 1.0, 0.0])
+
+        renumbered, face_order, node_order = reorder_faces(
+            face_node_connectivity, key, 8
+        )
+
+        numpy.testing.assert_array_equal(face_order, [2, 1, 0])
+        numpy.testing.assert_array_equal(node_order, [3, 5, 6, 4, 1, 2, 0, 7])
+        original = numpy.ma.masked_array(
+            node_order[renumbered.data], mask=renumbered.mask
+        )
+        numpy.testing.assert_array_equal(
+            numpy.ma.filled(original, -1),
+            numpy.ma.filled(face_node_connectivity[face_order], -1),
+        )
+
+
+class Test_filter_faces_by_face_condition:
+    def given_int64_connectivity_when_filter_faces_then_int32_indices(self):
+        xn = numpy.arange(7.0)
+        yn = numpy.zeros(7)
+        face_node_connectivity = numpy.ma.masked_array(
+            numpy.array([[0, 1, 2, 0], [1, 3, 4, 2], [3, 5, 6, 4]], dtype=numpy.int64),
+            mask=[[False, False, False, True], [False] * 4, [False] * 4],
+        )
+        condition = numpy.array([False, True, True])
+
+        _, _, renumbered, iface, inode = filter_faces_by_face_condition(
+            xn, yn, face_node_connectivity, condition
+        )
+
+        assert iface.dtype == numpy.int32
+        assert renumbered.dtype == numpy.int32
+        numpy.testing.assert_array_equal(iface, [1, 2])
+        numpy.testing.assert_array_equal(inode[renumbered], face_node_connectivity[1:])
@@ -144,3 +144,75 @@ class Test_FileNameRetriever:
             config.set(q, tide, q_tide)
 
         return (q_reference_filename, q_with_intervention_filename)
+
+    def given_config_parser_without_variants_when_get_variant_file_names_then_return_no_variants(
+        self,
+    ):
+        """
+        given : config parser without variants
+        when :  get variant file names
+        then  : return no variants
+        """
+        config = ConfigParser()
+        config.optionxform = str
+        config["C1"] = {
+            "Discharge": "1000",
+            "Reference": "reference.nc",
+            "WithIntervention": "intervention.nc",
+        }
+
+        variant_filenames = FileNameRetriever(False).get_variant_file_names(config)
+
+        assert variant_filenames == {}
+
+    def given_config_parser_with_variants_when_get_variant_file_names_then_return_file_names_per_variant(
+        self,
+    ):
+        """
+        given : config parser with variants
+        when :  get variant file names
+        then  : return file names per variant with the default variant first
+        """
+        config = ConfigParser()
+        config.optionxform = str
+        config["C1"] = {
+            "Discharge": "1000",
+            "Reference": "reference1.nc",
+            "WithIntervention.A": "a1.nc",
+            "WithIntervention": "default1.nc",
+            "WithIntervention.B": "b1.nc",
+        }
+        config["C2"] = {
+            "Discharge": "2000",
+            "Reference": "reference2.nc",
+            "WithIntervention": "default2.nc",
+            "WithIntervention.B": "b2.nc",
+            "WithIntervention.A": "a2.nc",
+        }
+
+        variant_filenames = FileNameRetriever(False).get_variant_file_names(config)
+
+        assert list(variant_filenames) == ["default", "A", "B"]
+        assert variant_filenames["B"] == {
+            1000.0: ("reference1.nc", "b1.nc"),
+            2000.0: ("reference2.nc", "b2.nc"),
+        }
+
+    def given_variant_missing_for_condition_when_get_variant_file_names_then_throw_key_error(
+        self,
+    ):
+        """
+        given : variant missing for a condition
+        when :  get variant file names
+        then  : throw key error
+        """
+        config = ConfigParser()
+        config["C1"] = {
+            "Discharge": "1000",
+            "Reference": "reference1.nc",
+            "WithIntervention.A": "a1.nc",
+        }
+        config["C2"] = {"Discharge": "2000", "Reference": "reference2.nc"}
+
+        with pytest.raises(KeyError):
+            FileNameRetriever(False).get_variant_file_names(config)
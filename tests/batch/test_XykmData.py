@@ -1,6 +1,9 @@
+import subprocess
+import sys
 from unittest.mock import patch
 
 import numpy
+import pytest
 import shapely.prepared  # needed for test_determine_xykm_data
 from shapely.geometry import LineString
 
@@ -128,3 +131,184 @@ class Test_XykmData_initialize_data:
             numpy.testing.assert_array_equal(xykm_data.nni, nni)
 
             assert len(xykm_data_reporter.mock_calls) == 10
+
+
+def shuffled_strip(nfaces: int):
+    # strip of quadrilaterals along the x-axis stored in shuffled order
+    xn = numpy.repeat(numpy.arange(nfaces + 1, dtype=numpy.float64), 2)
+    yn = numpy.tile([0.0, 1.0], nfaces + 1)
+    faces = numpy.array(
+        [[2 * i, 2 * i + 2, 2 * i + 3, 2 * i + 1] for i in range(nfaces)]
+    )
+    order = numpy.random.default_rng(1).permutation(nfaces)
+    face_node_connectivity = numpy.ma.masked_array(faces[order])
+    return xn, yn, face_node_connectivity
+
+
+class Test_XykmData_face_order:
+    xykm = LineString([(-1.0, 0.5, 0.0), (11.0, 0.5, 12.0)])
+
+    def _get_xykm_data(self, xykm, face_order: str) -> XykmData:
+        xn, yn, face_node_connectivity = shuffled_strip(10)
+        with patch(
+            "dfastmi.batch.DflowfmReporters.XykmDataReporter", autospec=True
+        ) as xykm_data_reporter:
+            xykm_data = XykmData(xykm_data_reporter)
+            xykm_data.initialize_data(
+                xykm, xn, yn, face_node_connectivity.copy(), face_order
+            )
+        return xykm_data
+
+    def given_chainage_order_when_initialize_data_then_faces_sorted_along_line(
+        self,
+    ):
+        xn, _, face_node_connectivity = shuffled_strip(10)
+
+        xykm_data = self._get_xykm_data(self.xykm, "chainage")
+
+        xface = xn[face_node_connectivity].mean(axis=1)[xykm_data.iface]
+        assert (numpy.diff(xface) > 0).all()
+
+    def given_hilbert_order_without_line_when_initialize_data_then_faces_sorted(
+        self,
+    ):
+        xn, _, face_node_connectivity = shuffled_strip(10)
+
+        xykm_data = self._get_xykm_data(None, "hilbert")
+
+        xface = xn[face_node_connectivity].mean(axis=1)[xykm_data.iface]
+        assert (numpy.diff(xface) > 0).all()
+
+    @pytest.mark.parametrize("face_order", ["chainage", "hilbert"])
+    def given_face_order_when_initialize_data_then_scattered_data_unchanged(
+        self, face_order: str
+    ):
+        xn, yn, face_node_connectivity = shuffled_strip(10)
+        source = self._get_xykm_data(self.xykm, "source")
+
+        xykm_data = self._get_xykm_data(self.xykm, face_order)
+
+        def scatter_faces(data: XykmData, values: numpy.ndarray) -> numpy.ndarray:
+            result = numpy.full(face_node_connectivity.shape[0], numpy.nan)
+            result[data.iface] = values
+            return result
+
+        def scatter_nodes(data: XykmData, values: numpy.ndarray) -> numpy.ndarray:
+            result = numpy.full(xn.shape, numpy.nan)
+            result[data.inode] = values
+            return result
+
+        for name in ["dxi", "dyi"]:
+            numpy.testing.assert_array_equal(
+                scatter_faces(xykm_data, getattr(xykm_data, name)),
+                scatter_faces(source, getattr(source, name)),
+            )
+        for name in ["xni", "yni", "sni", "nni"]:
+            numpy.testing.assert_array_equal(
+                scatter_nodes(xykm_data, getattr(xykm_data, name)),
+                scatter_nodes(source, getattr(source, name)),
+            )
+        numpy.testing.assert_array_equal(
+            xykm_data.inode[xykm_data.face_node_connectivity_index],
+            face_node_connectivity[xykm_data.iface],
+        )
+        numpy.testing.assert_array_equal(
+            xykm_data.interest_region, source.interest_region
+        )
+
+
+class Test_XykmData_region_cache:
+    xykm = LineString([(-1.0, 0.5, 0.0), (11.0, 0.5, 12.0)])
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DFASTMI_CACHE_DIR", str(tmp_path / "cache"))
+
+    def _get_xykm_data(self, region_cache: bool, face_order: str = "source"):
+        xn, yn, face_node_connectivity = shuffled_strip(10)
+        with patch(
+            "dfastmi.batch.DflowfmReporters.XykmDataReporter", autospec=True
+        ) as xykm_data_reporter:
+            xykm_data = XykmData(xykm_data_reporter)
+            xykm_data.initialize_data(
+                self.xykm, xn, yn, face_node_connectivity, face_order, region_cache
+            )
+        return xykm_data
+
+    @pytest.mark.parametrize("face_order", ["source", "chainage"])
+    def given_cached_region_when_initialize_data_then_region_not_determined_again(
+        self, face_order: str
+    ):
+        expected = self._get_xykm_data(False, face_order)
+        self._get_xykm_data(True, face_order)
+
+        with (
+            patch.object(XykmData, "_filter_region_of_interest") as filter_region,
+            patch.object(XykmData, "_project_onto_line") as project,
+        ):
+            xykm_data = self._get_xykm_data(True, face_order)
+
+        filter_region.assert_not_called()
+        project.assert_not_called()
+        for name in [
+            "xni",
+            "yni",
+            "face_node_connectivity_index",
+            "iface",
+            "inode",
+            "dxi",
+            "dyi",
+            "sni",
+            "nni",
+            "xykline",
+            "interest_region",
+        ]:
+            numpy.testing.assert_array_equal(
+                getattr(xykm_data, name), getattr(expected, name)
+            )
+        assert (xykm_data.xmin, xykm_data.xmax, xykm_data.ymin, xykm_data.ymax) == (
+            expected.xmin,
+            expected.xmax,
+            expected.ymin,
+            expected.ymax,
+        )
+
+    def given_no_region_cache_when_initialize_data_twice_then_region_determined_again(
+        self, tmp_path
+    ):
+        self._get_xykm_data(False)
+
+        with patch.object(
+            XykmData,
+            "_filter_region_of_interest",
+            autospec=True,
+            side_effect=XykmData._filter_region_of_interest,
+        ) as filter_region:
+            self._get_xykm_data(False)
+
+        filter_region.assert_called_once()
+        assert not (tmp_path / "cache").exists()
+
+
+class Test_XykmData_imports:
+    def given_fresh_interpreter_when_initialize_data_with_line_then_region_selected(
+        self,
+    ):
+        code = (
+            "from unittest.mock import MagicMock\n"
+            "import numpy\n"
+            "from shapely.geometry import LineString\n"
+            "from dfastmi.batch.XykmData import XykmData\n"
+            "xn = numpy.array([0.0, 1.0, 1.0, 0.0])\n"
+            "yn = numpy.array([0.0, 0.0, 1.0, 1.0])\n"
+            "faces = numpy.ma.masked_array([[0, 1, 2, 3]])\n"
+            "xykm = LineString([(0.0, 0.5, 0.0), (1.0, 0.5, 1.0)])\n"
+            "data = XykmData(MagicMock())\n"
+            "data.initialize_data(xykm, xn, yn, faces)\n"
+            "print(len(data.iface))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "1"
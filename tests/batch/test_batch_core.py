@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 from contextlib import contextmanager
@@ -8,6 +9,7 @@ import numpy as np
 import pytest
 
 import dfastmi.batch.core
+import dfastmi.batch.instrumentation
 from dfastmi.config.ConfigFileOperations import ConfigFileOperations
 from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
 from dfastmi.io.RiversObject import RiversObject
@@ -398,6 +400,175 @@ class Test_batch_mode:
             os.chdir(cwd)
 
 
+class Test_batch_mode_timing:
+    @pytest.mark.parametrize("timing_format", ["json", "chrome"])
+    def given_timing_file_when_batch_mode_core_then_timing_reported(
+        self, tmp_path, timing_format: str, mocker
+    ):
+        stop_recording = mocker.spy(dfastmi.batch.instrumentation, "stop_recording")
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        tstdir = "tests/c01 - GendtseWaardNevengeul"
+        cwd = os.getcwd()
+        try:
+            os.chdir(tstdir)
+            rivers = RiversObject("../../dfastmi/Dutch_rivers_v1.ini")
+            config = ConfigFileOperations.load_configuration_file("c01_netcdf.cfg")
+            config.set("General", "OutputDir", str(tmp_path))
+            config.set("General", "Plotting", "False")
+            config.set("General", "TimingFile", "timing.json")
+            config.set("General", "TimingFormat", timing_format)
+            with captured_output():
+                success = dfastmi.batch.core.batch_mode_core(rivers, False, config)
+        finally:
+            os.chdir(cwd)
+
+        assert success
+        stop_recording.assert_called_once()
+        report = (tmp_path / "report.txt").read_text().splitlines()
+        stages = [line[:30].strip() for line in report]
+        for stage in [
+            "analysis",
+            "load mesh",
+            "region of interest",
+            "read dzq",
+            "kernel",
+            "write netCDF",
+            "plotting",
+        ]:
+            assert stage in stages
+        assert report[-1] == "The program has ended !!!"
+
+        with open(tmp_path / "timing.json") as timing_file:
+            timing = json.load(timing_file)
+        if timing_format == "chrome":
+            names = [event["name"] for event in timing["traceEvents"]]
+        else:
+            names = [span["name"] for span in timing["spans"]]
+        assert names[0] == "analysis"
+        assert "read dzq" in names
+
+    def given_no_timing_when_batch_mode_core_then_no_timing_table(self, tmp_path):
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        tstdir = "tests/c01 - GendtseWaardNevengeul"
+        cwd = os.getcwd()
+        try:
+            os.chdir(tstdir)
+            rivers = RiversObject("../../dfastmi/Dutch_rivers_v1.ini")
+            config = ConfigFileOperations.load_configuration_file("c01_netcdf.cfg")
+            config.set("General", "OutputDir", str(tmp_path))
+            config.set("General", "Plotting", "False")
+            with captured_output():
+                dfastmi.batch.core.batch_mode_core(rivers, False, config)
+        finally:
+            os.chdir(cwd)
+
+        report = (tmp_path / "report.txt").read_text()
+        assert "wall [s]" not in report
+        assert not dfastmi.batch.instrumentation.is_recording()
+
+    def given_profiling_when_batch_mode_core_then_profiles_written(self, tmp_path):
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        tstdir = "tests/c01 - GendtseWaardNevengeul"
+        cwd = os.getcwd()
+        dfastmi.batch.instrumentation.enable_profiling()
+        try:
+            os.chdir(tstdir)
+            rivers = RiversObject("../../dfastmi/Dutch_rivers_v1.ini")
+            config = ConfigFileOperations.load_configuration_file("c01_netcdf.cfg")
+            config.set("General", "OutputDir", str(tmp_path))
+            config.set("General", "Plotting", "False")
+            with captured_output():
+                success = dfastmi.batch.core.batch_mode_core(rivers, False, config)
+        finally:
+            dfastmi.batch.instrumentation.enable_profiling(False)
+            os.chdir(cwd)
+
+        assert success
+        assert (tmp_path / "profile_read_dzq.pstats").exists()
+        assert (tmp_path / "profile_load_mesh.pstats").exists()
+        assert (tmp_path / "profile.txt").exists()
+        report = (tmp_path / "report.txt").read_text()
+        assert "wall [s]" not in report
+        assert "Profiles of the analysis stages written to" in report
+
+
+class Test_batch_mode_blocks:
+    def _run(self, outputdir, block_size: str) -> bool:
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        tstdir = "tests/c01 - GendtseWaardNevengeul"
+        cwd = os.getcwd()
+        try:
+            os.chdir(tstdir)
+            rivers = RiversObject("../../dfastmi/Dutch_rivers_v1.ini")
+            config = ConfigFileOperations.load_configuration_file("c01_netcdf.cfg")
+            config.set("General", "OutputDir", str(outputdir))
+            config.set("General", "Plotting", "False")
+            config.set("General", "BlockSize", block_size)
+            with captured_output():
+                return dfastmi.batch.core.batch_mode_core(rivers, False, config)
+        finally:
+            os.chdir(cwd)
+
+    def given_block_size_when_batch_mode_core_then_same_output_as_without_blocks(
+        self, tmp_path
+    ):
+        assert self._run(tmp_path / "all", "0")
+        assert self._run(tmp_path / "blocks", "1000")
+
+        for filename in ["dfastmi_results.nc", "projected_mesh.nc"]:
+            with (
+                netCDF4.Dataset(tmp_path / "all" / filename) as expected,
+                netCDF4.Dataset(tmp_path / "blocks" / filename) as result,
+            ):
+                assert list(result.variables) == list(expected.variables)
+                for name, variable in expected.variables.items():
+                    np.testing.assert_array_equal(
+                        np.ma.filled(result.variables[name][...], np.nan),
+                        np.ma.filled(variable[...], np.nan),
+                    )
+
+
+class Test_batch_mode_variants_with_sweep:
+    def given_variants_and_sweep_when_batch_mode_core_then_error_reported(
+        self, tmp_path, monkeypatch
+    ):
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        calls = []
+        monkeypatch.setattr(
+            dfastmi.batch.core,
+            "get_variant_filenames",
+            lambda *args: {"A": {}, "B": {}},
+        )
+        monkeypatch.setattr(
+            dfastmi.batch.core.variants,
+            "analyse_and_report_variants",
+            lambda *args: calls.append("variants") or True,
+        )
+        monkeypatch.setattr(
+            dfastmi.batch.core.sweep,
+            "analyse_and_report_sweep",
+            lambda *args: calls.append("sweep") or True,
+        )
+        tstdir = "tests/c01 - GendtseWaardNevengeul"
+        cwd = os.getcwd()
+        try:
+            os.chdir(tstdir)
+            rivers = RiversObject("../../dfastmi/Dutch_rivers_v1.ini")
+            config = ConfigFileOperations.load_configuration_file("c01_netcdf.cfg")
+            config.set("General", "OutputDir", str(tmp_path))
+            config.set("General", "Plotting", "False")
+            config["Sweep"] = {"Ucrit": "0.2, 0.4"}
+            with captured_output():
+                success = dfastmi.batch.core.batch_mode_core(rivers, False, config)
+        finally:
+            os.chdir(cwd)
+
+        assert not success
+        assert calls == []
+        report = (tmp_path / "report.txt").read_text()
+        assert "can't be combined with a [Sweep] block" in report
+
+
 class Test_batch_countq:
     @pytest.mark.parametrize(
         "vector_data, expected_true_flags_count",
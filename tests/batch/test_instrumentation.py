@@ -0,0 +1,180 @@
+import json
+import pstats
+from io import StringIO
+
+import pytest
+
+from dfastmi.batch import instrumentation
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+
+
+@pytest.fixture
+def recording():
+    instrumentation.start_recording()
+    yield
+    instrumentation.stop_recording()
+
+
+@pytest.fixture
+def profiling(recording):
+    instrumentation.enable_profiling()
+    yield
+    instrumentation.enable_profiling(False)
+
+
+def busy_function():
+    return sum(i * i for i in range(10**4))
+
+
+class Test_span:
+    def given_no_recording_when_span_then_nothing_recorded(self):
+        with instrumentation.span("stage"):
+            pass
+
+        assert not instrumentation.is_recording()
+        assert instrumentation.stop_recording() == []
+
+    def given_recording_when_nested_spans_then_recorded_in_start_order(self, recording):
+        with instrumentation.span("outer"):
+            with instrumentation.span("inner"):
+                bytearray(10**6)
+        with instrumentation.span("next"):
+            pass
+
+        spans = instrumentation.stop_recording()
+
+        assert [(span.name, span.depth) for span in spans] == [
+            ("outer", 0),
+            ("inner", 1),
+            ("next", 0),
+        ]
+        assert spans[0].wall_time >= spans[1].wall_time
+        assert spans[2].start >= spans[0].start + spans[0].wall_time
+        assert all(span.cpu_time >= 0.0 for span in spans)
+        assert all(span.peak_rss >= 0 for span in spans)
+
+    def given_exception_in_span_when_recording_then_span_closed(self, recording):
+        with pytest.raises(ValueError):
+            with instrumentation.span("failing"):
+                raise ValueError("failure")
+        with instrumentation.span("next"):
+            pass
+
+        spans = instrumentation.stop_recording()
+
+        assert [span.depth for span in spans] == [0, 0]
+
+    def given_file_written_in_span_when_recording_then_bytes_written_counted(
+        self, recording, tmp_path
+    ):
+        if instrumentation.get_io_counters() == (0, 0):
+            pytest.skip("I/O counters not available on this platform")
+
+        with instrumentation.span("write"):
+            (tmp_path / "data.bin").write_bytes(bytes(10**6))
+
+        spans = instrumentation.stop_recording()
+
+        assert spans[0].bytes_written >= 10**6
+
+
+class Test_profiling:
+    def given_profiling_disabled_when_span_then_no_profiles(self, recording):
+        with instrumentation.span("analysis"):
+            with instrumentation.span("kernel"):
+                busy_function()
+
+        assert instrumentation.get_profiles() == {}
+
+    def given_profiling_when_nested_spans_then_stages_below_root_profiled(
+        self, profiling
+    ):
+        with instrumentation.span("analysis"):
+            with instrumentation.span("kernel"):
+                with instrumentation.span("inner"):
+                    busy_function()
+            with instrumentation.span("kernel"):
+                busy_function()
+
+        profiles = instrumentation.get_profiles()
+
+        assert list(profiles) == ["kernel"]
+        functions = [function[2] for function in profiles["kernel"].stats]
+        assert functions.count("busy_function") == 1
+        calls = [
+            stats[1]
+            for function, stats in profiles["kernel"].stats.items()
+            if function[2] == "busy_function"
+        ]
+        assert calls == [2]
+
+    def given_profiles_when_write_profiles_then_pstats_and_summary_written(
+        self, profiling, tmp_path
+    ):
+        with instrumentation.span("analysis"):
+            with instrumentation.span("read dzq"):
+                busy_function()
+
+        filenames = instrumentation.write_profiles(str(tmp_path))
+
+        assert filenames == [
+            str(tmp_path / "profile_read_dzq.pstats"),
+            str(tmp_path / instrumentation.PROFILE_SUMMARY),
+        ]
+        stats = pstats.Stats(filenames[0])
+        assert any(function[2] == "busy_function" for function in stats.stats)
+        summary = (tmp_path / instrumentation.PROFILE_SUMMARY).read_text()
+        assert summary.startswith("=== read dzq ===")
+        assert "busy_function" in summary
+
+
+class Test_write_timing:
+    def _get_spans(self):
+        return [
+            instrumentation.Span("analysis", 0, 0.0, 2.0, 1.5, 2 * 1024**2, 0, 10),
+            instrumentation.Span("read dzq", 1, 0.5, 1.0, 0.8, 2 * 1024**2, 0, 10),
+        ]
+
+    def given_spans_when_write_report_then_table_with_row_per_span(self):
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        report = StringIO()
+
+        instrumentation.write_report(report, self._get_spans())
+
+        lines = report.getvalue().splitlines()
+        assert lines[1].startswith("stage")
+        assert lines[3].startswith("analysis ")
+        assert lines[3].split()[1:] == ["2.00", "1.50", "2.0", "0.0", "0.0"]
+        assert lines[4].startswith("  read dzq ")
+        assert lines[5].startswith("-----")
+
+    def given_spans_when_write_json_file_then_spans_written(self, tmp_path):
+        filename = str(tmp_path / "timing.json")
+
+        instrumentation.write_timing_file(
+            filename, self._get_spans(), instrumentation.JSON_FORMAT
+        )
+
+        with open(filename) as timing_file:
+            timing = json.load(timing_file)
+        assert timing["format"] == instrumentation.TIMING_FORMAT
+        assert timing["spans"][1]["name"] == "read dzq"
+        assert timing["spans"][1]["depth"] == 1
+        assert timing["spans"][1]["bytes_read"] == 2 * 1024**2
+
+    def given_spans_when_write_chrome_trace_then_complete_events_written(
+        self, tmp_path
+    ):
+        filename = str(tmp_path / "timing.json")
+
+        instrumentation.write_timing_file(
+            filename, self._get_spans(), instrumentation.CHROME_FORMAT
+        )
+
+        with open(filename) as timing_file:
+            timing = json.load(timing_file)
+        events = timing["traceEvents"]
+        assert [event["ph"] for event in events] == ["X", "X"]
+        assert events[1]["ts"] == pytest.approx(0.5e6)
+        assert events[1]["dur"] == pytest.approx(1.0e6)
+        assert events[1]["args"]["cpu_time"] == 0.8
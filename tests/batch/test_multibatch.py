@@ -0,0 +1,151 @@
+import multiprocessing
+import shutil
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import dfastmi.batch.multibatch
+from dfastmi.batch.multibatch import (
+    expand_config_patterns,
+    get_case_overrides,
+    multi_batch_mode,
+)
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.RiversObject import RiversObject
+
+NETCDF_CASE = "tests/c01 - GendtseWaardNevengeul"
+
+
+@pytest.fixture
+def case_dir(tmp_path) -> Path:
+    case_dir = tmp_path / "c01"
+    case_dir.mkdir()
+    for name in ["c01_netcdf.cfg"] + [
+        f"{kind}-Q{i}_map.nc"
+        for kind in ["reference", "intervention"]
+        for i in (1, 2, 3)
+    ]:
+        shutil.copy(Path(NETCDF_CASE) / name, case_dir / name)
+    shutil.copy(case_dir / "c01_netcdf.cfg", case_dir / "c01_netcdf_copy.cfg")
+    return case_dir
+
+
+@pytest.fixture
+def rivers() -> RiversObject:
+    ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+    return RiversObject("dfastmi/Dutch_rivers_v1.ini")
+
+
+class Test_expand_config_patterns:
+    def given_glob_pattern_and_names_when_expanded_then_sorted_unique_files_returned(
+        self, case_dir: Path
+    ):
+        config_files = expand_config_patterns(
+            [str(case_dir / "*.cfg"), str(case_dir / "c01_netcdf.cfg"), "missing.cfg"]
+        )
+
+        assert config_files == [
+            str(case_dir / "c01_netcdf.cfg"),
+            str(case_dir / "c01_netcdf_copy.cfg"),
+            "missing.cfg",
+        ]
+
+
+class Test_get_case_overrides:
+    def given_cases_sharing_output_dir_when_get_overrides_then_subdirectory_per_case(
+        self, case_dir: Path
+    ):
+        config_files = [
+            str(case_dir / "c01_netcdf.cfg"),
+            str(case_dir / "c01_netcdf_copy.cfg"),
+        ]
+
+        overrides = get_case_overrides(config_files)
+
+        assert overrides[0]["OutputDir"] == str(case_dir / "output" / "c01_netcdf")
+        assert overrides[1]["OutputDir"] == str(case_dir / "output" / "c01_netcdf_copy")
+        assert overrides[0]["FigureDir"] == str(case_dir / "figure" / "c01_netcdf")
+        assert all(override["ClosePlots"] == "True" for override in overrides)
+
+    def given_case_with_own_output_dir_when_get_overrides_then_output_dir_kept(
+        self, case_dir: Path
+    ):
+        config_files = [str(case_dir / "c01_netcdf.cfg")]
+
+        overrides = get_case_overrides(config_files)
+
+        assert overrides == [{"ClosePlots": "True"}]
+
+
+class Test_multi_batch_mode:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def given_two_cases_when_multi_batch_mode_then_reports_isolated_and_summary_printed(
+        self, case_dir: Path, rivers: RiversObject, workers: int, capsys
+    ):
+        results = multi_batch_mode(
+            [str(case_dir / "*.cfg")], rivers, False, workers=workers
+        )
+
+        assert [result.success for result in results] == [True, True]
+        assert all(result.runtime > 0 for result in results)
+        assert all(result.peak_memory > 0 for result in results)
+        for name in ["c01_netcdf", "c01_netcdf_copy"]:
+            assert (case_dir / "output" / name / "report.txt").exists()
+        output = capsys.readouterr().out
+        assert "2 of 2 cases completed successfully." in output
+
+    def given_missing_config_file_when_multi_batch_mode_then_failure_reported(
+        self, rivers: RiversObject, capsys
+    ):
+        results = multi_batch_mode(["missing.cfg"], rivers, False, workers=1)
+
+        assert len(results) == 1
+        assert not results[0].success
+        assert results[0].error != ""
+        assert "0 of 1 cases completed successfully." in capsys.readouterr().out
+
+    def given_pattern_without_matches_when_multi_batch_mode_then_nothing_run(
+        self, tmp_path: Path, rivers: RiversObject, mocker
+    ):
+        run_case = mocker.spy(dfastmi.batch.multibatch, "_run_case")
+
+        results = multi_batch_mode([str(tmp_path / "*.cfg")], rivers, False)
+
+        assert results == []
+        run_case.assert_not_called()
+
+    def given_case_when_run_case_then_allocations_not_traced(
+        self, case_dir: Path, rivers: RiversObject, mocker
+    ):
+        tracing = []
+
+        def batch_mode_core(*args) -> bool:
+            tracing.append(tracemalloc.is_tracing())
+            return True
+
+        mocker.patch(
+            "dfastmi.batch.multibatch.batch_mode_core", side_effect=batch_mode_core
+        )
+        dfastmi.batch.multibatch._initialize_worker(
+            ApplicationSettingsHelper.PROGTEXTS, rivers
+        )
+
+        result = dfastmi.batch.multibatch._run_case(
+            str(case_dir / "c01_netcdf.cfg"), {}, False
+        )
+
+        assert tracing == [False]
+        assert result.success
+        assert result.peak_memory > 0
+
+    def given_two_cases_when_multi_batch_mode_then_fresh_process_per_case(
+        self, case_dir: Path, rivers: RiversObject, mocker
+    ):
+        pool = mocker.spy(multiprocessing.get_context("spawn"), "Pool")
+
+        results = multi_batch_mode([str(case_dir / "*.cfg")], rivers, False, workers=1)
+
+        assert [result.success for result in results] == [True, True]
+        assert pool.call_args.kwargs["processes"] == 1
+        assert pool.call_args.kwargs["maxtasksperchild"] == 1
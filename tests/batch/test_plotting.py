@@ -0,0 +1,76 @@
+import subprocess
+import sys
+
+import pytest
+
+import dfastmi.batch.plotting as plotting
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+class Test_plotting_initialize:
+    def test_import_does_not_load_matplotlib(self):
+        code = (
+            "import sys\n"
+            "import dfastmi.batch.plotting as plotting\n"
+            "print('matplotlib' in sys.modules, plotting.is_initialized())"
+        )
+        assert run_python(code) == "False False"
+
+    def test_show_and_close_all_without_figures_do_not_load_matplotlib(self):
+        code = (
+            "import sys\n"
+            "import dfastmi.batch.plotting as plotting\n"
+            "plotting.show(block=False)\n"
+            "plotting.close_all()\n"
+            "print('matplotlib' in sys.modules)"
+        )
+        assert run_python(code) == "False"
+
+    def test_initialize_non_interactive_selects_agg_backend(self):
+        code = (
+            "import dfastmi.batch.plotting as plotting\n"
+            "matplotlib = plotting.initialize(interactive=False)\n"
+            "print(plotting.is_initialized(), matplotlib.get_backend().lower())"
+        )
+        assert run_python(code) == "True agg"
+
+    @pytest.mark.parametrize("positive_up", [True, False])
+    def test_plot_sedimentation_loads_matplotlib_on_first_use(self, positive_up):
+        code = (
+            "import numpy\n"
+            "import dfastmi.batch.plotting as plotting\n"
+            "plotting.initialize(interactive=False)\n"
+            "fig, ax = plotting.plot_sedimentation(numpy.arange(3.0), 'km', "
+            "[numpy.ones(3)], 'volume', 'title', ['bin'], "
+            f"positive_up={positive_up})\n"
+            "print(len(ax.collections))\n"
+            "plotting.close_all()"
+        )
+        assert run_python(code) == "1"
+
+
+class Test_run_in_figure_thread:
+    def given_no_runner_when_run_in_figure_thread_then_called_directly(self):
+        assert plotting.run_in_figure_thread(max, 1, 3) == 3
+
+    def given_runner_when_run_in_figure_thread_then_task_passed_to_runner(self):
+        tasks = []
+
+        def runner(task):
+            tasks.append(task)
+            return task()
+
+        plotting.set_figure_thread_runner(runner)
+        try:
+            result = plotting.run_in_figure_thread(sorted, [2, 1], reverse=True)
+        finally:
+            plotting.set_figure_thread_runner(None)
+
+        assert result == [2, 1]
+        assert len(tasks) == 1
@@ -0,0 +1,111 @@
+import os
+from contextlib import redirect_stdout
+from io import StringIO
+
+import pytest
+
+import dfastmi.batch.core
+from dfastmi.batch import progress
+from dfastmi.config.ConfigFileOperations import ConfigFileOperations
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.RiversObject import RiversObject
+
+
+@pytest.fixture
+def listener():
+    reports = []
+    progress.reset()
+    progress.set_listener(lambda stage, fraction: reports.append((stage, fraction)))
+    yield reports
+    progress.set_listener(None)
+    progress.reset()
+
+
+class Test_report_stage:
+    def given_no_listener_when_report_stage_then_nothing_happens(self):
+        progress.reset()
+
+        progress.report_stage(progress.LOAD_MESH)
+
+        assert not progress.is_cancel_requested()
+
+    def given_listener_when_report_stage_then_fraction_of_analysis_reported(
+        self, listener
+    ):
+        progress.report_stage(progress.LOAD_MESH)
+        progress.report_stage(progress.READ_DZQ, 1, 4)
+        progress.report_stage(progress.INITIAL_YEAR_DREDGING, 1, 1)
+
+        assert listener[0] == (progress.LOAD_MESH, 0.0)
+        assert listener[1][0] == progress.READ_DZQ
+        assert listener[1][1] == pytest.approx(0.25)
+        assert listener[2] == (progress.INITIAL_YEAR_DREDGING, 1.0)
+
+    def given_cancel_requested_when_report_stage_then_analysis_cancelled(
+        self, listener
+    ):
+        progress.request_cancel()
+
+        with pytest.raises(progress.AnalysisCancelled):
+            progress.report_stage(progress.READ_DZQ)
+
+        assert listener == []
+
+    def given_cancel_requested_when_reset_then_analysis_continues(self, listener):
+        progress.request_cancel()
+        progress.reset()
+
+        progress.report_stage(progress.READ_DZQ)
+
+        assert len(listener) == 1
+
+
+class Test_batch_mode_progress:
+    def run_c01_netcdf(self, tmp_path):
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        tstdir = "tests/c01 - GendtseWaardNevengeul"
+        cwd = os.getcwd()
+        try:
+            os.chdir(tstdir)
+            rivers = RiversObject("../../dfastmi/Dutch_rivers_v1.ini")
+            config = ConfigFileOperations.load_configuration_file("c01_netcdf.cfg")
+            config.set("General", "OutputDir", str(tmp_path))
+            config.set("General", "Plotting", "False")
+            with redirect_stdout(StringIO()):
+                return dfastmi.batch.core.batch_mode_core(rivers, False, config)
+        finally:
+            os.chdir(cwd)
+
+    def given_listener_when_batch_mode_core_then_stages_reported_in_order(
+        self, tmp_path, listener
+    ):
+        success = self.run_c01_netcdf(tmp_path)
+
+        assert success
+        stages = list(dict.fromkeys(stage for stage, _ in listener))
+        assert stages == list(progress.STAGE_FRACTIONS)
+        fractions = [fraction for _, fraction in listener]
+        assert fractions == sorted(fractions)
+
+    def given_cancel_during_read_dzq_when_batch_mode_core_then_analysis_stops(
+        self, tmp_path
+    ):
+        stages = []
+
+        def cancel_on_read_dzq(stage: str, fraction: float):
+            stages.append(stage)
+            if stage == progress.READ_DZQ:
+                progress.request_cancel()
+
+        progress.reset()
+        progress.set_listener(cancel_on_read_dzq)
+        try:
+            with pytest.raises(progress.AnalysisCancelled):
+                self.run_c01_netcdf(tmp_path)
+        finally:
+            progress.set_listener(None)
+            progress.reset()
+
+        assert stages[-1] == progress.READ_DZQ
+        assert progress.CHAR_BED_CHANGES not in stages
+        assert not (tmp_path / "dfastmi_results.nc").exists()
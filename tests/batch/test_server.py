@@ -0,0 +1,198 @@
+import configparser
+import json
+import shutil
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from dfastmi.batch import sessioncache
+from dfastmi.batch.server import AnalysisServer, create_http_server
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.RiversObject import RiversObject
+
+NETCDF_CASE = "tests/c01 - GendtseWaardNevengeul"
+
+
+@pytest.fixture
+def case_dir(tmp_path) -> Path:
+    case_dir = tmp_path / "c01"
+    case_dir.mkdir()
+    for name in ["c01_netcdf.cfg"] + [
+        f"{kind}-Q{i}_map.nc"
+        for kind in ["reference", "intervention"]
+        for i in (1, 2, 3)
+    ]:
+        shutil.copy(Path(NETCDF_CASE) / name, case_dir / name)
+    return case_dir
+
+
+@pytest.fixture
+def server():
+    ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+    rivers = RiversObject("dfastmi/Dutch_rivers_v1.ini")
+    yield AnalysisServer(rivers, False)
+    sessioncache.disable()
+
+
+def read_sections(config_file: Path):
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    config.read(config_file)
+    return {section: dict(config[section]) for section in config.sections()}
+
+
+class Test_AnalysisServer:
+    def given_config_file_when_analysed_twice_then_mesh_and_mappings_reused(
+        self, server: AnalysisServer, case_dir: Path
+    ):
+        config_file = str(case_dir / "c01_netcdf.cfg")
+
+        first = server.analyse({"config_file": config_file})
+        second = server.analyse({"config_file": config_file})
+
+        assert first["success"] and second["success"]
+        assert second["output_dir"] == str(case_dir / "output")
+        assert Path(second["report_file"]).exists()
+        cache = server.get_status()["cache"]
+        assert cache["mesh"] == {"entries": 1, "hits": 1, "misses": 1}
+        assert cache["region of interest"]["hits"] == 1
+        assert cache["grid mapping"] == {"entries": 3, "hits": 3, "misses": 3}
+
+    def given_config_sections_when_analysed_then_paths_relative_to_rootdir(
+        self, server: AnalysisServer, case_dir: Path
+    ):
+        sections = read_sections(case_dir / "c01_netcdf.cfg")
+        sections["General"]["OutputDir"] = "results"
+
+        result = server.analyse({"config": sections, "rootdir": str(case_dir)})
+
+        assert result["success"]
+        assert result["error"] == ""
+        assert result["output_dir"] == str(case_dir / "results")
+        assert (case_dir / "results" / "dfastmi_results.nc").exists()
+
+    def given_missing_config_file_when_analysed_then_error_returned(
+        self, server: AnalysisServer, tmp_path: Path
+    ):
+        result = server.analyse({"config_file": str(tmp_path / "missing.cfg")})
+
+        assert not result["success"]
+        assert result["error"] != ""
+
+    def given_request_without_config_when_analysed_then_value_error_raised(
+        self, server: AnalysisServer
+    ):
+        with pytest.raises(ValueError):
+            server.analyse({"rivers": "Dutch_rivers_v1.ini"})
+
+
+@pytest.fixture
+def port(server: AnalysisServer):
+    http_server = create_http_server(server, port=0)
+
+    def handle_requests():
+        while not server.stopped:
+            http_server.handle_request()
+
+    thread = threading.Thread(target=handle_requests)
+    thread.start()
+    yield http_server.server_port
+    if not server.stopped:
+        server.stopped = True
+        # wake up the server waiting for a request
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{http_server.server_port}/")
+        except urllib.error.URLError:
+            pass
+    thread.join(timeout=60)
+    http_server.server_close()
+    assert not thread.is_alive()
+
+
+class Test_http_server:
+    def post(
+        self, port: int, path: str, data: dict, headers: Optional[dict] = None
+    ) -> dict:
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{port}{path}",
+            data=json.dumps(data).encode("utf-8"),
+            headers=headers,
+        )
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    def headers(self, server: AnalysisServer) -> dict:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {server.token}",
+        }
+
+    def given_running_server_when_requests_sent_then_results_returned_as_json(
+        self, server: AnalysisServer, case_dir: Path, port: int
+    ):
+        headers = self.headers(server)
+
+        result = self.post(
+            port,
+            "/analyse",
+            {"config_file": str(case_dir / "c01_netcdf.cfg")},
+            headers,
+        )
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{port}/status", headers=headers
+        )
+        with urllib.request.urlopen(request) as response:
+            status = json.loads(response.read())
+        with pytest.raises(urllib.error.HTTPError) as error:
+            self.post(port, "/analyse", {}, headers)
+        self.post(port, "/shutdown", {}, headers)
+
+        assert result["success"]
+        assert status["cache"]["mesh"]["misses"] == 1
+        assert error.value.code == 400
+        assert server.stopped
+
+    @pytest.mark.parametrize(
+        "headers, code",
+        [
+            ({"Content-Type": "application/json"}, 401),
+            (
+                {"Content-Type": "application/json", "Authorization": "Bearer wrong"},
+                401,
+            ),
+            ({"Content-Type": "text/plain", "Authorization": None}, 415),
+            (
+                {
+                    "Content-Type": "application/json",
+                    "Authorization": None,
+                    "Origin": "http://example.com",
+                },
+                403,
+            ),
+        ],
+    )
+    def given_unauthorized_request_when_shutdown_then_refused(
+        self, server: AnalysisServer, port: int, headers: dict, code: int
+    ):
+        headers = {
+            key: f"Bearer {server.token}" if value is None else value
+            for key, value in headers.items()
+        }
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            self.post(port, "/shutdown", {}, headers)
+
+        assert error.value.code == code
+        assert not server.stopped
+
+    def given_request_without_token_when_get_status_then_refused(
+        self, server: AnalysisServer, port: int
+    ):
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/status")
+
+        assert error.value.code == 401
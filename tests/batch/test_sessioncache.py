@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from dfastmi.batch import sessioncache
+
+
+@pytest.fixture
+def cache():
+    sessioncache.enable(max_entries=2)
+    yield sessioncache
+    sessioncache.disable()
+
+
+class Test_sessioncache:
+    def given_disabled_cache_when_get_then_value_computed_every_time(self, mocker):
+        compute = mocker.Mock(return_value=1)
+        get_key = mocker.Mock(return_value="key")
+
+        assert sessioncache.get("mesh", get_key, compute) == 1
+        assert sessioncache.get("mesh", get_key, compute) == 1
+
+        assert compute.call_count == 2
+        get_key.assert_not_called()
+        assert sessioncache.get_statistics() == {}
+
+    def given_enabled_cache_when_get_twice_then_value_computed_once(
+        self, cache, mocker
+    ):
+        compute = mocker.Mock(return_value=[1, 2])
+
+        first = cache.get("mesh", lambda: "key", compute)
+        second = cache.get("mesh", lambda: "key", compute)
+
+        compute.assert_called_once()
+        assert second is first
+        assert cache.get_statistics() == {
+            "mesh": {"entries": 1, "hits": 1, "misses": 1}
+        }
+
+    def given_full_cache_when_get_new_key_then_least_recently_used_evicted(
+        self, cache, mocker
+    ):
+        compute = mocker.Mock(side_effect=lambda: object())
+        cache.get("mesh", lambda: "a", compute)
+        cache.get("mesh", lambda: "b", compute)
+        cache.get("mesh", lambda: "a", compute)
+        cache.get("mesh", lambda: "c", compute)
+
+        cache.get("mesh", lambda: "a", compute)
+        cache.get("mesh", lambda: "b", compute)
+
+        assert compute.call_count == 4
+        assert cache.get_statistics()["mesh"]["entries"] == 2
+
+    def given_categories_when_get_same_key_then_values_kept_apart(self, cache):
+        cache.get("mesh", lambda: "key", lambda: 1)
+
+        assert cache.get("rivers", lambda: "key", lambda: 2) == 2
+
+    def given_cached_values_when_clear_then_values_computed_again(self, cache, mocker):
+        compute = mocker.Mock(return_value=1)
+        cache.get("mesh", lambda: "key", compute)
+
+        cache.clear()
+        cache.get("mesh", lambda: "key", compute)
+
+        assert compute.call_count == 2
+        assert cache.is_enabled()
+
+    def given_excluded_category_when_get_then_value_computed_but_not_cached(
+        self, cache, mocker
+    ):
+        compute = mocker.Mock(return_value=1)
+
+        with cache.excluding("flow fields"):
+            cache.get("flow fields", lambda: "key", compute)
+            cache.get("flow fields", lambda: "key", compute)
+            cache.get("mesh", lambda: "key", compute)
+        cache.get("flow fields", lambda: "key", compute)
+        cache.get("flow fields", lambda: "key", compute)
+
+        assert compute.call_count == 4
+        assert cache.get_statistics()["flow fields"] == {
+            "entries": 1,
+            "hits": 1,
+            "misses": 1,
+        }
+
+    def given_excluded_category_when_is_cached_then_false(self, cache):
+        with cache.excluding("flow fields"):
+            assert not cache.is_cached("flow fields")
+            assert cache.is_cached("reference fields")
+        assert cache.is_cached("flow fields")
+        cache.disable()
+        assert not cache.is_cached("flow fields")
+
+    def given_size_limit_when_get_then_least_recently_used_evicted_over_categories(
+        self, mocker
+    ):
+        compute = mocker.Mock(side_effect=lambda: np.zeros(100))
+        sessioncache.enable(max_size=2000)
+        try:
+            sessioncache.get("mesh", lambda: "a", compute)
+            sessioncache.get("flow fields", lambda: "b", compute)
+            sessioncache.get("mesh", lambda: "a", compute)
+            sessioncache.get("flow fields", lambda: "c", compute)
+
+            sessioncache.get("mesh", lambda: "a", compute)
+            sessioncache.get("flow fields", lambda: "b", compute)
+
+            assert compute.call_count == 4
+        finally:
+            sessioncache.disable()
+
+    def given_value_larger_than_size_limit_when_get_then_not_cached(self, mocker):
+        compute = mocker.Mock(side_effect=lambda: [np.zeros(100), np.zeros(100)])
+        sessioncache.enable(max_size=1000)
+        try:
+            sessioncache.get("flow fields", lambda: "key", compute)
+            sessioncache.get("flow fields", lambda: "key", compute)
+
+            assert compute.call_count == 2
+            assert sessioncache.get_statistics()["flow fields"]["entries"] == 0
+        finally:
+            sessioncache.disable()
+
+    def given_nested_value_when_get_size_then_arrays_counted_once(self, tmp_path):
+        array = np.zeros(10)
+        mapped = np.lib.format.open_memmap(
+            tmp_path / "mapped.npy", mode="w+", dtype=np.float64, shape=(10,)
+        )
+
+        assert sessioncache.get_size([array, (array, {"a": np.zeros(5)})]) == 120
+        assert sessioncache.get_size([mapped, "text", 1.0]) == 0
+
+    def given_arrays_when_array_key_then_key_depends_on_values_and_type(self):
+        faces = np.arange(5)
+
+        assert sessioncache.array_key(faces) == sessioncache.array_key(faces.copy())
+        assert sessioncache.array_key(faces) != sessioncache.array_key(faces[:4])
+        assert sessioncache.array_key(faces) != sessioncache.array_key(
+            faces.astype(np.int32)
+        )
+        assert sessioncache.array_key(None) == ""
@@ -0,0 +1,227 @@
+import csv
+import os
+from collections import Counter
+from configparser import ConfigParser
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import netCDF4
+import numpy
+import pytest
+
+import dfastmi.batch.core
+from dfastmi.batch import sweep
+from dfastmi.config.ConfigFileOperations import ConfigFileOperations
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.MapFile import MapFile
+from dfastmi.io.RiversObject import RiversObject
+from tests.batch.test_batch_core import captured_output
+
+
+@pytest.fixture
+def config() -> ConfigParser:
+    config = ConfigParser()
+    config.optionxform = str
+    config["General"] = {"Version": "3.0", "Ucrit": "0.3", "Comment": "100%%"}
+    config["C1"] = {"Discharge": "1000.0"}
+    return config
+
+
+class Test_has_sweep:
+    def given_no_sweep_block_when_has_sweep_then_false(self, config: ConfigParser):
+        assert not sweep.has_sweep(config)
+
+    def given_empty_sweep_block_when_has_sweep_then_false(self, config: ConfigParser):
+        config["Sweep"] = {}
+
+        assert not sweep.has_sweep(config)
+
+    def given_sweep_block_in_lower_case_when_has_sweep_then_true(
+        self, config: ConfigParser
+    ):
+        config["sweep"] = {"Ucrit": "0.2, 0.3"}
+
+        assert sweep.has_sweep(config)
+
+
+class Test_parse_values:
+    @pytest.mark.parametrize(
+        "text, expected_values",
+        [
+            ("0.2:0.05:0.5", [0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5]),
+            ("0.2:0.1:0.45", [0.2, 0.3, 0.4]),
+            ("3:-1:1", [3.0, 2.0, 1.0]),
+            ("1000, 1500 2000", [1000.0, 1500.0, 2000.0]),
+            ("0.7", [0.7]),
+        ],
+    )
+    def given_valid_text_when_parse_values_then_expected_values(
+        self, text: str, expected_values
+    ):
+        assert sweep.parse_values(text) == pytest.approx(expected_values)
+
+    @pytest.mark.parametrize(
+        "text", ["", "0.2:0.1", "0.2:0:0.5", "0.5:0.1:0.2", "0.2, high"]
+    )
+    def given_invalid_text_when_parse_values_then_value_error(self, text: str):
+        with pytest.raises(ValueError):
+            sweep.parse_values(text)
+
+
+class Test_get_variants:
+    def given_two_swept_settings_when_get_variants_then_all_combinations(
+        self, config: ConfigParser
+    ):
+        config["Sweep"] = {"ucrit": "0.2:0.1:0.3", "CelerFactor": "1, 2"}
+
+        variants = sweep.get_variants(config)
+
+        assert variants == [
+            {"Ucrit": 0.2, "CelerFactor": 1.0},
+            {"Ucrit": 0.2, "CelerFactor": 2.0},
+            {"Ucrit": 0.3, "CelerFactor": 1.0},
+            {"Ucrit": 0.3, "CelerFactor": 2.0},
+        ]
+
+    def given_unsupported_setting_when_get_variants_then_value_error(
+        self, config: ConfigParser
+    ):
+        config["Sweep"] = {"Branch": "Waal, Maas"}
+
+        with pytest.raises(ValueError):
+            sweep.get_variants(config)
+
+    def given_variant_when_get_variant_configuration_then_general_block_updated(
+        self, config: ConfigParser
+    ):
+        config["Sweep"] = {"Ucrit": "0.2, 0.4"}
+
+        variant_config = sweep.get_variant_configuration(
+            config, {"Ucrit": 0.4, "Qthreshold": 1500.0}
+        )
+
+        assert variant_config.sections() == ["General", "C1"]
+        assert variant_config.getfloat("General", "Ucrit") == 0.4
+        assert variant_config.getfloat("General", "Qthreshold") == 1500.0
+        assert variant_config.get("General", "Comment", raw=True) == "100%%"
+        assert config.get("General", "Ucrit") == "0.3"
+
+    def given_process_pool_when_get_variant_configuration_then_thread_pool(
+        self, config: ConfigParser
+    ):
+        config["General"]["WorkerPool"] = "processes"
+        config["Sweep"] = {"Ucrit": "0.2, 0.4"}
+
+        variant_config = sweep.get_variant_configuration(config, {"Ucrit": 0.4})
+
+        assert variant_config.get("General", "WorkerPool") == "threads"
+        assert config.get("General", "WorkerPool") == "processes"
+
+
+class Test_write_summary:
+    def given_rows_with_and_without_volumes_when_write_summary_then_empty_cells(
+        self, tmp_path
+    ):
+        summary_file = tmp_path / "sweep_summary.csv"
+        rows = [
+            {"scenario": 1, "Ucrit": 0.2, "sedimentation_area": 10.0},
+            {"scenario": 2, "Ucrit": 0.3},
+        ]
+
+        sweep.write_summary(summary_file, sweep.SUMMARY_COLUMNS, rows)
+
+        with summary_file.open(newline="") as file:
+            written = list(csv.DictReader(file))
+        assert list(written[0].keys()) == sweep.SUMMARY_COLUMNS
+        assert written[0]["sedimentation_area"] == "10.0"
+        assert written[1]["Ucrit"] == "0.3"
+        assert written[1]["sedimentation_area"] == ""
+
+
+class Test_get_bed_level_changes:
+    def given_report_data_when_get_bed_level_changes_then_full_mesh_arrays(self):
+        report_data = MagicMock()
+        report_data.face_node_connectivity = numpy.zeros((5, 4))
+        report_data.xykm_data.iface = numpy.array([1, 3])
+        report_data.dzgemi = numpy.array([0.1, 0.2])
+        report_data.dzmaxi = numpy.array([0.3, 0.4])
+        report_data.dzmini = numpy.array([-0.1, -0.2])
+        report_data.zmax_str = "maximum bed level change"
+        report_data.zmin_str = "minimum bed level change"
+
+        changes = sweep.get_bed_level_changes(report_data)
+
+        assert [name for name, _, _ in changes] == ["avgdzb", "maxdzb", "mindzb"]
+        assert changes[1][2] == "maximum bed level change"
+        nc_fill = netCDF4.default_fillvals["f8"]
+        numpy.testing.assert_array_equal(
+            changes[0][1], [nc_fill, 0.1, nc_fill, 0.2, nc_fill]
+        )
+        numpy.testing.assert_array_equal(
+            changes[2][1], [nc_fill, -0.1, nc_fill, -0.2, nc_fill]
+        )
+
+
+class Test_analyse_and_report_sweep:
+    def _run(self, outputdir: Path, sweep_block) -> bool:
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        tstdir = "tests/c01 - GendtseWaardNevengeul"
+        cwd = os.getcwd()
+        try:
+            os.chdir(tstdir)
+            rivers = RiversObject("../../dfastmi/Dutch_rivers_v1.ini")
+            config = ConfigFileOperations.load_configuration_file("c01_netcdf.cfg")
+            config.set("General", "OutputDir", str(outputdir))
+            config.set("General", "Plotting", "False")
+            if sweep_block:
+                config["Sweep"] = sweep_block
+            else:
+                config.set("General", "Ucrit", "0.2")
+            with captured_output():
+                return dfastmi.batch.core.batch_mode_core(rivers, False, config)
+        finally:
+            os.chdir(cwd)
+
+    def given_sweep_block_when_batch_mode_core_then_scenarios_written_and_files_read_once(
+        self, tmp_path, mocker
+    ):
+        x_velocity = mocker.spy(MapFile, "x_velocity")
+
+        success = self._run(
+            tmp_path / "sweep", {"Ucrit": "0.2, 0.4", "CelerFactor": "1, 2"}
+        )
+
+        assert success
+        reads = Counter(str(call.args[0]._file) for call in x_velocity.call_args_list)
+        assert len(reads) == 6
+        assert set(reads.values()) == {1}
+
+        assert self._run(tmp_path / "single", None)
+        with (
+            netCDF4.Dataset(tmp_path / "sweep" / "dfastmi_results.nc") as result,
+            netCDF4.Dataset(tmp_path / "single" / "dfastmi_results.nc") as single,
+        ):
+            avgdzb = result.variables["avgdzb"]
+            facedim = single.variables["avgdzb"].dimensions[-1]
+            assert avgdzb.dimensions == ("scenario", facedim)
+            assert avgdzb.shape == (4, single.dimensions[facedim].size)
+            numpy.testing.assert_array_equal(
+                result.variables["ucrit"][:], [0.2, 0.2, 0.4, 0.4]
+            )
+            numpy.testing.assert_array_equal(
+                result.variables["celer_factor"][:], [1.0, 2.0, 1.0, 2.0]
+            )
+            numpy.testing.assert_array_equal(
+                avgdzb[0, :], single.variables["avgdzb"][:]
+            )
+            assert numpy.any(avgdzb[0, :] != avgdzb[2, :])
+
+        with (tmp_path / "sweep" / "sweep_summary.csv").open(newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert [row["scenario"] for row in rows] == ["1", "2", "3", "4"]
+        assert [row["Ucrit"] for row in rows] == ["0.2", "0.2", "0.4", "0.4"]
+        assert [row["CelerFactor"] for row in rows] == ["1.0", "2.0", "1.0", "2.0"]
+        assert float(rows[1]["sedimentation_length"]) == pytest.approx(
+            2 * float(rows[0]["sedimentation_length"])
+        )
+        assert all(row["sedimentation_area"] == "" for row in rows)
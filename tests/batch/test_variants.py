@@ -0,0 +1,81 @@
+import csv
+import os
+from pathlib import Path
+
+import netCDF4
+import numpy
+import pytest
+
+import dfastmi.batch.core
+from dfastmi.batch import variants
+from dfastmi.config.ConfigFileOperations import ConfigFileOperations
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.RiversObject import RiversObject
+from tests.batch.test_batch_core import captured_output
+
+
+class Test_get_variable_suffixes:
+    @pytest.mark.parametrize(
+        "names, expected_suffixes",
+        [
+            (["A", "B"], ["A", "B"]),
+            (["long groyne", "groyne-2"], ["long_groyne", "groyne_2"]),
+            (["a b", "a-b", "a_b"], ["a_b", "a_b_2", "a_b_3"]),
+        ],
+    )
+    def given_variant_names_when_get_variable_suffixes_then_unique_valid_suffixes(
+        self, names, expected_suffixes
+    ):
+        suffixes = variants.get_variable_suffixes(names)
+
+        assert [suffixes[name] for name in names] == expected_suffixes
+
+
+class Test_analyse_and_report_variants:
+    def given_two_variants_when_batch_mode_core_then_variables_and_summary_per_variant(
+        self, tmp_path: Path
+    ):
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        tstdir = "tests/c01 - GendtseWaardNevengeul"
+        refdir = Path(tstdir) / "ref_Qmin_Q4000_special_backward_case"
+        cwd = os.getcwd()
+        try:
+            os.chdir(tstdir)
+            rivers = RiversObject("rivers_Q4000_v2.ini")
+            config = ConfigFileOperations.load_configuration_file("Qmin_4000_v2.cfg")
+            config.set("General", "OutputDir", str(tmp_path))
+            config.set("General", "Plotting", "False")
+            for i, section in enumerate(["C1", "C2", "C3"], start=1):
+                intervention = config.get(section, "WithIntervention")
+                config.remove_option(section, "WithIntervention")
+                config.set(section, "WithIntervention.A", intervention)
+                config.set(section, "WithIntervention.B", f"reference-Q{i}_map.nc")
+            with captured_output():
+                success = dfastmi.batch.core.batch_mode_core(rivers, False, config)
+        finally:
+            os.chdir(cwd)
+
+        assert success
+        with (
+            netCDF4.Dataset(tmp_path / "dfastmi_results.nc") as result,
+            netCDF4.Dataset(refdir / "dfastmi_results.nc") as reference,
+        ):
+            for quantity in ["avgdzb", "maxdzb", "mindzb"]:
+                assert f"{quantity}_A" in result.variables
+                assert f"{quantity}_B" in result.variables
+                assert quantity not in result.variables
+                numpy.testing.assert_allclose(
+                    result.variables[f"{quantity}_A"][:],
+                    reference.variables[quantity][:],
+                )
+            assert numpy.ma.count(result.variables["avgdzb_B"][:]) > 0
+            assert numpy.all(result.variables["avgdzb_B"][:] == 0.0)
+
+        with (tmp_path / "variants_summary.csv").open(newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert list(rows[0].keys()) == variants.SUMMARY_COLUMNS
+        assert [row["variant"] for row in rows] == ["A", "B"]
+
+        report = (tmp_path / "report.txt").read_text()
+        assert report.count("Variant: A") == 2
+        assert "intervention-Q3_map.nc" in report
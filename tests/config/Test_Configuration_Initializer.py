@@ -126,3 +126,189 @@ class Test_Configuration_Initializer:
         assert configuration_initialized.time_fractions_of_the_year == (0.0, 1.0, 0.0)
         assert configuration_initialized.rsigma == (1.0, 0.0, 1.0)
         assert configuration_initialized.celerity == (6.7, 8.9, 10.1)
+
+    def given_no_workers_when_initialized_then_conditions_processed_sequentially(
+        self, config: ConfigParser, reach: Reach
+    ):
+        reach.qstagnant = 4.5
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.workers == 1
+        assert configuration_initialized.worker_pool == "threads"
+
+    @pytest.mark.parametrize(
+        "workers, worker_pool, expected_workers, expected_pool",
+        [
+            ("3", "Processes", 3, "processes"),
+            ("2", "threads", 2, "threads"),
+            ("invalid", "unknown", 1, "threads"),
+        ],
+    )
+    def given_workers_when_initialized_then_workers_and_pool_set(
+        self,
+        config: ConfigParser,
+        reach: Reach,
+        workers: str,
+        worker_pool: str,
+        expected_workers: int,
+        expected_pool: str,
+    ):
+        reach.qstagnant = 4.5
+        config.set("General", "Workers", workers)
+        config.set("General", "WorkerPool", worker_pool)
+
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.workers == expected_workers
+        assert configuration_initialized.worker_pool == expected_pool
+
+    def given_zero_workers_when_initialized_then_one_worker_per_cpu(
+        self, config: ConfigParser, reach: Reach, mocker
+    ):
+        reach.qstagnant = 4.5
+        config.set("General", "Workers", "0")
+        mocker.patch(
+            "dfastmi.config.AConfigurationInitializerBase.os.cpu_count",
+            return_value=6,
+        )
+
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.workers == 6
+
+    def given_no_dzq_cache_when_initialized_then_dzq_cache_disabled(
+        self, config: ConfigParser, reach: Reach
+    ):
+        reach.qstagnant = 4.5
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert not configuration_initialized.dzq_cache
+        assert configuration_initialized.dzq_cache_size == 2048 * 1024**2
+
+    @pytest.mark.parametrize(
+        "dzq_cache, dzq_cache_size, expected_cache, expected_size",
+        [
+            ("True", "10", True, 10 * 1024**2),
+            ("yes", "0.5", True, 512 * 1024),
+            ("invalid", "invalid", False, 2048 * 1024**2),
+        ],
+    )
+    def given_dzq_cache_when_initialized_then_dzq_cache_set(
+        self,
+        config: ConfigParser,
+        reach: Reach,
+        dzq_cache: str,
+        dzq_cache_size: str,
+        expected_cache: bool,
+        expected_size: int,
+    ):
+        reach.qstagnant = 4.5
+        config.set("General", "DzqCache", dzq_cache)
+        config.set("General", "DzqCacheSize", dzq_cache_size)
+
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.dzq_cache == expected_cache
+        assert configuration_initialized.dzq_cache_size == expected_size
+
+    @pytest.mark.parametrize(
+        "region_cache, expected_region_cache",
+        [(None, False), ("True", True), ("invalid", False)],
+    )
+    def given_region_cache_when_initialized_then_region_cache_set(
+        self,
+        config: ConfigParser,
+        reach: Reach,
+        region_cache: str,
+        expected_region_cache: bool,
+    ):
+        reach.qstagnant = 4.5
+        if region_cache is not None:
+            config.set("General", "RegionCache", region_cache)
+
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.region_cache == expected_region_cache
+
+    @pytest.mark.parametrize(
+        "block_size, expected_block_size",
+        [(None, 0), ("100000", 100000), ("-5", 0), ("invalid", 0)],
+    )
+    def given_block_size_when_initialized_then_block_size_set(
+        self,
+        config: ConfigParser,
+        reach: Reach,
+        block_size: str,
+        expected_block_size: int,
+    ):
+        reach.qstagnant = 4.5
+        if block_size is not None:
+            config.set("General", "BlockSize", block_size)
+
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.block_size == expected_block_size
+
+    @pytest.mark.parametrize(
+        "face_order, expected_face_order",
+        [
+            (None, "source"),
+            ("chainage", "chainage"),
+            (" Hilbert ", "hilbert"),
+            ("invalid", "source"),
+        ],
+    )
+    def given_face_order_when_initialized_then_face_order_set(
+        self,
+        config: ConfigParser,
+        reach: Reach,
+        face_order: str,
+        expected_face_order: str,
+    ):
+        reach.qstagnant = 4.5
+        if face_order is not None:
+            config.set("General", "FaceOrder", face_order)
+
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.face_order == expected_face_order
+
+    @pytest.mark.parametrize(
+        "value, expected_precision",
+        [(None, "double"), (" Single ", "single"), ("invalid", "double")],
+    )
+    def given_precision_when_initialized_then_precision_set(
+        self,
+        config: ConfigParser,
+        reach: Reach,
+        value: str,
+        expected_precision: str,
+    ):
+        reach.qstagnant = 4.5
+        if value is not None:
+            config.set("General", "Precision", value)
+
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.precision == expected_precision
+
+    @pytest.mark.parametrize(
+        "value, expected_celerity",
+        [(None, 15.13), ("2.0", 30.26), ("-1.0", 15.13), ("invalid", 15.13)],
+    )
+    def given_celer_factor_when_initialized_then_celerity_scaled(
+        self,
+        config: ConfigParser,
+        reach: Reach,
+        value: str,
+        expected_celerity: float,
+    ):
+        reach.qstagnant = 4.5
+        if value is not None:
+            config.set("General", "CelerFactor", value)
+
+        configuration_initialized = ConfigurationInitializer(reach, config)
+
+        assert configuration_initialized.celerity == pytest.approx(
+            (expected_celerity,) * 3
+        )
@@ -97,3 +97,50 @@ class Test_write_config:
         relative_path = config[section][key]
 
         assert relative_path == ""
+
+
+class Test_load_configuration_dict:
+    def given_sections_with_relative_paths_when_loaded_then_absolute_paths_returned(
+        self, tmp_path: Path
+    ):
+        sections = {
+            "general": {"Version": "1.0", "OutputDir": "output", "Qbankfull": 4000},
+            "Q1": {"Reference": "reference-Q1_map.nc"},
+        }
+
+        config = ConfigFileOperations.load_configuration_dict(sections, str(tmp_path))
+
+        assert config.get("General", "OutputDir") == str(tmp_path / "output")
+        assert config.get("General", "Qbankfull") == "4000"
+        assert config.get("Q1", "Reference") == str(tmp_path / "reference-Q1_map.nc")
+
+    def given_variants_with_relative_paths_when_loaded_then_absolute_paths_returned(
+        self, tmp_path: Path
+    ):
+        sections = {
+            "General": {"Version": "3.0"},
+            "C1": {
+                "Reference": "reference-Q1_map.nc",
+                "WithIntervention.A": "A/Q1_map.nc",
+            },
+        }
+
+        config = ConfigFileOperations.load_configuration_dict(sections, str(tmp_path))
+
+        assert config.get("C1", "WithIntervention.A") == str(tmp_path / "A/Q1_map.nc")
+
+    def given_sections_without_version_when_loaded_then_lookup_error_raised(
+        self, tmp_path: Path
+    ):
+        with pytest.raises(LookupError):
+            ConfigFileOperations.load_configuration_dict(
+                {"General": {"Mode": "D-Flow FM map"}}, str(tmp_path)
+            )
+
+    def given_sections_with_unsupported_version_when_loaded_then_value_error_raised(
+        self, tmp_path: Path
+    ):
+        with pytest.raises(ValueError):
+            ConfigFileOperations.load_configuration_dict(
+                {"General": {"Version": "4.0"}}, str(tmp_path)
+            )
@@ -6,6 +6,7 @@ import pytest
 from mock import patch
 from packaging.version import Version
 
+from dfastmi.batch import sessioncache
 from dfastmi.config.ConfigFileOperations import (
     ConfigFileOperations,
     check_configuration,
@@ -171,6 +172,33 @@ def test_load_configuration(dialog_model: DialogModel, mocker) -> None:
     assert dialog_model.config is not None
 
 
+def test_load_configuration_clears_session_cache(
+    dialog_model: DialogModel, mocker
+) -> None:
+    """
+    Test case for discarding the cached data of the previous case.
+
+    given: A DialogModel instance and data cached for a previous case.
+    when: Loading a configuration file.
+    then: The cached data is discarded, but caching stays enabled.
+    """
+    config = ConfigParser()
+    config["General"] = {}
+    mocker.patch.object(
+        ConfigFileOperations, "load_configuration_file", return_value=config
+    )
+    sessioncache.enable()
+    try:
+        sessioncache.get("mesh", lambda: "key", lambda: 1)
+
+        assert dialog_model.load_configuration("test.cfg")
+
+        assert sessioncache.get_statistics() == {}
+        assert sessioncache.is_enabled()
+    finally:
+        sessioncache.disable()
+
+
 def test_load_configuration_except(dialog_model: DialogModel, mocker) -> None:
     """
     Test case for loading configuration with an exception.
@@ -6,6 +6,7 @@ import mock
 import pytest
 from mock import patch
 
+from dfastmi.batch import progress
 from dfastmi.batch.DFastUtils import get_progloc
 from dfastmi.gui.dialog_model import DialogModel
 from dfastmi.gui.dialog_view_model import DialogViewModel
@@ -118,6 +119,83 @@ def test_run_analysis_exception(
     mock_batch_mode_core.assert_called_once()
 
 
+def test_start_analysis_success(
+    dialog_view_model: DialogViewModel, mock_batch_mode_core: MagicMock, qtbot
+) -> None:
+    """
+    Test case for running the analysis in the background.
+    given: A DialogModel instance.
+    when: Calling the start_analysis method.
+    then: The analysis runs in a worker thread and analysis_finished reports success.
+    """
+    with qtbot.waitSignal(
+        dialog_view_model.analysis_finished, raising=True, timeout=10000
+    ) as blocker:
+        dialog_view_model.start_analysis()
+
+    assert blocker.args == [True]
+    mock_batch_mode_core.assert_called_once()
+    dialog_view_model.cancel_analysis(wait=True)
+    assert not dialog_view_model.is_analysis_running
+
+
+def test_start_analysis_cancelled(
+    dialog_view_model: DialogViewModel, mock_batch_mode_core: MagicMock, qtbot
+) -> None:
+    """
+    Test case for cancelling the analysis running in the background.
+    given: A DialogModel instance with an analysis reporting its progress.
+    when: Calling the cancel_analysis method while the analysis is running.
+    then: The analysis stops at the next stage and analysis_cancelled is emitted.
+    """
+    stages = []
+
+    def analysis(*args, **kwargs):
+        progress.report_stage(progress.LOAD_MESH)
+        dialog_view_model.cancel_analysis()
+        progress.report_stage(progress.REGION_OF_INTEREST)
+        stages.append("not cancelled")
+        return True
+
+    mock_batch_mode_core.side_effect = analysis
+
+    with qtbot.waitSignal(
+        dialog_view_model.analysis_cancelled, raising=True, timeout=10000
+    ):
+        with qtbot.waitSignal(dialog_view_model.analysis_progress) as blocker:
+            dialog_view_model.start_analysis()
+
+    assert blocker.args == [progress.LOAD_MESH, 0]
+    assert stages == []
+
+
+def test_start_analysis_cancelled_before_worker_runs(
+    dialog_view_model: DialogViewModel, mock_batch_mode_core: MagicMock, qtbot
+) -> None:
+    """
+    Test case for cancelling the analysis directly after starting it.
+    given: A DialogModel instance with an analysis reporting its progress.
+    when: Calling the cancel_analysis method directly after start_analysis.
+    then: The analysis stops at its first stage and analysis_cancelled is emitted.
+    """
+    stages = []
+
+    def analysis(*args, **kwargs):
+        progress.report_stage(progress.LOAD_MESH)
+        stages.append("not cancelled")
+        return True
+
+    mock_batch_mode_core.side_effect = analysis
+
+    with qtbot.waitSignal(
+        dialog_view_model.analysis_cancelled, raising=True, timeout=10000
+    ):
+        dialog_view_model.start_analysis()
+        dialog_view_model.cancel_analysis()
+
+    assert stages == []
+
+
 def test_initialization(dialog_view_model, mock_model):
     """
     given : dialog_view_model and mock_model
@@ -0,0 +1,10 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch) -> Path:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("DFASTMI_CACHE_DIR", str(cache_dir))
+    return cache_dir
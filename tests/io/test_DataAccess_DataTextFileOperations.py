@@ -46,6 +46,29 @@ class Test_read_waqua_xyz:
         assert numpy.shape(data) == (4, 2)
         assert (data == datar).all() == True
 
+    def test_read_waqua_xyz_03(self):
+        """
+        Read WAQUA xyz export same as numpy.genfromtxt.
+        """
+        filename = "tests/c01 - GendtseWaardNevengeul/xyz_velocity-zeta.001.Q1.xyz"
+        col = (2, 3, 4)
+        data = DataTextFileOperations.read_waqua_xyz(filename, col)
+        datar = numpy.genfromtxt(filename, delimiter=",", skip_header=1, usecols=col)
+        assert numpy.shape(data) == numpy.shape(datar)
+        assert (data == datar).all() == True
+
+    def test_read_waqua_xyz_files_01(self):
+        """
+        Read multiple WAQUA xyz files with different columns.
+        """
+        filename = "tests/files/read_waqua_xyz_test.xyc"
+        data = DataTextFileOperations.read_waqua_xyz_files(
+            [filename, filename], [(1, 2), (2,)]
+        )
+        assert len(data) == 2
+        assert numpy.shape(data[0]) == (4, 2)
+        assert (data[1] == numpy.array([3.0, 6.0, 9.0, 12.0])).all() == True
+
 
 class Test_write_simona_box:
     def test_write_simona_box_01(self):
@@ -110,6 +133,43 @@ class Test_write_simona_box:
         self.maxDiff = None
         assert all_lines == all_lines_ref
 
+    def test_write_simona_box_04(self, tmp_path):
+        """
+        Write SIMONA BOX file identical to formatting value by value.
+        """
+        filename = tmp_path / "test.box"
+        rng = numpy.random.default_rng(0)
+        data = rng.normal(scale=1000.0, size=(25, 23))
+        data[3, :] = numpy.nan
+        data[:, 4] = -0.0
+        firstm = 2
+        firstn = 1
+        DataTextFileOperations.write_simona_box(str(filename), data, firstm, firstn)
+
+        boxheader = "      BOX MNMN=({m1:4d},{n1:5d},{m2:5d},{n2:5d}), VARIABLE_VAL=\n"
+        reference = ""
+        for j in range(firstn, 23, 10):
+            k = min(23, j + 10)
+            reference += boxheader.format(m1=firstm + 1, n1=j + 1, m2=25, n2=k)
+            for m in range(firstm, 25):
+                reference += "   " + "".join(f"{v:12.3f}" for v in data[m, j:k]) + "\n"
+        assert filename.read_text() == reference
+
+    def test_write_simona_box_files_01(self, tmp_path):
+        """
+        Write multiple SIMONA BOX files.
+        """
+        filenames = [str(tmp_path / f"test{i}.box") for i in range(3)]
+        data = [numpy.full((2, 2), float(i)) for i in range(3)]
+        DataTextFileOperations.write_simona_box_files(filenames, data, 0, 0)
+        for i, filename in enumerate(filenames):
+            all_lines = open(filename, "r").read().splitlines()
+            assert all_lines == [
+                "      BOX MNMN=(   1,    1,    2,    2), VARIABLE_VAL=",
+                f"   {i:12.3f}{i:12.3f}",
+                f"   {i:12.3f}{i:12.3f}",
+            ]
+
 
 class Test_get_xykm:
     def test_get_xykm_01(self):
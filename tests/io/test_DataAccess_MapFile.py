@@ -101,6 +101,19 @@ class Test_data_access_read_face_variable:
             str(cm.value) == 'Expected one variable for "water level", but obtained 0.'
         )
 
+    def test_read_face_variable_for_selected_faces(self, map_file: MapFile):
+        """
+        Testing read_face_variable for a selection of faces.
+        """
+        faces = numpy.array([5, 1, 3000, 7])
+        for time_index_from_last in [None, 1]:
+            expected = map_file.x_velocity(time_index_from_last)[faces]
+
+            datac = map_file.x_velocity(time_index_from_last, faces=faces)
+
+            numpy.testing.assert_array_equal(datac, expected)
+        assert map_file.water_depth(faces=numpy.zeros(0, dtype=int)).shape == (0,)
+
 
 class TestReadGridGeometryFromMapFile:
 
@@ -227,6 +240,71 @@ class Test_ugrid_add:
         rootgrp.close()
         assert new_added_units == units
 
+    def test_ugrid_add_block(self, setup_data):
+        """
+        Testing add_variable_block for two blocks of faces.
+        """
+        meshname = "mesh2d"
+        facedim = "face"
+        long_name = "block_variable"
+
+        map_file = MapFile(self.dst_filename)
+        for faces in [numpy.array([1, 3, 4]), numpy.array([10, 4000])]:
+            map_file.add_variable_block(
+                "block", faces, faces * 0.5, meshname, facedim, long_name, "m"
+            )
+
+        datac = map_file.read_face_variable(long_name)
+        assert datac.shape == (4132,)
+        assert list(numpy.flatnonzero(~numpy.ma.getmaskarray(datac))) == [
+            1,
+            3,
+            4,
+            10,
+            4000,
+        ]
+        assert datac[4000] == 2000.0
+
+    def test_ugrid_add_scenarios(self, setup_data):
+        """
+        Testing add_scenario_parameter and add_scenario_variable for two scenarios.
+        """
+        meshname = "mesh2d"
+        facedim = "face"
+
+        map_file = MapFile(self.dst_filename)
+        map_file.add_scenario_parameter(
+            "ucrit",
+            numpy.array([0.2, 0.4]),
+            "scenario",
+            "critical flow velocity",
+            "m/s",
+        )
+        for scenario in range(2):
+            map_file.add_scenario_variable(
+                "avgdzb",
+                scenario,
+                numpy.full(4132, scenario + 0.5),
+                meshname,
+                facedim,
+                "scenario",
+                "bed level change",
+                "m",
+            )
+
+        with netCDF4.Dataset(self.dst_filename) as rootgrp:
+            ucrit = rootgrp.variables["ucrit"]
+            avgdzb = rootgrp.variables["avgdzb"]
+            assert ucrit.dimensions == ("scenario",)
+            assert ucrit.units == "m/s"
+            numpy.testing.assert_array_equal(ucrit[:], [0.2, 0.4])
+            assert avgdzb.dimensions == ("scenario", "face")
+            assert avgdzb.mesh == meshname
+            assert avgdzb.location == "face"
+            assert avgdzb.long_name == "bed level change"
+            numpy.testing.assert_array_equal(avgdzb[:, 0], [0.5, 1.5])
+            numpy.testing.assert_array_equal(avgdzb[1, :], numpy.full(4132, 1.5))
+
 
 class Test_copy_var:
     dst_filename = "test.nc"
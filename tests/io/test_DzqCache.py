@@ -0,0 +1,100 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Tuple
+
+import numpy
+import pytest
+
+from dfastmi.io.DzqCache import DzqCache
+
+IFACE = numpy.arange(8)
+DX = numpy.ones(8)
+DY = numpy.zeros(8)
+
+
+@pytest.fixture
+def dzq_dir(cache_dir: Path) -> Path:
+    return cache_dir / "dzq"
+
+
+@pytest.fixture
+def filenames(tmp_path) -> Tuple[str, str]:
+    reference = tmp_path / "reference_map.nc"
+    intervention = tmp_path / "intervention_map.nc"
+    shutil.copy("tests/files/e02_f001_c011_simplechannel_map.nc", reference)
+    shutil.copy("tests/files/e02_f001_c011_simplechannel_map.nc", intervention)
+    return str(reference), str(intervention)
+
+
+class Test_DzqCache:
+    def given_same_input_when_get_cache_key_then_same_key(self, filenames):
+        key1 = DzqCache.get_cache_key(filenames, 0.3, 1, DX, DY, IFACE)
+        key2 = DzqCache.get_cache_key(filenames, 0.3, 1, DX, DY, IFACE)
+
+        assert key1 == key2
+
+    @pytest.mark.parametrize(
+        "ucrit, n_fields, iface",
+        [(0.4, 1, IFACE), (0.3, 2, IFACE), (0.3, 1, IFACE[:-1])],
+    )
+    def given_changed_parameters_when_get_cache_key_then_different_key(
+        self, filenames, ucrit: float, n_fields: int, iface: numpy.ndarray
+    ):
+        key = DzqCache.get_cache_key(filenames, 0.3, 1, DX, DY, IFACE)
+
+        assert DzqCache.get_cache_key(filenames, ucrit, n_fields, DX, DY, iface) != key
+
+    def given_direction_when_get_cache_key_then_only_used_for_multiple_fields(
+        self, filenames
+    ):
+        assert DzqCache.get_cache_key(
+            filenames, 0.3, 1, DX, DY, IFACE
+        ) == DzqCache.get_cache_key(filenames, 0.3, 1, DY, DX, IFACE)
+        assert DzqCache.get_cache_key(
+            filenames, 0.3, 3, DX, DY, IFACE
+        ) != DzqCache.get_cache_key(filenames, 0.3, 3, DY, DX, IFACE)
+
+    def given_modified_file_when_get_cache_key_then_different_key(self, filenames):
+        key = DzqCache.get_cache_key(filenames, 0.3, 1, DX, DY, IFACE)
+        stat = os.stat(filenames[1])
+        os.utime(filenames[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert DzqCache.get_cache_key(filenames, 0.3, 1, DX, DY, IFACE) != key
+
+    def given_saved_dzq_when_load_then_data_memory_mapped(self, dzq_dir: Path):
+        dzq = numpy.linspace(-1.0, 1.0, 8)
+
+        DzqCache.save("key", dzq, 1024**2)
+        cached_dzq = DzqCache.load("key")
+
+        assert (dzq_dir / "key.npy").exists()
+        assert isinstance(cached_dzq, numpy.memmap)
+        assert (cached_dzq == dzq).all()
+
+    def given_no_cache_entry_when_load_then_none(self, dzq_dir: Path):
+        assert DzqCache.load("unknown") is None
+
+    def given_full_cache_when_save_then_least_recently_used_entry_evicted(
+        self, dzq_dir: Path
+    ):
+        dzq = numpy.zeros(1000)
+        DzqCache.save("old", dzq, 1024**2)
+        DzqCache.save("used", dzq, 1024**2)
+        for age, key in enumerate(["used", "old"]):
+            os.utime(dzq_dir / f"{key}.npy", ns=(0, 10**9 * (age + 1)))
+        DzqCache.load("old")
+        entry_size = (dzq_dir / "old.npy").stat().st_size
+
+        DzqCache.save("new", dzq, 2 * entry_size)
+
+        assert sorted(path.stem for path in dzq_dir.glob("*.npy")) == ["new", "old"]
+
+    def given_failing_write_when_save_then_no_temporary_file_left(
+        self, dzq_dir: Path, mocker
+    ):
+        mocker.patch("dfastmi.io.DzqCache.os.replace", side_effect=OSError)
+
+        DzqCache.save("key", numpy.zeros(8), 1024**2)
+
+        assert list(dzq_dir.iterdir()) == []
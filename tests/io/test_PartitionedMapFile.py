@@ -0,0 +1,275 @@
+import os
+from pathlib import Path
+from typing import List
+
+import netCDF4
+import numpy
+import pytest
+
+import dfastmi.io.PartitionedMapFile
+from dfastmi.io.DzqCache import DzqCache
+from dfastmi.io.MapFile import MapFile
+from dfastmi.io.OutputFileFactory import OutputFileFactory
+from dfastmi.io.PartitionedMapFile import PartitionedMapFile
+
+SOURCE_MAP_FILE = "tests/files/e02_f001_c011_simplechannel_map.nc"
+
+
+def write_partitions(
+    source: str, directory: Path, name: str, global_numbers: bool = True
+) -> List[Path]:
+    """
+    Split a map file into two partitions with ghost cells like D-Flow FM does.
+
+    The faces of the second partition are stored in reverse order, such that
+    the global face numbers are needed to recover the original order.
+    """
+    with netCDF4.Dataset(source) as dataset:
+        xn = dataset.variables["mesh2d_node_x"][...]
+        yn = dataset.variables["mesh2d_node_y"][...]
+        face_nodes = dataset.variables["mesh2d_face_nodes"][...] - 1
+        fields = {
+            name: dataset.variables[name][...]
+            for name in ["mesh2d_ucx", "mesh2d_ucy", "mesh2d_waterdepth"]
+        }
+        attributes = {
+            name: dict(dataset.variables[name].__dict__)
+            for name in ["mesh2d_node_x", "mesh2d_node_y"] + list(fields)
+        }
+        times = dataset.variables["time"][...]
+
+    nfaces = face_nodes.shape[0]
+    domain = (numpy.arange(nfaces) >= nfaces // 2).astype(numpy.int32)
+    files = []
+    for partition in range(2):
+        owned_nodes = numpy.unique(face_nodes[domain == partition].compressed())
+        faces = numpy.flatnonzero(
+            numpy.isin(face_nodes.filled(-1), owned_nodes).any(axis=1)
+        )
+        if partition == 1:
+            faces = faces[::-1]
+        nodes = numpy.unique(face_nodes[faces].compressed())
+        local_face_nodes = numpy.searchsorted(nodes, face_nodes[faces].filled(0)) + 1
+        local_face_nodes[numpy.ma.getmaskarray(face_nodes[faces])] = -999
+
+        file = directory / f"{name}_{partition:04d}_map.nc"
+        with netCDF4.Dataset(file, "w") as dataset:
+            dataset.createDimension("mesh2d_nNodes", len(nodes))
+            dataset.createDimension("mesh2d_nFaces", len(faces))
+            dataset.createDimension("mesh2d_nMax_face_nodes", face_nodes.shape[1])
+            dataset.createDimension("time", None)
+            mesh = dataset.createVariable("mesh2d", "i4")
+            mesh.setncatts(
+                {
+                    "cf_role": "mesh_topology",
+                    "topology_dimension": 2,
+                    "node_coordinates": "mesh2d_node_x mesh2d_node_y",
+                    "node_dimension": "mesh2d_nNodes",
+                    "face_node_connectivity": "mesh2d_face_nodes",
+                    "face_dimension": "mesh2d_nFaces",
+                    "max_face_nodes_dimension": "mesh2d_nMax_face_nodes",
+                    "edge_dimension": "mesh2d_nEdges",
+                }
+            )
+            for var_name, values in [("mesh2d_node_x", xn), ("mesh2d_node_y", yn)]:
+                variable = dataset.createVariable(var_name, "f8", ("mesh2d_nNodes",))
+                variable.setncatts(attributes[var_name])
+                variable[:] = values[nodes]
+            variable = dataset.createVariable(
+                "mesh2d_face_nodes",
+                "i4",
+                ("mesh2d_nFaces", "mesh2d_nMax_face_nodes"),
+                fill_value=-999,
+            )
+            variable.start_index = 1
+            variable[:] = local_face_nodes
+            variable = dataset.createVariable("time", "f8", ("time",))
+            variable[:] = times
+            for var_name, values in fields.items():
+                variable = dataset.createVariable(
+                    var_name, "f8", ("time", "mesh2d_nFaces"), fill_value=-999.0
+                )
+                variable.setncatts(
+                    {
+                        key: value
+                        for key, value in attributes[var_name].items()
+                        if key != "_FillValue"
+                    }
+                )
+                variable[:] = values[:, faces]
+            variable = dataset.createVariable(
+                "mesh2d_flowelem_domain", "i4", ("mesh2d_nFaces",)
+            )
+            variable[:] = domain[faces]
+            if global_numbers:
+                variable = dataset.createVariable(
+                    "mesh2d_flowelem_globalnr", "i4", ("mesh2d_nFaces",)
+                )
+                variable[:] = faces + 1
+        files.append(file)
+    return files
+
+
+def face_node_coordinates(output_file) -> numpy.ndarray:
+    face_nodes = output_file.face_node_connectivity
+    if face_nodes.mask.shape == ():
+        face_nodes = numpy.ma.masked_less(face_nodes, 0)
+    xn = numpy.asarray(output_file.node_x_coordinates)
+    yn = numpy.asarray(output_file.node_y_coordinates)
+    data = face_nodes.filled(0)
+    return numpy.where(
+        numpy.ma.getmaskarray(face_nodes), numpy.nan, xn[data] + 1j * yn[data]
+    )
+
+
+@pytest.fixture
+def partitions(tmp_path) -> List[Path]:
+    return write_partitions(SOURCE_MAP_FILE, tmp_path, "simplechannel")
+
+
+@pytest.fixture(params=[1, 2], ids=["sequential", "parallel"])
+def max_workers(request) -> int:
+    yield request.param
+    PartitionedMapFile.shutdown_executor()
+
+
+class Test_PartitionedMapFile:
+    def given_partitioned_map_files_when_generate_then_partitioned_map_file(
+        self, partitions: List[Path]
+    ):
+        output_file = OutputFileFactory.generate(partitions[0])
+
+        assert isinstance(output_file, PartitionedMapFile)
+        assert output_file.partitions == partitions
+
+    def given_single_numbered_map_file_when_generate_then_map_file(
+        self, partitions: List[Path]
+    ):
+        partitions[1].unlink()
+
+        output_file = OutputFileFactory.generate(partitions[0])
+
+        assert type(output_file) is MapFile
+
+    def given_partitioned_map_files_when_reading_faces_then_ghost_cells_dropped_and_global_order_used(
+        self, partitions: List[Path], max_workers: int
+    ):
+        source = MapFile(SOURCE_MAP_FILE)
+        output_file = PartitionedMapFile(partitions[1], max_workers)
+
+        for time_index_from_last in [None, 1]:
+            numpy.testing.assert_array_equal(
+                output_file.x_velocity(time_index_from_last=time_index_from_last),
+                source.x_velocity(time_index_from_last=time_index_from_last),
+            )
+        numpy.testing.assert_array_equal(
+            output_file.water_depth(), source.water_depth()
+        )
+
+    def given_partitioned_map_files_when_reading_selected_faces_then_values_in_requested_order(
+        self, partitions: List[Path], max_workers: int
+    ):
+        source = MapFile(SOURCE_MAP_FILE)
+        output_file = PartitionedMapFile(partitions[0], max_workers)
+        faces = numpy.array([4000, 3, 2100, 2000, 17])
+
+        numpy.testing.assert_array_equal(
+            output_file.y_velocity(faces=faces), source.y_velocity()[faces]
+        )
+
+    def given_partitioned_map_files_when_reading_mesh_then_shared_nodes_merged(
+        self, partitions: List[Path]
+    ):
+        source = MapFile(SOURCE_MAP_FILE)
+        output_file = PartitionedMapFile(partitions[0])
+
+        assert len(output_file.node_x_coordinates) == len(source.node_x_coordinates)
+        numpy.testing.assert_array_equal(
+            face_node_coordinates(output_file), face_node_coordinates(source)
+        )
+
+    def given_no_global_numbers_when_reading_faces_then_faces_ordered_by_domain(
+        self, tmp_path
+    ):
+        partitions = write_partitions(
+            SOURCE_MAP_FILE, tmp_path, "simplechannel", global_numbers=False
+        )
+        source_depth = MapFile(SOURCE_MAP_FILE).water_depth()
+        nfaces = len(source_depth)
+
+        water_depth = PartitionedMapFile(partitions[0]).water_depth()
+
+        expected = numpy.concatenate(
+            [source_depth[: nfaces // 2], source_depth[nfaces // 2 :][::-1]]
+        )
+        numpy.testing.assert_array_equal(water_depth, expected)
+
+    def given_partitioned_map_files_when_copy_ugrid_then_merged_mesh_written(
+        self, partitions: List[Path], tmp_path
+    ):
+        output_file = PartitionedMapFile(partitions[0])
+        target_file = tmp_path / "merged.nc"
+
+        output_file.copy_ugrid(target_file)
+
+        merged = MapFile(target_file)
+        assert merged.mesh2d_name == "mesh2d"
+        assert merged.face_dimension_name == "mesh2d_nFaces"
+        numpy.testing.assert_array_equal(
+            face_node_coordinates(merged), face_node_coordinates(output_file)
+        )
+        with netCDF4.Dataset(target_file) as dataset:
+            assert "edge_dimension" not in dataset.variables["mesh2d"].ncattrs()
+
+    def given_missing_domain_numbers_when_reading_faces_then_value_error(
+        self, partitions: List[Path]
+    ):
+        with netCDF4.Dataset(partitions[1], "a") as dataset:
+            dataset.renameVariable("mesh2d_flowelem_domain", "domain")
+
+        with pytest.raises(ValueError, match="mesh2d_flowelem_domain"):
+            PartitionedMapFile(partitions[0]).water_depth()
+
+    def given_modified_partition_when_get_file_identity_then_identity_changes(
+        self, partitions: List[Path]
+    ):
+        identity = DzqCache.get_file_identity(str(partitions[0]))
+        stat = os.stat(partitions[1])
+        os.utime(partitions[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert DzqCache.get_file_identity(str(partitions[0])) != identity
+
+
+class Test_PartitionedMapFile_executor:
+    @pytest.fixture(autouse=True)
+    def shutdown(self):
+        yield
+        PartitionedMapFile.shutdown_executor()
+
+    def given_multiple_workers_when_reading_faces_then_pool_sized_by_max_workers(
+        self, partitions: List[Path]
+    ):
+        PartitionedMapFile(partitions[0], max_workers=2).water_depth()
+        assert dfastmi.io.PartitionedMapFile._executor._max_workers == 2
+
+        PartitionedMapFile(partitions[0], max_workers=3).water_depth()
+        assert dfastmi.io.PartitionedMapFile._executor._max_workers == 3
+
+        PartitionedMapFile.shutdown_executor()
+        assert dfastmi.io.PartitionedMapFile._executor is None
+
+    def given_worker_process_when_reading_faces_then_partitions_read_sequentially(
+        self, partitions: List[Path], mocker
+    ):
+        mocker.patch(
+            "dfastmi.io.PartitionedMapFile.multiprocessing.parent_process",
+            return_value=mocker.Mock(),
+        )
+        get_executor = mocker.spy(dfastmi.io.PartitionedMapFile, "_get_executor")
+
+        water_depth = PartitionedMapFile(partitions[0], max_workers=2).water_depth()
+
+        get_executor.assert_not_called()
+        numpy.testing.assert_array_equal(
+            water_depth, MapFile(SOURCE_MAP_FILE).water_depth()
+        )
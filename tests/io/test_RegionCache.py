@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+
+import numpy
+import pytest
+from shapely.geometry import LineString
+
+from dfastmi.io.RegionCache import RegionCache
+
+XN = numpy.array([0.0, 1.0, 1.0, 0.0])
+YN = numpy.array([0.0, 0.0, 1.0, 1.0])
+FACE_NODE_CONNECTIVITY = numpy.ma.masked_array([[0, 1, 2, 3]])
+XYKM = LineString([(0.0, 0.5, 0.0), (1.0, 0.5, 1.0)])
+NAMES = ("iface", "sni")
+
+
+@pytest.fixture
+def region_dir(cache_dir: Path) -> Path:
+    return cache_dir / "region"
+
+
+def get_arrays(size: int = 4):
+    return {"iface": numpy.arange(size), "sni": numpy.linspace(0.0, 1.0, size)}
+
+
+class Test_RegionCache:
+    def given_same_input_when_get_cache_key_then_same_key(self):
+        key1 = RegionCache.get_cache_key(XN, YN, FACE_NODE_CONNECTIVITY, XYKM, 3000.0)
+        key2 = RegionCache.get_cache_key(
+            XN.copy(), YN.copy(), FACE_NODE_CONNECTIVITY.copy(), XYKM, 3000.0
+        )
+
+        assert key1 == key2
+
+    @pytest.mark.parametrize(
+        "xn, face_node_connectivity, xykm, buffer_width",
+        [
+            (XN + 1.0, FACE_NODE_CONNECTIVITY, XYKM, 3000.0),
+            (XN, numpy.ma.masked_array([[1, 2, 3, 0]]), XYKM, 3000.0),
+            (
+                XN,
+                FACE_NODE_CONNECTIVITY,
+                LineString([(0, 0.5, 0), (1, 0.5, 2)]),
+                3000.0,
+            ),
+            (XN, FACE_NODE_CONNECTIVITY, XYKM, 2000.0),
+        ],
+    )
+    def given_changed_input_when_get_cache_key_then_different_key(
+        self, xn, face_node_connectivity, xykm, buffer_width
+    ):
+        key = RegionCache.get_cache_key(XN, YN, FACE_NODE_CONNECTIVITY, XYKM, 3000.0)
+
+        assert (
+            RegionCache.get_cache_key(
+                xn, YN, face_node_connectivity, xykm, buffer_width
+            )
+            != key
+        )
+
+    def given_saved_arrays_when_load_then_data_memory_mapped(self, region_dir: Path):
+        arrays = get_arrays()
+
+        RegionCache.save("key", arrays)
+        cached_arrays = RegionCache.load("key", NAMES)
+
+        assert (region_dir / "key" / "iface.npy").exists()
+        for name in NAMES:
+            assert isinstance(cached_arrays[name], numpy.memmap)
+            assert (cached_arrays[name] == arrays[name]).all()
+
+    def given_no_cache_entry_when_load_then_none(self, region_dir: Path):
+        assert RegionCache.load("unknown", NAMES) is None
+
+    def given_incomplete_cache_entry_when_load_then_none(self, region_dir: Path):
+        RegionCache.save("key", get_arrays())
+        os.remove(region_dir / "key" / "sni.npy")
+
+        assert RegionCache.load("key", NAMES) is None
+
+    def given_full_cache_when_save_then_least_recently_used_entry_evicted(
+        self, region_dir: Path
+    ):
+        arrays = get_arrays(1000)
+        RegionCache.save("old", arrays)
+        RegionCache.save("used", arrays)
+        for age, key in enumerate(["used", "old"]):
+            os.utime(region_dir / key, ns=(0, 10**9 * (age + 1)))
+        RegionCache.load("old", NAMES)
+        entry_size = sum(file.stat().st_size for file in (region_dir / "old").iterdir())
+
+        RegionCache.save("new", arrays, 2 * entry_size)
+
+        assert sorted(path.name for path in region_dir.iterdir()) == ["new", "old"]
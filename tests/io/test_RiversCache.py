@@ -0,0 +1,137 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.RiversCache import RiversCache
+from dfastmi.io.RiversObject import RiversObject
+
+
+@pytest.fixture
+def rivers_file(tmp_path) -> str:
+    ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+    rivers_file = tmp_path / "rivers.ini"
+    shutil.copy("dfastmi/Dutch_rivers_v3.ini", rivers_file)
+    return str(rivers_file)
+
+
+def reach_parameters(rivers: RiversObject):
+    return [
+        (
+            branch.name,
+            branch.qlocation,
+            reach.name,
+            reach.normal_width,
+            reach.ucritical,
+            reach.qstagnant,
+            reach.hydro_q,
+            reach.celer_form,
+        )
+        for branch in rivers.branches
+        for reach in branch.reaches
+    ]
+
+
+class Test_RiversCache:
+    def given_rivers_file_when_read_without_cache_then_no_cache_file_written(
+        self, cache_dir: Path, rivers_file: str
+    ):
+        RiversObject(rivers_file)
+
+        assert not cache_dir.exists()
+
+    def given_rivers_file_when_read_with_cache_then_cache_file_written(
+        self, cache_dir: Path, rivers_file: str
+    ):
+        RiversObject(rivers_file, use_cache=True)
+
+        assert RiversCache.get_cache_file(rivers_file).exists()
+
+    def given_cached_rivers_file_when_read_with_cache_then_data_loaded_from_cache(
+        self, cache_dir: Path, rivers_file: str, mocker
+    ):
+        rivers = RiversObject(rivers_file, use_cache=True)
+        read_file = mocker.patch.object(RiversObject, "_read_rivers_file")
+
+        cached_rivers = RiversObject(rivers_file, use_cache=True)
+
+        read_file.assert_not_called()
+        assert cached_rivers.version == rivers.version
+        assert reach_parameters(cached_rivers) == reach_parameters(rivers)
+        for branch in cached_rivers.branches:
+            for reach in branch.reaches:
+                assert reach.parent_branch is branch
+                assert reach.celer_object.parent_reach is reach
+
+    def given_modified_rivers_file_when_read_with_cache_then_file_parsed_again(
+        self, cache_dir: Path, rivers_file: str, mocker
+    ):
+        RiversObject(rivers_file, use_cache=True)
+        with open(rivers_file, "a") as file:
+            file.write("\n")
+        read_file = mocker.spy(RiversObject, "_read_rivers_file")
+
+        RiversObject(rivers_file, use_cache=True)
+
+        read_file.assert_called_once()
+
+    def given_changed_data_model_when_read_with_cache_then_file_parsed_again(
+        self, cache_dir: Path, rivers_file: str, mocker
+    ):
+        RiversObject(rivers_file, use_cache=True)
+        mocker.patch.object(
+            RiversCache, "_get_schema_fingerprint", return_value="new schema"
+        )
+        read_file = mocker.spy(RiversObject, "_read_rivers_file")
+
+        RiversObject(rivers_file, use_cache=True)
+
+        read_file.assert_called_once()
+
+    def given_corrupt_cache_file_when_read_with_cache_then_file_parsed_again(
+        self, cache_dir: Path, rivers_file: str, mocker
+    ):
+        RiversObject(rivers_file, use_cache=True)
+        RiversCache.get_cache_file(rivers_file).write_bytes(b"corrupt")
+        read_file = mocker.spy(RiversObject, "_read_rivers_file")
+
+        rivers = RiversObject(rivers_file, use_cache=True)
+
+        read_file.assert_called_once()
+        assert len(rivers.branches) > 0
+
+    def given_rivers_file_without_checksum_when_read_from_cache_then_missing_checksum_reported(
+        self, cache_dir: Path, mocker
+    ):
+        ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+        rivers_file = "tests/files/read_riversv2_test.ini"
+        RiversObject(rivers_file, use_cache=True)
+        log_text = mocker.patch(
+            "dfastmi.io.RiversObject.ApplicationSettingsHelper.log_text"
+        )
+
+        RiversObject(rivers_file, use_cache=True)
+
+        log_text.assert_called_once_with("checksum", dict={"filename": rivers_file})
+
+    def given_cached_rivers_file_when_read_with_cache_then_lookup_by_name_available(
+        self, cache_dir: Path, rivers_file: str
+    ):
+        RiversObject(rivers_file, use_cache=True)
+
+        rivers = RiversObject(rivers_file, use_cache=True)
+
+        branch = rivers.branches[0]
+        assert rivers.get_branch(branch.name) is branch
+        assert branch.get_reach(branch.reaches[0].name) is branch.reaches[0]
+
+    def given_failing_write_when_read_with_cache_then_no_temporary_file_left(
+        self, cache_dir: Path, rivers_file: str, mocker
+    ):
+        mocker.patch("dfastmi.io.RiversCache.os.replace", side_effect=OSError)
+
+        rivers = RiversObject(rivers_file, use_cache=True)
+
+        assert len(rivers.branches) > 0
+        assert list(RiversCache.get_cache_file(rivers_file).parent.iterdir()) == []
@@ -3,6 +3,7 @@ import sys
 from contextlib import contextmanager
 from io import StringIO
 
+import numpy
 import pytest
 from pydantic import ValidationError
 
@@ -299,3 +300,51 @@ class Test_read_rivers:
             str(validation_exception["msg"])
             == 'Value error, Invalid value 8 specified for "CelerForm" for branch "Branch1", reach "Branch1 R1"; only 1 and 2 are supported.'
         )
+
+
+class Test_lookup_rivers:
+    def given_a_rivers_config_file_when_get_branch_then_branch_with_name_returned(
+        self,
+    ):
+        rivers = RiversObject("tests/files/read_riversv2_test.ini")
+
+        assert rivers.get_branch("Branch2") is rivers.branches[1]
+        assert rivers.get_branch("Unknown") is None
+
+    def given_a_rivers_config_file_when_get_reach_then_reach_with_name_returned(
+        self,
+    ):
+        rivers = RiversObject("tests/files/read_riversv2_test.ini")
+        branch = rivers.get_branch("Branch2")
+
+        assert branch.get_reach("Branch2 R2") is branch.reaches[1]
+        assert branch.get_reach("Branch1 R1") is None
+
+    def given_a_rivers_config_file_when_get_reach_parameters_then_columns_returned(
+        self,
+    ):
+        rivers = RiversObject("tests/files/read_riversv2_test.ini")
+
+        parameters = rivers.get_reach_parameters()
+
+        assert list(parameters["branch"]) == ["Branch1", "Branch2", "Branch2"]
+        assert list(parameters["reach"]) == ["Branch1 R1", "Branch2 R1", "Branch2 R2"]
+        assert list(parameters["normal_width"]) == [250.0, 250.0, 100.0]
+        assert list(parameters["ucritical"]) == [0.3, 0.3, 0.3]
+        assert list(parameters["qstagnant"]) == [50.0, 0.0, 1500.0]
+        assert list(parameters["celer_form"]) == [2, 2, 2]
+        assert list(parameters["celer_q_coefficient"]) == [11.0, 11.0, 11.0]
+        assert list(parameters["celer_q_exponent"]) == [21.0, 21.0, 21.0]
+        assert list(parameters["prop_q"]) == [None, None, None]
+
+    def given_a_legacy_rivers_config_file_when_get_reach_parameters_then_celerity_undefined(
+        self,
+    ):
+        rivers = RiversObject("tests/files/read_rivers_test.ini")
+
+        parameters = rivers.get_reach_parameters()
+
+        nreaches = sum(len(branch.reaches) for branch in rivers.branches)
+        assert len(parameters["reach"]) == nreaches
+        assert (parameters["celer_form"] == 0).all()
+        assert numpy.isnan(parameters["celer_q_coefficient"]).all()
@@ -0,0 +1,127 @@
+import os
+import shutil
+from pathlib import Path
+
+import numpy
+import pytest
+
+from dfastmi.io.DataTextFileOperations import DataTextFileOperations
+from dfastmi.io.XyzCache import XyzCache
+
+COLS = (2, 3, 4)
+
+
+@pytest.fixture
+def xyz_file(tmp_path) -> str:
+    xyz_file = tmp_path / "xyz_velocity-zeta.001.Q1.xyz"
+    shutil.copy(
+        "tests/c01 - GendtseWaardNevengeul/xyz_velocity-zeta.001.Q1.xyz", xyz_file
+    )
+    return str(xyz_file)
+
+
+class Test_XyzCache:
+    def given_xyz_file_when_read_without_cache_then_no_sidecar_written(
+        self, xyz_file: str
+    ):
+        DataTextFileOperations.read_waqua_xyz(xyz_file, COLS)
+
+        data_file, key_file = XyzCache.get_cache_files(xyz_file, COLS)
+        assert not data_file.exists()
+        assert not key_file.exists()
+
+    def given_xyz_file_when_read_with_cache_then_sidecar_written(self, xyz_file: str):
+        data = DataTextFileOperations.read_waqua_xyz(xyz_file, COLS, use_cache=True)
+
+        data_file, key_file = XyzCache.get_cache_files(xyz_file, COLS)
+        assert data_file.exists()
+        assert key_file.exists()
+        assert (numpy.load(data_file) == data).all()
+
+    def given_cached_xyz_file_when_read_with_cache_then_data_memory_mapped(
+        self, xyz_file: str, mocker
+    ):
+        data = DataTextFileOperations.read_waqua_xyz(xyz_file, COLS, use_cache=True)
+        read_csv = mocker.patch("pandas.read_csv")
+
+        cached_data = DataTextFileOperations.read_waqua_xyz(
+            xyz_file, COLS, use_cache=True
+        )
+
+        read_csv.assert_not_called()
+        assert isinstance(cached_data, numpy.memmap)
+        assert (cached_data == data).all()
+
+    def given_touched_xyz_file_when_read_with_cache_then_data_loaded_from_cache(
+        self, xyz_file: str, mocker
+    ):
+        DataTextFileOperations.read_waqua_xyz(xyz_file, COLS, use_cache=True)
+        stat = os.stat(xyz_file)
+        os.utime(xyz_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        read_csv = mocker.patch("pandas.read_csv")
+
+        cached_data = DataTextFileOperations.read_waqua_xyz(
+            xyz_file, COLS, use_cache=True
+        )
+
+        read_csv.assert_not_called()
+        assert isinstance(cached_data, numpy.memmap)
+
+    def given_modified_xyz_file_when_read_with_cache_then_file_parsed_again(
+        self, xyz_file: str
+    ):
+        DataTextFileOperations.read_waqua_xyz(xyz_file, COLS, use_cache=True)
+        with open(xyz_file, "a") as file:
+            file.write(
+                "     197000.000,     431000.000,         1.5000,     9,     9,        99\n"
+            )
+
+        data = DataTextFileOperations.read_waqua_xyz(xyz_file, COLS, use_cache=True)
+
+        assert not isinstance(data, numpy.memmap)
+        assert tuple(data[-1]) == (1.5, 9.0, 9.0)
+
+    def given_corrupt_sidecar_when_read_with_cache_then_file_parsed_again(
+        self, xyz_file: str
+    ):
+        reference = DataTextFileOperations.read_waqua_xyz(xyz_file, COLS)
+        DataTextFileOperations.read_waqua_xyz(xyz_file, COLS, use_cache=True)
+        data_file, _ = XyzCache.get_cache_files(xyz_file, COLS)
+        data_file.write_bytes(b"corrupt")
+
+        data = DataTextFileOperations.read_waqua_xyz(xyz_file, COLS, use_cache=True)
+
+        assert (data == reference).all()
+
+    def given_different_columns_when_read_with_cache_then_separate_sidecars_used(
+        self, xyz_file: str
+    ):
+        DataTextFileOperations.read_waqua_xyz(xyz_file, COLS, use_cache=True)
+
+        data = DataTextFileOperations.read_waqua_xyz(xyz_file, (2,), use_cache=True)
+
+        assert (
+            numpy.shape(data)
+            == numpy.shape(DataTextFileOperations.read_waqua_xyz(xyz_file, COLS))[:1]
+        )
+        assert XyzCache.get_cache_files(xyz_file, (2,))[0].exists()
+
+    @pytest.mark.parametrize("failing_file", [0, 1], ids=["data", "key"])
+    def given_failing_write_when_save_then_no_temporary_file_left(
+        self, xyz_file: str, failing_file: int, mocker
+    ):
+        replace = os.replace
+        calls = []
+
+        def failing_replace(source, target):
+            calls.append(target)
+            if len(calls) > failing_file:
+                raise OSError
+            replace(source, target)
+
+        mocker.patch("dfastmi.io.XyzCache.os.replace", side_effect=failing_replace)
+
+        XyzCache.save(xyz_file, COLS, numpy.zeros((3, 3)))
+
+        suffixes = sorted(path.suffix for path in Path(xyz_file).parent.iterdir())
+        assert suffixes == sorted([".xyz"] + [".npy"] * failing_file)
@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+
+from dfastmi.io import cachedir
+
+
+class Test_get_cache_dir:
+    def given_cache_dir_variable_when_get_cache_dir_then_variable_used(
+        self, cache_dir: Path
+    ):
+        assert cachedir.get_cache_dir() == cache_dir
+
+    def given_no_cache_dir_variable_when_get_cache_dir_then_user_cache_dir(
+        self, tmp_path: Path, monkeypatch
+    ):
+        monkeypatch.delenv(cachedir.CACHE_DIR_VARIABLE, raising=False)
+        monkeypatch.setattr(cachedir.sys, "platform", "linux")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert cachedir.get_cache_dir() == tmp_path / "dfastmi"
+
+
+class Test_evict_entries:
+    def given_entries_too_large_when_evict_entries_then_least_recently_used_removed(
+        self, tmp_path: Path
+    ):
+        (tmp_path / "directory").mkdir()
+        (tmp_path / "directory" / "data").write_bytes(bytes(100))
+        (tmp_path / "old").write_bytes(bytes(100))
+        (tmp_path / "new").write_bytes(bytes(100))
+        for age, name in enumerate(["new", "directory", "old"]):
+            os.utime(tmp_path / name, ns=(0, 10**9 * (3 - age)))
+
+        cachedir.evict_entries(tmp_path.iterdir(), 150)
+
+        assert [path.name for path in tmp_path.iterdir()] == ["new"]
+
+    def given_entries_fitting_when_evict_entries_then_nothing_removed(
+        self, tmp_path: Path
+    ):
+        (tmp_path / "old").write_bytes(bytes(100))
+        (tmp_path / "new").write_bytes(bytes(100))
+
+        cachedir.evict_entries(tmp_path.iterdir(), 200)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["new", "old"]
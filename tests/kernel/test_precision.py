@@ -0,0 +1,98 @@
+import numpy
+import pytest
+
+import dfastmi.kernel.core
+from dfastmi.kernel import precision
+
+
+class Test_precision_policy:
+    def given_no_policy_when_get_precision_then_double(self):
+        assert precision.get_precision() == precision.DOUBLE
+        assert precision.float_dtype() == numpy.float64
+
+    def given_single_policy_when_float_dtype_then_float32_and_restored_afterwards(
+        self,
+    ):
+        with precision.policy(precision.SINGLE):
+            assert precision.float_dtype() == numpy.float32
+
+        assert precision.get_precision() == precision.DOUBLE
+
+    def given_exception_in_policy_when_leaving_context_then_precision_restored(self):
+        with pytest.raises(RuntimeError):
+            with precision.policy(precision.SINGLE):
+                raise RuntimeError("failure")
+
+        assert precision.get_precision() == precision.DOUBLE
+
+    def given_unsupported_precision_when_set_precision_then_value_error(self):
+        with pytest.raises(ValueError):
+            precision.set_precision("half")
+
+        assert precision.get_precision() == precision.DOUBLE
+
+
+class Test_precision_conversions:
+    @pytest.mark.parametrize(
+        "size, dtype",
+        [(0, numpy.int32), (precision.INT32_MAX, numpy.int32), (2**31, numpy.int64)],
+    )
+    def given_size_when_index_dtype_then_smallest_sufficient_type(self, size, dtype):
+        assert precision.index_dtype(size) == dtype
+
+    def given_masked_indices_when_as_index_then_int32_and_mask_kept(self):
+        indices = numpy.ma.masked_array(
+            [[0, 1, 2], [2, 3, -1]], mask=[[0, 0, 0], [0, 0, 1]]
+        )
+
+        converted = precision.as_index(indices)
+
+        assert converted.dtype == numpy.int32
+        assert (converted.mask == indices.mask).all()
+        assert (converted.data == indices.data).all()
+
+    def given_masked_field_when_as_float_with_single_policy_then_float32_and_mask_kept(
+        self,
+    ):
+        field = numpy.ma.masked_array([0.5, 1.5, 2.5], mask=[0, 1, 0])
+
+        with precision.policy(precision.SINGLE):
+            converted = precision.as_float(field)
+
+        assert converted.dtype == numpy.float32
+        assert (converted.mask == field.mask).all()
+
+    def given_double_field_when_as_float_with_double_policy_then_not_copied(self):
+        field = numpy.array([0.5, 1.5])
+
+        assert precision.as_float(field) is field
+
+    def given_scalar_when_as_float_then_unchanged(self):
+        assert precision.as_float(0.5) == 0.5
+
+
+class Test_main_computation_precision:
+    def given_single_precision_dzq_when_main_computation_then_float32_results_close_to_double(
+        self,
+    ):
+        rng = numpy.random.default_rng(1)
+        dzq = [rng.uniform(-1.0, 1.0, 1000) for _ in range(3)]
+        time_fractions_of_the_year = (0.2, 0.5, 0.3)
+        rsigma = (0.3, 0.6, 0.9)
+
+        expected = dfastmi.kernel.core.main_computation(
+            dzq, time_fractions_of_the_year, rsigma
+        )
+        with precision.policy(precision.SINGLE):
+            result = dfastmi.kernel.core.main_computation(
+                [precision.as_float(dzq_period) for dzq_period in dzq],
+                time_fractions_of_the_year,
+                rsigma,
+            )
+
+        for single, double in zip(result[:3], expected[:3]):
+            assert single.dtype == numpy.float32
+            assert numpy.allclose(single, double, atol=1e-6)
+        for single, double in zip(result[3], expected[3]):
+            assert single.dtype == numpy.float32
+            assert numpy.allclose(single, double, atol=1e-6)
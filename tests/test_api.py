@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import netCDF4
+import numpy as np
+import pytest
+
+import dfastmi.api
+import dfastmi.batch.core
+from dfastmi.api import AnalysisResult, Condition
+from dfastmi.config.ConfigFileOperations import ConfigFileOperations
+from dfastmi.io.ApplicationSettingsHelper import ApplicationSettingsHelper
+from dfastmi.io.RiversObject import RiversObject
+
+NETCDF_CASE = Path("tests/c01 - GendtseWaardNevengeul")
+BRANCH = "Bovenrijn & Waal"
+REACH = "Boven-Waal                   km  868-886"
+
+
+@pytest.fixture
+def rivers() -> RiversObject:
+    ApplicationSettingsHelper.load_program_texts("dfastmi/messages.UK.ini")
+    return RiversObject("dfastmi/Dutch_rivers_v1.ini")
+
+
+@pytest.fixture
+def conditions():
+    return [
+        Condition(
+            discharge,
+            str(NETCDF_CASE.absolute() / f"reference-Q{i}_map.nc"),
+            str(NETCDF_CASE.absolute() / f"intervention-Q{i}_map.nc"),
+        )
+        for i, discharge in enumerate([3000.0, 4000.0, 6000.0], start=1)
+    ]
+
+
+def analyse(rivers, conditions, output_dir=None) -> AnalysisResult:
+    return dfastmi.api.analyse(
+        rivers,
+        BRANCH,
+        REACH,
+        conditions,
+        ucrit=0.3,
+        settings={"Qbankfull": "4000.0"},
+        output_dir=output_dir,
+    )
+
+
+class Test_analyse:
+    def given_conditions_when_analysed_then_results_equal_batch_results(
+        self, rivers, conditions, tmp_path
+    ):
+        config = ConfigFileOperations.load_configuration_file(
+            str(NETCDF_CASE / "c01_netcdf.cfg")
+        )
+        config.set("General", "OutputDir", str(tmp_path))
+        assert dfastmi.batch.core.batch_mode_core(rivers, False, config)
+
+        result = analyse(rivers, conditions)
+
+        assert result.success
+        assert result.nfaces == 2555
+        assert len(result.dzq) == 3
+        assert result.sedimentation_data is None
+        with netCDF4.Dataset(tmp_path / "dfastmi_results.nc") as dataset:
+            for name, values in [
+                ("avgdzb", result.dzgem),
+                ("maxdzb", result.dzmax),
+                ("mindzb", result.dzmin),
+            ]:
+                np.testing.assert_array_equal(
+                    np.ma.filled(dataset.variables[name][:], np.nan),
+                    result.on_mesh(values),
+                )
+
+    def given_no_output_dir_when_analysed_then_no_files_written(
+        self, rivers, conditions, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+
+        result = analyse(rivers, conditions)
+
+        assert result.success
+        assert list(tmp_path.iterdir()) == []
+
+    def given_output_dir_when_analysed_then_netcdf_results_written(
+        self, rivers, conditions, tmp_path
+    ):
+        result = analyse(rivers, conditions, output_dir=tmp_path / "output")
+
+        assert result.success
+        assert (tmp_path / "output" / "dfastmi_results.nc").exists()
+        assert not (tmp_path / "output" / "report.txt").exists()
+
+    def given_missing_simulation_file_when_analysed_then_no_success(
+        self, rivers, conditions, tmp_path
+    ):
+        conditions[1].intervention = str(tmp_path / "missing_map.nc")
+
+        result = analyse(rivers, conditions)
+
+        assert not result.success
+        assert result.dzgem is None
+        assert "missing_map.nc" in result.log
+
+    def given_unknown_reach_when_analysed_then_lookup_error_raised(
+        self, rivers, conditions
+    ):
+        with pytest.raises(LookupError):
+            dfastmi.api.analyse(rivers, BRANCH, "unknown reach", conditions)
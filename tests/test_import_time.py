@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from benchmarks.startup import measure, parse_import_times
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(arguments: List[str]) -> Dict[str, int]:
+    """
+    Run python with -X importtime and return the modules loaded.
+
+    The import time budgets are checked by benchmarks/startup.py, since wall
+    clock times aren't reliable on shared test machines.
+    """
+    stderr = measure(arguments, ROOT)
+    assert "Traceback" not in stderr, stderr
+    return parse_import_times(stderr)
+
+
+def top_level_packages(cumulative: Dict[str, int]) -> List[str]:
+    return sorted({name.split(".")[0] for name in cumulative})
+
+
+class Test_import_time:
+    def test_batch_mode_does_not_load_gui_or_plotting(self, tmp_path):
+        config = str(tmp_path / "missing.cfg")
+        cumulative = import_times(
+            ["-m", "dfastmi", "--mode", "BATCH", "--config", config]
+        )
+
+        packages = top_level_packages(cumulative)
+        for package in ["PyQt5", "matplotlib", "fiona", "geopandas"]:
+            assert package not in packages
+        assert "dfastmi.gui.dialog_view" not in cumulative
+        assert "dfastmi.cli" not in cumulative
+        assert "dfastmi.batch.core" in cumulative
+
+    def test_cli_mode_does_not_load_gui_or_plotting(self):
+        cumulative = import_times(["-c", "import dfastmi.cmd, dfastmi.cli"])
+
+        packages = top_level_packages(cumulative)
+        for package in ["PyQt5", "matplotlib", "fiona", "geopandas"]:
+            assert package not in packages
+        assert "dfastmi.gui.dialog_view" not in cumulative
+
+    @pytest.mark.skipif(sys.platform != "win32", reason="GUI requires Windows")
+    def test_gui_mode_does_not_load_plotting_before_analysis(self):
+        cumulative = import_times(["-c", "import dfastmi.cmd, dfastmi.gui.dialog_view"])
+
+        packages = top_level_packages(cumulative)
+        assert "PyQt5" in packages
+        assert "matplotlib" not in packages